@@ -86,7 +86,7 @@ async def quick_start(args: argparse.Namespace, secrets_manager: BaseSecretsMana
         logging.getLogger().error("Invalid password.")
         return
 
-    await Security.wait_til_decryption_done()
+    # The strategy only waits for the connectors it uses to be decrypted, see start_check
     await create_yml_files_legacy()
     init_logging("hummingbot_logs.yml", client_config_map)
     await read_system_configs_from_yml()
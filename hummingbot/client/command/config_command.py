@@ -73,22 +73,30 @@ client_configs_to_display = ["autofill_import",
                              "gateway",
                              "gateway_api_host",
                              "gateway_api_port",
+                             "gateway_quote_cache_ttl",
                              "rate_oracle_source",
                              "extra_tokens",
+                             "rate_oracle_connector_prices",
                              "fetch_pairs_from_all_exchanges",
                              "global_token",
                              "global_token_name",
                              "global_token_symbol",
                              "rate_limits_share_pct",
+                             "order_book_coalesce_diffs",
+                             "db_write_behind_interval",
                              "commands_timeout",
                              "create_command_timeout",
                              "other_commands_timeout",
                              "tables_format",
                              "tick_size",
+                             "clock_mode",
+                             "min_tick_interval",
+                             "max_idle_interval",
                              "market_data_collection",
                              "market_data_collection_enabled",
                              "market_data_collection_interval",
                              "market_data_collection_depth",
+                             "market_data_collection_storage",
                              ]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
@@ -31,6 +31,9 @@ class ExitCommand:
         if self._gateway_monitor is not None:
             self._gateway_monitor.stop()
 
+        if self.markets_recorder is not None:
+            self.markets_recorder.flush_pending_writes()
+
         self.notify("Winding down notifiers...")
         for notifier in self.notifiers:
             notifier.stop()
@@ -94,6 +94,9 @@ class ExportCommand:
                                  session: Session,
                                  number_of_rows: Optional[int] = None,
                                  config_file_path: str = None) -> List[TradeFill]:
+        if self.markets_recorder is not None:
+            # The trades queued by the markets recorder are written first, for the query to return them
+            self.markets_recorder.flush_pending_writes()
 
         filters = [TradeFill.timestamp >= start_timestamp]
         if config_file_path is not None:
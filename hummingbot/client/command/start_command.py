@@ -18,9 +18,10 @@ from hummingbot.client.config.config_data_types import BaseClientModel
 from hummingbot.client.config.config_helpers import get_strategy_starter_file
 from hummingbot.client.config.config_validators import validate_bool
 from hummingbot.client.config.config_var import ConfigVar
+from hummingbot.client.config.security import Security
 from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.connector.connector_status import get_connector_status, warning_messages
-from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.clock import ClockMode
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.exceptions import InvalidScriptModule, OracleRateUnavailable
@@ -100,6 +101,10 @@ class StartCommand(GatewayChainApiManager):
                     self.strategy_file_name = None
                     raise
 
+        if is_quickstart:
+            # The connectors of a script are only known once it's loaded, so it waits for every connector config
+            await Security.wait_til_decryption_done(None if script else settings.required_exchanges)
+
         if script:
             file_name = script.split(".")[0]
             self.strategy_name = file_name
@@ -195,6 +200,7 @@ class StartCommand(GatewayChainApiManager):
         self._in_start_check = False
 
         # We always start the RateOracle. It is required for PNL calculation.
+        RateOracle.get_instance().connectors = list(self.markets.values())
         RateOracle.get_instance().start()
         if self._mqtt:
             self._mqtt.patch_loggers()
@@ -257,10 +263,12 @@ class StartCommand(GatewayChainApiManager):
             self.start_time = time.time() * 1e3  # Time in milliseconds
             tick_size = self.client_config_map.tick_size
             self.logger().info(f"Creating the clock with tick size: {tick_size}")
-            self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            self.clock = self.client_config_map.clock_mode.get_clock(tick_size)
             for market in self.markets.values():
                 if market is not None:
                     self.clock.add_iterator(market)
+                    if self.clock.clock_mode is ClockMode.EVENT_DRIVEN:
+                        self.clock.subscribe_to_connector(market)
                     self.markets_recorder.restore_market_states(self.strategy_file_name, market)
                     if len(market.limit_orders) > 0:
                         self.notify(f"Canceling dangling limit orders on {market.name}...")
@@ -158,7 +158,7 @@ class StatusCommand:
             self.notify('  - Strategy check: Please import or create a strategy.')
             return False
 
-        if not Security.is_decryption_done():
+        if not Security.is_decryption_done(required_exchanges):
             self.notify('  - Security check: Encrypted files are being processed. Please wait and try again later.')
             return False
 
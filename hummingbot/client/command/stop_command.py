@@ -53,6 +53,7 @@ class StopCommand:
 
         if RateOracle.get_instance().started:
             RateOracle.get_instance().stop()
+        RateOracle.get_instance().connectors = []
 
         if self.markets_recorder is not None:
             self.markets_recorder.stop()
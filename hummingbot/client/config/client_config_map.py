@@ -32,6 +32,7 @@ from hummingbot.connector.exchange.gate_io.gate_io_utils import GateIOConfigMap
 from hummingbot.connector.exchange.injective_v2.injective_v2_utils import InjectiveConfigMap
 from hummingbot.connector.exchange.kucoin.kucoin_utils import KuCoinConfigMap
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.clock import Clock, ClockMode
 from hummingbot.core.rate_oracle.rate_oracle import RATE_ORACLE_SOURCES, RateOracle
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils.kill_switch import ActiveKillSwitch, KillSwitch, PassThroughKillSwitch
@@ -152,6 +153,11 @@ class MQTTBridgeConfigMap(BaseClientModel):
         title = "mqtt_bridge"
 
 
+# sqlite stores the snapshots in the MarketData table, columnar in compressed numpy chunks and columnar_npy in
+# uncompressed numpy chunks, which are larger but memory-mapped when read (see ColumnarMarketDataWriter)
+MARKET_DATA_COLLECTION_STORAGES = ("sqlite", "columnar", "columnar_npy")
+
+
 class MarketDataCollectionConfigMap(BaseClientModel):
     market_data_collection_enabled: bool = Field(
         default=True,
@@ -179,10 +185,24 @@ class MarketDataCollectionConfigMap(BaseClientModel):
             ),
         ),
     )
+    market_data_collection_storage: str = Field(
+        default="sqlite",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                f"Set where the market data is stored ({'/'.join(MARKET_DATA_COLLECTION_STORAGES)}) (Default=sqlite)"
+            ),
+        ),
+    )
 
     class Config:
         title = "market_data_collection"
 
+    @validator("market_data_collection_storage", pre=True)
+    def validate_market_data_collection_storage(cls, v: str):
+        if v not in MARKET_DATA_COLLECTION_STORAGES:
+            raise ValueError(f"Invalid storage, please choose a value from {MARKET_DATA_COLLECTION_STORAGES}.")
+        return v
+
 
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
@@ -384,6 +404,64 @@ KILL_SWITCH_MODES = {
 }
 
 
+class ClockConfigMode(BaseClientModel, ABC):
+    @abstractmethod
+    def get_clock(self, tick_size: float) -> Clock:
+        ...
+
+
+class ClockRealTimeMode(ClockConfigMode):
+    class Config:
+        title = "clock_real_time"
+
+    def get_clock(self, tick_size: float) -> Clock:
+        return Clock(ClockMode.REALTIME, tick_size=tick_size)
+
+
+class ClockEventDrivenMode(ClockConfigMode):
+    min_tick_interval: float = Field(
+        default=0.05,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "What is the minimum time (in seconds) between two ticks when the markets change?"
+            ),
+        ),
+    )
+    max_idle_interval: float = Field(
+        default=1.0,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "What is the maximum time (in seconds) between two ticks when the markets don't change?"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "clock_event_driven"
+
+    def get_clock(self, tick_size: float) -> Clock:
+        return Clock(ClockMode.EVENT_DRIVEN,
+                     tick_size=tick_size,
+                     min_tick_interval=self.min_tick_interval,
+                     max_idle_interval=self.max_idle_interval)
+
+    @validator("min_tick_interval", "max_idle_interval", pre=True)
+    def validate_interval(cls, v: float):
+        """Used for client-friendly error output."""
+        ret = validate_float(v, min_value=0, inclusive=False)
+        if ret is not None:
+            raise ValueError(ret)
+        return v
+
+
+CLOCK_MODES = {
+    ClockRealTimeMode.Config.title: ClockRealTimeMode,
+    ClockEventDrivenMode.Config.title: ClockEventDrivenMode,
+}
+
+
 class AutofillImportEnum(str, ClientConfigEnum):
     start = "start"
     config = "config"
@@ -595,6 +673,15 @@ class GatewayConfigMap(BaseClientModel):
             prompt=lambda cm: "Please enter your Gateway API port",
         ),
     )
+    gateway_quote_cache_ttl: float = Field(
+        default=5.0,
+        ge=0,
+        description=("Number of seconds the Gateway AMM quote prices are reused, e.g. the block time of the network."
+                     " Concurrent requests for the same quote are always sent once"),
+        client_data=ClientFieldData(
+            prompt=lambda cm: "How long (in seconds) do you want to reuse the Gateway AMM quote prices?",
+        ),
+    )
 
     class Config:
         title = "gateway"
@@ -1071,6 +1158,16 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    rate_oracle_connector_prices: bool = Field(
+        default=False,
+        description=("Use the order books of the running strategy connectors for the rate oracle rates they can"
+                     " price, instead of requesting them to the rate oracle source"),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Would you like the rate oracle to use the order books of the running connectors? (Yes/No)"
+            ),
+        ),
+    )
     global_token: GlobalTokenConfigMap = Field(
         default=GlobalTokenConfigMap(),
         description="A universal token which to display tokens values in, e.g. USD,EUR,BTC"
@@ -1089,6 +1186,28 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    order_book_coalesce_diffs: bool = Field(
+        default=False,
+        description=("Merge the order book diff messages queued for a trading pair by price level and apply them at"
+                     " once, instead of one by one, to catch up faster after reconnections or bursts of messages"),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Would you like to merge the queued order book diff messages of the exchange connectors? (Yes/No)"
+            ),
+        ),
+    )
+    db_write_behind_interval: float = Field(
+        default=1.0,
+        ge=0,
+        description=("Interval (in seconds) between the writes of the order events to the database. The events are"
+                     " queued and written together by a writer thread. Enter 0 to write each event when it happens"),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "How often (in seconds) do you want to write the order events to the database?"
+                " (Enter 0 to write them when they happen)"
+            ),
+        ),
+    )
     commands_timeout: CommandsTimeoutConfigMap = Field(default=CommandsTimeoutConfigMap())
     tables_format: ClientConfigEnum(
         value="TabulateFormats",  # noqa: F821
@@ -1118,6 +1237,14 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    clock_mode: Union[tuple(CLOCK_MODES.values())] = Field(
+        default=ClockRealTimeMode(),
+        description="In the real time mode the clock ticks every tick size. In the event driven mode it ticks when the"
+                    "\nbest prices of the markets or the orders change, and at least every max_idle_interval.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: f"Select the clock mode ({'/'.join(list(CLOCK_MODES.keys()))})",
+        ),
+    )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
 
     class Config:
@@ -1153,7 +1280,8 @@ class ClientConfigMap(BaseClientModel):
             sub_model = TELEGRAM_MODES[v].construct()
         return sub_model
 
-    @validator("send_error_logs", "fetch_pairs_from_all_exchanges", pre=True)
+    @validator("send_error_logs", "fetch_pairs_from_all_exchanges", "rate_oracle_connector_prices",
+               "order_book_coalesce_diffs", pre=True)
     def validate_bool(cls, v: str):
         """Used for client-friendly error output."""
         if isinstance(v, str):
@@ -1226,6 +1354,18 @@ class ClientConfigMap(BaseClientModel):
         """Used for client-friendly error output."""
         return super().validate_decimal(v, field)
 
+    @validator("clock_mode", pre=True)
+    def validate_clock_mode(cls, v: Union[(str, Dict) + tuple(CLOCK_MODES.values())]):
+        if isinstance(v, tuple(CLOCK_MODES.values()) + (Dict,)):
+            sub_model = v
+        elif v not in CLOCK_MODES:
+            raise ValueError(
+                f"Invalid clock mode, please choose a value from {list(CLOCK_MODES.keys())}."
+            )
+        else:
+            sub_model = CLOCK_MODES[v].construct()
+        return sub_model
+
     @validator("tick_size", pre=True)
     def validate_tick_size(cls, v: float):
         """Used for client-friendly error output."""
@@ -1246,3 +1386,4 @@ class ClientConfigMap(BaseClientModel):
         rate_source_mode: RateSourceModeBase = values["rate_oracle_source"]
         RateOracle.get_instance().source = rate_source_mode.build_rate_source()
         RateOracle.get_instance().quote_token = values["global_token"].global_token_name
+        RateOracle.get_instance().use_connector_prices = values.get("rate_oracle_connector_prices", False)
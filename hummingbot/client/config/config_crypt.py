@@ -1,16 +1,20 @@
 import binascii
+import hmac
 import json
+import threading
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
 
-from eth_account import Account
 from eth_keyfile.keyfile import (
     DKLEN,
     SCRYPT_P,
     SCRYPT_R,
     Random,
-    _pbkdf2_hash,
-    _scrypt_hash,
+    _derive_pbkdf_key,
+    _derive_scrypt_key,
     big_endian_to_int,
+    decode_hex,
+    decrypt_aes_ctr,
     encode_hex_no_prefix,
     encrypt_aes_ctr,
     get_default_work_factor_for_kdf,
@@ -43,12 +47,32 @@ class BaseSecretsManager(ABC):
 
 
 class ETHKeyFileSecretManger(BaseSecretsManager):
+    def __init__(self, password: str):
+        super().__init__(password)
+        # The keys derived from the password, by key derivation function and parameters (salt included), so that
+        # the key derivation runs once per parameter set for the session instead of once per secret.
+        self._derived_keys: Dict[Tuple[str, str], bytes] = {}
+        # The secrets can be decrypted from several threads. Each parameter set has its own lock, so that a key is
+        # derived once even when it is requested in parallel, while keys of different parameter sets are derived
+        # concurrently.
+        self._derived_key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._encryption_kdfparams: Optional[Dict[str, Any]] = None
+
     def encrypt_secret_value(self, attr: str, value: str):
         if self._password is None:
             raise ValueError(f"Could not encrypt secret attribute {attr} because no password was provided.")
         password_bytes = self._password.encode()
         value_bytes = value.encode()
-        keyfile_json = _create_v3_keyfile_json(value_bytes, password_bytes)
+        with self._lock:
+            if self._encryption_kdfparams is None:
+                self._encryption_kdfparams = _create_kdfparams(kdf="pbkdf2")
+        keyfile_json = _create_v3_keyfile_json(
+            value_bytes,
+            password_bytes,
+            kdfparams=self._encryption_kdfparams,
+            derived_key=self._derive_key("pbkdf2", self._encryption_kdfparams),
+        )
         json_str = json.dumps(keyfile_json)
         encrypted_value = binascii.hexlify(json_str.encode()).decode()
         return encrypted_value
@@ -56,10 +80,25 @@ class ETHKeyFileSecretManger(BaseSecretsManager):
     def decrypt_secret_value(self, attr: str, value: str) -> str:
         if self._password is None:
             raise ValueError(f"Could not decrypt secret attribute {attr} because no password was provided.")
-        value = binascii.unhexlify(value)
-        decrypted_value = Account.decrypt(value.decode(), self._password).decode()
+        keyfile_json = json.loads(binascii.unhexlify(value))
+        crypto = keyfile_json["crypto"]
+        derived_key = self._derive_key(crypto["kdf"], crypto["kdfparams"])
+        decrypted_value = _decode_v3_keyfile_json(keyfile_json, derived_key).decode()
         return decrypted_value
 
+    def _derive_key(self, kdf: str, kdfparams: Dict[str, Any]) -> bytes:
+        key = (kdf, json.dumps(kdfparams, sort_keys=True))
+        derived_key = self._derived_keys.get(key)
+        if derived_key is None:
+            with self._lock:
+                key_lock = self._derived_key_locks.setdefault(key, threading.Lock())
+            with key_lock:
+                derived_key = self._derived_keys.get(key)
+                if derived_key is None:
+                    derived_key = _derive_key(self._password.encode(), kdf, kdfparams)
+                    self._derived_keys[key] = derived_key
+        return derived_key
+
 
 def store_password_verification(secrets_manager: BaseSecretsManager):
     encrypted_word = secrets_manager.encrypt_secret_value(PASSWORD_VERIFICATION_WORD, PASSWORD_VERIFICATION_WORD)
@@ -80,24 +119,13 @@ def validate_password(secrets_manager: BaseSecretsManager) -> bool:
     return valid
 
 
-def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_factor=None):
-    """
-    Encrypt message by a given password.
-    Most of this code is copied from eth_key_file.key_file, removed address and is from json result.
-    """
+def _create_kdfparams(kdf: str, work_factor: Optional[int] = None) -> Dict[str, Any]:
     salt = Random.get_random_bytes(16)
 
     if work_factor is None:
         work_factor = get_default_work_factor_for_kdf(kdf)
 
     if kdf == 'pbkdf2':
-        derived_key = _pbkdf2_hash(
-            password,
-            hash_name='sha256',
-            salt=salt,
-            iterations=work_factor,
-            dklen=DKLEN,
-        )
         kdfparams = {
             'c': work_factor,
             'dklen': DKLEN,
@@ -105,14 +133,6 @@ def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_fac
             'salt': encode_hex_no_prefix(salt),
         }
     elif kdf == 'scrypt':
-        derived_key = _scrypt_hash(
-            password,
-            salt=salt,
-            buflen=DKLEN,
-            r=SCRYPT_R,
-            p=SCRYPT_P,
-            n=work_factor,
-        )
         kdfparams = {
             'dklen': DKLEN,
             'n': work_factor,
@@ -122,6 +142,30 @@ def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_fac
         }
     else:
         raise NotImplementedError("KDF not implemented: {0}".format(kdf))
+    return kdfparams
+
+
+def _derive_key(password: bytes, kdf: str, kdfparams: Dict[str, Any]) -> bytes:
+    if kdf == 'pbkdf2':
+        derived_key = _derive_pbkdf_key({'kdfparams': kdfparams}, password)
+    elif kdf == 'scrypt':
+        derived_key = _derive_scrypt_key({'kdfparams': kdfparams}, password)
+    else:
+        raise TypeError("Unsupported key derivation function: {0}".format(kdf))
+    return derived_key
+
+
+def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_factor=None, kdfparams=None,
+                            derived_key=None):
+    """
+    Encrypt message by a given password.
+    Most of this code is copied from eth_key_file.key_file, removed address and is from json result.
+    The key derivation parameters and the key derived with them can be passed to reuse a key derived before.
+    """
+    if kdfparams is None:
+        kdfparams = _create_kdfparams(kdf, work_factor)
+    if derived_key is None:
+        derived_key = _derive_key(password, kdf, kdfparams)
 
     iv = big_endian_to_int(Random.get_random_bytes(16))
     encrypt_key = derived_key[:16]
@@ -142,3 +186,27 @@ def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_fac
         'version': 3,
         'alias': '',  # Add this line to include the 'alias' field with an empty string value
     }
+
+
+def _decode_v3_keyfile_json(keyfile_json, derived_key):
+    """
+    Decrypt message with the key derived from the password.
+    Most of this code is copied from eth_key_file.key_file, the key derivation is left to the caller.
+    """
+    if keyfile_json.get('version') != 3:
+        raise NotImplementedError("Keyfile version not implemented: {0}".format(keyfile_json.get('version')))
+    crypto = keyfile_json['crypto']
+
+    # Validate that the derived key matchs the provided MAC
+    ciphertext = decode_hex(crypto['ciphertext'])
+    mac = keccak(derived_key[16:32] + ciphertext)
+
+    expected_mac = decode_hex(crypto['mac'])
+
+    if not hmac.compare_digest(mac, expected_mac):
+        raise ValueError("MAC mismatch")
+
+    encrypt_key = derived_key[:16]
+    iv = big_endian_to_int(decode_hex(crypto['cipherparams']['iv']))
+
+    return decrypt_aes_ctr(ciphertext, encrypt_key, iv)
@@ -1,7 +1,10 @@
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional
+
+import hummingbot
 
 from hummingbot.client.config.config_crypt import PASSWORD_VERIFICATION_PATH, BaseSecretsManager, validate_password
 from hummingbot.client.config.config_helpers import (
@@ -15,8 +18,7 @@ from hummingbot.client.config.config_helpers import (
     save_to_yml,
     update_connector_hb_config,
 )
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -25,6 +27,8 @@ class Security:
     secrets_manager: Optional[BaseSecretsManager] = None
     _secure_configs = {}
     _decryption_done = asyncio.Event()
+    _connector_decryption_events: Optional[Dict[str, asyncio.Event]] = None
+    _connector_decryption_timeout: float = 30
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -52,19 +56,55 @@ class Security:
         if not validate_password(secrets_manager):
             return False
         cls.secrets_manager = secrets_manager
-        coro = AsyncCallScheduler.shared_instance().call_async(cls.decrypt_all, timeout_seconds=30)
-        safe_ensure_future(coro)
+        encrypted_files = cls._start_decryption()
+        safe_ensure_future(cls._decrypt_connector_configs(encrypted_files))
         return True
 
     @classmethod
     def decrypt_all(cls):
+        encrypted_files = cls._start_decryption()
+        with ThreadPoolExecutor() as executor:
+            for file_path, _ in zip(encrypted_files, executor.map(cls.decrypt_connector_config, encrypted_files)):
+                cls._connector_decryption_events[connector_name_from_file(file_path)].set()
+        cls._decryption_done.set()
+
+    @classmethod
+    def _start_decryption(cls) -> List[Path]:
         cls._secure_configs.clear()
         cls._decryption_done.clear()
         encrypted_files = list_connector_configs()
-        for file in encrypted_files:
-            cls.decrypt_connector_config(file)
+        cls._connector_decryption_events = {
+            connector_name_from_file(file_path): asyncio.Event() for file_path in encrypted_files
+        }
+        return encrypted_files
+
+    @classmethod
+    async def _decrypt_connector_configs(cls, encrypted_files: List[Path]):
+        await safe_gather(*[cls._decrypt_connector_config_async(file_path) for file_path in encrypted_files])
         cls._decryption_done.set()
 
+    @classmethod
+    async def _decrypt_connector_config_async(cls, file_path: Path):
+        """
+        Decrypts the connector config in the shared executor, so that the key derivations of the connector configs
+        run in parallel, and flags the connector as decrypted once done.
+        """
+        connector_name = connector_name_from_file(file_path)
+        decryption_event = cls._connector_decryption_events[connector_name]
+        try:
+            await asyncio.wait_for(
+                asyncio.get_event_loop().run_in_executor(
+                    hummingbot.get_executor(), cls.decrypt_connector_config, file_path
+                ),
+                timeout=cls._connector_decryption_timeout,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            cls.logger().error(f"Error decrypting the {connector_name} connector config.", exc_info=True)
+        finally:
+            decryption_event.set()
+
     @classmethod
     def decrypt_connector_config(cls, file_path: Path):
         connector_name = connector_name_from_file(file_path)
@@ -86,8 +126,19 @@ class Security:
         cls._secure_configs.pop(connector_name)
 
     @classmethod
-    def is_decryption_done(cls):
-        return cls._decryption_done.is_set()
+    def is_decryption_done(cls, connector_names: Optional[Iterable[str]] = None) -> bool:
+        """
+        Checks whether the connector configs are decrypted. If connector names are given, only the configs of these
+        connectors are checked.
+        """
+        if cls._decryption_done.is_set():
+            return True
+        if connector_names is None or cls._connector_decryption_events is None:
+            return False
+        return all(
+            cls._connector_decryption_events[connector_name].is_set()
+            for connector_name in set(connector_names).intersection(cls._connector_decryption_events)
+        )
 
     @classmethod
     def decrypted_value(cls, key: str) -> Optional[ClientConfigAdapter]:
@@ -98,8 +149,18 @@ class Security:
         return cls._secure_configs.copy()
 
     @classmethod
-    async def wait_til_decryption_done(cls):
-        await cls._decryption_done.wait()
+    async def wait_til_decryption_done(cls, connector_names: Optional[Iterable[str]] = None):
+        """
+        Waits for the connector configs to be decrypted. If connector names are given, only waits for the configs of
+        these connectors, connectors without a config are not waited for.
+        """
+        if connector_names is None or cls._connector_decryption_events is None:
+            await cls._decryption_done.wait()
+        else:
+            await safe_gather(*[
+                cls._connector_decryption_events[connector_name].wait()
+                for connector_name in set(connector_names).intersection(cls._connector_decryption_events)
+            ])
 
     @classmethod
     def api_keys(cls, connector_name: str) -> Dict[str, Optional[str]]:
@@ -326,6 +326,8 @@ class HummingbotApplication(*commands):
             self.strategy_file_name,
             self.strategy_name,
             self.client_config_map.market_data_collection,
+            write_behind_interval=self.client_config_map.db_write_behind_interval or None,
+            trades_performance_start=int(self.init_time * 1e3),
         )
         self.markets_recorder.start()
         if self._mqtt is not None:
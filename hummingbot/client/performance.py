@@ -1,8 +1,8 @@
 import logging
 from collections import defaultdict
 from dataclasses import dataclass
-from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from decimal import Decimal, getcontext
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import PositionAction, TradeType
@@ -224,30 +224,30 @@ class PerformanceMetrics:
             impact = Decimal(str(trade.amount)) * Decimal(str(trade.price)) * fee_percent * Decimal("-1")
         return impact
 
-    async def _calculate_fees(self, quote: str, trades: List[Any]):
-        for trade in trades:
-            fee_percent = None
-            trade_price = None
-            trade_amount = None
-            if self._is_trade_fill(trade):
-                if trade.trade_fee.get("percent") is not None:
-                    trade_price = Decimal(str(trade.price))
-                    trade_amount = Decimal(str(trade.amount))
-                    fee_percent = Decimal(str(trade.trade_fee["percent"]))
-                flat_fees = [TokenAmount(token=flat_fee["token"], amount=Decimal(flat_fee["amount"]))
-                             for flat_fee in trade.trade_fee.get("flat_fees", [])]
-            else:  # assume this is Trade object
-                if trade.trade_fee.percent is not None:
-                    trade_price = Decimal(trade.price)
-                    trade_amount = Decimal(trade.amount)
-                    fee_percent = Decimal(trade.trade_fee.percent)
-                flat_fees = trade.trade_fee.flat_fees
-
-            if fee_percent is not None:
-                self.fees[quote] += trade_price * trade_amount * fee_percent
-            for flat_fee in flat_fees:
-                self.fees[flat_fee.token] += flat_fee.amount
+    def _add_trade_fees(self, quote: str, trade: Any):
+        fee_percent = None
+        trade_price = None
+        trade_amount = None
+        if self._is_trade_fill(trade):
+            if trade.trade_fee.get("percent") is not None:
+                trade_price = Decimal(str(trade.price))
+                trade_amount = Decimal(str(trade.amount))
+                fee_percent = Decimal(str(trade.trade_fee["percent"]))
+            flat_fees = [TokenAmount(token=flat_fee["token"], amount=Decimal(flat_fee["amount"]))
+                         for flat_fee in trade.trade_fee.get("flat_fees", [])]
+        else:  # assume this is Trade object
+            if trade.trade_fee.percent is not None:
+                trade_price = Decimal(trade.price)
+                trade_amount = Decimal(trade.amount)
+                fee_percent = Decimal(trade.trade_fee.percent)
+            flat_fees = trade.trade_fee.flat_fees
+
+        if fee_percent is not None:
+            self.fees[quote] += trade_price * trade_amount * fee_percent
+        for flat_fee in flat_fees:
+            self.fees[flat_fee.token] += flat_fee.amount
 
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -262,6 +262,11 @@ class PerformanceMetrics:
                         f"using {RateOracle.get_instance()}. PNL value will be inconsistent."
                     )
 
+    async def _calculate_fees(self, quote: str, trades: List[Any]):
+        for trade in trades:
+            self._add_trade_fees(quote, trade)
+        await self._calculate_fee_in_quote(quote)
+
     def _calculate_trade_pnl(self, buys: list, sells: list):
         self.trade_pnl = self.cur_value - self.hold_value
 
@@ -302,15 +307,40 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        # The fees are calculated before the trade PnL, which aggregates the fills of the derivative orders in their
+        # first fill
+        await self._calculate_fees(quote, trades)
+        await self._calculate_value_metrics(trading_pair,
+                                            current_balances,
+                                            start_price=Decimal(str(trades[0].price)),
+                                            last_price=Decimal(str(trades[-1].price)))
+        self._calculate_trade_pnl(buys, sells)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _calculate_value_metrics(self,
+                                       trading_pair: str,
+                                       current_balances: Dict[str, Decimal],
+                                       start_price: Decimal,
+                                       last_price: Decimal):
+        """
+        Calculates the balances, prices and portfolio values from the trade volumes
+        :param trading_pair: the trading market to get performance metrics
+        :param current_balances: current user account balance
+        :param start_price: the price of the first trade
+        :param last_price: the price of the last trade, used if the rate oracle has no price for the market
+        """
+        base, quote = split_hb_trading_pair(trading_pair)
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = start_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -318,9 +348,214 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
 
-        await self._calculate_fees(quote, trades)
 
-        self.total_pnl = self.trade_pnl - self.fee_in_quote
-        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+class _AggregatedOrder:
+    """
+    The fills of an order, aggregated as PerformanceMetrics.aggregate_orders does
+    """
+    __slots__ = ("position", "price_sum", "amount", "fills", "pair")
+
+    def __init__(self, position: str):
+        self.position = position
+        self.price_sum = 0
+        self.amount = 0
+        self.fills = 0
+        self.pair: Optional[_PositionPair] = None
+
+    @property
+    def price(self) -> Decimal:
+        return self.price_sum / self.fills
+
+    def add_fill(self, trade: Any):
+        self.price_sum += trade.price
+        self.amount += trade.amount
+        self.fills += 1
+
+
+class _PositionPair:
+    """
+    An open position order paired with the order that closes it, as PerformanceMetrics.position_order pairs them
+    """
+    __slots__ = ("open", "close", "is_long", "pnl")
+
+    def __init__(self, open: _AggregatedOrder, close: _AggregatedOrder, is_long: bool):
+        self.open = open
+        self.close = close
+        self.is_long = is_long
+        self.pnl: Optional[Decimal] = None
+
+    def calculate_pnl(self) -> Decimal:
+        if self.is_long:
+            return (self.close.price - self.open.price) * self.close.amount
+        return (self.open.price - self.close.price) * self.close.amount
+
+
+class _SideOrders:
+    """
+    The buy or sell orders of a market, with their open and close position orders in the order they were created
+    """
+    __slots__ = ("orders", "opens", "closes")
+
+    def __init__(self):
+        self.orders: Dict[str, _AggregatedOrder] = {}
+        self.opens: List[_AggregatedOrder] = []
+        self.closes: List[_AggregatedOrder] = []
+
+
+class PerformanceAccumulator:
+    """
+    Keeps the performance of the trades of a market up to date trade by trade. The volumes, fees and derivative
+    positions are accumulated as PerformanceMetrics computes them, so that metrics() returns the same results as
+    PerformanceMetrics.create with every trade added, without processing the trades again.
+    """
+
+    _accumulated_fields = ("num_buys", "num_sells", "num_trades",
+                           "b_vol_base", "s_vol_base", "tot_vol_base",
+                           "b_vol_quote", "s_vol_quote", "tot_vol_quote",
+                           "avg_b_price", "avg_s_price", "avg_tot_price")
+
+    def __init__(self, trading_pair: str):
+        self.trading_pair = trading_pair
+        self._quote = split_hb_trading_pair(trading_pair)[1]
+        self._totals = PerformanceMetrics()
+        self._start_price: Optional[Decimal] = None
+        self._last_price: Optional[Decimal] = None
+        self._buys = _SideOrders()
+        self._sells = _SideOrders()
+        # Whether the first buy and the first sell are TradeFill, and the sides with a trade without position, which
+        # is what PerformanceMetrics._are_derivatives checks on the buys and on the sells
+        self._first_trade_is_fill: Dict[str, bool] = {}
+        self._nil_position_sides: Set[str] = set()
+        self._long_pairs: List[_PositionPair] = []
+        self._short_pairs: List[_PositionPair] = []
+        # Running sum of the PnL of the position pairs, valid while no addition is rounded
+        self._pnl_sum = s_decimal_0
+        self._pnl_abs_sum = s_decimal_0
+        self._pnl_min_exponent = 0
+        self._summed_pnl: Optional[Decimal] = None
+
+    @classmethod
+    def accumulate_by_market(cls, trades: List[Any]) -> Dict[Tuple[str, str], "PerformanceAccumulator"]:
+        """
+        :param trades: the list of TradeFill, in the order they were filled
+        :return: the performance accumulators of the trades of each market and trading pair
+        """
+        accumulators = {}
+        for trade in trades:
+            accumulator = accumulators.get((trade.market, trade.symbol))
+            if accumulator is None:
+                accumulator = cls(trade.symbol)
+                accumulators[(trade.market, trade.symbol)] = accumulator
+            accumulator.add_trade(trade)
+        return accumulators
+
+    @property
+    def num_trades(self) -> int:
+        return self._totals.num_trades
+
+    def add_trade(self, trade: Any):
+        """
+        :param trade: a TradeFill or Trade object, added in the order the trades were filled
+        """
+        buys, sells = self._totals._preprocess_trades_and_group_by_type([trade])
+        self._totals.num_buys += len(buys)
+        self._totals.num_sells += len(sells)
+        self._totals.num_trades = self._totals.num_buys + self._totals.num_sells
+        self._totals._add_trade_fees(self._quote, trade)
+
+        self._last_price = Decimal(str(trade.price))
+        if self._start_price is None:
+            self._start_price = self._last_price
+
+        if not buys and not sells:
+            return
+        trade_type = TradeType.BUY.name if buys else TradeType.SELL.name
+        if trade_type not in self._first_trade_is_fill:
+            self._first_trade_is_fill[trade_type] = self._totals._is_trade_fill(trade)
+        if trade.position == PositionAction.NIL.value:
+            self._nil_position_sides.add(trade_type)
+
+        if buys:
+            self._add_position_fill(trade, self._buys, self._sells, is_long=True)
+        else:
+            self._add_position_fill(trade, self._sells, self._buys, is_long=False)
+
+    async def metrics(self, current_balances: Dict[str, Decimal]) -> PerformanceMetrics:
+        """
+        Calculates PnL, fees, Return % and etc... of the trades added
+        :param current_balances: current user account balance
+        """
+        performance = PerformanceMetrics()
+        for field in self._accumulated_fields:
+            setattr(performance, field, getattr(self._totals, field))
+        performance.fees.update(self._totals.fees)
+        derivative_pnl = self._derivative_pnl() if self._are_derivatives() else None
+
+        await performance._calculate_fee_in_quote(self._quote)
+        await performance._calculate_value_metrics(self.trading_pair,
+                                                   current_balances,
+                                                   start_price=self._start_price,
+                                                   last_price=self._last_price)
+        if derivative_pnl is None:
+            performance.trade_pnl = performance.cur_value - performance.hold_value
+        else:
+            performance.trade_pnl = derivative_pnl
+
+        performance.total_pnl = performance.trade_pnl - performance.fee_in_quote
+        performance.return_pct = performance.divide(performance.total_pnl, performance.hold_value)
+        return performance
+
+    def _are_derivatives(self) -> bool:
+        return any(is_trade_fill and trade_type not in self._nil_position_sides
+                   for trade_type, is_trade_fill in self._first_trade_is_fill.items())
+
+    def _add_position_fill(self, trade: Any, side: _SideOrders, other_side: _SideOrders, is_long: bool):
+        order = side.orders.get(trade.order_id)
+        if order is None:
+            order = _AggregatedOrder(trade.position)
+            order.add_fill(trade)
+            side.orders[trade.order_id] = order
+            # An open position order is paired with the first unpaired close position order of the other side, and
+            # a close position order with the first unpaired open position order of the other side
+            if order.position == "OPEN":
+                side.opens.append(order)
+                if len(side.opens) <= len(other_side.closes):
+                    self._add_pair(_PositionPair(order, other_side.closes[len(side.opens) - 1], is_long))
+            elif order.position == "CLOSE":
+                side.closes.append(order)
+                if len(side.closes) <= len(other_side.opens):
+                    self._add_pair(_PositionPair(other_side.opens[len(side.closes) - 1], order, not is_long))
+        else:
+            order.add_fill(trade)
+            if order.pair is not None:
+                self._update_pair_pnl(order.pair)
+
+    def _add_pair(self, pair: _PositionPair):
+        pair.open.pair = pair
+        pair.close.pair = pair
+        if pair.is_long:
+            self._long_pairs.append(pair)
+        else:
+            self._short_pairs.append(pair)
+        self._update_pair_pnl(pair)
+
+    def _update_pair_pnl(self, pair: _PositionPair):
+        pnl = pair.calculate_pnl()
+        if pair.pnl is not None:
+            self._pnl_sum -= pair.pnl
+        self._pnl_sum += pnl
+        pair.pnl = pnl
+        self._pnl_abs_sum += abs(pnl)
+        self._pnl_min_exponent = min(self._pnl_min_exponent, pnl.as_tuple().exponent)
+        self._summed_pnl = None
+
+    def _derivative_pnl(self) -> Decimal:
+        # While every PnL and their sum fit in the decimal precision no addition is rounded, and the running sum is
+        # the sum of the PnL in any order. Otherwise they are summed in the order of PerformanceMetrics.derivative_pnl.
+        if self._pnl_abs_sum.adjusted() < getcontext().prec + self._pnl_min_exponent - 1:
+            return Decimal(str(self._pnl_sum))
+        if self._summed_pnl is None:
+            self._summed_pnl = Decimal(str(sum([pair.pnl for pair in self._long_pairs] +
+                                               [pair.pnl for pair in self._short_pairs])))
+        return self._summed_pnl
@@ -1,11 +1,12 @@
 import importlib
 import json
+import os
 from decimal import Decimal
 from enum import Enum
 from os import DirEntry, scandir
 from os.path import exists, join, realpath
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from pydantic import SecretStr
 
@@ -39,6 +40,7 @@ CLIENT_CONFIG_PATH = CONF_DIR_PATH / "conf_client.yml"
 TRADE_FEES_CONFIG_PATH = CONF_DIR_PATH / "conf_fee_overrides.yml"
 STRATEGIES_CONF_DIR_PATH = CONF_DIR_PATH / "strategies"
 CONNECTORS_CONF_DIR_PATH = CONF_DIR_PATH / "connectors"
+CONNECTOR_SETTINGS_CACHE_PATH = CONF_DIR_PATH / "connector_settings_cache.json"
 CONF_PREFIX = "conf_"
 CONF_POSTFIX = "_strategy"
 PMM_SCRIPTS_PATH = root_path() / "pmm_scripts"
@@ -450,6 +452,26 @@ class ConnectorSetting(NamedTuple):
         return self.type.name.lower()
 
 
+CONFIG_KEYS_INDEX = ConnectorSetting._fields.index("config_keys")
+
+
+class CachedConnectorSetting(ConnectorSetting):
+    """
+    Connector setting loaded from the connector settings cache. Its config_keys holds the (utils module, attribute,
+    domain) the config keys are defined in, and they are imported the first time they are used.
+    """
+    __slots__ = ()
+
+    @property
+    def config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        config_keys_source: Optional[Tuple[str, str, Optional[str]]] = tuple.__getitem__(self, CONFIG_KEYS_INDEX)
+        if config_keys_source is None:
+            return None
+        util_module_path, attribute, domain = config_keys_source
+        config_keys = getattr(importlib.import_module(util_module_path), attribute)
+        return config_keys if domain is None else config_keys[domain]
+
+
 class AllConnectorSettings:
     paper_trade_connectors_names: List[str] = []
     all_connector_settings: Dict[str, ConnectorSetting] = {}
@@ -458,9 +480,48 @@ class AllConnectorSettings:
     def create_connector_settings(cls):
         """
         Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+        The settings are loaded from the connector settings cache, the connectors utils modules are only imported if
+        the cache was created by another version or the utils modules changed since. The cache is not saved while a
+        connector is missing one of its dependencies, so that the connector is added once the dependency is installed.
         """
         cls.all_connector_settings = {}  # reset
+        util_modules: List[Tuple[str, str, str]] = cls._connector_util_modules()
+        fingerprint: Dict[str, Any] = cls._connector_settings_fingerprint(util_modules)
+        if not cls._load_connector_settings_cache(fingerprint):
+            missing_dependencies = cls._import_connector_settings(util_modules)
+            if len(missing_dependencies) == 0:
+                cls._save_connector_settings_cache(fingerprint)
+
+        # add gateway connectors
+        gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
+        trade_fee_settings: List[float] = [0.0, 0.0]  # we assume no swap fees for now
+        trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema("gateway", trade_fee_settings)
+
+        for connection_spec in gateway_connections_conf:
+            market_name: str = GatewayConnectionSetting.get_market_name_from_connector_spec(connection_spec)
+            cls.all_connector_settings[market_name] = ConnectorSetting(
+                name=market_name,
+                type=ConnectorType[connection_spec["trading_type"]],
+                centralised=False,
+                example_pair="WETH-USDC",
+                use_ethereum_wallet=False,
+                trade_fee_schema=trade_fee_schema,
+                config_keys=None,
+                is_sub_domain=False,
+                parent_name=None,
+                domain_parameter=None,
+                use_eth_gas_lookup=False,
+            )
+
+        return cls.all_connector_settings
+
+    @staticmethod
+    def _connector_util_modules() -> List[Tuple[str, str, str]]:
+        """
+        :return: the connector type directory, connector name and utils module path of every connector
+        """
         connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+        util_modules = []
 
         type_dirs: List[DirEntry] = [
             cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
@@ -476,73 +537,145 @@ class AllConnectorSettings:
             for connector_dir in connector_dirs:
                 if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
                     continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
+                util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
+                                        f"{connector_dir.name}.{connector_dir.name}_utils"
+                util_modules.append((type_dir.name, connector_dir.name, util_module_path))
+        return util_modules
 
-        # add gateway connectors
-        gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
-        trade_fee_settings: List[float] = [0.0, 0.0]  # we assume no swap fees for now
-        trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema("gateway", trade_fee_settings)
+    @staticmethod
+    def _connector_settings_fingerprint(util_modules: List[Tuple[str, str, str]]) -> Dict[str, Any]:
+        """
+        Identifies the connectors the settings are created from: the Hummingbot version, and the modification time of
+        every connector utils module.
+        """
+        with open(root_path() / "hummingbot" / "VERSION") as version_file:
+            version = version_file.read().strip()
+        modification_times = {}
+        for _, _, util_module_path in util_modules:
+            try:
+                modification_times[util_module_path] = os.stat(
+                    root_path().joinpath(*util_module_path.split(".")).with_suffix(".py")).st_mtime_ns
+            except OSError:
+                modification_times[util_module_path] = None
+        return {"version": version, "util_modules": modification_times}
 
-        for connection_spec in gateway_connections_conf:
-            market_name: str = GatewayConnectionSetting.get_market_name_from_connector_spec(connection_spec)
-            cls.all_connector_settings[market_name] = ConnectorSetting(
-                name=market_name,
-                type=ConnectorType[connection_spec["trading_type"]],
-                centralised=False,
-                example_pair="WETH-USDC",
-                use_ethereum_wallet=False,
+    @classmethod
+    def _import_connector_settings(cls, util_modules: List[Tuple[str, str, str]]) -> List[str]:
+        """
+        :return: the names of the connectors skipped because one of the modules their utils module imports is missing
+        """
+        missing_dependencies = []
+        for type_dir_name, connector_name, util_module_path in util_modules:
+            if connector_name in cls.all_connector_settings:
+                raise Exception(f"Multiple connectors with the same {connector_name} name.")
+            try:
+                util_module = importlib.import_module(util_module_path)
+            except ModuleNotFoundError as e:
+                if e.name != util_module_path:
+                    missing_dependencies.append(connector_name)
+                continue
+            trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+            trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
+                connector_name, trade_fee_settings
+            )
+            cls.all_connector_settings[connector_name] = ConnectorSetting(
+                name=connector_name,
+                type=ConnectorType[type_dir_name.capitalize()],
+                centralised=getattr(util_module, "CENTRALIZED", True),
+                example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
+                use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
                 trade_fee_schema=trade_fee_schema,
-                config_keys=None,
+                config_keys=getattr(util_module, "KEYS", None),
                 is_sub_domain=False,
                 parent_name=None,
                 domain_parameter=None,
-                use_eth_gas_lookup=False,
+                use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
             )
+            # Adds other domains of connector
+            other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+            for domain in other_domains:
+                trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+                trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
+                parent = cls.all_connector_settings[connector_name]
+                cls.all_connector_settings[domain] = ConnectorSetting(
+                    name=domain,
+                    type=parent.type,
+                    centralised=parent.centralised,
+                    example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                    use_ethereum_wallet=parent.use_ethereum_wallet,
+                    trade_fee_schema=trade_fee_schema,
+                    config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
+                    is_sub_domain=True,
+                    parent_name=parent.name,
+                    domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                    use_eth_gas_lookup=parent.use_eth_gas_lookup,
+                )
+        return missing_dependencies
 
-        return cls.all_connector_settings
+    @classmethod
+    def _load_connector_settings_cache(cls, fingerprint: Dict[str, Any]) -> bool:
+        """
+        :return: False if there is no cache for the connectors fingerprint
+        """
+        try:
+            with open(CONNECTOR_SETTINGS_CACHE_PATH) as cache_file:
+                cache: Dict[str, Any] = json.load(cache_file)
+            if cache["fingerprint"] != fingerprint:
+                return False
+            for setting in cache["connector_settings"]:
+                config_keys_source = setting["config_keys"]
+                cls.all_connector_settings[setting["name"]] = CachedConnectorSetting(
+                    name=setting["name"],
+                    type=ConnectorType[setting["type"]],
+                    centralised=setting["centralised"],
+                    example_pair=setting["example_pair"],
+                    use_ethereum_wallet=setting["use_ethereum_wallet"],
+                    trade_fee_schema=TradeFeeSchema.from_json(setting["trade_fee_schema"]),
+                    config_keys=tuple(config_keys_source) if config_keys_source is not None else None,
+                    is_sub_domain=setting["is_sub_domain"],
+                    parent_name=setting["parent_name"],
+                    domain_parameter=setting["domain_parameter"],
+                    use_eth_gas_lookup=setting["use_eth_gas_lookup"],
+                )
+        except (OSError, ValueError, KeyError, TypeError):
+            cls.all_connector_settings = {}
+            return False
+        return True
+
+    @classmethod
+    def _save_connector_settings_cache(cls, fingerprint: Dict[str, Any]):
+        connector_settings = []
+        for setting in cls.all_connector_settings.values():
+            util_module_path = (f"hummingbot.connector.{setting.type.name.lower()}.{setting.base_name()}."
+                                f"{setting.base_name()}_utils")
+            if setting.config_keys is None:
+                config_keys_source = None
+            elif setting.is_sub_domain:
+                config_keys_source = [util_module_path, "OTHER_DOMAINS_KEYS", setting.name]
+            else:
+                config_keys_source = [util_module_path, "KEYS", None]
+            connector_settings.append({
+                "name": setting.name,
+                "type": setting.type.name,
+                "centralised": setting.centralised,
+                "example_pair": setting.example_pair,
+                "use_ethereum_wallet": setting.use_ethereum_wallet,
+                "trade_fee_schema": setting.trade_fee_schema.to_json(),
+                "config_keys": config_keys_source,
+                "is_sub_domain": setting.is_sub_domain,
+                "parent_name": setting.parent_name,
+                "domain_parameter": setting.domain_parameter,
+                "use_eth_gas_lookup": setting.use_eth_gas_lookup,
+            })
+        # The cache is replaced at once, so that it is never read partially written
+        temporary_cache_path = f"{CONNECTOR_SETTINGS_CACHE_PATH}.tmp"
+        try:
+            with open(temporary_cache_path, "w") as cache_file:
+                json.dump({"fingerprint": fingerprint, "connector_settings": connector_settings}, cache_file)
+            os.replace(temporary_cache_path, CONNECTOR_SETTINGS_CACHE_PATH)
+        except OSError:
+            # The settings are created from the connectors utils modules on the next start
+            pass
 
     @classmethod
     def initialize_paper_trade_settings(cls, paper_trade_exchanges: List[str]):
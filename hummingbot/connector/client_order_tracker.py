@@ -2,8 +2,7 @@ import asyncio
 import logging
 from collections import defaultdict
 from decimal import Decimal
-from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Mapping, Optional
 
 from cachetools import TTLCache
 
@@ -29,6 +28,88 @@ if TYPE_CHECKING:
 cot_logger = None
 
 
+class OrdersView(Mapping):
+    """
+    Read only view of several order dictionaries as if they were merged, the later dictionaries taking precedence.
+    Looking up an order doesn't copy the dictionaries. Iterating takes a snapshot of the merged orders, so the
+    dictionaries can change while iterating.
+    """
+
+    def __init__(self, *orders_maps: Mapping[str, InFlightOrder]):
+        self._orders_maps = orders_maps[::-1]
+
+    def __getitem__(self, key: str) -> InFlightOrder:
+        for orders in self._orders_maps:
+            order = orders.get(key)
+            if order is not None:
+                return order
+        raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return any(key in orders for orders in self._orders_maps)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._merged())
+
+    def __len__(self) -> int:
+        return len(self._merged())
+
+    def keys(self):
+        return self._merged().keys()
+
+    def values(self):
+        return self._merged().values()
+
+    def items(self):
+        return self._merged().items()
+
+    def copy(self) -> Dict[str, InFlightOrder]:
+        return self._merged()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._merged()})"
+
+    def _merged(self) -> Dict[str, InFlightOrder]:
+        merged = {}
+        for orders in reversed(self._orders_maps):
+            merged.update(orders.items())
+        return merged
+
+
+class OrdersByExchangeOrderIdView(Mapping):
+    """
+    Read only view of tracked orders by exchange order id, backed by the exchange order id index of the tracker.
+    """
+
+    def __init__(self, tracker: "ClientOrderTracker", orders: OrdersView):
+        self._tracker = tracker
+        self._orders = orders
+
+    def __getitem__(self, exchange_order_id: str) -> InFlightOrder:
+        order = self._tracker._fetch_indexed_order(exchange_order_id=exchange_order_id, orders=self._orders)
+        if order is None:
+            raise KeyError(exchange_order_id)
+        return order
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._merged())
+
+    def __len__(self) -> int:
+        return len(self._merged())
+
+    def keys(self):
+        return self._merged().keys()
+
+    def values(self):
+        return self._merged().values()
+
+    def items(self):
+        return self._merged().items()
+
+    def _merged(self) -> Dict[str, InFlightOrder]:
+        return {order.exchange_order_id: order for order in self._orders.values()}
+
+
 class ClientOrderTracker:
 
     MAX_CACHE_SIZE = 1000
@@ -57,6 +138,10 @@ class ClientOrderTracker:
         self._in_flight_orders: Dict[str, InFlightOrder] = {}
         self._cached_orders: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
         self._lost_orders: Dict[str, InFlightOrder] = {}
+        # Orders by exchange order id, and orders that didn't have an exchange order id when they were indexed.
+        # Entries are checked when read, orders that are no longer tracked are removed when they are found
+        self._orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._orders_without_exchange_order_id: Dict[str, InFlightOrder] = {}
 
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
@@ -74,7 +159,7 @@ class ClientOrderTracker:
         """
         Returns orders that are no longer actively tracked.
         """
-        return {client_order_id: order for client_order_id, order in self._cached_orders.items()}
+        return dict(self._cached_orders.items())
 
     @property
     def all_orders(self) -> Dict[str, InFlightOrder]:
@@ -84,39 +169,33 @@ class ClientOrderTracker:
         return {**self.active_orders, **self.cached_orders}
 
     @property
-    def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns all orders that could still be impacted by trades: active orders, cached orders and lost orders
+        Returns a read only view of all orders that could still be impacted by trades: active orders, cached orders
+        and lost orders
         """
-        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+        return OrdersView(self._in_flight_orders, self._cached_orders, self._lost_orders)
 
     @property
-    def all_fillable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_fillable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order
-            for order in chain(self.active_orders.values(), self.cached_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return OrdersByExchangeOrderIdView(tracker=self, orders=self.all_fillable_orders)
 
     @property
-    def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns all orders that could receive status updates
+        Returns a read only view of all orders that could receive status updates
         """
-        return {**self.active_orders, **self.lost_orders}
+        return OrdersView(self._in_flight_orders, self._lost_orders)
 
     @property
-    def all_updatable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_updatable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order for order in chain(self.active_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return OrdersByExchangeOrderIdView(tracker=self, orders=self.all_updatable_orders)
 
     @property
     def current_timestamp(self) -> int:
@@ -130,7 +209,7 @@ class ClientOrderTracker:
         """
         Returns a dictionary of all orders marked as failed after not being found more times than the configured limit
         """
-        return {client_order_id: order for client_order_id, order in self._lost_orders.items()}
+        return dict(self._lost_orders)
 
     @property
     def lost_order_count_limit(self) -> int:
@@ -142,6 +221,7 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._index_order(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
@@ -162,6 +242,7 @@ class ClientOrderTracker:
             elif order.is_failure:
                 # If the order is marked as failed but is still in the tracking states, it was a lost order
                 self._lost_orders[order.client_order_id] = order
+                self._index_order(order)
 
     def fetch_tracked_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._in_flight_orders.get(client_order_id, None)
@@ -172,28 +253,21 @@ class ClientOrderTracker:
     def fetch_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
-        found_order = None
+        found_order = self._cached_orders.get(client_order_id) or self._in_flight_orders.get(client_order_id)
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None
-            )
+        if found_order is None and exchange_order_id is not None:
+            found_order = self._fetch_indexed_order(
+                exchange_order_id=exchange_order_id, orders=OrdersView(self._in_flight_orders, self._cached_orders))
 
         return found_order
 
     def fetch_lost_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
-        found_order = None
+        found_order = self._lost_orders.get(client_order_id)
 
-        if client_order_id in self._lost_orders:
-            found_order = self._lost_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self._lost_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+        if found_order is None and exchange_order_id is not None:
+            found_order = self._fetch_indexed_order(exchange_order_id=exchange_order_id, orders=self._lost_orders)
 
         return found_order
 
@@ -203,7 +277,9 @@ class ClientOrderTracker:
     def process_trade_update(self, trade_update: TradeUpdate):
         client_order_id: str = trade_update.client_order_id
 
-        tracked_order: Optional[InFlightOrder] = self.all_fillable_orders.get(client_order_id)
+        tracked_order: Optional[InFlightOrder] = (self._lost_orders.get(client_order_id)
+                                                  or self._cached_orders.get(client_order_id)
+                                                  or self._in_flight_orders.get(client_order_id))
 
         if tracked_order:
             previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
@@ -249,6 +325,7 @@ class ClientOrderTracker:
                     await self._process_order_update(order_update)
                     del self._cached_orders[client_order_id]
                     self._lost_orders[tracked_order.client_order_id] = tracked_order
+                    self._index_order(tracked_order)
         else:
             lost_order = self._lost_orders.get(client_order_id)
             if lost_order is not None:
@@ -291,6 +368,7 @@ class ClientOrderTracker:
 
             updated: bool = tracked_order.update_with_order_update(order_update)
             if updated:
+                self._index_order(tracked_order)
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
         else:
@@ -304,6 +382,48 @@ class ClientOrderTracker:
             else:
                 self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
+    def _index_order(self, order: InFlightOrder):
+        if order.exchange_order_id is None:
+            self._orders_without_exchange_order_id[order.client_order_id] = order
+        else:
+            self._orders_by_exchange_order_id[order.exchange_order_id] = order
+            self._orders_without_exchange_order_id.pop(order.client_order_id, None)
+            if len(self._orders_by_exchange_order_id) > 2 * (self.MAX_CACHE_SIZE + len(self._in_flight_orders)
+                                                             + len(self._lost_orders)):
+                self._remove_untracked_orders_from_index()
+
+    def _fetch_indexed_order(self, exchange_order_id: str, orders: Mapping[str, InFlightOrder]) -> Optional[InFlightOrder]:
+        """
+        Finds an order by exchange order id with the index, the order has to be one of the orders provided
+        """
+        order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        if order is None or order.exchange_order_id != exchange_order_id:
+            # The exchange order id might have been assigned to an order directly
+            self._index_orders_without_exchange_order_id()
+            order = self._orders_by_exchange_order_id.get(exchange_order_id)
+
+        if order is None or order.exchange_order_id != exchange_order_id or orders.get(order.client_order_id) is not order:
+            return None
+        return order
+
+    def _index_orders_without_exchange_order_id(self):
+        for client_order_id, order in list(self._orders_without_exchange_order_id.items()):
+            if order.exchange_order_id is not None:
+                self._index_order(order)
+            elif not self._is_tracked(order):
+                del self._orders_without_exchange_order_id[client_order_id]
+
+    def _remove_untracked_orders_from_index(self):
+        self._orders_by_exchange_order_id = {
+            exchange_order_id: order
+            for exchange_order_id, order in self._orders_by_exchange_order_id.items()
+            if order.exchange_order_id == exchange_order_id and self._is_tracked(order)
+        }
+
+    def _is_tracked(self, order: InFlightOrder) -> bool:
+        return any(orders.get(order.client_order_id) is order
+                   for orders in (self._in_flight_orders, self._cached_orders, self._lost_orders))
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
@@ -1,4 +1,5 @@
 import asyncio
+import json
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
@@ -120,6 +121,13 @@ class BinanceExchange(ExchangePyBase):
         pairs_prices = await self._api_get(path_url=CONSTANTS.TICKER_BOOK_PATH_URL)
         return pairs_prices
 
+    async def get_pairs_prices(self, symbols: List[str]) -> List[Dict[str, str]]:
+        pairs_prices = await self._api_get(
+            path_url=CONSTANTS.TICKER_BOOK_PATH_URL,
+            params={"symbols": json.dumps(symbols, separators=(",", ":"))},
+        )
+        return pairs_prices
+
     def _is_request_exception_related_to_time_synchronizer(self, request_exception: Exception):
         error_description = str(request_exception)
         is_time_synchronizer_related = ("-1021" in error_description
@@ -45,6 +45,7 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    MAX_CONCURRENT_ORDER_UPDATES = 20
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -76,7 +77,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            coalesce_diffs=client_config_map.order_book_coalesce_diffs))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
@@ -183,6 +185,15 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         return all(self.status_dict.values())
 
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        """
+        Returns True if the connector is ready to operate on the trading pair, even if the order books of other trading
+        pairs are still being initialized.
+        """
+        status = self.status_dict
+        status.pop("order_books_initialized", None)
+        return all(status.values()) and self.order_book_tracker.is_order_book_ready(trading_pair)
+
     @property
     def name_cap(self) -> str:
         return self.name.capitalize()
@@ -951,18 +962,55 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
-        for order in orders:
-            try:
-                trade_updates = await self._all_trade_updates_for_order(order=order)
-                for trade_update in trade_updates:
-                    self._order_tracker.process_trade_update(trade_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                self.logger().warning(
-                    f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
-                    exc_info=request_error,
-                )
+        """
+        Processes the fills of the orders, requested in a single call when the connector supports it
+        (see _request_batch_trade_updates) and otherwise, or if that call fails, concurrently for every order
+        """
+        if len(orders) == 0:
+            return
+        try:
+            batch_trade_updates = await self._request_batch_trade_updates(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch the trade updates of {len(orders)} orders in a single request. "
+                f"Error: {request_error}",
+                exc_info=request_error,
+            )
+            batch_trade_updates = None
+
+        if batch_trade_updates is None:
+            await self._run_concurrently_for_orders(orders=orders, function=self._update_order_fills)
+        else:
+            for trade_update in batch_trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+
+    async def _update_order_fills(self, order: InFlightOrder):
+        try:
+            trade_updates = await self._all_trade_updates_for_order(order=order)
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
+                exc_info=request_error,
+            )
+
+    async def _run_concurrently_for_orders(self, orders: List[InFlightOrder], function: Callable):
+        """
+        Runs function(order) for all the orders concurrently, with at most MAX_CONCURRENT_ORDER_UPDATES running at the
+        same time. The requests are still subject to the rate limits of the throttler.
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ORDER_UPDATES)
+
+        async def run_for_order(order: InFlightOrder):
+            async with semaphore:
+                await function(order)
+
+        await safe_gather(*[run_for_order(order) for order in orders])
 
     async def _handle_update_error_for_active_order(self, order: InFlightOrder, error: Exception):
         try:
@@ -991,7 +1039,32 @@ class ExchangePyBase(ExchangeBase, ABC):
             self.logger().warning(f"Error fetching status update for the lost order {order.client_order_id}: {error}.")
 
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
+        """
+        Processes the status of the orders. The connector can provide the status of several orders in a single call
+        (see _request_batch_order_status), the status of the rest of orders is requested concurrently for every order
+        """
+        if len(orders) == 0:
+            return
+        batch_order_updates = {}
+        try:
+            batch_order_updates = await self._request_batch_order_status(orders=orders) or {}
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch the status of {len(orders)} orders in a single request. Error: {request_error}",
+                exc_info=request_error,
+            )
+
+        pending_orders = []
         for order in orders:
+            order_update = batch_order_updates.get(order.client_order_id)
+            if order_update is not None:
+                self._order_tracker.process_order_update(order_update)
+            else:
+                pending_orders.append(order)
+
+        async def update_order(order: InFlightOrder):
             try:
                 order_update = await self._request_order_status(tracked_order=order)
                 self._order_tracker.process_order_update(order_update)
@@ -1000,6 +1073,8 @@ class ExchangePyBase(ExchangeBase, ABC):
             except Exception as request_error:
                 await error_handler(order, request_error)
 
+        await self._run_concurrently_for_orders(orders=pending_orders, function=update_order)
+
     async def _update_orders(self):
         orders_to_update = self.in_flight_orders.copy()
         await self._update_orders_with_error_handler(
@@ -1050,6 +1125,27 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _request_batch_trade_updates(self, orders: List[InFlightOrder]) -> Optional[List[TradeUpdate]]:
+        """
+        Connectors with an endpoint that returns the account trades (e.g. all trades since a timestamp) can override
+        this method to request the fills of all the orders in one or a few calls.
+
+        :param orders: the orders to request the fills for
+        :return: the trade updates of all the orders, or None to request the fills of every order separately
+        """
+        return None
+
+    async def _request_batch_order_status(self, orders: List[InFlightOrder]) -> Optional[Dict[str, OrderUpdate]]:
+        """
+        Connectors with an endpoint that returns the status of several orders (e.g. all the open orders) can override
+        this method to request the status of the orders in one or a few calls.
+
+        :param orders: the orders to request the status for
+        :return: the order updates by client order id. The status of the orders without an update is requested
+        separately for every order
+        """
+        return None
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
@@ -5,9 +5,10 @@ import logging
 import re
 import time
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union, cast
 
 from async_timeout import timeout
+from cachetools import TTLCache
 
 from hummingbot.client.settings import GatewayConnectionSetting
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
@@ -29,7 +30,6 @@ from hummingbot.core.event.events import (
 from hummingbot.core.gateway import check_transaction_exceptions
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.logger import HummingbotLogger
@@ -49,6 +49,7 @@ class GatewayEVMAMM(ConnectorBase):
 
     API_CALL_TIMEOUT = 10.0
     POLL_INTERVAL = 1.0
+    QUOTE_CACHE_MAXSIZE = 100
     UPDATE_BALANCE_INTERVAL = 30.0
     APPROVAL_ORDER_ID_PATTERN = re.compile(r"approve-(\w+)-(\w+)")
 
@@ -72,6 +73,9 @@ class GatewayEVMAMM(ConnectorBase):
     _poll_notifier: Optional[asyncio.Event]
     _native_currency: str
     _amount_quantum_dict: Dict[str, Decimal]
+    _quote_cache: TTLCache
+    _quote_requests: Dict[Tuple, asyncio.Future]
+    _quote_cache_stats: Dict[str, int]
 
     def __init__(self,
                  client_config_map: "ClientConfigAdapter",
@@ -115,6 +119,10 @@ class GatewayEVMAMM(ConnectorBase):
         self._network_transaction_fee: Optional[TokenAmount] = None
         self._order_tracker: ClientOrderTracker = ClientOrderTracker(connector=self, lost_order_count_limit=10)
         self._amount_quantum_dict = {}
+        self._quote_cache = TTLCache(maxsize=self.QUOTE_CACHE_MAXSIZE,
+                                     ttl=client_config_map.gateway.gateway_quote_cache_ttl)
+        self._quote_requests = {}
+        self._quote_cache_stats = {"hits": 0, "coalesced": 0, "misses": 0}
         safe_ensure_future(self.load_token_data())
 
     @classmethod
@@ -143,6 +151,25 @@ class GatewayEVMAMM(ConnectorBase):
     def name(self):
         return self._name
 
+    @property
+    def quote_cache_ttl(self) -> float:
+        return self._quote_cache.ttl
+
+    @quote_cache_ttl.setter
+    def quote_cache_ttl(self, ttl: float):
+        """
+        Sets how long quote prices are reused, e.g. the block time of the network. The cached quotes are discarded.
+        """
+        self._quote_cache = TTLCache(maxsize=self.QUOTE_CACHE_MAXSIZE, ttl=ttl)
+
+    @property
+    def quote_cache_stats(self) -> Dict[str, int]:
+        """
+        Counts of quote prices returned from the cache (hits), from an identical request in flight (coalesced), and
+        requested to gateway (misses).
+        """
+        return dict(self._quote_cache_stats)
+
     @property
     def address(self):
         return self._wallet_address
@@ -223,10 +250,8 @@ class GatewayEVMAMM(ConnectorBase):
         Updates inflight order statuses from API results
         This is used by the MarketsRecorder class to orchestrate market classes at a higher level.
         """
-        self._order_tracker._in_flight_orders.update({
-            key: GatewayInFlightOrder.from_json(value)
-            for key, value in saved_states.items()
-        })
+        for value in saved_states.values():
+            self._order_tracker.start_tracking_order(GatewayInFlightOrder.from_json(value))
 
     def create_approval_order_id(self, token_symbol: str) -> str:
         return f"approve-{self.connector_name}-{token_symbol}"
@@ -408,7 +433,6 @@ class GatewayEVMAMM(ConnectorBase):
             return Decimal(str(price))
         return None
 
-    @async_ttl_cache(ttl=5, maxsize=10)
     async def get_quote_price(
             self,
             trading_pair: str,
@@ -417,7 +441,8 @@ class GatewayEVMAMM(ConnectorBase):
             ignore_shim: bool = False
     ) -> Optional[Decimal]:
         """
-        Retrieves a quote price.
+        Retrieves a quote price. Quote prices are reused for quote_cache_ttl seconds, and concurrent requests for the
+        same quote share a single gateway request.
 
         :param trading_pair: The market trading pair
         :param is_buy: True for an intention to buy, False for an intention to sell
@@ -425,7 +450,36 @@ class GatewayEVMAMM(ConnectorBase):
         :param ignore_shim: Ignore the price shim, and return the real price on the network
         :return: The quote price.
         """
-
+        key = (self.chain, self.network, trading_pair, is_buy, Decimal(amount), ignore_shim)
+        price = self._quote_cache.get(key)
+        if price is not None:
+            self._quote_cache_stats["hits"] += 1
+            return price
+
+        request = self._quote_requests.get(key)
+        if request is not None:
+            self._quote_cache_stats["coalesced"] += 1
+        else:
+            self._quote_cache_stats["misses"] += 1
+            request = safe_ensure_future(self._request_quote_price(trading_pair, is_buy, amount, ignore_shim))
+            self._quote_requests[key] = request
+            request.add_done_callback(lambda done_request: self._quote_request_done(key, done_request))
+        # Callers being cancelled don't cancel the request shared with the other callers
+        return await asyncio.shield(request)
+
+    def _quote_request_done(self, key: Tuple, request: asyncio.Future):
+        del self._quote_requests[key]
+        # Unavailable quotes are requested again
+        if not request.cancelled() and request.exception() is None and request.result() is not None:
+            self._quote_cache[key] = request.result()
+
+    async def _request_quote_price(
+            self,
+            trading_pair: str,
+            is_buy: bool,
+            amount: Decimal,
+            ignore_shim: bool = False
+    ) -> Optional[Decimal]:
         base, quote = trading_pair.split("-")
         side: TradeType = TradeType.BUY if is_buy else TradeType.SELL
 
@@ -10,7 +10,6 @@ from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.in_flight_order import OrderState, OrderUpdate
 from hummingbot.core.data_type.trade_fee import TokenAmount
-from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
@@ -163,24 +162,13 @@ class GatewayNearAMM(GatewayEVMAMM):
         """
         pass
 
-    @async_ttl_cache(ttl=5, maxsize=10)
-    async def get_quote_price(
+    async def _request_quote_price(
             self,
             trading_pair: str,
             is_buy: bool,
             amount: Decimal,
             ignore_shim: bool = False
     ) -> Optional[Decimal]:
-        """
-        Retrieves a quote price.
-
-        :param trading_pair: The market trading pair
-        :param is_buy: True for an intention to buy, False for an intention to sell
-        :param amount: The amount required (in base token unit)
-        :param ignore_shim: Ignore the price shim, and return the real price on the network
-        :return: The quote price.
-        """
-
         base, quote = trading_pair.split("-")
         side: TradeType = TradeType.BUY if is_buy else TradeType.SELL
 
@@ -18,7 +18,6 @@ from hummingbot.core.data_type.trade_fee import TokenAmount
 from hummingbot.core.event.events import AccountEvent, PositionModeChangeEvent, TradeType
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
@@ -125,8 +124,7 @@ class GatewayEVMAMMPerpetual(GatewayEVMAMM, PerpetualTrading):
     def get_order_size_quantum(self, trading_pair: str, price: Decimal) -> Decimal:
         return Decimal("1e-18")
 
-    @async_ttl_cache(ttl=5, maxsize=10)
-    async def get_quote_price(
+    async def _request_quote_price(
             self,
             trading_pair: str,
             is_buy: bool,
@@ -134,15 +132,8 @@ class GatewayEVMAMMPerpetual(GatewayEVMAMM, PerpetualTrading):
             ignore_shim: bool = False
     ) -> Optional[Decimal]:
         """
-        Retrieves a quote price.
-
-        :param trading_pair: The market trading pair
-        :param is_buy: True for an intention to buy, False for an intention to sell
-        :param amount: The amount required (in base token unit)
-        :param ignore_shim: Ignore the price shim, and return the real price on the network
-        :return: The quote price.
+        Requests the mark price of the perpetual market. Quote prices are cached and coalesced by get_quote_price.
         """
-
         base, quote = trading_pair.split("-")
         side: PositionSide = PositionSide.LONG if is_buy else PositionSide.SHORT
 
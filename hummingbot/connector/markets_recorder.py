@@ -4,15 +4,18 @@ import logging
 import os.path
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from decimal import Decimal
+from itertools import islice
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
 from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap
+from hummingbot.client.performance import PerformanceAccumulator
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import PriceType
@@ -35,6 +38,7 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.logger import HummingbotLogger
+from hummingbot.model.columnar_market_data import ColumnarMarketDataWriter
 from hummingbot.model.executors import Executors
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_data import MarketData
@@ -50,6 +54,12 @@ from hummingbot.smart_components.executors.arbitrage_executor.arbitrage_executor
 from hummingbot.smart_components.executors.dca_executor.dca_executor import DCAExecutor
 from hummingbot.smart_components.executors.position_executor.position_executor import PositionExecutor
 
+# A queued database write, with the display name and the tracking states of its market at the time of the event
+PendingWrite = Tuple[Callable[[Session], Optional[bool]],
+                     Optional[str],
+                     Optional[Dict[str, Any]],
+                     Optional[Callable[[], None]]]
+
 
 class MarketsRecorder:
     _logger = None
@@ -76,7 +86,17 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 write_behind_interval: Optional[float] = None,
+                 write_behind_batch_size: int = 100,
+                 trades_performance_start: Optional[int] = None):
+        """
+        :param write_behind_interval: if set, the order events are not written to the database when they arrive.
+            They are queued and written in a single transaction by a writer thread every write_behind_interval seconds
+        :param write_behind_batch_size: number of queued writes that triggers a write before the interval is over
+        :param trades_performance_start: if set, the trades performance includes the trades of the config stored
+            since this timestamp (in milliseconds), and the trades filled after this timestamp only
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -87,6 +107,29 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._market_data_writer: Optional[ColumnarMarketDataWriter] = None
+        if market_data_collection.market_data_collection_storage in ("columnar", "columnar_npy"):
+            self._market_data_writer = ColumnarMarketDataWriter(
+                root_path=os.path.join(data_path(), "market_data"),
+                depth=market_data_collection.market_data_collection_depth,
+                compressed=market_data_collection.market_data_collection_storage == "columnar",
+                write_in_background=True,
+            )
+        self._write_behind_interval: Optional[float] = write_behind_interval
+        self._write_behind_batch_size: int = write_behind_batch_size
+        self._write_behind_task: Optional[asyncio.Task] = None
+        self._writer_executor: Optional[ThreadPoolExecutor] = None
+        self._last_write_future: Optional[Future] = None
+        self._pending_writes: List[PendingWrite] = []
+        if write_behind_interval is not None:
+            self._writer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="markets_recorder")
+        # Creation timestamp of the known orders, to avoid loading the order record when exporting its fills
+        self._order_creation_timestamps: Dict[str, int] = {}
+        # Performance of the trades of each market and trading pair, updated with every fill
+        self._trades_performance: Dict[Tuple[str, str], PerformanceAccumulator] = {}
+        self._trades_performance_start: Optional[int] = trades_performance_start
+        if trades_performance_start is not None:
+            self._load_trades_performance(trades_performance_start)
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -96,6 +139,7 @@ class MarketsRecorder:
 
             exchange_order_ids = self.get_orders_for_config_and_market(self._config_file_path, market, True, 2000)
             market.add_exchange_order_ids_from_market_recorder({o.exchange_order_id: o.id for o in exchange_order_ids})
+            self._order_creation_timestamps.update({o.id: o.creation_timestamp for o in exchange_order_ids})
 
         self._create_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_create_order)
         self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
@@ -134,28 +178,10 @@ class MarketsRecorder:
         while True:
             try:
                 if all(ex.ready for ex in self._markets):
-                    with self._sql_manager.get_new_session() as session:
-                        with session.begin():
-                            for market in self._markets:
-                                exchange = market.display_name
-                                for trading_pair in market.trading_pairs:
-                                    mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
-                                    best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
-                                    best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
-                                    order_book = market.get_order_book(trading_pair)
-                                    depth = self._market_data_collection_config.market_data_collection_depth + 1
-                                    market_data = MarketData(
-                                        timestamp=self.db_timestamp,
-                                        exchange=exchange,
-                                        trading_pair=trading_pair,
-                                        mid_price=mid_price,
-                                        best_bid=best_bid,
-                                        best_ask=best_ask,
-                                        order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
-                                    )
-                                    session.add(market_data)
+                    if self._market_data_writer is not None:
+                        self._record_columnar_market_data()
+                    else:
+                        self._record_sql_market_data()
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -163,6 +189,52 @@ class MarketsRecorder:
             finally:
                 await self._sleep(self._market_data_collection_config.market_data_collection_interval)
 
+    def _record_sql_market_data(self):
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                for market in self._markets:
+                    exchange = market.display_name
+                    for trading_pair in market.trading_pairs:
+                        mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
+                        best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
+                        best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
+                        order_book = market.get_order_book(trading_pair)
+                        depth = self._market_data_collection_config.market_data_collection_depth + 1
+                        market_data = MarketData(
+                            timestamp=self.db_timestamp,
+                            exchange=exchange,
+                            trading_pair=trading_pair,
+                            mid_price=mid_price,
+                            best_bid=best_bid,
+                            best_ask=best_ask,
+                            order_book={
+                                "bid": list(islice(order_book.bid_entries(), depth)),
+                                "ask": list(islice(order_book.ask_entries(), depth))}
+                        )
+                        session.add(market_data)
+
+    def _record_columnar_market_data(self):
+        timestamp = time.time()
+        for market in self._markets:
+            for trading_pair in market.trading_pairs:
+                self._market_data_writer.append(
+                    timestamp=timestamp,
+                    exchange=market.display_name,
+                    trading_pair=trading_pair,
+                    order_book=market.get_order_book(trading_pair),
+                )
+
+    async def _write_behind_loop(self):
+        while True:
+            try:
+                self._submit_pending_writes()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error while submitting database writes.", exc_info=True)
+            finally:
+                await self._sleep(self._write_behind_interval)
+
     @property
     def sql_manager(self) -> SQLConnectionManager:
         return self._sql_manager
@@ -179,12 +251,23 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def trades_performance(self) -> Dict[Tuple[str, str], PerformanceAccumulator]:
+        """
+        The performance accumulators of the trades recorded, by market and trading pair
+        """
+        return self._trades_performance
+
     def start(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_config.market_data_collection_enabled:
             self._start_market_data_recording()
+        if self._write_behind_interval is not None:
+            if self._writer_executor is None:
+                self._writer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="markets_recorder")
+            self._write_behind_task = self._ev_loop.create_task(self._write_behind_loop())
 
     def stop(self):
         for market in self._markets:
@@ -192,6 +275,97 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        if self._market_data_writer is not None:
+            try:
+                self._market_data_writer.close()
+            except Exception:
+                self.logger().error("Unexpected error while writing the market data.", exc_info=True)
+        if self._write_behind_task is not None:
+            self._write_behind_task.cancel()
+            self._write_behind_task = None
+        self.flush_pending_writes()
+        if self._writer_executor is not None:
+            self._writer_executor.shutdown(wait=True)
+            self._writer_executor = None
+
+    def flush_pending_writes(self):
+        """
+        Writes all the queued events to the database, and waits until the writer thread is done with them
+        """
+        if self._writer_executor is None:
+            return
+        self._submit_pending_writes()
+        if self._last_write_future is not None:
+            self._last_write_future.result()
+
+    def _queue_write(self,
+                     write: Callable[[Session], Optional[bool]],
+                     market: Optional[ConnectorBase] = None,
+                     after_commit: Optional[Callable[[], None]] = None):
+        """
+        Queues a database write. The tracking states of the market are captured now, and saved together with the write,
+        unless the write returns False because it had nothing to record. after_commit is called once the write is
+        committed.
+        Without write-behind the write is executed immediately, and its errors are raised.
+        """
+        if market is not None:
+            self._pending_writes.append((write, market.display_name, market.tracking_states, after_commit))
+        else:
+            self._pending_writes.append((write, None, None, after_commit))
+        if self._writer_executor is None:
+            self._write_batch(self._take_pending_writes(), isolate_errors=False)
+        elif len(self._pending_writes) >= self._write_behind_batch_size:
+            self._submit_pending_writes()
+
+    def _take_pending_writes(self) -> List[PendingWrite]:
+        writes, self._pending_writes = self._pending_writes, []
+        return writes
+
+    def _submit_pending_writes(self):
+        if len(self._pending_writes) > 0:
+            self._last_write_future = self._writer_executor.submit(
+                self._write_batch_in_writer_thread, self._take_pending_writes())
+
+    def _write_batch(self, writes: List[PendingWrite], isolate_errors: bool = True):
+        """
+        Writes the events in a single transaction. Each event is written in its own savepoint, so that an event that
+        fails to be written is the only one lost, unless isolate_errors is False, in which case the error is raised.
+        Only the latest tracking states of each market are saved.
+        """
+        market_states: Dict[str, Dict[str, Any]] = {}
+        after_commit_callbacks: List[Callable[[], None]] = []
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                for write, market_name, tracking_states, after_commit in writes:
+                    try:
+                        with session.begin_nested():
+                            recorded = write(session)
+                    except Exception:
+                        if not isolate_errors:
+                            raise
+                        self.logger().error("Unexpected error while writing an event to the database.", exc_info=True)
+                        continue
+                    if market_name is not None and recorded is not False:
+                        market_states[market_name] = tracking_states
+                    if after_commit is not None:
+                        after_commit_callbacks.append(after_commit)
+                for market_name, tracking_states in market_states.items():
+                    self._save_tracking_states(self._config_file_path, market_name, tracking_states, session)
+            # Still in the session, for the committed records to be reloaded if needed
+            for after_commit in after_commit_callbacks:
+                if isolate_errors:
+                    try:
+                        after_commit()
+                    except Exception:
+                        self.logger().error("Unexpected error after writing an event to the database.", exc_info=True)
+                else:
+                    after_commit()
+
+    def _write_batch_in_writer_thread(self, writes: List[PendingWrite]):
+        try:
+            self._write_batch(writes)
+        except Exception:
+            self.logger().error(f"Unexpected error while writing {len(writes)} events to the database.", exc_info=True)
 
     def store_position_executor(self, executor: Dict):
         with self._sql_manager.get_new_session() as session:
@@ -225,6 +399,7 @@ class MarketsRecorder:
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
+        self.flush_pending_writes()
         with self._sql_manager.get_new_session() as session:
             filters = [Order.config_file_path == config_file_path,
                        Order.market == market.display_name]
@@ -240,6 +415,7 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        self.flush_pending_writes()
         with self._sql_manager.get_new_session() as session:
             query: Query = (session
                             .query(TradeFill)
@@ -250,21 +426,71 @@ class MarketsRecorder:
             else:
                 return query.limit(number_of_rows).all()
 
+    def _load_trades_performance(self, start_timestamp: int):
+        with self._sql_manager.get_new_session() as session:
+            trade_fills: List[TradeFill] = (session
+                                            .query(TradeFill)
+                                            .filter(TradeFill.timestamp >= start_timestamp,
+                                                    TradeFill.config_file_path.like(f"%{self._config_file_path}%"))
+                                            .order_by(TradeFill.timestamp)
+                                            .all())
+            for trade_fill in trade_fills:
+                self._add_trade_performance(trade_fill)
+
+    def _add_trade_performance(self, trade_fill: TradeFill):
+        key = (trade_fill.market, trade_fill.symbol)
+        accumulator = self._trades_performance.get(key)
+        if accumulator is None:
+            accumulator = PerformanceAccumulator(trade_fill.symbol)
+            self._trades_performance[key] = accumulator
+        accumulator.add_trade(trade_fill)
+
+    @staticmethod
+    def _stored_trade_fill(trade_fill: TradeFill) -> TradeFill:
+        """
+        Returns the trade fill with its price and amount as they are stored in the database, for the trades
+        performance to match the performance calculated from the stored trade fills
+        """
+        def stored_value(column_name: str, value: Decimal) -> Decimal:
+            column_type = TradeFill.__table__.c[column_name].type
+            return column_type.process_result_value(column_type.process_bind_param(value, None), None)
+
+        return TradeFill(market=trade_fill.market,
+                         symbol=trade_fill.symbol,
+                         order_id=trade_fill.order_id,
+                         trade_type=trade_fill.trade_type,
+                         price=stored_value("price", trade_fill.price),
+                         amount=stored_value("amount", trade_fill.amount),
+                         trade_fee=trade_fill.trade_fee,
+                         position=trade_fill.position)
+
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
+        self._save_tracking_states(config_file_path, market.display_name, market.tracking_states, session)
+
+    def _save_tracking_states(self,
+                              config_file_path: str,
+                              market_name: str,
+                              tracking_states: Dict[str, Any],
+                              session: Session):
+        market_states: Optional[MarketState] = (session
+                                                .query(MarketState)
+                                                .filter(MarketState.config_file_path == config_file_path,
+                                                        MarketState.market == market_name)
+                                                .one_or_none())
         timestamp: int = self.db_timestamp
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = tracking_states
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=tracking_states)
             session.add(market_states)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
+        self.flush_pending_writes()
         with self._sql_manager.get_new_session() as session:
             market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
 
@@ -294,31 +520,33 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        order_record: Order = Order(id=evt.order_id,
+                                    config_file_path=self._config_file_path,
+                                    strategy=self._strategy_name,
+                                    market=market.display_name,
+                                    symbol=evt.trading_pair,
+                                    base_asset=base_asset,
+                                    quote_asset=quote_asset,
+                                    creation_timestamp=timestamp,
+                                    order_type=evt.type.name,
+                                    amount=Decimal(evt.amount),
+                                    leverage=evt.leverage if evt.leverage else 1,
+                                    price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                    position=evt.position if evt.position else PositionAction.NIL.value,
+                                    last_status=event_type.name,
+                                    last_update_timestamp=timestamp,
+                                    exchange_order_id=evt.exchange_order_id)
+        order_status: OrderStatus = OrderStatus(order=order_record,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        self._order_creation_timestamps[evt.order_id] = timestamp
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+
+        def write(session: Session):
+            session.add(order_record)
+            session.add(order_status)
+
+        self._queue_write(write, market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -333,57 +561,54 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                try:
-                    fee_in_quote = evt.trade_fee.fee_amount_in_token(
-                        trading_pair=evt.trading_pair,
-                        price=evt.price,
-                        order_amount=evt.amount,
-                        token=quote_asset,
-                        exchange=market
-                    )
-                except Exception as e:
-                    self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
-                    fee_in_quote = 0
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    trade_fee_in_quote=fee_in_quote,
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
-                self.append_to_csv(trade_fill_record)
+        # Order status and trade fill record should be added even if the order record is not found, because it's
+        # possible for fill event to come in before the order created event for market orders.
+        order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        try:
+            fee_in_quote = evt.trade_fee.fee_amount_in_token(
+                trading_pair=evt.trading_pair,
+                price=evt.price,
+                order_amount=evt.amount,
+                token=quote_asset,
+                exchange=market
+            )
+        except Exception as e:
+            self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
+            fee_in_quote = 0
+        trade_fill_record: TradeFill = TradeFill(
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=market.display_name,
+            symbol=evt.trading_pair,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=evt.trade_type.name,
+            order_type=evt.order_type.name,
+            price=evt.price,
+            amount=evt.amount,
+            leverage=evt.leverage if evt.leverage else 1,
+            trade_fee=evt.trade_fee.to_json(),
+            trade_fee_in_quote=fee_in_quote,
+            exchange_trade_id=evt.exchange_trade_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+        )
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
+                                                                           trade_fill_record.exchange_trade_id,
+                                                                           trade_fill_record.symbol)})
+        if self._trades_performance_start is None or timestamp >= self._trades_performance_start:
+            self._add_trade_performance(self._stored_trade_fill(trade_fill_record))
+
+        def write(session: Session):
+            # Update the order record if it exists
+            self._update_order_record(session, order_id, event_type.name, timestamp)
+            session.add(order_status)
+            session.add(trade_fill_record)
+
+        self._queue_write(write, market, after_commit=lambda: self.append_to_csv(trade_fill_record))
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -395,19 +620,32 @@ class MarketsRecorder:
 
         timestamp: float = evt.timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
+        def write(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                        config_file_path=self.config_file_path,
+                                                                        market=market.display_name,
+                                                                        rate=evt.funding_rate,
+                                                                        symbol=evt.trading_pair,
+                                                                        amount=float(evt.amount))
+                session.add(funding_payment_record)
+
+        self._queue_write(write)
+
+    @staticmethod
+    def _update_order_record(session: Session, order_id: str, status: str, timestamp: int) -> bool:
+        """
+        Updates the order record without loading it first
+        :return: True if the order record exists
+        """
+        updated_rows: int = (session
+                             .query(Order)
+                             .filter(Order.id == order_id)
+                             .update({Order.last_status: status, Order.last_update_timestamp: timestamp}))
+        return updated_rows > 0
 
     @staticmethod
     def _csv_matches_header(file_path: str, header: tuple) -> bool:
@@ -423,8 +661,11 @@ class MarketsRecorder:
 
         # adding extra field "age"
         # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
-        age = pd.Timestamp(int((trade.timestamp * 1e-3) - (trade.order.creation_timestamp * 1e-3)), unit='s').strftime(
-            '%H:%M:%S') if (trade.order is not None and "//" not in trade.order_id) else "n/a"
+        order_creation_timestamp: Optional[int] = self._order_creation_timestamps.get(trade.order_id)
+        if order_creation_timestamp is None and trade.order is not None:
+            order_creation_timestamp = trade.order.creation_timestamp
+        age = pd.Timestamp(int((trade.timestamp * 1e-3) - (order_creation_timestamp * 1e-3)), unit='s').strftime(
+            '%H:%M:%S') if (order_creation_timestamp is not None and "//" not in trade.order_id) else "n/a"
         field_names += ("age",)
         field_data += (age,)
 
@@ -453,18 +694,16 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+        def write(session: Session) -> bool:
+            if not self._update_order_record(session, order_id, event_type.name, timestamp):
+                return False
+            order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            session.add(order_status)
+            return True
 
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        self._queue_write(write, market)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -499,16 +738,12 @@ class MarketsRecorder:
             return
 
         timestamp: int = self.db_timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                             timestamp=timestamp,
+                                                             tx_hash=evt.exchange_order_id,
+                                                             token_id=evt.token_id,
+                                                             trade_fee=evt.trade_fee.to_json())
+        self._queue_write(lambda session: session.add(rp_update), connector)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -518,17 +753,14 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                         strategy=self._strategy_name,
+                                                                         token_id=evt.token_id,
+                                                                         token_0=evt.token_0,
+                                                                         token_1=evt.token_1,
+                                                                         claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                         claimed_fee_1=Decimal(evt.claimed_fee_1))
+        self._queue_write(lambda session: session.add(rp_fees), connector)
 
     @staticmethod
     async def _sleep(delay):
@@ -0,0 +1,259 @@
+import asyncio
+import time
+from bisect import bisect_left
+from collections import defaultdict, deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+    AsyncRequestContextBase,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit
+
+# Number of expired entries tolerated at the head of a window before its buffers are compacted
+WINDOW_COMPACTION_THRESHOLD = 1024
+
+
+class SlidingWindow:
+    """
+    Keeps the timestamps and weights of the tasks logged against a single limit id.
+    Timestamps are stored in arrival order together with the running sum of the weights, so both the capacity used
+    in the window and the time until enough capacity is freed are found with a binary search.
+    """
+
+    def __init__(self):
+        self._timestamps: List[float] = []
+        self._cumulative_weights: List[int] = []
+        self._start: int = 0
+        self._expired_weight: int = 0
+
+    def __len__(self) -> int:
+        return len(self._timestamps) - self._start
+
+    def add(self, timestamp: float, weight: int):
+        total = self._cumulative_weights[-1] if self._cumulative_weights else 0
+        self._timestamps.append(timestamp)
+        self._cumulative_weights.append(total + weight)
+
+    def expire(self, cutoff: float):
+        """
+        Drops the entries logged before the cutoff timestamp
+        """
+        start = bisect_left(self._timestamps, cutoff, self._start)
+        if start > self._start:
+            self._start = start
+            self._expired_weight = self._cumulative_weights[start - 1]
+            if start > WINDOW_COMPACTION_THRESHOLD and start * 2 > len(self._timestamps):
+                del self._timestamps[:start]
+                del self._cumulative_weights[:start]
+                self._start = 0
+
+    def used_capacity(self) -> int:
+        if len(self) == 0:
+            return 0
+        return self._cumulative_weights[-1] - self._expired_weight
+
+    def time_to_free(self, capacity: int) -> float:
+        """
+        :param capacity: the capacity that has to be freed
+        :return: the timestamp of the entry whose expiration frees the requested capacity
+        """
+        index = bisect_left(self._cumulative_weights, self._expired_weight + capacity, self._start)
+        return self._timestamps[index]
+
+
+class SlidingWindowRequestContext(AsyncRequestContextBase):
+    """
+    An async context class ('async with' syntax) that waits until the SlidingWindowAsyncThrottler grants capacity for
+    the rate limit and its linked limits.
+    """
+
+    def __init__(self,
+                 throttler: "SlidingWindowAsyncThrottler",
+                 rate_limit: Optional[RateLimit],
+                 related_limits: List[Tuple[RateLimit, int]]):
+        self._throttler: SlidingWindowAsyncThrottler = throttler
+        self._rate_limit: Optional[RateLimit] = rate_limit
+        self._related_limits: List[Tuple[RateLimit, int]] = related_limits
+        self._limits: List[Tuple[RateLimit, int]] = (
+            [] if rate_limit is None else [(rate_limit, rate_limit.weight)] + related_limits
+        )
+
+    def flush(self):
+        self._throttler.flush()
+
+    def within_capacity(self) -> bool:
+        return self._throttler.wait_time(self._limits) <= 0
+
+    async def acquire(self):
+        await self._throttler.acquire(self._limits)
+
+
+class SlidingWindowAsyncThrottler(AsyncThrottlerBase):
+    """
+    Alternative to AsyncThrottler that does not scan a shared task log on every request.
+    Each limit id has its own sliding window of timestamps with running weight sums. When a task does not fit in the
+    windows the throttler calculates when enough capacity will be freed and schedules a single wake up at that time.
+    Waiting tasks are granted capacity in the order they arrived (FIFO). A waiting task only blocks the tasks that
+    arrived after it and share one of its limits.
+    A task heavier than the limit itself is let through once its window is empty, instead of waiting forever.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,
+                 limits_share_percentage: Optional[Decimal] = None
+                 ):
+        """
+        :param rate_limits: List of RateLimit(s).
+        :param retry_interval: Not used by this throttler, kept for compatibility with AsyncThrottler.
+        :param safety_margin_pct: Percentage of limit to be added as a safety margin when calculating capacity to ensure
+            calls are within the limit.
+        :param limits_share_percentage: Percentage of the limits to be used by this instance (important when multiple
+            bots operate with the same account)
+        """
+        super().__init__(
+            rate_limits=rate_limits,
+            retry_interval=retry_interval,
+            safety_margin_pct=safety_margin_pct,
+            limits_share_percentage=limits_share_percentage,
+        )
+        self._windows: Dict[str, SlidingWindow] = defaultdict(SlidingWindow)
+        self._waiters: Deque[Tuple[asyncio.Future, List[Tuple[RateLimit, int]]]] = deque()
+        # Number of waiting tasks per limit id, new tasks for these limits queue behind them
+        self._waiting_limit_ids: Dict[str, int] = defaultdict(int)
+        self._wake_up_handle: Optional[asyncio.TimerHandle] = None
+
+    def execute_task(self, limit_id: str) -> SlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        return SlidingWindowRequestContext(
+            throttler=self,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+        )
+
+    def flush(self):
+        """
+        Removes the entries that have passed their rate limit periods from all windows
+        """
+        now = self._time()
+        for limit_id, window in self._windows.items():
+            rate_limit = self._id_to_limit_map.get(limit_id)
+            if rate_limit is not None:
+                window.expire(now - self._window_length(rate_limit))
+
+    def wait_time(self, limits: List[Tuple[RateLimit, int]]) -> float:
+        """
+        :param limits: the rate limits and weights a task consumes
+        :return: the seconds to wait until all the limits have capacity for the task (0 if it can run now)
+        """
+        wait, _ = self._wait_time(limits, self._time())
+        return wait
+
+    async def acquire(self, limits: List[Tuple[RateLimit, int]]):
+        """
+        Waits until there is capacity for a task consuming the given limits and logs the task in the windows.
+        """
+        if len(limits) == 0:
+            return
+        now = self._time()
+        wait = None
+        if not any(self._waiting_limit_ids.get(rate_limit.limit_id) for rate_limit, _ in limits):
+            wait, limiting_rate_limit = self._wait_time(limits, now)
+            if wait <= 0:
+                self._register_task(limits, now)
+                return
+            self._warn_max_capacity_reached(limiting_rate_limit, now)
+
+        future = asyncio.get_event_loop().create_future()
+        self._waiters.append((future, limits))
+        for rate_limit, _ in limits:
+            self._waiting_limit_ids[rate_limit.limit_id] += 1
+        if wait is not None:
+            # Tasks queued behind another waiter are woken up when the tasks ahead of them are processed
+            self._schedule_wake_up(wait)
+        await future
+
+    def _schedule_wake_up(self, delay: float):
+        loop = asyncio.get_event_loop()
+        wake_up_time = loop.time() + delay
+        if self._wake_up_handle is None or wake_up_time < self._wake_up_handle.when():
+            if self._wake_up_handle is not None:
+                self._wake_up_handle.cancel()
+            self._wake_up_handle = loop.call_at(wake_up_time, self._process_waiters)
+
+    def _process_waiters(self):
+        self._wake_up_handle = None
+        now = self._time()
+        blocked_limit_ids: Set[str] = set()
+        next_wake_up: Optional[float] = None
+        pending_waiters = deque()
+        self._waiting_limit_ids.clear()
+
+        for future, limits in self._waiters:
+            if future.done():
+                continue
+            if not any(rate_limit.limit_id in blocked_limit_ids for rate_limit, _ in limits):
+                wait, limiting_rate_limit = self._wait_time(limits, now)
+                if wait <= 0:
+                    self._register_task(limits, now)
+                    future.set_result(None)
+                    continue
+                self._warn_max_capacity_reached(limiting_rate_limit, now)
+                next_wake_up = wait if next_wake_up is None else min(next_wake_up, wait)
+            pending_waiters.append((future, limits))
+            for rate_limit, _ in limits:
+                blocked_limit_ids.add(rate_limit.limit_id)
+                self._waiting_limit_ids[rate_limit.limit_id] += 1
+
+        self._waiters = pending_waiters
+        if next_wake_up is not None:
+            self._schedule_wake_up(next_wake_up)
+
+    def _wait_time(self, limits: List[Tuple[RateLimit, int]], now: float) -> Tuple[float, Optional[RateLimit]]:
+        max_wait = 0.0
+        limiting_rate_limit = None
+        for rate_limit, weight in limits:
+            window_length = self._window_length(rate_limit)
+            window = self._windows[rate_limit.limit_id]
+            window.expire(now - window_length)
+            used_capacity = window.used_capacity()
+            excess = used_capacity + weight - rate_limit.limit
+            if excess > 0 and used_capacity > 0:
+                # Tasks heavier than the limit only need the window to be empty
+                capacity_to_free = min(excess, used_capacity)
+                # An entry is counted while its age is not greater than the window length, so it expires as soon
+                # as the clock moves past that point
+                wait = max(window.time_to_free(capacity_to_free) + window_length - now, 0) + 1e-6
+                if wait > max_wait:
+                    max_wait = wait
+                    limiting_rate_limit = rate_limit
+        return max_wait, limiting_rate_limit
+
+    def _register_task(self, limits: List[Tuple[RateLimit, int]], now: float):
+        for rate_limit, weight in limits:
+            self._windows[rate_limit.limit_id].add(now, weight)
+
+    def _window_length(self, rate_limit: RateLimit) -> float:
+        return rate_limit.time_interval * (1 + self._safety_margin_pct)
+
+    def _warn_max_capacity_reached(self, rate_limit: RateLimit, now: float):
+        if AsyncRequestContextBase._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                  f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                  f"is {self._windows[rate_limit.limit_id].used_capacity()} in the last " \
+                  f"{rate_limit.time_interval} seconds"
+            self.logger().notify(msg)
+            AsyncRequestContextBase._last_max_cap_warning_ts = now
+
+    def _time(self) -> float:
+        return time.time()
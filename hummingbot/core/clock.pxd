@@ -1,5 +1,7 @@
 # distutils: language=c++
 
+from hummingbot.core.event.event_listener cimport EventListener
+
 cdef class Clock:
     cdef:
         object _clock_mode
@@ -10,3 +12,17 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        double _min_tick_interval
+        double _max_idle_interval
+        object _wake_up_event
+        EventListener _wake_up_listener
+        list _subscribed_connectors
+        dict _subscribed_order_books
+
+    cdef c_notify(self)
+    cdef bint c_tick_iterators(self)
+    cdef c_subscribe_to_order_books(self)
+
+cdef class ClockWakeUpListener(EventListener):
+    cdef:
+        Clock _clock
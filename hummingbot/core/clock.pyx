@@ -3,15 +3,38 @@
 import asyncio
 import logging
 import time
-from typing import List
+from typing import List, Optional
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.event.event_listener cimport EventListener
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
 
+# Connector events that wake up an event driven clock: changes of the tracked orders
+ORDER_EVENTS = [
+    MarketEvent.BuyOrderCreated,
+    MarketEvent.SellOrderCreated,
+    MarketEvent.OrderFilled,
+    MarketEvent.OrderCancelled,
+    MarketEvent.BuyOrderCompleted,
+    MarketEvent.SellOrderCompleted,
+    MarketEvent.OrderFailure,
+    MarketEvent.OrderExpired,
+]
+
+
+cdef class ClockWakeUpListener(EventListener):
+    def __init__(self, clock: Clock):
+        super().__init__()
+        self._clock = clock
+
+    cdef c_call(self, object arg):
+        self._clock.c_notify()
+
 
 cdef class Clock:
     @classmethod
@@ -21,12 +44,22 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self,
+                 clock_mode: ClockMode,
+                 tick_size: float = 1.0,
+                 start_time: float = 0.0,
+                 end_time: float = 0.0,
+                 min_tick_interval: float = 0.05,
+                 max_idle_interval: Optional[float] = None):
         """
-        :param clock_mode: either real time mode or back testing mode
+        :param clock_mode: real time mode, event driven mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param min_tick_interval: (event driven mode only) minimum time between ticks, changes within the interval are
+        handled together in the next tick
+        :param max_idle_interval: (event driven mode only) maximum time between ticks when nothing changes, defaults to
+        the tick size
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +69,12 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._min_tick_interval = min_tick_interval
+        self._max_idle_interval = max_idle_interval if max_idle_interval is not None else tick_size
+        self._wake_up_event = None
+        self._wake_up_listener = ClockWakeUpListener(self)
+        self._subscribed_connectors = []
+        self._subscribed_order_books = {}
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -49,6 +88,14 @@ cdef class Clock:
     def tick_size(self) -> float:
         return self._tick_size
 
+    @property
+    def min_tick_interval(self) -> float:
+        return self._min_tick_interval
+
+    @property
+    def max_idle_interval(self) -> float:
+        return self._max_idle_interval
+
     @property
     def child_iterators(self) -> List[TimeIterator]:
         return self._child_iterators
@@ -81,6 +128,77 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        if iterator in self._subscribed_connectors:
+            self.unsubscribe_from_connector(iterator)
+
+    def subscribe_to_order_book(self, order_book: "OrderBook"):
+        """
+        (event driven mode only) Ticks the child iterators when the best bid or ask of the order book changes
+        """
+        if id(order_book) not in self._subscribed_order_books:
+            self._subscribed_order_books[id(order_book)] = order_book
+            order_book.add_listener(OrderBookEvent.BestPriceChangeEvent, self._wake_up_listener)
+
+    def unsubscribe_from_order_book(self, order_book: "OrderBook"):
+        if self._subscribed_order_books.pop(id(order_book), None) is not None:
+            order_book.remove_listener(OrderBookEvent.BestPriceChangeEvent, self._wake_up_listener)
+
+    def subscribe_to_connector(self, connector: "ConnectorBase"):
+        """
+        (event driven mode only) Ticks the child iterators when the connector's orders change or the best bid or ask of
+        any of its order books changes. Order books added to the connector later are subscribed in the next tick.
+        """
+        if connector not in self._subscribed_connectors:
+            self._subscribed_connectors.append(connector)
+            for event in ORDER_EVENTS:
+                connector.add_listener(event, self._wake_up_listener)
+            self.c_subscribe_to_order_books()
+
+    def unsubscribe_from_connector(self, connector: "ConnectorBase"):
+        """
+        Stops ticking the child iterators on the changes of the connector's orders and order books. Called when the
+        connector is removed from the clock.
+        """
+        if connector in self._subscribed_connectors:
+            self._subscribed_connectors.remove(connector)
+            for event in ORDER_EVENTS:
+                connector.remove_listener(event, self._wake_up_listener)
+            order_books = getattr(connector, "order_books", None) or {}
+            for order_book in order_books.values():
+                self.unsubscribe_from_order_book(order_book)
+
+    def notify(self):
+        """
+        (event driven mode only) Requests a tick, as soon as the minimum tick interval allows it
+        """
+        self.c_notify()
+
+    cdef c_notify(self):
+        if self._wake_up_event is not None:
+            self._wake_up_event.set()
+
+    cdef c_subscribe_to_order_books(self):
+        for connector in self._subscribed_connectors:
+            order_books = getattr(connector, "order_books", None) or {}
+            for order_book in order_books.values():
+                self.subscribe_to_order_book(order_book)
+
+    cdef bint c_tick_iterators(self):
+        """
+        Runs through all the child iterators in real time mode.
+        :return: False if the clock has to stop
+        """
+        cdef TimeIterator child_iterator
+        for ci in self._current_context:
+            child_iterator = ci
+            try:
+                child_iterator.c_tick(self._current_tick)
+            except StopIteration:
+                self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
+                return False
+            except Exception:
+                self.logger().error("Unexpected error running clock tick.", exc_info=True)
+        return True
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -102,6 +220,10 @@ cdef class Clock:
             self._started = True
 
         try:
+            if self._clock_mode is ClockMode.EVENT_DRIVEN:
+                await self._run_event_driven_til(timestamp)
+                return
+
             while True:
                 now = time.time()
                 if now >= timestamp:
@@ -112,21 +234,51 @@ cdef class Clock:
                 await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
 
-                # Run through all the child iterators.
-                for ci in self._current_context:
-                    child_iterator = ci
-                    try:
-                        child_iterator.c_tick(self._current_tick)
-                    except StopIteration:
-                        self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
-                        return
-                    except Exception:
-                        self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                if not self.c_tick_iterators():
+                    return
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    async def _run_event_driven_til(self, timestamp: float):
+        cdef:
+            double now
+            double last_tick_time = time.time()
+            double wait_time
+
+        self._wake_up_event = asyncio.Event()
+        try:
+            while True:
+                now = time.time()
+                if now >= timestamp:
+                    return
+
+                # Wait for a change, or until the child iterators have been idle for too long
+                wait_time = min(last_tick_time + self._max_idle_interval, timestamp) - now
+                if wait_time > 0 and not self._wake_up_event.is_set():
+                    try:
+                        await asyncio.wait_for(self._wake_up_event.wait(), timeout=wait_time)
+                    except asyncio.TimeoutError:
+                        pass
+
+                # Changes during the minimum interval are handled together in the next tick
+                now = time.time()
+                if now >= timestamp:
+                    return
+                if now < last_tick_time + self._min_tick_interval:
+                    await asyncio.sleep(last_tick_time + self._min_tick_interval - now)
+                    now = time.time()
+                self._wake_up_event.clear()
+
+                self._current_tick = now
+                last_tick_time = now
+                self.c_subscribe_to_order_books()
+                if not self.c_tick_iterators():
+                    return
+        finally:
+            self._wake_up_event = None
+
     def backtest_til(self, timestamp: float):
         cdef TimeIterator child_iterator
 
@@ -6,3 +6,5 @@ from enum import Enum
 class ClockMode(Enum):
     REALTIME = 1
     BACKTEST = 2
+    # Real time, ticking when the subscribed order books' best prices or the connectors' orders change
+    EVENT_DRIVEN = 3
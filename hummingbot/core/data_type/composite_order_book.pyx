@@ -3,14 +3,21 @@
 
 from typing import Iterator
 
+import numpy as np
+
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from libcpp.set cimport set
 from libcpp.vector cimport vector
 
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
+cimport numpy as np
+
+NaN = float("nan")
+
 cdef class CompositeOrderBook(OrderBook):
     """
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
@@ -28,6 +35,7 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._traded_order_book._version += 1
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -192,3 +200,124 @@ cdef class CompositeOrderBook(OrderBook):
                 return best_bid.price
         except Exception:
             raise
+
+    cdef object c_entries(self, bint is_buy):
+        return self.ask_entries() if is_buy else self.bid_entries()
+
+    # The depth queries walk the composite entries instead of the C++ book sets, which don't include the recorded
+    # filled orders. The depth index is not used, the filled orders change it without a book update.
+
+    cdef np.ndarray c_get_depth_index(self, bint is_buy):
+        cdef:
+            np.ndarray index
+        rows = list(self.c_entries(is_buy))
+        index = np.empty((len(rows), 4), dtype=np.float64, order="F")
+        index[:, :2] = [(row.price, row.amount) for row in rows] if len(rows) > 0 else np.empty((0, 2))
+        index[:, 2] = np.cumsum(index[:, 1])
+        index[:, 3] = np.cumsum(index[:, 0] * index[:, 1])
+        index.flags.writeable = False
+        return index
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in self.c_entries(is_buy):
+            cumulative_volume += order_book_row.amount
+            if cumulative_volume >= volume:
+                result_price = order_book_row.price
+                break
+
+        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double total_cost = 0
+            double total_volume = 0
+            double result_vwap = NaN
+
+        for order_book_row in self.c_entries(is_buy):
+            total_cost += order_book_row.amount * order_book_row.price
+            total_volume += order_book_row.amount
+            if total_volume >= volume:
+                total_cost -= order_book_row.amount * order_book_row.price
+                total_volume -= order_book_row.amount
+                incremental_amount = volume - total_volume
+                total_cost += incremental_amount * order_book_row.price
+                total_volume += incremental_amount
+                result_vwap = total_cost / total_volume
+                break
+
+        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in self.c_entries(is_buy):
+            cumulative_volume += order_book_row.amount * order_book_row.price
+            if cumulative_volume >= quote_volume:
+                result_price = order_book_row.price
+                break
+
+        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef:
+            double cumulative_volume = 0
+            double cumulative_base_amount = 0
+            double row_amount = 0
+
+        for order_book_row in self.c_entries(is_buy):
+            row_amount = order_book_row.amount
+            if row_amount + cumulative_base_amount >= base_amount:
+                row_amount = base_amount - cumulative_base_amount
+            cumulative_base_amount += row_amount
+            cumulative_volume += row_amount * order_book_row.price
+            if cumulative_base_amount >= base_amount:
+                break
+
+        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in self.c_entries(is_buy):
+            if (order_book_row.price > price) if is_buy else (order_book_row.price < price):
+                break
+            cumulative_volume += order_book_row.amount
+            result_price = order_book_row.price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        for order_book_row in self.c_entries(is_buy):
+            if (order_book_row.price > price) if is_buy else (order_book_row.price < price):
+                break
+            cumulative_volume += order_book_row.amount * order_book_row.price
+            result_price = order_book_row.price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef tuple c_get_depth_curve(self, bint is_buy, np.ndarray[np.float64_t, ndim=1] volumes):
+        prices = np.array([self.c_get_price_for_volume(is_buy, volume).result_price for volume in volumes],
+                          dtype=np.float64)
+        vwaps = np.array([self.c_get_vwap_for_volume(is_buy, volume).result_price if volume != 0 else NaN
+                          for volume in volumes],
+                         dtype=np.float64)
+        return prices, vwaps
+
+    cdef tuple c_get_volumes_for_prices(self, bint is_buy, np.ndarray[np.float64_t, ndim=1] prices):
+        volumes = np.array([self.c_get_volume_for_price(is_buy, price).result_volume for price in prices],
+                           dtype=np.float64)
+        quote_volumes = np.array([self.c_get_quote_volume_for_price(is_buy, price).result_volume for price in prices],
+                                 dtype=np.float64)
+        return volumes, quote_volumes
@@ -20,10 +20,19 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef int64_t _version
+    cdef bint _depth_index_enabled
+    cdef np.ndarray _bid_depth_index
+    cdef np.ndarray _ask_depth_index
+    cdef int64_t _bid_depth_index_version
+    cdef int64_t _ask_depth_index_version
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_diff_entries(self, set[OrderBookEntry] &book, vector[OrderBookEntry] &entries)
+    cdef c_finalize_diffs(self, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_notify_best_price_change(self, double previous_best_bid, double previous_best_ask)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
@@ -37,3 +46,6 @@ cdef class OrderBook(PubSub):
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
+    cdef np.ndarray c_get_depth_index(self, bint is_buy)
+    cdef tuple c_get_depth_curve(self, bint is_buy, np.ndarray[np.float64_t, ndim=1] volumes)
+    cdef tuple c_get_volumes_for_prices(self, bint is_buy, np.ndarray[np.float64_t, ndim=1] prices)
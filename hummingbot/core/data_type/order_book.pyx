@@ -14,6 +14,7 @@ from typing import (
 import numpy as np
 import pandas as pd
 
+from libcpp.algorithm cimport reverse
 from cython.operator cimport(
     address as ref,
     dereference as deref,
@@ -26,6 +27,7 @@ from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
+    OrderBookBestPriceChangeEvent,
     OrderBookEvent,
     OrderBookTradeEvent
 )
@@ -35,9 +37,118 @@ cimport numpy as np
 ob_logger = None
 NaN = float("nan")
 
+# Columns of the depth index
+cdef enum:
+    DEPTH_PRICE = 0
+    DEPTH_AMOUNT = 1
+    DEPTH_CUMULATIVE_AMOUNT = 2
+    DEPTH_CUMULATIVE_QUOTE_VOLUME = 3
+
+
+cdef inline Py_ssize_t c_depth_level_reaching(const double[::1, :] index, Py_ssize_t column, double value):
+    """
+    Binary search of the first level where the cumulative column reaches the value, the number of levels if none does.
+    """
+    cdef:
+        Py_ssize_t low = 0
+        Py_ssize_t high = index.shape[0]
+        Py_ssize_t middle
+    while low < high:
+        middle = (low + high) >> 1
+        if index[middle, column] >= value:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+cdef inline Py_ssize_t c_depth_level_beyond_price(const double[::1, :] index, bint is_buy, double price):
+    """
+    Binary search of the first level with a price worse than the given price, the number of levels if there is none.
+    """
+    cdef:
+        Py_ssize_t low = 0
+        Py_ssize_t high = index.shape[0]
+        Py_ssize_t middle
+    while low < high:
+        middle = (low + high) >> 1
+        if (index[middle, DEPTH_PRICE] > price) if is_buy else (index[middle, DEPTH_PRICE] < price):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+cdef int64_t c_numpy_to_entries(np.ndarray[np.float64_t, ndim=2] array,
+                                vector[OrderBookEntry] &entries,
+                                int64_t last_update_id):
+    """
+    Pushes the [price, amount, update_id] rows of a float64 array into a C++ entry vector, indexing the buffer
+    directly instead of materializing a numpy row object per level.
+    """
+    cdef:
+        Py_ssize_t i
+        Py_ssize_t num_rows = array.shape[0]
+        int64_t update_id
+
+    entries.reserve(entries.size() + num_rows)
+    for i in range(num_rows):
+        update_id = <int64_t>array[i, 2]
+        entries.push_back(OrderBookEntry(array[i, 0], array[i, 1], update_id))
+        if update_id > last_update_id:
+            last_update_id = update_id
+    return last_update_id
+
+
+cdef c_raw_levels_to_entries(object levels, vector[OrderBookEntry] &entries, int64_t update_id):
+    """
+    Parses raw exchange levels (sequences starting with price and amount, as strings or numbers) straight into a
+    C++ entry vector, without building intermediate OrderBookRow tuples.
+    """
+    cdef:
+        double price
+        double amount
+
+    for level in levels:
+        price = float(level[0])
+        amount = float(level[1])
+        entries.push_back(OrderBookEntry(price, amount, update_id))
+
+
+cdef c_latest_raw_levels_to_entries(object levels, vector[OrderBookEntry] &entries, int64_t update_id,
+                                    dict seen_prices):
+    """
+    Same as c_raw_levels_to_entries, but skips (without parsing them) the levels whose raw price is in seen_prices.
+    Levels are visited from last to first, so the last level of a message for a price is the one kept.
+    """
+    cdef:
+        double price
+        double amount
+
+    for level in reversed(levels):
+        raw_price = level[0]
+        if raw_price in seen_prices:
+            continue
+        seen_prices[raw_price] = None
+        price = float(raw_price)
+        amount = float(level[1])
+        entries.push_back(OrderBookEntry(price, amount, update_id))
+
+
+cdef c_latest_rows_to_entries(object rows, vector[OrderBookEntry] &entries, dict seen_prices):
+    """
+    Pushes the OrderBookRow entries whose price is not in seen_prices, visiting the rows from last to first.
+    """
+    for row in reversed(rows):
+        if row.price in seen_prices:
+            continue
+        seen_prices[row.price] = None
+        entries.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_BEST_PRICE_CHANGE_EVENT_TAG = OrderBookEvent.BestPriceChangeEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -55,33 +166,45 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._version = 0
+        self._depth_index_enabled = False
+        self._bid_depth_index = None
+        self._ask_depth_index = None
+        self._bid_depth_index_version = -1
+        self._ask_depth_index_version = -1
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        # Apply the diffs. Diffs with 0 amounts mean deletion.
+        self.c_apply_diff_entries(self._bid_book, bids)
+        self.c_apply_diff_entries(self._ask_book, asks)
+        self.c_finalize_diffs(update_id)
+
+    cdef c_apply_diff_entries(self, set[OrderBookEntry] &book, vector[OrderBookEntry] &entries):
+        """
+        Replaces the book levels with the given entries, in order. Entries with 0 amount remove the level.
+        """
+        cdef:
+            set[OrderBookEntry].iterator result
+
+        for entry in entries:
+            result = book.find(entry)
+            if result != book.end():
+                book.erase(result)
+            if entry.getAmount() > 0:
+                book.insert(entry)
+
+    cdef c_finalize_diffs(self, int64_t update_id):
         cdef:
-            set[OrderBookEntry].iterator bid_book_end = self._bid_book.end()
-            set[OrderBookEntry].iterator ask_book_end = self._ask_book.end()
             set[OrderBookEntry].reverse_iterator bid_iterator
             set[OrderBookEntry].iterator ask_iterator
-            set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
-
-        # Apply the diffs. Diffs with 0 amounts mean deletion.
-        for bid in bids:
-            result = self._bid_book.find(bid)
-            if result != bid_book_end:
-                self._bid_book.erase(result)
-            if bid.getAmount() > 0:
-                self._bid_book.insert(bid)
-        for ask in asks:
-            result = self._ask_book.find(ask)
-            if result != ask_book_end:
-                self._ask_book.erase(result)
-            if ask.getAmount() > 0:
-                self._ask_book.insert(ask)
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+        self._version += 1
 
         # Record the current best prices, for faster c_get_price() calls.
         bid_iterator = self._bid_book.rbegin()
@@ -95,11 +218,14 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self.c_notify_best_price_change(previous_best_bid, previous_best_ask)
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
             double best_ask_price = float("NaN")
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
             set[OrderBookEntry].reverse_iterator bid_iterator
             set[OrderBookEntry].iterator ask_iterator
             OrderBookEntry top_bid
@@ -108,6 +234,7 @@ cdef class OrderBook(PubSub):
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
         self._ask_book.clear()
+        self._version += 1
         for bid in bids:
             self._bid_book.insert(bid)
             if not (bid.getPrice() <= best_bid_price):
@@ -135,6 +262,17 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_notify_best_price_change(previous_best_bid, previous_best_ask)
+
+    cdef c_notify_best_price_change(self, double previous_best_bid, double previous_best_ask):
+        # NaN prices (empty book sides) are considered equal
+        if ((previous_best_bid == self._best_bid or (previous_best_bid != previous_best_bid and
+                                                     self._best_bid != self._best_bid))
+                and (previous_best_ask == self._best_ask or (previous_best_ask != previous_best_ask and
+                                                             self._best_ask != self._best_ask))):
+            return
+        self.c_trigger_event(self.ORDER_BOOK_BEST_PRICE_CHANGE_EVENT_TAG,
+                             OrderBookBestPriceChangeEvent(self._best_bid, self._best_ask))
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -161,6 +299,25 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def version(self) -> int:
+        """
+        Incremented every time diffs or a snapshot are applied to the book
+        """
+        return self._version
+
+    @property
+    def depth_index_enabled(self) -> bool:
+        """
+        When enabled, the depth queries are binary searches on the depth index of each side, which is rebuilt the first
+        time it is used after the book changes. It speeds up many queries between book updates.
+        """
+        return self._depth_index_enabled
+
+    @depth_index_enabled.setter
+    def depth_index_enabled(self, value: bool):
+        self._depth_index_enabled = value
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -197,6 +354,85 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_raw_diffs(self, bids: List[List[str]], asks: List[List[str]], update_id: int):
+        """
+        Applies diffs given as raw exchange levels, i.e. sequences whose first two items are the price and the amount
+        (either strings or numbers). All levels are tagged with the update_id. The levels are parsed and applied in a
+        single pass, without creating OrderBookRow instances.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        c_raw_levels_to_entries(bids, cpp_bids, update_id)
+        c_raw_levels_to_entries(asks, cpp_asks, update_id)
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+
+    def apply_raw_snapshot(self, bids: List[List[str]], asks: List[List[str]], update_id: int):
+        """
+        Applies a snapshot given as raw exchange levels. See apply_raw_diffs for the expected format.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        c_raw_levels_to_entries(bids, cpp_bids, update_id)
+        c_raw_levels_to_entries(asks, cpp_asks, update_id)
+        self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
+
+    def apply_diff_message(self, message: OrderBookMessage):
+        """
+        Applies a diff message, using the raw levels fast path when the message supports it.
+        """
+        if message.has_raw_levels:
+            self.apply_raw_diffs(message.raw_bids, message.raw_asks, message.update_id)
+        else:
+            self.apply_diffs(message.bids, message.asks, message.update_id)
+
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        """
+        Applies a snapshot message, using the raw levels fast path when the message supports it.
+        """
+        if message.has_raw_levels:
+            self.apply_raw_snapshot(message.raw_bids, message.raw_asks, message.update_id)
+        else:
+            self.apply_snapshot(message.bids, message.asks, message.update_id)
+
+    def apply_diff_messages(self, messages: List[OrderBookMessage]):
+        """
+        Applies several diff messages as one consolidated diff: for every price level only the entry with the highest
+        update id (the latest one if they share the update id) is parsed and applied, and the overlap truncation and
+        best prices update run only once.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+            set[OrderBookEntry].reverse_iterator entries_iterator
+            int64_t last_update_id
+
+        if len(messages) == 0:
+            return
+        ordered_messages = sorted(messages, key=lambda message: message.update_id)
+        last_update_id = ordered_messages[-1].update_id
+        # Python dicts are used as hash sets, since the set name refers to the C++ set here
+        seen_bid_prices = {}
+        seen_ask_prices = {}
+
+        # Walk from the newest message to the oldest one, so that the first entry seen for a price level is the one
+        # that wins. Raw levels are deduplicated by their raw price, before parsing them.
+        for message in reversed(ordered_messages):
+            if message.has_raw_levels:
+                c_latest_raw_levels_to_entries(message.raw_bids, cpp_bids, message.update_id, seen_bid_prices)
+                c_latest_raw_levels_to_entries(message.raw_asks, cpp_asks, message.update_id, seen_ask_prices)
+            else:
+                c_latest_rows_to_entries(message.bids, cpp_bids, seen_bid_prices)
+                c_latest_rows_to_entries(message.asks, cpp_asks, seen_ask_prices)
+
+        # Entries were collected newest first, apply them oldest first
+        reverse(cpp_bids.begin(), cpp_bids.end())
+        reverse(cpp_asks.begin(), cpp_asks.end())
+        self.c_apply_diff_entries(self._bid_book, cpp_bids)
+        self.c_apply_diff_entries(self._ask_book, cpp_asks)
+        self.c_finalize_diffs(last_update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -227,12 +463,8 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+        last_update_id = c_numpy_to_entries(bids_array, cpp_bids, last_update_id)
+        last_update_id = c_numpy_to_entries(asks_array, cpp_asks, last_update_id)
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
     def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
@@ -254,12 +486,8 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+        last_update_id = c_numpy_to_entries(bids_array, cpp_bids, last_update_id)
+        last_update_id = c_numpy_to_entries(asks_array, cpp_asks, last_update_id)
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
@@ -280,6 +508,31 @@ cdef class OrderBook(PubSub):
             yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
             inc(it)
 
+    def top_levels(self, depth: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Reads the best depth levels of each side directly from the books.
+        :return: bids and asks as float64 arrays of shape (depth, 2) with [price, amount] rows, best price first. Rows
+        beyond the levels available in the book are NaN.
+        """
+        cdef:
+            np.ndarray[np.float64_t, ndim=2] bids = np.full((depth, 2), NaN, dtype=np.float64)
+            np.ndarray[np.float64_t, ndim=2] asks = np.full((depth, 2), NaN, dtype=np.float64)
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            Py_ssize_t i = 0
+        while i < depth and bid_it != self._bid_book.rend():
+            bids[i, 0] = deref(bid_it).getPrice()
+            bids[i, 1] = deref(bid_it).getAmount()
+            inc(bid_it)
+            i += 1
+        i = 0
+        while i < depth and ask_it != self._ask_book.end():
+            asks[i, 0] = deref(ask_it).getPrice()
+            asks[i, 1] = deref(ask_it).getAmount()
+            inc(ask_it)
+            i += 1
+        return bids, asks
+
     def simulate_buy(self, amount: float) -> List[OrderBookRow]:
         amount_left = amount
         retval = []
@@ -318,23 +571,83 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
+    cdef np.ndarray c_get_depth_index(self, bint is_buy):
+        cdef:
+            np.ndarray index
+            double[::1, :] levels
+            Py_ssize_t i = 0
+            double cumulative_amount = 0
+            double cumulative_quote_volume = 0
+            double price
+            double amount
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+
+        if is_buy and self._ask_depth_index_version == self._version:
+            return self._ask_depth_index
+        if not is_buy and self._bid_depth_index_version == self._version:
+            return self._bid_depth_index
+
+        index = np.empty((self._ask_book.size() if is_buy else self._bid_book.size(), 4), dtype=np.float64, order="F")
+        levels = index
+        while (ask_it != self._ask_book.end()) if is_buy else (bid_it != self._bid_book.rend()):
+            if is_buy:
+                price = deref(ask_it).getPrice()
+                amount = deref(ask_it).getAmount()
+                inc(ask_it)
+            else:
+                price = deref(bid_it).getPrice()
+                amount = deref(bid_it).getAmount()
+                inc(bid_it)
+            # Accumulated in book order, like the walks of the queries, for identical results
+            cumulative_amount += amount
+            cumulative_quote_volume += amount * price
+            levels[i, DEPTH_PRICE] = price
+            levels[i, DEPTH_AMOUNT] = amount
+            levels[i, DEPTH_CUMULATIVE_AMOUNT] = cumulative_amount
+            levels[i, DEPTH_CUMULATIVE_QUOTE_VOLUME] = cumulative_quote_volume
+            i += 1
+        index.flags.writeable = False
+
+        if is_buy:
+            self._ask_depth_index = index
+            self._ask_depth_index_version = self._version
+        else:
+            self._bid_depth_index = index
+            self._bid_depth_index_version = self._version
+        return index
+
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
+            const double[::1, :] index
+            Py_ssize_t level
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+
+        if self._depth_index_enabled:
+            index = self.c_get_depth_index(is_buy)
+            level = c_depth_level_reaching(index, DEPTH_CUMULATIVE_AMOUNT, volume)
+            if level < index.shape[0]:
+                cumulative_volume = index[level, DEPTH_CUMULATIVE_AMOUNT]
+                result_price = index[level, DEPTH_PRICE]
+            elif index.shape[0] > 0:
+                cumulative_volume = index[index.shape[0] - 1, DEPTH_CUMULATIVE_AMOUNT]
+        elif is_buy:
+            while ask_it != self._ask_book.end():
+                cumulative_volume += deref(ask_it).getAmount()
                 if cumulative_volume >= volume:
-                    result_price = order_book_row.price
+                    result_price = deref(ask_it).getPrice()
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
+            while bid_it != self._bid_book.rend():
+                cumulative_volume += deref(bid_it).getAmount()
                 if cumulative_volume >= volume:
-                    result_price = order_book_row.price
+                    result_price = deref(bid_it).getPrice()
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
@@ -343,30 +656,49 @@ cdef class OrderBook(PubSub):
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+            double price
+            double amount
+            double incremental_amount
+            const double[::1, :] index
+            Py_ssize_t level
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+
+        if self._depth_index_enabled:
+            index = self.c_get_depth_index(is_buy)
+            level = c_depth_level_reaching(index, DEPTH_CUMULATIVE_AMOUNT, volume)
+            if level < index.shape[0]:
+                price = index[level, DEPTH_PRICE]
+                amount = index[level, DEPTH_AMOUNT]
+                total_cost = index[level, DEPTH_CUMULATIVE_QUOTE_VOLUME] - amount * price
+                total_volume = index[level, DEPTH_CUMULATIVE_AMOUNT] - amount
+                incremental_amount = volume - total_volume
+                total_cost += incremental_amount * price
+                total_volume += incremental_amount
+                result_vwap = total_cost / total_volume
+            elif index.shape[0] > 0:
+                total_volume = index[index.shape[0] - 1, DEPTH_CUMULATIVE_AMOUNT]
+            return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+        while (ask_it != self._ask_book.end()) if is_buy else (bid_it != self._bid_book.rend()):
+            if is_buy:
+                price = deref(ask_it).getPrice()
+                amount = deref(ask_it).getAmount()
+                inc(ask_it)
+            else:
+                price = deref(bid_it).getPrice()
+                amount = deref(bid_it).getAmount()
+                inc(bid_it)
+            total_cost += amount * price
+            total_volume += amount
+            if total_volume >= volume:
+                total_cost -= amount * price
+                total_volume -= amount
+                incremental_amount = volume - total_volume
+                total_cost += incremental_amount * price
+                total_volume += incremental_amount
+                result_vwap = total_cost / total_volume
+                break
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
@@ -374,19 +706,33 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
+            const double[::1, :] index
+            Py_ssize_t level
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+
+        if self._depth_index_enabled:
+            index = self.c_get_depth_index(is_buy)
+            level = c_depth_level_reaching(index, DEPTH_CUMULATIVE_QUOTE_VOLUME, quote_volume)
+            if level < index.shape[0]:
+                cumulative_volume = index[level, DEPTH_CUMULATIVE_QUOTE_VOLUME]
+                result_price = index[level, DEPTH_PRICE]
+            elif index.shape[0] > 0:
+                cumulative_volume = index[index.shape[0] - 1, DEPTH_CUMULATIVE_QUOTE_VOLUME]
+        elif is_buy:
+            while ask_it != self._ask_book.end():
+                cumulative_volume += deref(ask_it).getAmount() * deref(ask_it).getPrice()
                 if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+                    result_price = deref(ask_it).getPrice()
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
+            while bid_it != self._bid_book.rend():
+                cumulative_volume += deref(bid_it).getAmount() * deref(bid_it).getPrice()
                 if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+                    result_price = deref(bid_it).getPrice()
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
@@ -395,25 +741,46 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
+            double price
+            const double[::1, :] index
+            Py_ssize_t level
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+
+        if self._depth_index_enabled:
+            index = self.c_get_depth_index(is_buy)
+            level = c_depth_level_reaching(index, DEPTH_CUMULATIVE_AMOUNT, base_amount)
+            if level > 0:
+                cumulative_base_amount = index[level - 1, DEPTH_CUMULATIVE_AMOUNT]
+                cumulative_volume = index[level - 1, DEPTH_CUMULATIVE_QUOTE_VOLUME]
+            # Continues the walk from the level reaching the base amount, rounding can require more than one level
+            while level < index.shape[0]:
+                price = index[level, DEPTH_PRICE]
+                row_amount = index[level, DEPTH_AMOUNT]
                 if row_amount + cumulative_base_amount >= base_amount:
                     row_amount = base_amount - cumulative_base_amount
                 cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
+                cumulative_volume += row_amount * price
                 if cumulative_base_amount >= base_amount:
                     break
+                level += 1
+            return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+        while (ask_it != self._ask_book.end()) if is_buy else (bid_it != self._bid_book.rend()):
+            if is_buy:
+                price = deref(ask_it).getPrice()
+                row_amount = deref(ask_it).getAmount()
+                inc(ask_it)
+            else:
+                price = deref(bid_it).getPrice()
+                row_amount = deref(bid_it).getAmount()
+                inc(bid_it)
+            if row_amount + cumulative_base_amount >= base_amount:
+                row_amount = base_amount - cumulative_base_amount
+            cumulative_base_amount += row_amount
+            cumulative_volume += row_amount * price
+            if cumulative_base_amount >= base_amount:
+                break
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
@@ -421,19 +788,31 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
+            const double[::1, :] index
+            Py_ssize_t level
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+
+        if self._depth_index_enabled:
+            index = self.c_get_depth_index(is_buy)
+            level = c_depth_level_beyond_price(index, is_buy, price)
+            if level > 0:
+                cumulative_volume = index[level - 1, DEPTH_CUMULATIVE_AMOUNT]
+                result_price = index[level - 1, DEPTH_PRICE]
+        elif is_buy:
+            while ask_it != self._ask_book.end():
+                if deref(ask_it).getPrice() > price:
                     break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+                cumulative_volume += deref(ask_it).getAmount()
+                result_price = deref(ask_it).getPrice()
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
+            while bid_it != self._bid_book.rend():
+                if deref(bid_it).getPrice() < price:
                     break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+                cumulative_volume += deref(bid_it).getAmount()
+                result_price = deref(bid_it).getPrice()
+                inc(bid_it)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -441,22 +820,152 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
+            const double[::1, :] index
+            Py_ssize_t level
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+
+        if self._depth_index_enabled:
+            index = self.c_get_depth_index(is_buy)
+            level = c_depth_level_beyond_price(index, is_buy, price)
+            if level > 0:
+                cumulative_volume = index[level - 1, DEPTH_CUMULATIVE_QUOTE_VOLUME]
+                result_price = index[level - 1, DEPTH_PRICE]
+        elif is_buy:
+            while ask_it != self._ask_book.end():
+                if deref(ask_it).getPrice() > price:
                     break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+                cumulative_volume += deref(ask_it).getAmount() * deref(ask_it).getPrice()
+                result_price = deref(ask_it).getPrice()
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
+            while bid_it != self._bid_book.rend():
+                if deref(bid_it).getPrice() < price:
                     break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+                cumulative_volume += deref(bid_it).getAmount() * deref(bid_it).getPrice()
+                result_price = deref(bid_it).getPrice()
+                inc(bid_it)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
+    cdef tuple c_get_depth_curve(self, bint is_buy, np.ndarray[np.float64_t, ndim=1] volumes):
+        cdef:
+            np.ndarray[np.int64_t, ndim=1] order = np.argsort(volumes, kind="stable")
+            np.ndarray[np.float64_t, ndim=1] prices = np.full(volumes.shape[0], NaN, dtype=np.float64)
+            np.ndarray[np.float64_t, ndim=1] vwaps = np.full(volumes.shape[0], NaN, dtype=np.float64)
+            Py_ssize_t query = 0
+            Py_ssize_t index
+            double total_cost = 0
+            double total_volume = 0
+            double level_cost
+            double level_volume
+            double incremental_amount
+            double price
+            double amount
+            const double[::1, :] depth_index
+            Py_ssize_t level
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+
+        if self._depth_index_enabled:
+            depth_index = self.c_get_depth_index(is_buy)
+            for query in range(volumes.shape[0]):
+                level = c_depth_level_reaching(depth_index, DEPTH_CUMULATIVE_AMOUNT, volumes[query])
+                if level < depth_index.shape[0]:
+                    price = depth_index[level, DEPTH_PRICE]
+                    amount = depth_index[level, DEPTH_AMOUNT]
+                    prices[query] = price
+                    total_cost = depth_index[level, DEPTH_CUMULATIVE_QUOTE_VOLUME] - amount * price
+                    total_volume = depth_index[level, DEPTH_CUMULATIVE_AMOUNT] - amount
+                    incremental_amount = volumes[query] - total_volume
+                    if total_volume + incremental_amount != 0:
+                        vwaps[query] = (total_cost + incremental_amount * price) / (total_volume + incremental_amount)
+            return prices, vwaps
+
+        while query < volumes.shape[0] and ((ask_it != self._ask_book.end()) if is_buy
+                                            else (bid_it != self._bid_book.rend())):
+            if is_buy:
+                price = deref(ask_it).getPrice()
+                amount = deref(ask_it).getAmount()
+                inc(ask_it)
+            else:
+                price = deref(bid_it).getPrice()
+                amount = deref(bid_it).getAmount()
+                inc(bid_it)
+            # Same operations as c_get_price_for_volume and c_get_vwap_for_volume, for identical results
+            level_cost = total_cost + amount * price
+            level_volume = total_volume + amount
+            while query < volumes.shape[0] and level_volume >= volumes[order[query]]:
+                index = order[query]
+                prices[index] = price
+                incremental_amount = volumes[index] - (level_volume - amount)
+                if (level_volume - amount) + incremental_amount != 0:
+                    vwaps[index] = (((level_cost - amount * price) + incremental_amount * price)
+                                    / ((level_volume - amount) + incremental_amount))
+                query += 1
+            total_cost = level_cost
+            total_volume = level_volume
+
+        return prices, vwaps
+
+    cdef tuple c_get_volumes_for_prices(self, bint is_buy, np.ndarray[np.float64_t, ndim=1] prices):
+        cdef:
+            np.ndarray[np.int64_t, ndim=1] order = np.argsort(prices, kind="stable")
+            np.ndarray[np.float64_t, ndim=1] volumes = np.zeros(prices.shape[0], dtype=np.float64)
+            np.ndarray[np.float64_t, ndim=1] quote_volumes = np.zeros(prices.shape[0], dtype=np.float64)
+            Py_ssize_t query
+            Py_ssize_t index
+            double cumulative_volume = 0
+            double cumulative_quote_volume = 0
+            double price
+            double amount
+            const double[::1, :] depth_index
+            Py_ssize_t level
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+
+        if self._depth_index_enabled:
+            depth_index = self.c_get_depth_index(is_buy)
+            for query in range(prices.shape[0]):
+                level = c_depth_level_beyond_price(depth_index, is_buy, prices[query])
+                if level > 0:
+                    volumes[query] = depth_index[level - 1, DEPTH_CUMULATIVE_AMOUNT]
+                    quote_volumes[query] = depth_index[level - 1, DEPTH_CUMULATIVE_QUOTE_VOLUME]
+            return volumes, quote_volumes
+
+        if not is_buy:
+            # The bids are walked from the highest price, so the queries are answered from the highest price
+            order = order[::-1].copy()
+        query = 0
+        while query < prices.shape[0] and ((ask_it != self._ask_book.end()) if is_buy
+                                           else (bid_it != self._bid_book.rend())):
+            if is_buy:
+                price = deref(ask_it).getPrice()
+                amount = deref(ask_it).getAmount()
+            else:
+                price = deref(bid_it).getPrice()
+                amount = deref(bid_it).getAmount()
+            # Queries with a price better than the level get the volume of the levels before it
+            while query < prices.shape[0] and ((prices[order[query]] < price) if is_buy
+                                               else (prices[order[query]] > price)):
+                index = order[query]
+                volumes[index] = cumulative_volume
+                quote_volumes[index] = cumulative_quote_volume
+                query += 1
+            cumulative_volume += amount
+            cumulative_quote_volume += amount * price
+            if is_buy:
+                inc(ask_it)
+            else:
+                inc(bid_it)
+        while query < prices.shape[0]:
+            index = order[query]
+            volumes[index] = cumulative_volume
+            quote_volumes[index] = cumulative_quote_volume
+            query += 1
+
+        return volumes, quote_volumes
+
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
 
@@ -475,9 +984,38 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    def get_depth_index(self, is_buy: bool) -> np.ndarray:
+        """
+        Cumulative depth of one side of the book, rebuilt only when the book changed since the last call.
+        :param is_buy: True for the asks, False for the bids
+        :return: read only float64 array of shape (levels, 4) with [price, amount, cumulative amount, cumulative quote
+        volume] rows, best price first. It is not modified by later book updates.
+        """
+        return self.c_get_depth_index(is_buy)
+
+    def get_depth_curve(self, is_buy: bool, volumes) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Answers the price for volume and VWAP for volume queries of many volumes in a single walk of the book.
+        :param is_buy: True to walk the asks, False to walk the bids
+        :param volumes: the base volumes to query
+        :return: the prices and VWAPs for each volume, as returned by get_price_for_volume and get_vwap_for_volume.
+        NaN where the book doesn't have enough volume.
+        """
+        return self.c_get_depth_curve(is_buy, np.ascontiguousarray(volumes, dtype=np.float64).reshape(-1))
+
+    def get_volumes_for_prices(self, is_buy: bool, prices) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Answers the volume for price and quote volume for price queries of many prices in a single walk of the book.
+        :param is_buy: True to walk the asks, False to walk the bids
+        :param prices: the prices to query
+        :return: the base and quote volumes available at each price or better, as the result volumes of
+        get_volume_for_price and get_quote_volume_for_price
+        """
+        return self.c_get_volumes_for_prices(is_buy, np.ascontiguousarray(prices, dtype=np.float64).reshape(-1))
+
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_message(diff)
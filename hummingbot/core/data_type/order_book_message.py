@@ -1,7 +1,7 @@
 from collections import namedtuple
 from enum import Enum
 from functools import total_ordering
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -54,15 +54,44 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
 
     @property
     def asks(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["asks"]
-        ]
+        # Parsed rows are cached, since the same message is replayed on every snapshot restore
+        asks = self.__dict__.get("_parsed_asks")
+        if asks is None:
+            asks = [
+                OrderBookRow(float(price), float(amount), self.update_id)
+                for price, amount, *trash in self.content["asks"]
+            ]
+            self.__dict__["_parsed_asks"] = asks
+        return asks
 
     @property
     def bids(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
-        ]
+        bids = self.__dict__.get("_parsed_bids")
+        if bids is None:
+            bids = [
+                OrderBookRow(float(price), float(amount), self.update_id)
+                for price, amount, *trash in self.content["bids"]
+            ]
+            self.__dict__["_parsed_bids"] = bids
+        return bids
+
+    @property
+    def has_raw_levels(self) -> bool:
+        """
+        Indicates if the bids and asks in the content are raw exchange levels ([price, amount, ...] with the price and
+        amount as strings or numbers) that share the message update id, so that the order book can parse and apply
+        them directly. Subclasses that redefine how bids and asks are interpreted do not support raw levels.
+        """
+        cls = type(self)
+        return cls.asks is OrderBookMessage.asks and cls.bids is OrderBookMessage.bids
+
+    @property
+    def raw_asks(self) -> List[Any]:
+        return self.content["asks"]
+
+    @property
+    def raw_bids(self) -> List[Any]:
+        return self.content["bids"]
 
     @property
     def has_update_id(self) -> bool:
@@ -23,6 +23,11 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # Maximum number of order book snapshots requested at the same time during initialization. The request rate itself
+    # is controlled by the data source's throttler.
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS: int = 10
+    # Delay before requesting again the snapshots that failed during initialization
+    SNAPSHOT_RETRY_INTERVAL: float = 5.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,11 +36,24 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 coalesce_diffs: bool = False):
+        """
+        :param data_source: the data source providing the order book messages
+        :param trading_pairs: the trading pairs to track
+        :param domain: the exchange domain, if any
+        :param coalesce_diffs: if True, all the diff messages already queued for a trading pair are merged by price
+            level (the highest update id wins) and applied to the order book at once, instead of one by one
+        """
         self._domain: Optional[str] = domain
+        self._coalesce_diffs: bool = coalesce_diffs
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_ready_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -68,6 +86,19 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        Trading pairs whose order book is already initialized, even if the initialization of the rest is ongoing
+        """
+        return [trading_pair for trading_pair in self._trading_pairs if self.is_order_book_ready(trading_pair)]
+
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self._order_book_ready_events and self._order_book_ready_events[trading_pair].is_set()
+
+    async def wait_order_book_ready(self, trading_pair: str):
+        await self._order_book_ready_events[trading_pair].wait()
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -138,6 +169,8 @@ class OrderBookTracker:
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        for ready_event in self._order_book_ready_events.values():
+            ready_event.clear()
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
@@ -174,15 +207,41 @@ class OrderBookTracker:
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books. The snapshots for all trading pairs are requested concurrently (the request rate is
+        limited by the data source's throttler), and each order book starts being tracked as soon as it is ready.
+        The snapshots that fail are requested again after SNAPSHOT_RETRY_INTERVAL, until all order books are ready.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SNAPSHOT_REQUESTS)
+        initialized_count = 0
+
+        async def init_order_book(trading_pair: str):
+            nonlocal initialized_count
+            async with semaphore:
+                order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+            self._order_books[trading_pair] = order_book
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+            self._order_book_ready_events[trading_pair].set()
+            initialized_count += 1
             self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+                               f"{initialized_count}/{len(self._trading_pairs)} completed.")
+
+        pending_trading_pairs = list(self._trading_pairs)
+        while True:
+            results = await asyncio.gather(*[init_order_book(trading_pair) for trading_pair in pending_trading_pairs],
+                                           return_exceptions=True)
+            failed_trading_pairs = []
+            for trading_pair, result in zip(pending_trading_pairs, results):
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                if isinstance(result, Exception):
+                    self.logger().network(f"Unexpected error while initializing the order book for {trading_pair}.",
+                                          exc_info=result)
+                    failed_trading_pairs.append(trading_pair)
+            if len(failed_trading_pairs) == 0:
+                break
+            pending_trading_pairs = failed_trading_pairs
+            await self._sleep(self.SNAPSHOT_RETRY_INTERVAL)
         self._order_books_initialized.set()
 
     async def _order_book_diff_router(self):
@@ -261,20 +320,33 @@ class OrderBookTracker:
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
 
+        next_message: Optional[OrderBookMessage] = None
+
         while True:
             try:
                 saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
 
                 # Process saved messages first if there are any
-                if len(saved_messages) > 0:
+                if next_message is not None:
+                    message, next_message = next_message, None
+                elif len(saved_messages) > 0:
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    if self._coalesce_diffs:
+                        diff_messages, next_message = self._drain_queued_diff_messages(
+                            first_message=message, saved_messages=saved_messages, message_queue=message_queue
+                        )
+                    else:
+                        diff_messages = [message]
+                    if len(diff_messages) == 1:
+                        order_book.apply_diff_message(message)
+                    else:
+                        order_book.apply_diff_messages(diff_messages)
+                    past_diffs_window.extend(diff_messages)
+                    diff_messages_accepted += len(diff_messages)
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -295,6 +367,24 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    @staticmethod
+    def _drain_queued_diff_messages(
+            first_message: OrderBookMessage,
+            saved_messages: Deque[OrderBookMessage],
+            message_queue: asyncio.Queue,
+    ) -> Tuple[List[OrderBookMessage], Optional[OrderBookMessage]]:
+        """
+        Collects the diff messages that are already available for a trading pair, without waiting for new ones.
+        The collection stops at the first message that is not a diff, which is returned to be processed next.
+        """
+        diff_messages: List[OrderBookMessage] = [first_message]
+        while len(saved_messages) > 0 or not message_queue.empty():
+            message = saved_messages.popleft() if len(saved_messages) > 0 else message_queue.get_nowait()
+            if message.type is not OrderBookMessageType.DIFF:
+                return diff_messages, message
+            diff_messages.append(message)
+        return diff_messages, None
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
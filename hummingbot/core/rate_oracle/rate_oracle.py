@@ -1,10 +1,12 @@
 import asyncio
 import logging
+import time
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 import hummingbot.client.settings  # noqa
-from hummingbot.connector.utils import combine_to_hb_trading_pair
+from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
+from hummingbot.core.gateway.utils import unwrap_token_symbol
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.rate_oracle.sources.ascend_ex_rate_source import AscendExRateSource
@@ -18,6 +20,9 @@ from hummingbot.core.rate_oracle.utils import find_rate
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
+if TYPE_CHECKING:
+    from hummingbot.connector.connector_base import ConnectorBase
+
 RATE_ORACLE_SOURCES = {
     "binance": BinanceRateSource,
     "coin_gecko": CoinGeckoRateSource,
@@ -27,12 +32,20 @@ RATE_ORACLE_SOURCES = {
     "gate_io": GateIoRateSource,
 }
 
+# Seconds a requested pair keeps being fetched without being requested again
+PAIR_SUBSCRIPTION_TTL = 300
+MIN_FETCH_INTERVAL = 1.0
+MAX_FETCH_INTERVAL = 30.0
+
 
 class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
     The find_rate is then used on these prices to find a rate on a given pair.
+    The pairs requested to the oracle are subscribed to, only their prices are fetched from the source, and the
+    fetches back off while the rates of the subscribed pairs don't change, up to the smallest max_fetch_interval the
+    pairs were requested with. Pairs are requested with MIN_FETCH_INTERVAL by default, which disables the back off.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
@@ -56,6 +69,12 @@ class RateOracle(NetworkBase):
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
+        # Trading pair -> max fetch interval the pair was requested with -> last request timestamp
+        self._subscribed_pairs: Dict[str, Dict[float, float]] = {}
+        self._subscription_event = asyncio.Event()
+        self._fetch_interval = MIN_FETCH_INTERVAL
+        self._use_connector_prices = False
+        self._connectors: List["ConnectorBase"] = []
 
     def __str__(self):
         return f"{self._source.name} rate oracle"
@@ -95,6 +114,29 @@ class RateOracle(NetworkBase):
             self._quote_token = new_token
             self._prices = {}
 
+    @property
+    def use_connector_prices(self) -> bool:
+        """
+        Whether the rates are found from the order books of the connectors before the prices of the source
+        """
+        return self._use_connector_prices
+
+    @use_connector_prices.setter
+    def use_connector_prices(self, use_connector_prices: bool):
+        self._use_connector_prices = use_connector_prices
+
+    @property
+    def connectors(self) -> List["ConnectorBase"]:
+        return self._connectors.copy()
+
+    @connectors.setter
+    def connectors(self, connectors: List["ConnectorBase"]):
+        self._connectors = list(connectors)
+
+    @property
+    def subscribed_pairs(self) -> List[str]:
+        return list(self._subscribed_pairs)
+
     @property
     def prices(self) -> Dict[str, Decimal]:
         """
@@ -115,7 +157,11 @@ class RateOracle(NetworkBase):
 
     async def check_network(self) -> NetworkStatus:
         try:
-            prices = await self._source.get_prices(quote_token=self._quote_token)
+            trading_pairs = self._active_subscribed_pairs()
+            if trading_pairs:
+                prices = await self._source.get_prices_for_pairs(trading_pairs, quote_token=self._quote_token)
+            else:
+                prices = await self._source.get_prices(quote_token=self._quote_token)
             if not prices:
                 raise Exception(f"Error fetching new prices from {self._source.name}.")
         except asyncio.CancelledError:
@@ -143,19 +189,26 @@ class RateOracle(NetworkBase):
         :param base_token: The token symbol that we want to price, e.g. BTC
         :return A conversion rate
         """
-        prices = await self._source.get_prices(quote_token=self._quote_token)
         pair = combine_to_hb_trading_pair(base=base_token, quote=self._quote_token)
-        return find_rate(prices, pair)
+        return await self.rate_async(pair)
 
-    def get_pair_rate(self, pair: str) -> Decimal:
+    def get_pair_rate(self, pair: str, max_fetch_interval: float = MIN_FETCH_INTERVAL) -> Decimal:
         """
         Finds a conversion rate for a given trading pair, this can be direct or indirect prices as
         long as it can find a route to achieve this.
 
         :param pair: A trading pair, e.g. BTC-USDT
+        :param max_fetch_interval: The longest time in seconds the price fetches may back off to, up to
+            MAX_FETCH_INTERVAL, while the rate doesn't change
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        self._subscribe(pair, max_fetch_interval)
+        rate = None
+        if self._use_connector_prices:
+            rate = find_rate(self._connector_prices(pair), pair)
+        if rate is None:
+            rate = find_rate(self._prices, pair)
+        return rate
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
@@ -173,14 +226,17 @@ class RateOracle(NetworkBase):
 
         return rate
 
-    async def rate_async(self, pair: str) -> Decimal:
+    async def rate_async(self, pair: str, max_fetch_interval: float = MIN_FETCH_INTERVAL) -> Decimal:
         """
         Finds a conversion rate in an async operation, it is a class method which can be used directly without having to
         start the RateOracle network.
         :param pair: A trading pair, e.g. BTC-USDT
+        :param max_fetch_interval: The longest time in seconds the price fetches may back off to, up to
+            MAX_FETCH_INTERVAL, while the rate doesn't change
         :return A conversion rate
         """
-        prices = await self._source.get_prices(quote_token=self._quote_token)
+        self._subscribe(pair, max_fetch_interval)
+        prices = await self._source.get_prices_for_pairs([pair], quote_token=self._quote_token)
         return find_rate(prices, pair)
 
     def set_price(self, pair: str, price: Decimal):
@@ -189,17 +245,107 @@ class RateOracle(NetworkBase):
         """
         self._prices[pair] = price
 
+    def _subscribe(self, pair: str, max_fetch_interval: float):
+        max_fetch_interval = min(max(max_fetch_interval, MIN_FETCH_INTERVAL), MAX_FETCH_INTERVAL)
+        subscriptions = self._subscribed_pairs.setdefault(pair, {})
+        if max_fetch_interval < min(subscriptions, default=MAX_FETCH_INTERVAL + 1):
+            # Fetch the price of the new pair, or the price now requested more often, without waiting for the next fetch
+            self._subscription_event.set()
+        subscriptions[max_fetch_interval] = time.time()
+
+    def _active_subscribed_pairs(self) -> List[str]:
+        expiration = time.time() - PAIR_SUBSCRIPTION_TTL
+        for pair, subscriptions in list(self._subscribed_pairs.items()):
+            for max_fetch_interval in [interval for interval, timestamp in subscriptions.items()
+                                       if timestamp < expiration]:
+                del subscriptions[max_fetch_interval]
+            if not subscriptions:
+                del self._subscribed_pairs[pair]
+        return list(self._subscribed_pairs)
+
+    def _max_fetch_interval(self) -> float:
+        return min((min(subscriptions) for subscriptions in self._subscribed_pairs.values()),
+                   default=MIN_FETCH_INTERVAL)
+
+    def _prune_prices(self, trading_pairs: List[str]):
+        """
+        Drops the prices that share no token with the trading pairs, find_rate doesn't use them for their rates.
+        """
+        tokens = set()
+        for trading_pair in trading_pairs:
+            for token in split_hb_trading_pair(trading_pair=trading_pair):
+                tokens.update((token, unwrap_token_symbol(token)))
+        self._prices = {
+            pair: price for pair, price in self._prices.items()
+            if not tokens.isdisjoint(split_hb_trading_pair(trading_pair=pair))
+        }
+
+    def _connector_prices(self, pair: str) -> Dict[str, Decimal]:
+        """
+        Mid prices of the connectors order books with a token of the pair, enough for find_rate to find its rate.
+        """
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        tokens = {base, quote, unwrap_token_symbol(base), unwrap_token_symbol(quote)}
+        prices = {}
+        for connector in self._connectors:
+            try:
+                order_books = connector.order_books
+            except (AttributeError, NotImplementedError):
+                continue
+            for trading_pair, order_book in order_books.items():
+                if tokens.isdisjoint(split_hb_trading_pair(trading_pair=trading_pair)):
+                    continue
+                try:
+                    mid_price = (Decimal(str(order_book.get_price(True)))
+                                 + Decimal(str(order_book.get_price(False)))) / Decimal("2")
+                except EnvironmentError:
+                    continue  # empty order book
+                if mid_price > 0:
+                    prices[trading_pair] = mid_price
+        return prices
+
+    async def _fetch_prices(self):
+        """
+        Fetches the prices of the subscribed pairs, or every price of the source if no pair is subscribed. The next
+        fetch is delayed twice as long as the previous one while the rates of the subscribed pairs don't change, up to
+        the smallest max fetch interval of the subscriptions.
+        The prices of the pairs no longer subscribed are dropped.
+        """
+        trading_pairs = self._active_subscribed_pairs()
+        if trading_pairs:
+            new_prices = await self._source.get_prices_for_pairs(trading_pairs, quote_token=self._quote_token)
+            self._prune_prices(trading_pairs)
+        else:
+            new_prices = await self._source.get_prices(quote_token=self._quote_token)
+        previous_rates = [find_rate(self._prices, pair) for pair in trading_pairs]
+        self._prices.update(new_prices)
+
+        if self._prices:
+            self._ready_event.set()
+        rates = [find_rate(self._prices, pair) for pair in trading_pairs]
+        if rates != previous_rates:
+            self._fetch_interval = MIN_FETCH_INTERVAL
+        else:
+            self._fetch_interval = min(self._fetch_interval * 2, self._max_fetch_interval())
+
     async def _fetch_price_loop(self):
         while True:
+            self._subscription_event.clear()
             try:
-                new_prices = await self._source.get_prices(quote_token=self._quote_token)
-                self._prices.update(new_prices)
-
-                if self._prices:
-                    self._ready_event.set()
+                await self._fetch_prices()
             except asyncio.CancelledError:
                 raise
             except Exception:
                 self.logger().network(f"Error fetching new prices from {self.source.name}.", exc_info=True,
                                       app_warning_msg=f"Couldn't fetch newest prices from {self.source.name}.")
-            await asyncio.sleep(1)
+            await self._wait_for_next_fetch()
+
+    async def _wait_for_next_fetch(self):
+        # asyncio.wait, unlike asyncio.wait_for, never swallows the cancellation of the fetch loop
+        subscription_task = safe_ensure_future(self._subscription_event.wait())
+        try:
+            done, _ = await asyncio.wait([subscription_task], timeout=self._fetch_interval)
+        finally:
+            subscription_task.cancel()
+        if done:
+            self._fetch_interval = MIN_FETCH_INTERVAL
@@ -1,7 +1,8 @@
 from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
 
 from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.gateway.utils import unwrap_token_symbol
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
@@ -9,6 +10,10 @@ from hummingbot.core.utils.async_utils import safe_gather
 if TYPE_CHECKING:
     from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
 
+# Above this many symbols the book tickers of every pair are requested instead, for the same request weight and
+# without an oversized symbols parameter
+MAX_REQUESTED_SYMBOLS = 100
+
 
 class BinanceRateSource(RateSourceBase):
     def __init__(self):
@@ -40,21 +45,65 @@ class BinanceRateSource(RateSourceBase):
                 results.update(task_result)
         return results
 
+    async def get_prices_for_pairs(self, trading_pairs: List[str], quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        """
+        Fetches the prices of the Binance pairs with a token of the trading pairs, which is all find_rate needs.
+        """
+        self._ensure_exchanges()
+        tokens = set()
+        for trading_pair in trading_pairs:
+            for token in split_hb_trading_pair(trading_pair=trading_pair):
+                tokens.update((token, unwrap_token_symbol(token)))
+        results = {}
+        tasks = [
+            self._get_binance_prices(exchange=self._binance_exchange, tokens=tokens),
+            self._get_binance_prices(exchange=self._binance_us_exchange, quote_token="USD", tokens=tokens),
+        ]
+        task_results = await safe_gather(*tasks, return_exceptions=True)
+        for task_result in task_results:
+            if isinstance(task_result, Exception):
+                self.logger().error(
+                    msg="Unexpected error while retrieving rates from Binance. Check the log file for more info.",
+                    exc_info=task_result,
+                )
+                break
+            else:
+                results.update(task_result)
+        return results
+
     def _ensure_exchanges(self):
         if self._binance_exchange is None:
             self._binance_exchange = self._build_binance_connector_without_private_keys(domain="com")
             self._binance_us_exchange = self._build_binance_connector_without_private_keys(domain="us")
 
     @staticmethod
-    async def _get_binance_prices(exchange: 'BinanceExchange', quote_token: str = None) -> Dict[str, Decimal]:
+    async def _get_binance_prices(
+        exchange: 'BinanceExchange', quote_token: str = None, tokens: Optional[Set[str]] = None
+    ) -> Dict[str, Decimal]:
         """
         Fetches binance prices
 
         :param exchange: The exchange instance from which to query prices.
         :param quote_token: A quote symbol, if specified only pairs with the quote symbol are included for prices
+        :param tokens: Token symbols, if specified only the prices of pairs with one of the tokens are requested,
+            unless there are more than MAX_REQUESTED_SYMBOLS of them
         :return: A dictionary of trading pairs and prices
         """
-        pairs_prices = await exchange.get_all_pairs_prices()
+        if tokens is None:
+            pairs_prices = await exchange.get_all_pairs_prices()
+        else:
+            symbol_map = await exchange.trading_pair_symbol_map()
+            symbols = [
+                symbol for symbol, trading_pair in symbol_map.items()
+                if not tokens.isdisjoint(split_hb_trading_pair(trading_pair=trading_pair))
+                and (quote_token is None or split_hb_trading_pair(trading_pair=trading_pair)[1] == quote_token)
+            ]
+            if len(symbols) > MAX_REQUESTED_SYMBOLS:
+                pairs_prices = await exchange.get_all_pairs_prices()
+            elif symbols:
+                pairs_prices = await exchange.get_pairs_prices(symbols=symbols)
+            else:
+                pairs_prices = []
         results = {}
         for pair_price in pairs_prices:
             try:
@@ -1,7 +1,7 @@
 import logging
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from hummingbot.logger import HummingbotLogger
 
@@ -23,3 +23,14 @@ class RateSourceBase(ABC):
     @abstractmethod
     async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
         ...
+
+    async def get_prices_for_pairs(self, trading_pairs: List[str], quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        """
+        Fetches the prices needed to find the rates of the trading pairs. Sources that can't fetch a part of their
+        prices return all of them.
+
+        :param trading_pairs: The trading pairs for which rates are needed
+        :param quote_token: A quote symbol, if specified only pairs with the quote symbol are included for prices
+        :return: A dictionary of trading pairs and prices
+        """
+        return await self.get_prices(quote_token=quote_token)
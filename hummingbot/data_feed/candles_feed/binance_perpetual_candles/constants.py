@@ -5,8 +5,10 @@ from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, Rate
 REST_URL = "https://fapi.binance.com"
 HEALTH_CHECK_ENDPOINT = "/fapi/v1/ping"
 CANDLES_ENDPOINT = "/fapi/v1/klines"
+CANDLES_FETCH_LIMIT = 1000
 
 WSS_URL = "wss://fstream.binance.com/ws"
+WS_MAX_STREAMS_PER_CONNECTION = 200
 
 INTERVALS = bidict({
     "1m": 60,
@@ -5,8 +5,10 @@ from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, Rate
 REST_URL = "https://api.binance.com"
 HEALTH_CHECK_ENDPOINT = "/api/v3/ping"
 CANDLES_ENDPOINT = "/api/v3/klines"
+CANDLES_FETCH_LIMIT = 1000
 
 WSS_URL = "wss://stream.binance.com:9443/ws"
+WS_MAX_STREAMS_PER_CONNECTION = 200
 
 INTERVALS = bidict({
     "1s": "1s",
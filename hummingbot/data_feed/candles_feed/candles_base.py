@@ -1,8 +1,8 @@
 import asyncio
 import os
-from collections import deque
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from bidict import bidict
 
@@ -10,14 +10,18 @@ from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+from hummingbot.data_feed.candles_feed.candles_history_store import CandlesHistoryStore
+from hummingbot.data_feed.candles_feed.candles_stream_multiplexer import CandlesStreamMultiplexer
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a CandlesBuffer to store candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
     """
@@ -41,13 +45,18 @@ class CandlesBase(NetworkBase):
     })
     columns = ["timestamp", "open", "high", "low", "close", "volume", "quote_asset_volume",
                "n_trades", "taker_buy_base_volume", "taker_buy_quote_volume"]
+    # Maximum number of attempts to get the historical candles from the history store
+    HISTORICAL_CANDLES_MAX_ATTEMPTS = 5
 
     def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150):
         super().__init__()
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesBuffer(n_columns=len(self.columns), maxlen=max_records)
+        self._candles_df_cache: Optional[Tuple[int, pd.DataFrame]] = None
         self._listen_candles_task: Optional[asyncio.Task] = None
+        self._stream_multiplexer: Optional[CandlesStreamMultiplexer] = None
+        self._history_store: Optional[CandlesHistoryStore] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
         if interval in self.intervals.keys():
@@ -59,23 +68,34 @@ class CandlesBase(NetworkBase):
 
     async def start_network(self):
         """
-        This method starts the network and starts a task for listen_for_subscriptions.
+        This method starts the network. If the candles feed supports shared websocket connections, it streams the
+        candles through the CandlesStreamMultiplexer of the exchange, otherwise it starts a task for
+        listen_for_subscriptions.
         """
         await self.stop_network()
-        self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
+        if self.ws_max_channels_per_connection is not None:
+            self._stream_multiplexer = CandlesStreamMultiplexer.get_instance(self)
+            self._api_factory = self._stream_multiplexer.api_factory
+            self._stream_multiplexer.add_feed(self)
+        else:
+            self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
 
     async def stop_network(self):
         """
-        This method stops the network by canceling the _listen_candles_task task.
+        This method stops the network by canceling the _listen_candles_task task, or removing the candles feed from
+        the CandlesStreamMultiplexer.
         """
         if self._listen_candles_task is not None:
             self._listen_candles_task.cancel()
             self._listen_candles_task = None
+        if self._stream_multiplexer is not None:
+            self._stream_multiplexer.remove_feed(self)
+            self._stream_multiplexer = None
 
     @property
     def is_ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -110,12 +130,140 @@ class CandlesBase(NetworkBase):
     async def check_network(self) -> NetworkStatus:
         raise NotImplementedError
 
+    @property
+    def candles_fetch_limit(self) -> Optional[int]:
+        """
+        This property returns the maximum number of candles returned by fetch_candles for a range of timestamps, or
+        None if the historical candles of the candles feed are not fetched by range. When it is set, the historical
+        candles are filled from the CandlesHistoryStore.
+        """
+        return None
+
+    @property
+    def candles_timestamp_scale(self) -> int:
+        """
+        This property returns the number of units of the timestamps of the candles in a second, e.g. 1000 if the
+        timestamps are in milliseconds.
+        """
+        return 1
+
+    @property
+    def candle_timestamp_step(self) -> int:
+        """
+        This property returns the duration of a candle in the unit of the timestamps of the candles.
+        """
+        return self.get_seconds_from_interval(self.interval) * self.candles_timestamp_scale
+
+    @property
+    def history_store(self) -> CandlesHistoryStore:
+        """
+        This property returns the store of the historical candles, shared by every candles feed by default.
+        """
+        return self._history_store or CandlesHistoryStore.get_instance()
+
+    @history_store.setter
+    def history_store(self, history_store: CandlesHistoryStore):
+        self._history_store = history_store
+
+    @property
+    def ws_max_channels_per_connection(self) -> Optional[int]:
+        """
+        This property returns the maximum number of channels subscribed through a websocket connection shared with
+        other candles feeds of the exchange, or None if the candles feed uses its own websocket connection.
+        A candles feed that supports shared connections implements ws_channel, ws_subscription_request,
+        ws_message_channel and _process_websocket_message.
+        """
+        return None
+
+    @property
+    def ws_subscription_interval(self) -> float:
+        """
+        This property returns the minimum time in seconds between two subscription requests sent through a shared
+        websocket connection.
+        """
+        return 1.0
+
+    @property
+    def ws_channel(self) -> str:
+        """
+        This property returns the websocket channel of the candles of the trading pair and interval.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def ws_subscription_request(cls, channels: List[str], subscribe: bool = True) -> WSJSONRequest:
+        """
+        This method returns the request that subscribes to, or unsubscribes from, the websocket channels.
+        :param channels: the websocket channels
+        :param subscribe: True to subscribe to the channels, False to unsubscribe from them
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def ws_message_channel(cls, data: Dict[str, Any]) -> Optional[str]:
+        """
+        This method returns the websocket channel of a websocket message, or None if it is not a candles message.
+        :param data: the websocket message
+        """
+        raise NotImplementedError
+
+    @property
+    def candles_version(self) -> int:
+        """
+        This property returns a number that increases every time the candles are updated.
+        """
+        return self._candles.version
+
+    @property
+    def last_candle_timestamp(self) -> Optional[float]:
+        """
+        This property returns the timestamp of the last candle, or None if there are no candles.
+        """
+        return float(self._candles[-1][0]) if len(self._candles) > 0 else None
+
+    @property
+    def last_candle(self) -> Optional[np.ndarray]:
+        """
+        This property returns the values of the last candle, in the order of the columns, or None if there are no
+        candles.
+        """
+        return self._candles[-1] if len(self._candles) > 0 else None
+
+    @property
+    def candles_array(self) -> np.ndarray:
+        """
+        This property returns a read-only view of the candles stored in the _candles buffer, with a row for every
+        candle and a column for every value in the order of the columns. The view is not copied: it shows the updates
+        of the current candle, but it is only valid until a candle is added or removed, and must be copied to be kept.
+        """
+        return self._candles.values
+
+    def get_column(self, column: str) -> np.ndarray:
+        """
+        This method returns a read-only contiguous view of a column of the candles stored in the _candles buffer. The
+        view is not copied: it shows the updates of the current candle, but it is only valid until a candle is added
+        or removed, and must be copied to be kept.
+        :param column: name of the column
+        """
+        return self._candles.column(self.columns.index(column))
+
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles buffer as a Pandas DataFrame.
+        The DataFrame is built once per update of the candles, and a copy of it is returned, so it can be modified.
+        """
+        if self._candles_df_cache is None or self._candles_df_cache[0] != self._candles.version:
+            candles_df = pd.DataFrame(self._candles.values, columns=self.columns, copy=True)
+            self._candles_df_cache = (self._candles.version, candles_df)
+        return self._candles_df_cache[1].copy()
+
+    def get_candles_df(self, start: int = 0) -> pd.DataFrame:
+        """
+        This method returns the candles stored in the _candles buffer from the given position as a Pandas DataFrame.
+        :param start: position of the first candle
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        return pd.DataFrame(self._candles.values[start:], columns=self.columns, copy=True)
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -133,6 +281,23 @@ class CandlesBase(NetworkBase):
         df.sort_values(by="timestamp", ascending=False, inplace=True)
         self._candles.extendleft(df.values.tolist())
 
+    def load_candles_from_store(self) -> bool:
+        """
+        This method loads the last candles of the newest range stored in the history store, memory-mapped so that only
+        the loaded candles are read.
+        :return: True if there were stored candles, False otherwise
+        """
+        stored_ranges = self.history_store.stored_ranges(self)
+        if len(stored_ranges) == 0:
+            return False
+        range_start, range_end = stored_ranges[-1]
+        start_time = max(range_start, range_end - (self._candles.maxlen - 1) * self.candle_timestamp_step)
+        stored = self.history_store.load(self, start_time=start_time, end_time=range_end)
+        if stored is None or stored.shape[1] == 0:
+            return False
+        self._candles.extendleft(stored.T[::-1])
+        return True
+
     async def fetch_candles(self,
                             start_time: Optional[int] = None,
                             end_time: Optional[int] = None,
@@ -148,9 +313,68 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This is an abstract method that must be implemented by a subclass to fill the _candles deque with historical candles.
+        This method fills the _candles buffer with the candles before the first candle, from the history store. It
+        must be implemented by a subclass without a candles_fetch_limit.
+        The candles before the first candle are closed, they are not capped to the last closed candle by the local
+        clock.
         """
-        raise NotImplementedError
+        if self.candles_fetch_limit is None:
+            raise NotImplementedError
+        if len(self._candles) == 0 or self.is_ready:
+            return
+        first_timestamp = int(self._candles[0][0])
+        missing_records = self._candles.maxlen - len(self._candles)
+        end_time = first_timestamp - self.candle_timestamp_step
+        start_time = end_time - (missing_records - 1) * self.candle_timestamp_step
+        candles = await self._get_candles_from_store(start_time=start_time, end_time=end_time, end_time_closed=True)
+        if candles is None:
+            return
+        # The candles might have been cleared or updated by the websocket while fetching the historical candles
+        if len(self._candles) == 0 or int(self._candles[0][0]) != first_timestamp:
+            return
+        missing_records = self._candles.maxlen - len(self._candles)
+        if missing_records > 0 and len(candles) > 0:
+            self._candles.extendleft(candles[-missing_records:][::-1])
+        if not self.is_ready:
+            self.logger().error(f"There is no data available for the quantity of "
+                                f"candles requested for {self.name}.")
+
+    async def download_candles(self):
+        """
+        This method replaces the candles of the _candles buffer with the last closed candles, from the history store,
+        without the websocket. Only the candles that are not stored yet are fetched from the exchange.
+        """
+        if self.candles_fetch_limit is None:
+            raise NotImplementedError
+        end_time = self.history_store.last_closed_candle_timestamp(self)
+        start_time = end_time - (self._candles.maxlen - 1) * self.candle_timestamp_step
+        candles = await self._get_candles_from_store(start_time=start_time, end_time=end_time)
+        if candles is None:
+            return
+        self._candles.clear()
+        self._candles.extendleft(candles[::-1])
+        if not self.is_ready:
+            self.logger().error(f"There is no data available for the quantity of "
+                                f"candles requested for {self.name}.")
+
+    async def _get_candles_from_store(self, start_time: int, end_time: int,
+                                      end_time_closed: bool = False) -> Optional[np.ndarray]:
+        for attempt in range(1, self.HISTORICAL_CANDLES_MAX_ATTEMPTS + 1):
+            try:
+                return await self.history_store.get_candles(self, start_time=start_time, end_time=end_time,
+                                                            end_time_closed=end_time_closed)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                if attempt == self.HISTORICAL_CANDLES_MAX_ATTEMPTS:
+                    self.logger().exception(
+                        f"Unexpected error occurred when getting historical klines. Giving up after {attempt} attempts."
+                    )
+                    return None
+                self.logger().exception(
+                    "Unexpected error occurred when getting historical klines. Retrying in 1 seconds...",
+                )
+                await self._sleep(1.0)
 
     async def listen_for_subscriptions(self):
         """
@@ -191,6 +415,13 @@ class CandlesBase(NetworkBase):
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         raise NotImplementedError
 
+    def _process_websocket_message(self, data: Dict[str, Any]):
+        """
+        Updates the candles with a candles message received through a shared websocket connection.
+        :param data: the websocket message
+        """
+        raise NotImplementedError
+
     async def _sleep(self, delay):
         """
         Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
@@ -0,0 +1,156 @@
+from typing import Iterable, Iterator, Union
+
+import numpy as np
+
+
+class CandlesBuffer:
+    """
+    Fixed capacity buffer of candles, stored by column in a preallocated float64 array, with the interface of a
+    double-ended queue with a maximum length: appending a candle to a full buffer evicts the first candle.
+    Each column is stored in a contiguous array with room for twice the maximum number of candles. The candles are
+    written one after the other from a head position, and moved back to the start of the arrays when the end is
+    reached, so that the candles are always contiguous and in order, and can be read as arrays without copying them.
+    The arrays returned by values and column are views of the buffer: they show the updates of the candles they cover
+    in place, and are only valid until the next candle is appended, removed or prepended, which can move the candles
+    to the start of the buffer. They must be copied to be kept longer.
+    The buffer also keeps track of its updates, so that the users of the candles can tell if they changed, and which
+    candles changed, without comparing them.
+    - version: increases with every update of the candles
+    - rewrites: number of updates of the candles other than appending a candle or updating the last candle
+    - pops: number of candles removed from the end, or updated in place at the end
+    - evictions: number of candles removed from the start when appending to a full buffer
+    """
+
+    def __init__(self, n_columns: int, maxlen: int):
+        self._maxlen = maxlen
+        self._data = np.full((n_columns, 2 * maxlen), np.nan, dtype=np.float64)
+        self._head = 0
+        self._tail = 0
+        self.version = 0
+        self.rewrites = 0
+        self.pops = 0
+        self.evictions = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Read-only view of the candles, with a row for every candle in order and a column for every value, valid until
+        the candles are appended, removed or prepended.
+        """
+        return self._read_only(self._data[:, self._head:self._tail].T)
+
+    def column(self, index: int) -> np.ndarray:
+        """
+        Read-only contiguous view of a column of the candles, valid until the candles are appended, removed or
+        prepended.
+        :param index: position of the column
+        """
+        return self._read_only(self._data[index, self._head:self._tail])
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for position in range(self._head, self._tail):
+            yield self._data[:, position].copy()
+
+    def __getitem__(self, index: Union[int, slice]) -> np.ndarray:
+        if isinstance(index, slice):
+            return self.values[index].copy()
+        return self._data[:, self._position(index)].copy()
+
+    def __setitem__(self, index: int, candle):
+        position = self._position(index)
+        self._data[:, position] = candle
+        if position == self._tail - 1:
+            self.pops += 1
+        else:
+            self.rewrites += 1
+        self.version += 1
+
+    def append(self, candle):
+        if len(self) == self._maxlen:
+            self._head += 1
+            self.evictions += 1
+        if self._tail == self._data.shape[1]:
+            self._move_to_start()
+        self._data[:, self._tail] = candle
+        self._tail += 1
+        self.version += 1
+
+    def update_last(self, candle):
+        """
+        Updates the last candle in place, e.g. with the new values of the current candle.
+        """
+        self[-1] = candle
+
+    def pop(self) -> np.ndarray:
+        candle = self[-1]
+        self._tail -= 1
+        self.pops += 1
+        self.version += 1
+        return candle
+
+    def extend(self, candles: Iterable):
+        for candle in candles:
+            self.append(candle)
+
+    def appendleft(self, candle):
+        self.extendleft([candle])
+
+    def extendleft(self, candles: Iterable):
+        """
+        Prepends the candles one by one, so they end up in reverse order, removing the last candles beyond the
+        maximum length.
+        """
+        if not isinstance(candles, np.ndarray):
+            candles = list(candles)
+        new_candles = np.asarray(candles, dtype=np.float64).reshape(-1, self._data.shape[0])[::-1]
+        candles = np.concatenate([new_candles.T, self._data[:, self._head:self._tail]], axis=1)
+        self._set(candles[:, :self._maxlen])
+
+    def popleft(self) -> np.ndarray:
+        candle = self[0]
+        self._head += 1
+        self._rewrite()
+        return candle
+
+    def clear(self):
+        self._head = 0
+        self._tail = 0
+        self._rewrite()
+
+    def _set(self, candles: np.ndarray):
+        count = candles.shape[1]
+        self._data[:, :count] = candles
+        self._head = 0
+        self._tail = count
+        self._rewrite()
+
+    def _rewrite(self):
+        self.rewrites += 1
+        self.version += 1
+
+    def _move_to_start(self):
+        # The views of the candles returned before point to the previous positions of the candles
+        count = len(self)
+        self._data[:, :count] = self._data[:, self._head:self._tail]
+        self._head = 0
+        self._tail = count
+
+    def _position(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("candles index out of range")
+        return self._head + index
+
+    @staticmethod
+    def _read_only(view: np.ndarray) -> np.ndarray:
+        view.flags.writeable = False
+        return view
@@ -0,0 +1,231 @@
+import asyncio
+import os
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot import data_path
+
+if TYPE_CHECKING:
+    from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+
+
+class CandlesHistoryStore:
+    """
+    On-disk cache of the historical candles of the candles feeds, by exchange, trading pair and interval.
+    The candles of a candles feed are stored in a directory of chunk files of consecutive candles, with an array per
+    column sorted by timestamp that is loaded memory-mapped. The name of a chunk file is the range of timestamps of its
+    candles, so a feed can have several stored ranges of candles. Only the closed candles are stored, and only the
+    candles missing from the stored ranges are fetched, in pages of up to `candles_fetch_limit` candles requested in
+    parallel. The requests go through the throttler of the candles feed, which keeps them within the rate limits of
+    the exchange.
+    The fetched candles are saved in new chunks, which are merged with the neighbouring chunks that are not bigger
+    than them. Extending a range rewrites its small chunks only, and a range has a number of chunks logarithmic in its
+    number of candles.
+    Unless the end of the requested candles is known to be closed, a candle is considered closed CLOSED_CANDLE_MARGIN
+    seconds after its end by the local clock, which can be ahead of the clock of the exchange. The last candle of a
+    stored range is fetched again when the range is extended, so that a candle stored before it was closed is replaced.
+    """
+    CLOSED_CANDLE_MARGIN = 10
+    _shared_instance: Optional["CandlesHistoryStore"] = None
+
+    @classmethod
+    def get_instance(cls) -> "CandlesHistoryStore":
+        if cls._shared_instance is None:
+            cls._shared_instance = cls()
+        return cls._shared_instance
+
+    def __init__(self, path: Optional[str] = None, max_parallel_requests: int = 5):
+        """
+        :param path: directory of the stored candles, `candles_history` in the data directory by default
+        :param max_parallel_requests: maximum number of candles requests sent at the same time
+        """
+        self._path = path
+        self._max_parallel_requests = max_parallel_requests
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    @property
+    def path(self) -> str:
+        if self._path is None:
+            self._path = os.path.join(data_path(), "candles_history")
+        return self._path
+
+    def directory_path(self, candles: "CandlesBase") -> str:
+        return os.path.join(self.path, f"candles_{candles.name}_{candles.interval}")
+
+    def load(self, candles: "CandlesBase", start_time: Optional[int] = None,
+             end_time: Optional[int] = None) -> Optional[np.ndarray]:
+        """
+        Returns the stored candles of the candles feed from start_time to end_time, both included, with a row for
+        every column and a column for every candle, or None if there are no stored candles. The candles of a single
+        chunk are returned as a read-only memory-mapped array, so that only the returned candles are read.
+        :param start_time: timestamp of the first candle, the first stored candle by default
+        :param end_time: timestamp of the last candle, the last stored candle by default
+        """
+        chunks = self._chunks(candles)
+        if len(chunks) == 0:
+            return None
+        parts = []
+        for index, (chunk_start, chunk_end, file_path) in enumerate(chunks):
+            if (start_time is not None and chunk_end < start_time) or (end_time is not None and chunk_start > end_time):
+                continue
+            columns = np.load(file_path, mmap_mode="r")
+            timestamps = columns[0]
+            first = 0 if start_time is None else np.searchsorted(timestamps, start_time, side="left")
+            last = len(timestamps) if end_time is None else np.searchsorted(timestamps, end_time, side="right")
+            if index + 1 < len(chunks):
+                # The candles fetched again at the start of the next chunk replace the candles of this chunk
+                last = min(last, np.searchsorted(timestamps, chunks[index + 1][0], side="left"))
+            if first < last:
+                parts.append(columns[:, first:last])
+        if len(parts) == 0:
+            return np.empty((len(candles.columns), 0))
+        return parts[0] if len(parts) == 1 else np.concatenate(parts, axis=1)
+
+    def stored_ranges(self, candles: "CandlesBase") -> List[Tuple[int, int]]:
+        """
+        Returns the timestamps of the first and last candles of the ranges fetched for the candles feed, sorted and
+        without any two ranges next to each other.
+        """
+        step = candles.candle_timestamp_step
+        ranges = []
+        for chunk_start, chunk_end, _ in self._chunks(candles):
+            if len(ranges) > 0 and chunk_start <= ranges[-1][1] + step:
+                ranges[-1] = (ranges[-1][0], max(ranges[-1][1], chunk_end))
+            else:
+                ranges.append((chunk_start, chunk_end))
+        return ranges
+
+    async def get_candles(self, candles: "CandlesBase", start_time: int, end_time: int,
+                          end_time_closed: bool = False) -> np.ndarray:
+        """
+        Returns the closed candles of the candles feed from start_time to end_time, both included, with a row for
+        every candle, fetching the candles missing from the store.
+        :param candles: the candles feed, with a candles_fetch_limit
+        :param start_time: timestamp of the first candle, in the unit of the timestamps of the candles
+        :param end_time: timestamp of the last candle, in the unit of the timestamps of the candles
+        :param end_time_closed: True if the candle of end_time is known to be closed, e.g. because a later candle was
+            received from the websocket. Otherwise end_time is capped to the last closed candle by the local clock.
+        """
+        step = candles.candle_timestamp_step
+        start_time = int(start_time)
+        end_time = int(end_time)
+        if not end_time_closed:
+            end_time = min(end_time, self.last_closed_candle_timestamp(candles))
+        if start_time > end_time:
+            return np.empty((0, len(candles.columns)))
+        lock = self._locks.setdefault(self.directory_path(candles), asyncio.Lock())
+        async with lock:
+            missing_ranges = self._missing_ranges(self.stored_ranges(candles), start_time, end_time, step)
+            if len(missing_ranges) > 0:
+                fetched = await self._fetch_ranges(candles, missing_ranges)
+                self._save(candles, fetched, missing_ranges)
+            # Copied, the chunk files can be merged and removed once the lock is released
+            return np.array(self.load(candles, start_time, end_time).T)
+
+    async def _fetch_ranges(self, candles: "CandlesBase", ranges: List[Tuple[int, int]]) -> np.ndarray:
+        step = candles.candle_timestamp_step
+        limit = candles.candles_fetch_limit
+        pages = [(page_start, min(page_start + (limit - 1) * step, range_end))
+                 for range_start, range_end in ranges
+                 for page_start in range(range_start, range_end + 1, limit * step)]
+        semaphore = asyncio.Semaphore(self._max_parallel_requests)
+
+        async def fetch_page(page_start: int, page_end: int) -> np.ndarray:
+            async with semaphore:
+                page = await candles.fetch_candles(start_time=page_start, end_time=page_end, limit=limit)
+            return np.asarray(page, dtype=np.float64).reshape(-1, len(candles.columns))
+
+        fetched_pages = await asyncio.gather(*[fetch_page(page_start, page_end) for page_start, page_end in pages])
+        return np.concatenate(fetched_pages).T
+
+    def _save(self, candles: "CandlesBase", fetched: np.ndarray, ranges: List[Tuple[int, int]]):
+        os.makedirs(self.directory_path(candles), exist_ok=True)
+        new_chunks = []
+        for range_start, range_end in ranges:
+            in_range = fetched[:, (fetched[0] >= range_start) & (fetched[0] <= range_end)]
+            _, positions = np.unique(in_range[0], return_index=True)
+            new_chunks.append(self._write_chunk(candles, range_start, range_end, in_range[:, positions]))
+        for chunk in new_chunks:
+            self._merge_chunk(candles, chunk)
+
+    def _merge_chunk(self, candles: "CandlesBase", chunk: Tuple[int, int, str]):
+        """
+        Merges the chunk with the neighbouring chunks of its range that are not bigger than it, until it has none.
+        """
+        step = candles.candle_timestamp_step
+
+        def size(merged_chunk: Tuple[int, int, str]) -> int:
+            return (merged_chunk[1] - merged_chunk[0]) // step + 1
+
+        while True:
+            chunks = self._chunks(candles)
+            if chunk not in chunks:
+                return  # already merged with the chunk of another fetched range
+            index = chunks.index(chunk)
+            neighbours = [
+                neighbour for neighbour in chunks[max(index - 1, 0):index] + chunks[index + 1:index + 2]
+                if neighbour[1] + step >= chunk[0] and neighbour[0] <= chunk[1] + step and size(neighbour) <= size(chunk)
+            ]
+            if len(neighbours) == 0:
+                return
+            merged = [chunk] + neighbours
+            merged_start = min(merged_chunk[0] for merged_chunk in merged)
+            merged_end = max(merged_chunk[1] for merged_chunk in merged)
+            columns = np.array(self.load(candles, merged_start, merged_end))
+            chunk = self._write_chunk(candles, merged_start, merged_end, columns)
+            for _, _, file_path in merged:
+                if file_path != chunk[2]:
+                    os.remove(file_path)
+
+    def _write_chunk(self, candles: "CandlesBase", start_time: int, end_time: int,
+                     columns: np.ndarray) -> Tuple[int, int, str]:
+        file_path = os.path.join(self.directory_path(candles), f"{int(start_time)}_{int(end_time)}.npy")
+        with open(f"{file_path}.tmp", "wb") as chunk_file:
+            np.save(chunk_file, np.ascontiguousarray(columns))
+        os.replace(f"{file_path}.tmp", file_path)
+        return int(start_time), int(end_time), file_path
+
+    def _chunks(self, candles: "CandlesBase") -> List[Tuple[int, int, str]]:
+        directory_path = self.directory_path(candles)
+        if not os.path.isdir(directory_path):
+            return []
+        chunks = []
+        for file_name in os.listdir(directory_path):
+            name, extension = os.path.splitext(file_name)
+            if extension == ".npy":
+                chunk_start, chunk_end = name.split("_")
+                chunks.append((int(chunk_start), int(chunk_end), os.path.join(directory_path, file_name)))
+        return sorted(chunks)
+
+    @staticmethod
+    def _missing_ranges(stored_ranges: List[Tuple[int, int]], start_time: int, end_time: int,
+                        step: int) -> List[Tuple[int, int]]:
+        missing_ranges = []
+        missing_start = start_time
+        for range_start, range_end in stored_ranges:
+            if range_end + step < missing_start:
+                continue
+            if range_start > end_time:
+                break
+            if range_start > missing_start:
+                missing_ranges.append((missing_start, range_start - step))
+            # The last candle of the stored range is fetched again if the range is extended
+            missing_start = range_end if range_end < end_time else end_time + step
+        if missing_start <= end_time:
+            missing_ranges.append((missing_start, end_time))
+        return missing_ranges
+
+    def last_closed_candle_timestamp(self, candles: "CandlesBase") -> int:
+        """
+        Returns the timestamp of the last closed candle of the candles feed, in the unit of the timestamps of the
+        candles.
+        """
+        step = candles.candle_timestamp_step
+        now = int((self._time() - self.CLOSED_CANDLE_MARGIN) * candles.candles_timestamp_scale)
+        return now // step * step - step
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
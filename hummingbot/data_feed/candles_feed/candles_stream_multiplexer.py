@@ -0,0 +1,187 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Type
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+
+
+class CandlesStreamConnection:
+    """
+    Websocket connection shared by the candles feeds of some of the channels of a CandlesStreamMultiplexer.
+    The subscriptions are sent in batches, at most one request per subscription interval, and every channel of the
+    connection is subscribed again when it reconnects.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, multiplexer: "CandlesStreamMultiplexer"):
+        self._multiplexer = multiplexer
+        self.channels: Set[str] = set()
+        self._pending_subscriptions: Set[str] = set()
+        self._pending_unsubscriptions: Set[str] = set()
+        self._subscriptions_updated = asyncio.Event()
+        self._listen_task: Optional[asyncio.Task] = None
+
+    def subscribe(self, channel: str):
+        self.channels.add(channel)
+        self._pending_unsubscriptions.discard(channel)
+        self._pending_subscriptions.add(channel)
+        self._subscriptions_updated.set()
+        if self._listen_task is None:
+            self._listen_task = safe_ensure_future(self.listen_for_subscriptions())
+
+    def unsubscribe(self, channel: str):
+        self.channels.discard(channel)
+        if channel in self._pending_subscriptions:
+            self._pending_subscriptions.discard(channel)
+        else:
+            self._pending_unsubscriptions.add(channel)
+            self._subscriptions_updated.set()
+
+    def stop(self):
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            self._listen_task = None
+
+    async def listen_for_subscriptions(self):
+        ws: Optional[WSAssistant] = None
+        while True:
+            send_subscriptions_task: Optional[asyncio.Task] = None
+            try:
+                ws = await self._multiplexer.connected_websocket_assistant()
+                # Only the channels of this connection are subscribed again
+                self._pending_subscriptions = set(self.channels)
+                self._pending_unsubscriptions.clear()
+                self._subscriptions_updated.set()
+                send_subscriptions_task = safe_ensure_future(self._send_subscriptions(ws))
+                async for ws_response in ws.iter_messages():
+                    data = ws_response.data
+                    if data is not None:  # data will be None when the websocket is disconnected
+                        self._multiplexer.process_websocket_message(data)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The websocket connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    "Unexpected error occurred when listening to public klines. Retrying in 1 seconds...",
+                )
+                await self._sleep(1.0)
+            finally:
+                send_subscriptions_task and send_subscriptions_task.cancel()
+                ws and await ws.disconnect()
+                await self._multiplexer.on_stream_interruption(self.channels)
+
+    async def _send_subscriptions(self, ws: WSAssistant):
+        while True:
+            await self._subscriptions_updated.wait()
+            self._subscriptions_updated.clear()
+            subscriptions, self._pending_subscriptions = self._pending_subscriptions, set()
+            unsubscriptions, self._pending_unsubscriptions = self._pending_unsubscriptions, set()
+            if unsubscriptions:
+                await ws.send(self._multiplexer.feed_class.ws_subscription_request(sorted(unsubscriptions),
+                                                                                   subscribe=False))
+            if subscriptions:
+                await ws.send(self._multiplexer.feed_class.ws_subscription_request(sorted(subscriptions)))
+                self.logger().info(f"Subscribed to {len(subscriptions)} public klines channels...")
+            await self._sleep(self._multiplexer.subscription_interval)
+
+    async def _sleep(self, delay: float):
+        """
+        Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
+        """
+        await asyncio.sleep(delay)
+
+
+class CandlesStreamMultiplexer:
+    """
+    Streams the candles of every candles feed of an exchange through a small pool of websocket connections, instead of
+    a connection per candles feed. Each connection subscribes to the channels of up to
+    `ws_max_channels_per_connection` candles feeds, and the messages are routed to the candles feeds by channel.
+    The candles feeds of the exchange also share the throttler of the REST requests, e.g. to fill the historical
+    candles.
+    """
+    _instances: Dict[str, "CandlesStreamMultiplexer"] = {}
+
+    @classmethod
+    def get_instance(cls, candles: "CandlesBase") -> "CandlesStreamMultiplexer":
+        if candles.wss_url not in cls._instances:
+            cls._instances[candles.wss_url] = cls(candles)
+        return cls._instances[candles.wss_url]
+
+    def __init__(self, candles: "CandlesBase"):
+        self.feed_class: Type["CandlesBase"] = type(candles)
+        self.wss_url = candles.wss_url
+        self.max_channels_per_connection = candles.ws_max_channels_per_connection
+        self.subscription_interval = candles.ws_subscription_interval
+        self.api_factory = WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=candles.rate_limits))
+        self._feeds: Dict[str, List["CandlesBase"]] = {}
+        self._connections: List[CandlesStreamConnection] = []
+        self._channel_connections: Dict[str, CandlesStreamConnection] = {}
+
+    @property
+    def connections(self) -> List[CandlesStreamConnection]:
+        return self._connections
+
+    def add_feed(self, candles: "CandlesBase"):
+        channel = candles.ws_channel
+        feeds = self._feeds.setdefault(channel, [])
+        if candles in feeds:
+            return
+        feeds.append(candles)
+        if len(feeds) == 1:
+            connection = self._connection_with_room()
+            connection.subscribe(channel)
+            self._channel_connections[channel] = connection
+
+    def remove_feed(self, candles: "CandlesBase"):
+        channel = candles.ws_channel
+        feeds = self._feeds.get(channel, [])
+        if candles not in feeds:
+            return
+        feeds.remove(candles)
+        if len(feeds) == 0:
+            del self._feeds[channel]
+            connection = self._channel_connections.pop(channel)
+            connection.unsubscribe(channel)
+            if len(connection.channels) == 0:
+                connection.stop()
+                self._connections.remove(connection)
+
+    async def connected_websocket_assistant(self) -> WSAssistant:
+        ws: WSAssistant = await self.api_factory.get_ws_assistant()
+        await ws.connect(ws_url=self.wss_url, ping_timeout=30)
+        return ws
+
+    def process_websocket_message(self, data: Dict[str, Any]):
+        channel = self.feed_class.ws_message_channel(data)
+        for candles in self._feeds.get(channel, []):
+            try:
+                candles._process_websocket_message(data)
+            except Exception:
+                candles.logger().exception(f"Unexpected error processing the klines of {candles.name}.")
+
+    async def on_stream_interruption(self, channels: Set[str]):
+        for channel in channels:
+            for candles in self._feeds.get(channel, []):
+                await candles._on_order_stream_interruption()
+
+    def _connection_with_room(self) -> CandlesStreamConnection:
+        for connection in self._connections:
+            if len(connection.channels) < self.max_channels_per_connection:
+                return connection
+        connection = CandlesStreamConnection(self)
+        self._connections.append(connection)
+        return connection
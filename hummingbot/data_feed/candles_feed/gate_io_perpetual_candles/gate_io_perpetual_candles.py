@@ -120,7 +120,7 @@ class GateioPerpetualCandles(CandlesBase):
                     # we have to add one more since, the last row is not going to be included
                     candles = await self.fetch_candles(end_time=end_timestamp, limit=missing_records + 1)
                     # we are computing again the quantity of records again since the websocket process is able to
-                    # modify the deque and if we extend it, the new observations are going to be dropped.
+                    # modify the buffer and if we extend it, the new observations are going to be dropped.
                     missing_records = self._candles.maxlen - len(self._candles)
                     self._candles.extendleft(candles[-(missing_records + 1):-1][::-1])
                     requests_executed += 1
@@ -191,7 +191,6 @@ class GateioPerpetualCandles(CandlesBase):
                                                        quote_asset_volume, n_trades, taker_buy_base_volume,
                                                        taker_buy_quote_volume]))
                     elif timestamp_ms == int(self._candles[-1][0]):
-                        self._candles.pop()
-                        self._candles.append(np.array([timestamp_ms, open, high, low, close, volume,
-                                                       quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                       taker_buy_quote_volume]))
+                        self._candles.update_last(np.array([timestamp_ms, open, high, low, close, volume,
+                                                            quote_asset_volume, n_trades, taker_buy_base_volume,
+                                                            taker_buy_quote_volume]))
@@ -131,7 +131,7 @@ class KrakenSpotCandles(CandlesBase):
                 start_time = end_timestamp - (720 * self.get_seconds_from_interval(self.interval)) + 1
                 candles = await self.fetch_candles(start_time=start_time, end_time=end_timestamp)
                 # we are computing again the quantity of records again since the websocket process is able to
-                # modify the deque and if we extend it, the new observations are going to be dropped.
+                # modify the buffer and if we extend it, the new observations are going to be dropped.
                 missing_records = self._candles.maxlen - len(self._candles)
                 # self._candles.extendleft(candles[::-1][-(missing_records + 1):-1])
                 self._candles.extendleft(candles[-(missing_records + 1):-1][::-1])
@@ -210,7 +210,6 @@ class KrakenSpotCandles(CandlesBase):
                                                        quote_asset_volume, n_trades, taker_buy_base_volume,
                                                        taker_buy_quote_volume]))
                     elif timestamp == int(self._candles[-1][0]):
-                        self._candles.pop()
-                        self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                       quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                       taker_buy_quote_volume]))
+                        self._candles.update_last(np.array([timestamp, open, high, low, close, volume,
+                                                            quote_asset_volume, n_trades, taker_buy_base_volume,
+                                                            taker_buy_quote_volume]))
@@ -104,7 +104,7 @@ class KucoinSpotCandles(CandlesBase):
                     start_time = end_timestamp - (1500 * self.get_seconds_from_interval(self.interval)) + 1
                     candles = await self.fetch_candles(end_time=end_timestamp, start_time=start_time)
                     # we are computing agaefin the quantity of records again since the websocket process is able to
-                    # modify the deque and if we extend it, the new observations are going to be dropped.
+                    # modify the buffer and if we extend it, the new observations are going to be dropped.
                     missing_records = self._candles.maxlen - len(self._candles)
                     self._candles.extendleft(candles[::-1][-(missing_records + 1):-1])
                     requests_executed += 1
@@ -186,8 +186,7 @@ class KucoinSpotCandles(CandlesBase):
                     # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
                     self._candles.append(candles_array)
                 elif timestamp == int(self._candles[-1][0]):
-                    self._candles.pop()
-                    self._candles.append(candles_array)
+                    self._candles.update_last(candles_array)
 
     async def _connected_websocket_assistant(self) -> WSAssistant:
         rest_assistant = await self._api_factory.get_rest_assistant()
@@ -90,7 +90,7 @@ class OKXPerpetualCandles(CandlesBase):
                     # we have to add one more since, the last row is not going to be included
                     candles = await self.fetch_candles(end_time=end_timestamp, limit=missing_records + 1)
                     # we are computing again the quantity of records again since the websocket process is able to
-                    # modify the deque and if we extend it, the new observations are going to be dropped.
+                    # modify the buffer and if we extend it, the new observations are going to be dropped.
                     missing_records = self._candles.maxlen - len(self._candles)
                     self._candles.extendleft(candles[-(missing_records + 1):-1])
                     requests_executed += 1
@@ -156,5 +156,4 @@ class OKXPerpetualCandles(CandlesBase):
                 elif int(timestamp) > int(self._candles[-1][0]):
                     self._candles.append(candles_row)
                 elif int(timestamp) == int(self._candles[-1][0]):
-                    self._candles.pop()
-                    self._candles.append(candles_row)
+                    self._candles.update_last(candles_row)
@@ -0,0 +1,89 @@
+from typing import Callable, Optional
+
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+
+
+class ProcessedCandlesCache:
+    """
+    Keeps the candles of a candles feed processed by a function, such as the indicators of a controller, until the
+    candles are updated.
+    If the processing of a candle only depends on the previous `lookback` candles (e.g. rolling window indicators),
+    only the updated candles are processed again when the candles are updated, with the `lookback` candles before
+    them. Otherwise, every candle is processed again.
+    When candles are evicted from the start of a full candles feed, the remaining candles keep the values processed
+    with the evicted candles, instead of being processed again without them.
+    """
+
+    def __init__(self,
+                 candles: CandlesBase,
+                 process: Callable[[pd.DataFrame], pd.DataFrame],
+                 lookback: Optional[int] = None):
+        """
+        :param candles: the candles feed
+        :param process: function that receives the candles as a DataFrame and returns the processed candles, with a
+            row for every candle
+        :param lookback: number of previous candles needed to process a candle, or None if the processing of a candle
+            depends on every previous candle
+        """
+        self._candles = candles
+        self._process = process
+        self.lookback = lookback
+        self._processed: Optional[pd.DataFrame] = None
+        self._version: Optional[int] = None
+        self._rewrites = 0
+        self._pops = 0
+        self._evictions = 0
+        self._full_updates = 0
+        self._incremental_updates = 0
+
+    @property
+    def stats(self):
+        """
+        Number of times the candles were processed entirely, and only from the updated candles
+        """
+        return {"full_updates": self._full_updates, "incremental_updates": self._incremental_updates}
+
+    def get(self) -> pd.DataFrame:
+        """
+        Returns the processed candles, processing the candles updated since the last call.
+        """
+        candles = self._candles._candles
+        if self._processed is not None and candles.version == self._version:
+            return self._processed
+        unchanged_candles = self._unchanged_candles()
+        if unchanged_candles is None or unchanged_candles <= self.lookback:
+            processed = self._process(self._candles.candles_df)
+            self._full_updates += 1
+        else:
+            # The candles kept from the processed candles are the first candles of the current candles
+            start = unchanged_candles - self.lookback
+            updated = self._process(self._candles.get_candles_df(start)).iloc[self.lookback:]
+            evicted = candles.evictions - self._evictions
+            processed = pd.concat([self._processed.iloc[evicted:evicted + unchanged_candles], updated],
+                                  ignore_index=True)
+            self._incremental_updates += 1
+        self._processed = processed
+        self._version = candles.version
+        self._rewrites = candles.rewrites
+        self._pops = candles.pops
+        self._evictions = candles.evictions
+        return processed
+
+    def clear(self):
+        self._processed = None
+        self._version = None
+
+    def _unchanged_candles(self) -> Optional[int]:
+        """
+        Returns the number of processed candles that were not updated, or None if it is not known.
+        """
+        candles = self._candles._candles
+        if self.lookback is None or self._processed is None or candles.rewrites != self._rewrites:
+            return None
+        # Without rewrites, the candles were only appended, removed from the end and evicted from the start. Every
+        # candle removed from the end might have been a processed candle.
+        evicted = candles.evictions - self._evictions
+        unchanged_candles = len(self._processed) - evicted - (candles.pops - self._pops)
+        return max(min(unchanged_candles, len(candles)), 0)
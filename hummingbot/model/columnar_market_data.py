@@ -0,0 +1,267 @@
+import os
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+SCALAR_COLUMNS = ("timestamp", "mid_price", "best_bid", "best_ask")
+LEVEL_COLUMNS = ("bid_price", "bid_amount", "ask_price", "ask_amount")
+COLUMNS = SCALAR_COLUMNS + LEVEL_COLUMNS
+
+
+def partition_name(timestamp: float) -> str:
+    """
+    :return: the name of the daily partition (UTC date) the timestamp belongs to
+    """
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+class ColumnarMarketDataWriter:
+    """
+    Append-only store of order book top levels, as an alternative to the MarketData table.
+    Each row holds the timestamp, mid price, best bid, best ask and the price and amount of the best `depth` levels of
+    each side, stored as typed numpy columns (levels are (rows, depth) float64 matrices, missing levels are NaN).
+    Rows are buffered in memory and written in chunks to
+        <root_path>/<exchange>/<trading_pair>/<UTC date>/<first row timestamp in ms>(.npz)
+    A compressed chunk is a single .npz file. An uncompressed chunk is a directory with one .npy file per column, which
+    ColumnarMarketDataReader memory-maps.
+    Rows are buffered for at most max_buffer_duration seconds, which bounds the rows lost if the process stops without
+    a flush.
+    """
+
+    def __init__(self,
+                 root_path: str,
+                 depth: int,
+                 chunk_size: int = 100,
+                 compressed: bool = True,
+                 max_buffer_duration: Optional[float] = 600.0,
+                 write_in_background: bool = False):
+        """
+        :param root_path: directory where the data is stored
+        :param depth: number of levels stored for each side of the book, at least 1
+        :param chunk_size: number of rows of a trading pair buffered before they are written to a chunk
+        :param compressed: whether chunks are compressed .npz files or directories of .npy files
+        :param max_buffer_duration: if set, the rows of a trading pair are written to a chunk once the first buffered
+            row is that many seconds older than the last one, even if the chunk size is not reached
+        :param write_in_background: whether chunks are written by a writer thread instead of the calling thread. The
+            errors of the writer thread are raised by the next call to append or flush
+        """
+        if depth < 1:
+            raise ValueError(f"The depth of the market data must be at least 1 (got {depth}).")
+        self._root_path: str = root_path
+        self._depth: int = depth
+        self._chunk_size: int = chunk_size
+        self._compressed: bool = compressed
+        self._max_buffer_duration: Optional[float] = max_buffer_duration
+        self._write_in_background: bool = write_in_background
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending_chunk_writes: List[Future] = []
+        # (exchange, trading_pair) -> (partition name, buffered rows)
+        self._buffers: Dict[Tuple[str, str], Tuple[str, List[Tuple[float, np.ndarray, np.ndarray]]]] = {}
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    def append(self, timestamp: float, exchange: str, trading_pair: str, order_book: OrderBook):
+        """
+        Buffers the top levels of the order book. The levels are read directly from the book.
+        :param timestamp: timestamp of the row, in seconds
+        """
+        bids, asks = order_book.top_levels(self._depth)
+        self.append_levels(timestamp, exchange, trading_pair, bids, asks)
+
+    def append_levels(self, timestamp: float, exchange: str, trading_pair: str, bids: np.ndarray, asks: np.ndarray):
+        """
+        Buffers a row given as bids and asks arrays of shape (depth, 2) with [price, amount] rows, best price first.
+        Timestamps are expected to be increasing for each trading pair.
+        """
+        self._raise_chunk_write_errors()
+        key = (exchange, trading_pair)
+        partition = partition_name(timestamp)
+        buffered_partition, rows = self._buffers.get(key, (partition, []))
+        if buffered_partition != partition and len(rows) > 0:
+            self._submit_chunk(exchange, trading_pair, buffered_partition, rows)
+            rows = []
+        rows.append((timestamp, bids, asks))
+        self._buffers[key] = (partition, rows)
+        if (len(rows) >= self._chunk_size
+                or (self._max_buffer_duration is not None and timestamp - rows[0][0] >= self._max_buffer_duration)):
+            self._submit_chunk(exchange, trading_pair, partition, rows)
+            del self._buffers[key]
+
+    def flush(self):
+        """
+        Writes all the buffered rows, and waits until the writer thread is done with them
+        """
+        for (exchange, trading_pair), (partition, rows) in self._buffers.items():
+            if len(rows) > 0:
+                self._submit_chunk(exchange, trading_pair, partition, rows)
+        self._buffers.clear()
+        pending_chunk_writes, self._pending_chunk_writes = self._pending_chunk_writes, []
+        for chunk_write in pending_chunk_writes:
+            chunk_write.result()
+
+    def close(self):
+        """
+        Writes all the buffered rows and stops the writer thread
+        """
+        try:
+            self.flush()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _submit_chunk(self,
+                      exchange: str,
+                      trading_pair: str,
+                      partition: str,
+                      rows: List[Tuple[float, np.ndarray, np.ndarray]]):
+        if not self._write_in_background:
+            self._write_chunk(exchange, trading_pair, partition, rows)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="columnar_market_data")
+        self._pending_chunk_writes.append(
+            self._executor.submit(self._write_chunk, exchange, trading_pair, partition, rows))
+
+    def _raise_chunk_write_errors(self):
+        done_chunk_writes = [chunk_write for chunk_write in self._pending_chunk_writes if chunk_write.done()]
+        if len(done_chunk_writes) > 0:
+            self._pending_chunk_writes = [chunk_write for chunk_write in self._pending_chunk_writes
+                                          if not chunk_write.done()]
+            for chunk_write in done_chunk_writes:
+                chunk_write.result()
+
+    def _write_chunk(self,
+                     exchange: str,
+                     trading_pair: str,
+                     partition: str,
+                     rows: List[Tuple[float, np.ndarray, np.ndarray]]):
+        timestamps = np.array([row[0] for row in rows], dtype=np.float64)
+        bids = np.stack([row[1] for row in rows]).astype(np.float64, copy=False)
+        asks = np.stack([row[2] for row in rows]).astype(np.float64, copy=False)
+        best_bid = bids[:, 0, 0]
+        best_ask = asks[:, 0, 0]
+        columns = {
+            "timestamp": timestamps,
+            "mid_price": (best_bid + best_ask) / 2,
+            "best_bid": best_bid,
+            "best_ask": best_ask,
+            "bid_price": np.ascontiguousarray(bids[:, :, 0]),
+            "bid_amount": np.ascontiguousarray(bids[:, :, 1]),
+            "ask_price": np.ascontiguousarray(asks[:, :, 0]),
+            "ask_amount": np.ascontiguousarray(asks[:, :, 1]),
+        }
+
+        partition_path = os.path.join(self._root_path, exchange, trading_pair, partition)
+        os.makedirs(partition_path, exist_ok=True)
+        chunk_name = str(int(timestamps[0] * 1e3))
+        # Chunks are written under a temporary name and renamed, so readers never see partial chunks
+        if self._compressed:
+            chunk_path = os.path.join(partition_path, f"{chunk_name}.npz")
+            tmp_path = os.path.join(partition_path, f".{chunk_name}.tmp.npz")
+            np.savez_compressed(tmp_path, **columns)
+            os.replace(tmp_path, chunk_path)
+        else:
+            chunk_path = os.path.join(partition_path, chunk_name)
+            tmp_path = os.path.join(partition_path, f".{chunk_name}.tmp")
+            os.makedirs(tmp_path, exist_ok=True)
+            for name, values in columns.items():
+                np.save(os.path.join(tmp_path, f"{name}.npy"), values)
+            if os.path.exists(chunk_path):
+                shutil.rmtree(chunk_path)
+            os.replace(tmp_path, chunk_path)
+
+
+class ColumnarMarketDataReader:
+    """
+    Reads the data written by ColumnarMarketDataWriter. Uncompressed chunks are memory-mapped.
+    """
+
+    def __init__(self, root_path: str):
+        self._root_path: str = root_path
+
+    def partitions(self, exchange: str, trading_pair: str) -> List[str]:
+        """
+        :return: the names (UTC dates) of the partitions available for the trading pair, in order
+        """
+        pair_path = os.path.join(self._root_path, exchange, trading_pair)
+        if not os.path.isdir(pair_path):
+            return []
+        return sorted(name for name in os.listdir(pair_path) if not name.startswith("."))
+
+    def iter_chunks(self,
+                    exchange: str,
+                    trading_pair: str,
+                    start: Optional[float] = None,
+                    end: Optional[float] = None) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Iterates over the chunks of the trading pair in time order, without copying memory-mapped columns.
+        :param start: if set, rows before this timestamp (in seconds) are skipped
+        :param end: if set, rows after this timestamp (in seconds) are skipped
+        :return: iterator of dictionaries of column name to array
+        """
+        start_partition = partition_name(start) if start is not None else None
+        end_partition = partition_name(end) if end is not None else None
+        for partition in self.partitions(exchange, trading_pair):
+            if ((start_partition is not None and partition < start_partition)
+                    or (end_partition is not None and partition > end_partition)):
+                continue
+            partition_path = os.path.join(self._root_path, exchange, trading_pair, partition)
+            chunk_names = [name for name in os.listdir(partition_path) if not name.startswith(".")]
+            for chunk_name in sorted(chunk_names, key=lambda name: int(name.split(".")[0])):
+                if end is not None and int(chunk_name.split(".")[0]) > end * 1e3:
+                    continue
+                columns = self._load_chunk(os.path.join(partition_path, chunk_name))
+                timestamps = columns["timestamp"]
+                first = 0 if start is None else np.searchsorted(timestamps, start, side="left")
+                last = len(timestamps) if end is None else np.searchsorted(timestamps, end, side="right")
+                if first < last:
+                    yield {name: values[first:last] for name, values in columns.items()}
+
+    def read(self,
+             exchange: str,
+             trading_pair: str,
+             start: Optional[float] = None,
+             end: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        :return: dictionary of column name to array with all the rows of the trading pair between start and end
+        """
+        chunks = list(self.iter_chunks(exchange, trading_pair, start, end))
+        if len(chunks) == 0:
+            return {name: np.empty(0, dtype=np.float64) for name in COLUMNS}
+        if len(chunks) == 1:
+            return chunks[0]
+        return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in COLUMNS}
+
+    def read_dataframe(self,
+                       exchange: str,
+                       trading_pair: str,
+                       start: Optional[float] = None,
+                       end: Optional[float] = None) -> pd.DataFrame:
+        """
+        :return: a DataFrame with the scalar columns and one column per level, named like bid_price_0 (best bid
+        price), bid_amount_0, ..., ask_amount_<depth - 1>
+        """
+        columns = self.read(exchange, trading_pair, start, end)
+        data = {name: columns[name] for name in SCALAR_COLUMNS}
+        for name in LEVEL_COLUMNS:
+            levels = columns[name]
+            if levels.ndim == 2:
+                for level in range(levels.shape[1]):
+                    data[f"{name}_{level}"] = levels[:, level]
+        return pd.DataFrame(data)
+
+    @staticmethod
+    def _load_chunk(chunk_path: str) -> Dict[str, np.ndarray]:
+        if chunk_path.endswith(".npz"):
+            with np.load(chunk_path) as chunk:
+                return {name: chunk[name] for name in COLUMNS}
+        return {name: np.load(os.path.join(chunk_path, f"{name}.npy"), mmap_mode="r") for name in COLUMNS}
@@ -42,9 +42,11 @@ class BollingerV1(DirectionalTradingControllerBase):
             return True
         return False
 
-    def get_processed_data(self) -> pd.DataFrame:
-        df = self.candles[0].candles_df
+    @property
+    def processed_data_lookback(self) -> int:
+        return self.config.bb_length
 
+    def process_candles(self, df: pd.DataFrame) -> pd.DataFrame:
         # Add indicators
         df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
 
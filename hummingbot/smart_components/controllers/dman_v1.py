@@ -1,6 +1,7 @@
 import time
 from decimal import Decimal
 
+import pandas as pd
 import pandas_ta as ta  # noqa: F401
 
 from hummingbot.core.data_type.common import TradeType
@@ -52,11 +53,10 @@ class DManV1(MarketMakingControllerBase):
             return True
         return False
 
-    def get_processed_data(self):
+    def process_candles(self, candles_df: pd.DataFrame) -> pd.DataFrame:
         """
-        Gets the price and spread multiplier from the last candlestick.
+        Adds the price and spread multiplier to the candles.
         """
-        candles_df = self.candles[0].candles_df
         natr = ta.natr(candles_df["high"], candles_df["low"], candles_df["close"], length=self.config.natr_length) / 100
 
         candles_df["spread_multiplier"] = natr
@@ -1,6 +1,7 @@
 import time
 from decimal import Decimal
 
+import pandas as pd
 import pandas_ta as ta  # noqa: F401
 
 from hummingbot.core.data_type.common import TradeType
@@ -59,11 +60,14 @@ class DManV3(MarketMakingControllerBase):
             return True
         return False
 
-    def get_processed_data(self):
+    @property
+    def processed_data_lookback(self) -> int:
+        return self.config.bb_length
+
+    def process_candles(self, candles_df: pd.DataFrame) -> pd.DataFrame:
         """
-        Gets the price and spread multiplier from the last candlestick.
+        Adds the price and spread multiplier to the candles.
         """
-        candles_df = self.candles[0].candles_df
         bbp = ta.bbands(candles_df["close"], length=self.config.bb_length, std=self.config.bb_std)
 
         candles_df["price_multiplier"] = bbp[f"BBM_{self.config.bb_length}_{self.config.bb_std}"]
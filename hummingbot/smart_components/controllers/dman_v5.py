@@ -156,8 +156,7 @@ class DManV5(GenericController):
                 activation_bounds=self.config.activation_bounds,
             ))
 
-    def get_signal(self):
-        candles_df = self.candles[0].candles_df
+    def process_candles(self, candles_df: pd.DataFrame) -> pd.DataFrame:
         macd_output = ta.macd(candles_df["close"], fast=self.config.macd_fast, slow=self.config.macd_slow,
                               signal=self.config.macd_signal)
         macd = macd_output[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"].apply(
@@ -166,8 +165,11 @@ class DManV5(GenericController):
             lambda x: 1 if x > 0 else -1)
 
         signal = macd + macdh
-        signal = signal.apply(lambda x: 1 if x == 2 else (-1 if x == -2 else 0))
-        return signal.iat[-1]
+        candles_df["signal"] = signal.apply(lambda x: 1 if x == 2 else (-1 if x == -2 else 0))
+        return candles_df
+
+    def get_signal(self):
+        return self.get_processed_data()["signal"].iat[-1]
 
     def store_actions_proposal(self) -> List[StoreExecutorAction]:
         """
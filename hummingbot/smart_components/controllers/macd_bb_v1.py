@@ -49,9 +49,7 @@ class MACDBBV1(DirectionalTradingControllerBase):
             return True
         return False
 
-    def get_processed_data(self) -> pd.DataFrame:
-        df = self.candles[0].candles_df
-
+    def process_candles(self, df: pd.DataFrame) -> pd.DataFrame:
         # Add indicators
         df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
         df.ta.macd(fast=self.config.macd_fast, slow=self.config.macd_slow, signal=self.config.macd_signal, append=True)
@@ -39,8 +39,11 @@ class TrendFollowerV1(DirectionalTradingControllerBase):
             return True
         return False
 
-    def get_processed_data(self) -> pd.DataFrame:
-        df = self.candles[0].candles_df
+    @property
+    def processed_data_lookback(self) -> int:
+        return max(self.config.sma_fast, self.config.sma_slow, self.config.bb_length)
+
+    def process_candles(self, df: pd.DataFrame) -> pd.DataFrame:
         df.ta.sma(length=self.config.sma_fast, append=True)
         df.ta.sma(length=self.config.sma_slow, append=True)
         df.ta.bbands(length=self.config.bb_length, std=2.0, append=True)
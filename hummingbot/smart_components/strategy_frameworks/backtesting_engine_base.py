@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -68,26 +68,100 @@ class BacktestingEngineBase:
 
     @staticmethod
     def apply_tp_sl_on_tl(df: pd.DataFrame, tp: float, sl: float):
-        events = df[df["signal"] != 0].copy()
-        if tp > 0:
-            take_profit = tp * events["target"]
-        else:
-            take_profit = pd.Series(index=df.index)  # NaNs
-        if sl > 0:
-            stop_loss = - sl * events["target"]
-        else:
-            stop_loss = pd.Series(index=df.index)  # NaNs
+        signals = df["signal"].values
+        event_positions = np.flatnonzero(signals != 0)
+        target = df["target"].values[event_positions]
+        take_profit = tp * target if tp > 0 else np.full(len(event_positions), np.nan)
+        stop_loss = - sl * target if sl > 0 else np.full(len(event_positions), np.nan)
 
-        for loc, tl in events["tl"].fillna(df.index[-1]).items():
-            df0 = df.close[loc:tl]  # path prices
-            df0 = (df0 / df.close[loc] - 1) * events.at[loc, "signal"]  # path returns
-            df.loc[loc, "stop_loss_time"] = df0[df0 < stop_loss[loc]].index.min()  # earliest stop loss.
-            df.loc[loc, "take_profit_time"] = df0[df0 > take_profit[loc]].index.min()  # earliest profit taking.
+        # Each event path goes from the event to its time limit, both included
+        timestamps = df.index.values
+        time_limits = df["tl"].fillna(df.index[-1]).values[event_positions]
+        path_ends = np.searchsorted(timestamps, time_limits, side="right")
+        take_profit_positions, stop_loss_positions = BacktestingEngineBase.get_first_barrier_touches(
+            close=df["close"].values.astype(np.float64),
+            path_starts=event_positions,
+            path_ends=path_ends,
+            signals=signals[event_positions],
+            take_profit=take_profit,
+            stop_loss=stop_loss,
+        )
+
+        for column, positions in (("stop_loss_time", stop_loss_positions), ("take_profit_time", take_profit_positions)):
+            touch_times = np.full(len(df), np.datetime64("NaT"), dtype="datetime64[ns]")
+            touched = positions >= 0
+            touch_times[event_positions[touched]] = timestamps[positions[touched]]
+            df[column] = touch_times
         df["close_time"] = df[["tl", "take_profit_time", "stop_loss_time"]].dropna(how="all").min(axis=1)
         df["close_type"] = df[["take_profit_time", "stop_loss_time", "tl"]].dropna(how="all").idxmin(axis=1)
         df["close_type"].replace({"take_profit_time": "tp", "stop_loss_time": "sl"}, inplace=True)
         return df
 
+    @staticmethod
+    def get_first_barrier_touches(close: np.ndarray,
+                                  path_starts: np.ndarray,
+                                  path_ends: np.ndarray,
+                                  signals: np.ndarray,
+                                  take_profit: np.ndarray,
+                                  stop_loss: np.ndarray,
+                                  max_chunk_size: int = 2 ** 22) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Finds for all the events at once the first position where the path return crosses the take profit and the
+        stop loss barriers. The paths of a chunk of events are laid out as rows of a (events, longest path) matrix.
+
+        :param close: close prices
+        :param path_starts: position of each event
+        :param path_ends: position after the last price of the path of each event
+        :param signals: signal of each event, the path returns are multiplied by it
+        :param take_profit: return above which the take profit is touched, NaN for no take profit
+        :param stop_loss: return below which the stop loss is touched, NaN for no stop loss
+        :param max_chunk_size: maximum number of path prices processed at once
+        :return: positions of the take profit and stop loss touches, -1 where the barrier isn't touched
+        """
+        take_profit_positions = np.full(len(path_starts), -1, dtype=np.int64)
+        stop_loss_positions = np.full(len(path_starts), -1, dtype=np.int64)
+        if len(path_starts) == 0:
+            return take_profit_positions, stop_loss_positions
+
+        path_lengths = path_ends - path_starts
+        path_offsets = np.arange(max(path_lengths.max(), 1))
+        chunk_length = max(max_chunk_size // len(path_offsets), 1)
+        for chunk_start in range(0, len(path_starts), chunk_length):
+            chunk = slice(chunk_start, chunk_start + chunk_length)
+            starts = path_starts[chunk]
+            in_path = path_offsets < path_lengths[chunk][:, None]
+            positions = np.minimum(starts[:, None] + path_offsets, len(close) - 1)
+            path_returns = (close[positions] / close[starts][:, None] - 1) * signals[chunk][:, None]
+            for barrier_positions, touches in (
+                    (take_profit_positions, in_path & (path_returns > take_profit[chunk][:, None])),
+                    (stop_loss_positions, in_path & (path_returns < stop_loss[chunk][:, None]))):
+                barrier_positions[chunk] = np.where(touches.any(axis=1), starts + touches.argmax(axis=1), -1)
+        return take_profit_positions, stop_loss_positions
+
+    @staticmethod
+    def apply_cooldown(close_times: np.ndarray, timestamps: np.ndarray, cooldown: np.timedelta64,
+                       last_close_time: np.datetime64) -> np.ndarray:
+        """
+        Selects the events that can be executed by an order level, each one starting at least cooldown after the
+        previous one closed.
+
+        :param close_times: close time of each event
+        :param timestamps: time of each event, sorted
+        :param cooldown: minimum time between the close of an executor and the start of the next one
+        :param last_close_time: close time of the last executor of the order level
+        :return: positions of the selected events
+        """
+        # Position of the first event that can be executed after each event closes
+        next_positions = np.searchsorted(timestamps, close_times + cooldown, side="left")
+        selected = []
+        position = np.searchsorted(timestamps, last_close_time + cooldown, side="left")
+        while position < len(timestamps):
+            selected.append(position)
+            if np.isnat(close_times[position]):
+                break
+            position = next_positions[position]
+        return np.array(selected, dtype=np.int64)
+
     def load_controller_data(self, data_path: str = data_path()):
         self.controller.load_historical_data(data_path=data_path)
 
@@ -6,10 +6,13 @@ from decimal import Decimal
 from typing import List, Optional
 
 import base58
+import pandas as pd
 from pydantic import BaseModel, validator
 
 from hummingbot.core.data_type.common import PositionMode
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig, CandlesFactory
+from hummingbot.data_feed.candles_feed.processed_candles_cache import ProcessedCandlesCache
 
 
 class ControllerConfigBase(BaseModel):
@@ -53,12 +56,32 @@ class ControllerBase(ABC):
         self._excluded_parameters = excluded_parameters or ["order_levels", "candles_config"]
         self.candles = self.initialize_candles(config.candles_config)
         self.close_price_trading_pair = config.close_price_trading_pair or config.trading_pair
+        self._processed_data_cache: Optional[ProcessedCandlesCache] = None
 
-    def get_processed_data(self):
+    @property
+    def processed_data_lookback(self) -> Optional[int]:
         """
-        Get the processed data.
+        Number of previous candles needed by process_candles to process a candle, or None if it depends on every
+        previous candle. When it is set, only the updated candles are processed when the candles are updated.
         """
-        pass
+        return None
+
+    def process_candles(self, candles_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Process the candles of the first candles feed, adding the indicators used by the controller.
+        """
+        raise NotImplementedError
+
+    def get_processed_data(self) -> pd.DataFrame:
+        """
+        Get the processed data. The candles processed by process_candles are cached until the candles are updated.
+        """
+        candles = self.candles[0]
+        if self._processed_data_cache is None or self._processed_data_cache._candles is not candles:
+            self._processed_data_cache = ProcessedCandlesCache(candles=candles,
+                                                               process=self.process_candles,
+                                                               lookback=self.processed_data_lookback)
+        return self._processed_data_cache.get()
 
     @staticmethod
     def is_perpetual(exchange: str):
@@ -83,7 +106,7 @@ class ControllerBase(ABC):
         """
         candles = self.get_candles_by_trading_pair(trading_pair)
         first_candle = list(candles.values())[0]
-        return Decimal(first_candle.candles_df["close"].iloc[-1])
+        return Decimal(first_candle.last_candle[CandlesBase.columns.index("close")])
 
     def get_candles_by_trading_pair(self, trading_pair: str):
         """
@@ -129,8 +152,15 @@ class ControllerBase(ABC):
             candle.start()
 
     def load_historical_data(self, data_path: str):
+        """
+        Loads the candles from the CSV files in the data path, or from the history store if there is no CSV file.
+        """
         for candle in self.candles:
-            candle.load_candles_from_csv(data_path)
+            try:
+                candle.load_candles_from_csv(data_path)
+            except FileNotFoundError:
+                if not candle.load_candles_from_store():
+                    raise
 
     def stop(self) -> None:
         """
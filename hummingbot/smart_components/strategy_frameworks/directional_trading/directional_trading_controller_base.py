@@ -99,9 +99,9 @@ class DirectionalTradingControllerBase(ControllerBase):
             )
             return position_config
 
-    def get_processed_data(self) -> pd.DataFrame:
+    def process_candles(self, candles_df: pd.DataFrame) -> pd.DataFrame:
         """
-        Retrieves the processed dataframe with indicators, signal, weight and spreads multipliers.
+        Adds the indicators, signal, weight and spreads multipliers to the candles.
         Returns:
             pd.DataFrame: The processed dataframe with indicators, signal, weight and spreads multipliers.
         """
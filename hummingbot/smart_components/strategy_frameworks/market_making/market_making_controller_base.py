@@ -72,6 +72,3 @@ class MarketMakingControllerBase(ControllerBase):
         Here you can use technical indicators to determine the parameters of the position config.
         """
         raise NotImplementedError
-
-    def get_processed_data(self):
-        raise NotImplementedError
@@ -1,11 +1,21 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport isfinite, sqrt
+from libc.stdint cimport int64_t
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length buffer of the latest values added.
+    Every value is stored twice, at its position and at its position plus the length, so the values in the buffer
+    are always a contiguous slice of the storage that can be returned as a view without copying.
+    The mean and variance are maintained incrementally (Welford's algorithm adapted to a sliding window). They are
+    recalculated from the values every time the buffer wraps around, to bound the accumulated floating point error,
+    and whenever non finite values leave the buffer.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -13,18 +23,39 @@ cdef class RingBuffer:
             pmm_logger = logging.getLogger(__name__)
         return pmm_logger
 
-    def __cinit__(self, int length):
+    def __cinit__(self, int64_t length):
         self._length = length
-        self._buffer = np.zeros(length, dtype=np.float64)
+        self._buffer = np.zeros(2 * length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
+        self._stale_statistics = False
 
     def __dealloc__(self):
         self._buffer = None
 
-    cdef void c_add_value(self, float val):
+    cdef void c_add_value(self, double val):
+        cdef:
+            int64_t size = self.c_size()
+            double previous_mean = self._mean
+            double evicted = self._buffer[self._delimiter] if self._is_full else 0
+
+        if not self._stale_statistics:
+            if not isfinite(val) or not isfinite(evicted):
+                self._stale_statistics = True
+            elif self._is_full:
+                self._mean = previous_mean + (val - evicted) / size
+                self._m2 += (val - evicted) * (val - self._mean + evicted - previous_mean)
+            else:
+                self._mean = previous_mean + (val - previous_mean) / (size + 1)
+                self._m2 += (val - previous_mean) * (val - self._mean)
+
         self._buffer[self._delimiter] = val
+        self._buffer[self._delimiter + self._length] = val
         self.c_increment_delimiter()
+        if self._delimiter == 0:
+            self._stale_statistics = True
 
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
@@ -34,57 +65,112 @@ cdef class RingBuffer:
     cdef bint c_is_empty(self):
         return (not self._is_full) and (0==self._delimiter)
 
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
     cdef double c_get_last_value(self):
         if self.c_is_empty():
             return np.nan
-        return self._buffer[self._delimiter-1]
+        return self._buffer[self._delimiter + self._length - 1]
+
+    cdef double c_get_first_value(self):
+        if self.c_is_empty():
+            return np.nan
+        return self._buffer[self._delimiter] if self._is_full else self._buffer[0]
 
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef void c_recalculate_statistics(self):
+        cdef:
+            int64_t size = self.c_size()
+            int64_t start = self._delimiter if self._is_full else 0
+            int64_t i
+            double total = 0
+            double m2 = 0
+        for i in range(start, start + size):
+            total += self._buffer[i]
+        self._mean = total / size if size > 0 else 0
+        for i in range(start, start + size):
+            m2 += (self._buffer[i] - self._mean) ** 2
+        self._m2 = m2
+        # Non finite values can't be removed incrementally, statistics are recalculated until they leave the buffer
+        self._stale_statistics = not (isfinite(self._mean) and isfinite(self._m2))
+
+    cdef double c_running_mean(self):
+        if self.c_is_empty():
+            return np.nan
+        if self._stale_statistics:
+            self.c_recalculate_statistics()
+        return self._mean
+
+    cdef double c_running_variance(self):
+        if self.c_is_empty():
+            return np.nan
+        if self._stale_statistics:
+            self.c_recalculate_statistics()
+        # Rounding errors can make the incremental result slightly negative
+        return max(self._m2 / self.c_size(), 0.0)
+
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self.c_running_mean()
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = self.c_running_variance()
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_running_variance())
         return result
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
-
-        if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_view(self):
+        cdef:
+            np.ndarray[np.double_t, ndim=1] view
+        if self._is_full:
+            view = np.asarray(self._buffer)[self._delimiter:self._delimiter + self._length]
         else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            view = np.asarray(self._buffer)[:self._delimiter]
+        view.flags.writeable = False
+        return view
+
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        return self.c_get_as_numpy_view().copy()
 
     def __init__(self, length):
         self._length = length
-        self._buffer = np.zeros(length, dtype=np.double)
+        self._buffer = np.zeros(2 * length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
 
+    def __len__(self):
+        return self.c_size()
+
     def add_value(self, val):
         self.c_add_value(val)
 
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_as_numpy_view(self):
+        """
+        :return: a read only view of the values in the buffer, oldest first. It is only valid until the next value is
+        added, use get_as_numpy_array to keep the values
+        """
+        return self.c_get_as_numpy_view()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
+    def get_first_value(self):
+        return self.c_get_first_value()
+
     @property
     def is_full(self):
         return self.c_is_full()
@@ -101,6 +187,20 @@ cdef class RingBuffer:
     def variance(self):
         return self.c_variance()
 
+    @property
+    def running_mean(self):
+        """
+        Mean of the values in the buffer, also available before the buffer is full (nan if it is empty)
+        """
+        return self.c_running_mean()
+
+    @property
+    def running_variance(self):
+        """
+        Population variance of the values in the buffer, also available before the buffer is full (nan if it is empty)
+        """
+        return self.c_running_variance()
+
     @property
     def length(self) -> int:
         return self._length
@@ -110,9 +210,12 @@ cdef class RingBuffer:
         data = self.get_as_numpy_array()
 
         self._length = value
-        self._buffer = np.zeros(value, dtype=np.float64)
+        self._buffer = np.zeros(2 * value, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
+        self._stale_statistics = False
 
         for val in data[-value:]:
             self.add_value(val)
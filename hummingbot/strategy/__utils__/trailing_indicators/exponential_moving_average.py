@@ -1,17 +1,39 @@
-from base_trailing_indicator import BaseTrailingIndicator
-import pandas as pd
+from .base_trailing_indicator import BaseTrailingIndicator
+import numpy as np
 
 
 class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
+    """
+    Exponential moving average of the samples in the sampling buffer, with span equal to the sampling length.
+    Matches pandas ewm(span=sampling_length, adjust=True).mean() over the buffer, but the weighted sum is updated on
+    every sample instead of being recalculated from the whole buffer.
+    """
     def __init__(self, sampling_length: int = 30, processing_length: int = 1):
         if processing_length != 1:
             raise Exception("Exponential moving average processing_length should be 1")
         super().__init__(sampling_length, processing_length)
+        self._weighted_sum = 0.0
+        self._set_decay()
+
+    def _set_decay(self):
+        self._decay = 1 - 2 / (self.sampling_length + 1)
+        # Weight of a sample when it leaves the buffer
+        self._evicted_weight = self._decay ** self.sampling_length
+
+    def add_sample(self, value: float):
+        evicted = self._sampling_buffer.get_first_value() if self._sampling_buffer.is_full else 0.0
+        self._weighted_sum = self._decay * self._weighted_sum + value - self._evicted_weight * evicted
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
-        ema = pd.Series(self._sampling_buffer.get_as_numpy_array())\
-            .ewm(span=self._sampling_length, adjust=True).mean()
-        return ema[-1]
+        weights_sum = (1 - self._decay ** len(self._sampling_buffer)) / (1 - self._decay)
+        return self._weighted_sum / weights_sum
 
     def _processing_calculation(self) -> float:
         return self._processing_buffer.get_last_value()
+
+    def _on_sampling_length_change(self):
+        self._set_decay()
+        samples = self._sampling_buffer.get_as_numpy_array()
+        weights = self._decay ** np.arange(samples.size - 1, -1, -1)
+        self._weighted_sum = float(np.dot(weights, samples))
@@ -1,18 +1,36 @@
+import math
+
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # Log returns between consecutive samples of the sampling buffer, with their running variance
+        self._log_returns = RingBuffer(max(sampling_length - 1, 1))
+        self._last_sample = np.nan
+
+    def add_sample(self, value: float):
+        if not math.isnan(self._last_sample) and self.sampling_length > 1:
+            self._log_returns.add_value(math.log(value / self._last_sample))
+        self._last_sample = value
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        if len(self._log_returns) > 0:
+            variance = self._log_returns.running_variance
+            return 0.0 if math.isnan(variance) else variance
+        return 0.0
 
     def _processing_calculation(self) -> float:
-        processing_array = self._processing_buffer.get_as_numpy_array()
-        if processing_array.size > 0:
-            return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+        if len(self._processing_buffer) > 0:
+            return math.sqrt(self._processing_buffer.running_mean)
+
+    def _on_sampling_length_change(self):
+        prices = self._sampling_buffer.get_as_numpy_array()
+        self._log_returns = RingBuffer(max(self.sampling_length - 1, 1))
+        if self.sampling_length > 1:
+            for log_return in np.diff(np.log(prices)):
+                self._log_returns.add_value(log_return)
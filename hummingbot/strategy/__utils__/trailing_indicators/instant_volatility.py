@@ -1,19 +1,40 @@
+import math
+
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class InstantVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # Squared differences between consecutive samples of the sampling buffer, their running mean gives the sum
+        # used for the volatility without going through the whole buffer on every sample
+        self._squared_diffs = RingBuffer(max(sampling_length - 1, 1))
+        self._last_sample = np.nan
+
+    def add_sample(self, value: float):
+        if not math.isnan(self._last_sample) and self.sampling_length > 1:
+            self._squared_diffs.add_value((value - self._last_sample) ** 2)
+        self._last_sample = value
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
         # The standard deviation should be calculated between ticks and not with a mean of the whole buffer
         # Otherwise if the asset is trending, changing the length of the buffer would result in a greater volatility as more ticks would be further away from the mean
         # which is a nonsense result. If volatility of the underlying doesn't change in fact, changing the length of the buffer shouldn't change the result.
-        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
-        vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
+        diffs_count = len(self._squared_diffs)
+        squared_diffs_sum = self._squared_diffs.running_mean * diffs_count if diffs_count > 0 else 0
+        vol = math.sqrt(squared_diffs_sum / len(self._sampling_buffer))
         return vol
 
     def _processing_calculation(self) -> float:
         # Only the last calculated volatlity, not an average of multiple past volatilities
         return self._processing_buffer.get_last_value()
+
+    def _on_sampling_length_change(self):
+        samples = self._sampling_buffer.get_as_numpy_array()
+        self._squared_diffs = RingBuffer(max(self.sampling_length - 1, 1))
+        if self.sampling_length > 1:
+            for squared_diff in np.square(np.diff(samples)):
+                self._squared_diffs.add_value(squared_diff)
@@ -3,6 +3,8 @@
 from libc.stdint cimport int64_t
 from libcpp.set cimport set
 
+cimport numpy as np
+
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.data_type.order_book import OrderBook
@@ -13,16 +15,26 @@ cdef class TradingIntensityIndicator:
         double _alpha
         double _kappa
         dict _trade_samples
+        list _trade_sample_timestamps
+        dict _price_level_amounts
+        dict _price_level_counts
         list _current_trade_sample
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
+        np.ndarray _quote_timestamps
+        np.ndarray _quote_prices
+        int64_t _quotes_start
+        int64_t _quotes_end
         int _sampling_length
         int _samples_length
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_quote(self, double timestamp, double price)
+    cdef c_process_trades(self)
+    cdef c_add_trade_samples(self, double timestamp, np.ndarray price_levels, np.ndarray amounts)
+    cdef c_remove_oldest_trade_sample(self)
     cdef c_estimate_intensity(self)
 
 cdef class TradesForwarder(EventListener):
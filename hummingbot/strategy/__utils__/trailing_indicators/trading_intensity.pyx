@@ -1,9 +1,9 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
+import bisect
 import warnings
-from decimal import Decimal
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 from scipy.optimize import curve_fit
@@ -17,6 +17,63 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+cimport numpy as np
+
+# Number of quotes the quote arrays are created with, they grow when needed
+INITIAL_QUOTES_CAPACITY = 64
+# Trade amount used in place of a zero amount, to be able to calculate its log
+MIN_TRADING_INTENSITY = 10**-10
+# Gauss-Newton refinement of the log-linear fit
+MAX_FIT_ITERATIONS = 50
+FIT_TOLERANCE = 1e-9
+
+
+def fit_exponential_decay(price_levels: np.ndarray, lambdas: np.ndarray) -> Optional[Tuple[float, float]]:
+    """
+    Least squares fit of lambdas = alpha * exp(-kappa * price_levels) without an iterative solver: the closed form
+    fit of log(lambdas) gives the starting point, which is refined with Gauss-Newton steps (solved in closed form
+    for two parameters) until it converges to the least squares solution.
+    :return: (alpha, kappa), or None if the fit didn't converge
+    """
+    if price_levels.size < 2 or np.ptp(price_levels) == 0 or np.any(lambdas <= 0):
+        return None
+
+    log_lambdas = np.log(lambdas)
+    price_levels_deviation = price_levels - price_levels.mean()
+    slope = (np.dot(price_levels_deviation, log_lambdas - log_lambdas.mean())
+             / np.dot(price_levels_deviation, price_levels_deviation))
+    kappa = -slope
+    alpha = np.exp(log_lambdas.mean() - slope * price_levels.mean())
+
+    for _ in range(MAX_FIT_ITERATIONS):
+        decay = np.exp(-kappa * price_levels)
+        residuals = lambdas - alpha * decay
+        alpha_gradient = decay
+        kappa_gradient = -alpha * price_levels * decay
+        aa = np.dot(alpha_gradient, alpha_gradient)
+        ab = np.dot(alpha_gradient, kappa_gradient)
+        bb = np.dot(kappa_gradient, kappa_gradient)
+        ar = np.dot(alpha_gradient, residuals)
+        br = np.dot(kappa_gradient, residuals)
+        determinant = aa * bb - ab * ab
+        if not determinant > 0:
+            return None
+        alpha_step = (bb * ar - ab * br) / determinant
+        kappa_step = (aa * br - ab * ar) / determinant
+        alpha += alpha_step
+        kappa += kappa_step
+        if not (np.isfinite(alpha) and np.isfinite(kappa)):
+            return None
+        if abs(alpha_step) <= FIT_TOLERANCE * abs(alpha) and abs(kappa_step) <= FIT_TOLERANCE * max(abs(kappa), 1):
+            if alpha < 0:
+                return None
+            if kappa < 0:
+                # The least squares solution with kappa >= 0 is on the bound, a constant intensity
+                return float(lambdas.mean()), 0.0
+            return float(alpha), float(kappa)
+    return None
+
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -26,11 +83,22 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
+    """
+    Estimates the trading intensity parameters alpha and kappa, where alpha * exp(-kappa * price_level) is the amount
+    traded at a distance price_level from the mid price, over the last sampling_length trade samples.
+    Quotes are kept in arrays sorted by timestamp, trades are matched with the quote before them with a binary search,
+    and the traded amount per price level is updated as trade samples enter and leave the window.
+    """
 
     def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
         self._alpha = 0
         self._kappa = 0
+        # Trade samples by timestamp (timestamp of the quote before the trades + 1), as lists of
+        # (price levels, amounts) arrays
         self._trade_samples = {}
+        self._trade_sample_timestamps = []
+        self._price_level_amounts = {}
+        self._price_level_counts = {}
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -38,7 +106,10 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
+        self._quote_timestamps = np.empty(INITIAL_QUOTES_CAPACITY, dtype=np.float64)
+        self._quote_prices = np.empty(INITIAL_QUOTES_CAPACITY, dtype=np.float64)
+        self._quotes_start = 0
+        self._quotes_end = 0
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -48,12 +119,12 @@ cdef class TradingIntensityIndicator:
 
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return len(self._trade_samples) == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != len(self._trade_samples)
+        self._samples_length = len(self._trade_samples)
         return is_changed
 
     @property
@@ -67,12 +138,17 @@ cdef class TradingIntensityIndicator:
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        return [{"timestamp": timestamp, "price": price}
+                for timestamp, price in zip(self._quote_timestamps[self._quotes_start:self._quotes_end][::-1].tolist(),
+                                            self._quote_prices[self._quotes_start:self._quotes_end][::-1].tolist())]
 
     @last_quotes.setter
     def last_quotes(self, value):
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        self._quotes_start = 0
+        self._quotes_end = 0
+        for quote in reversed(value):
+            self.c_add_quote(quote["timestamp"], float(quote["price"]))
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
@@ -80,38 +156,13 @@ cdef class TradingIntensityIndicator:
 
     cdef c_calculate(self, timestamp):
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
-
-        latest_processed_quote_idx = None
-        for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
-
-        # THere are no trades left to process
-        self._current_trade_sample = []
-        # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
+        self.c_add_quote(timestamp, float(price))
 
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+        if len(self._current_trade_sample) > 0:
+            self.c_process_trades()
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+        while len(self._trade_sample_timestamps) > self._sampling_length:
+            self.c_remove_oldest_trade_sample()
 
         if self.is_sampling_buffer_full:
             self.c_estimate_intensity()
@@ -123,44 +174,114 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
-    cdef c_estimate_intensity(self):
+    cdef c_add_quote(self, double timestamp, double price):
         cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
+            int64_t quotes_count = self._quotes_end - self._quotes_start
+            int64_t capacity = self._quote_timestamps.shape[0]
+            np.ndarray timestamps
+            np.ndarray prices
+
+        if self._quotes_end == capacity:
+            # Move the stored quotes to the beginning of the arrays, growing them if they are more than half full
+            if quotes_count > capacity // 2:
+                capacity *= 2
+            timestamps = np.empty(capacity, dtype=np.float64)
+            prices = np.empty(capacity, dtype=np.float64)
+            timestamps[:quotes_count] = self._quote_timestamps[self._quotes_start:self._quotes_end]
+            prices[:quotes_count] = self._quote_prices[self._quotes_start:self._quotes_end]
+            self._quote_timestamps = timestamps
+            self._quote_prices = prices
+            self._quotes_start = 0
+            self._quotes_end = quotes_count
+
+        self._quote_timestamps[self._quotes_end] = timestamp
+        self._quote_prices[self._quotes_end] = price
+        self._quotes_end += 1
+
+    cdef c_process_trades(self):
+        cdef:
+            np.ndarray quote_timestamps = self._quote_timestamps[self._quotes_start:self._quotes_end]
+            np.ndarray quote_prices = self._quote_prices[self._quotes_start:self._quotes_end]
+            np.ndarray trade_timestamps
+            np.ndarray trade_prices
+            np.ndarray trade_amounts
+            np.ndarray quote_indexes
+            np.ndarray matched
+            np.ndarray price_levels
+            np.ndarray sample_timestamps
+
+        trade_timestamps = np.fromiter((trade.timestamp for trade in self._current_trade_sample), dtype=np.float64)
+        trade_prices = np.fromiter((trade.price for trade in self._current_trade_sample), dtype=np.float64)
+        trade_amounts = np.fromiter((trade.amount for trade in self._current_trade_sample), dtype=np.float64)
+        # There are no trades left to process
+        self._current_trade_sample = []
 
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
+        # Each trade is matched with the last quote before it, trades without a previous quote are discarded
+        quote_indexes = np.searchsorted(quote_timestamps, trade_timestamps, side="left") - 1
+        matched = quote_indexes >= 0
+        if not matched.any():
+            return
+        quote_indexes = quote_indexes[matched]
+        price_levels = np.abs(trade_prices[matched] - quote_prices[quote_indexes])
+        trade_amounts = trade_amounts[matched]
+        sample_timestamps = quote_timestamps[quote_indexes] + 1
 
-                trades_consolidated[trade['price_level']] += trade['amount']
+        for sample_timestamp in np.unique(sample_timestamps).tolist():
+            in_sample = sample_timestamps == sample_timestamp
+            self.c_add_trade_samples(sample_timestamp, price_levels[in_sample], trade_amounts[in_sample])
 
-        price_levels = sorted(price_levels, reverse=True)
+        # Store quotes that happened after the latest trade + one before
+        self._quotes_start += quote_indexes.max()
+
+    cdef c_add_trade_samples(self, double timestamp, np.ndarray price_levels, np.ndarray amounts):
+        if timestamp not in self._trade_samples:
+            self._trade_samples[timestamp] = []
+            bisect.insort(self._trade_sample_timestamps, timestamp)
+        self._trade_samples[timestamp].append((price_levels, amounts))
+
+        for price_level, amount in zip(price_levels.tolist(), amounts.tolist()):
+            self._price_level_amounts[price_level] = self._price_level_amounts.get(price_level, 0) + amount
+            self._price_level_counts[price_level] = self._price_level_counts.get(price_level, 0) + 1
+
+    cdef c_remove_oldest_trade_sample(self):
+        timestamp = self._trade_sample_timestamps.pop(0)
+        for price_levels, amounts in self._trade_samples.pop(timestamp):
+            for price_level, amount in zip(price_levels.tolist(), amounts.tolist()):
+                count = self._price_level_counts[price_level] - 1
+                if count == 0:
+                    del self._price_level_counts[price_level]
+                    del self._price_level_amounts[price_level]
+                else:
+                    self._price_level_counts[price_level] = count
+                    self._price_level_amounts[price_level] -= amount
 
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+    cdef c_estimate_intensity(self):
+        cdef:
+            np.ndarray price_levels
+            np.ndarray lambdas
 
+        price_levels = np.fromiter(self._price_level_amounts.keys(), dtype=np.float64,
+                                   count=len(self._price_level_amounts))
+        lambdas = np.fromiter(self._price_level_amounts.values(), dtype=np.float64,
+                              count=len(self._price_level_amounts))
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        lambdas = np.where(lambdas == 0, MIN_TRADING_INTENSITY, lambdas)
+
+        params = fit_exponential_decay(price_levels, lambdas)
+        if params is not None:
+            self._alpha, self._kappa = params
+            return
 
         # Fit the probability density function; reuse previously calculated parameters as initial values
         try:
             params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
                                price_levels,
-                               lambdas_adj,
+                               lambdas,
                                p0=(self._alpha, self._kappa),
                                method='dogbox',
                                bounds=([0, 0], [np.inf, np.inf]))
 
-            self._kappa = Decimal(str(params[0][1]))
-            self._alpha = Decimal(str(params[0][0]))
+            self._kappa = params[0][1]
+            self._alpha = params[0][0]
         except (RuntimeError, ValueError) as e:
             pass
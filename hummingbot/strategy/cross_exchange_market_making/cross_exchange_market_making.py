@@ -1,10 +1,11 @@
+import asyncio
 import logging
 from collections import defaultdict, deque
 from decimal import Decimal
 from enum import Enum
 from functools import lru_cache
 from math import ceil, floor
-from typing import Dict, List, Tuple, cast
+from typing import Dict, List, Optional, Tuple, cast
 
 import pandas as pd
 from bidict import bidict
@@ -25,7 +26,7 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
 )
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making_config_map_pydantic import (
     CrossExchangeMarketMakingConfigMap,
     PassiveOrderRefreshMode,
@@ -82,7 +83,8 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                     market_pairs: List[MakerTakerMarketPair],
                     status_report_interval: float = 900,
                     logging_options: int = OPTION_LOG_ALL,
-                    hb_app_notification: bool = False
+                    hb_app_notification: bool = False,
+                    concurrent_market_pairs: bool = False
                     ):
         """
         Initializes a cross exchange market making strategy object.
@@ -91,6 +93,8 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         :param market_pairs: list of cross exchange market pairs
         :param logging_options: bit field for what types of logging to enable in this strategy object
         :param hb_app_notification:
+        :param concurrent_market_pairs: process the market pairs that don't share any balance concurrently, and keep
+        making markets on the other pairs while a pair is hedging
         """
         self._config_map = config_map
         self._market_pairs = {
@@ -105,6 +109,10 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         self._anti_hysteresis_timers = {}
         self._order_fill_buy_events = {}
         self._order_fill_sell_events = {}
+        # Maker fill records without a hedging order, by market pair and identity of the fill event. Exchange trade ids
+        # are not used as keys because they can be empty or repeated.
+        self._unhedged_buy_fill_records = {}
+        self._unhedged_sell_fill_records = {}
         self._suggested_price_samples = {}
 
         self._last_timestamp = 0
@@ -113,11 +121,18 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
         # Holds ongoing hedging orders mapped to their respective maker fill trades
         self._ongoing_hedging = bidict()
+        # Identities of the maker fill events mapped to their ongoing hedging order, and the maker fill events of each
+        # ongoing hedging order, which keeps the fill events (and so their identities) alive while they are indexed
+        self._ongoing_hedging_fill_ids = {}
+        self._ongoing_hedging_fill_events = {}
 
         self._logging_options = logging_options
 
-        self._last_taker_buy_price = None
-        self._last_taker_sell_price = None
+        self._last_taker_buy_prices = {}
+        self._last_taker_sell_prices = {}
+
+        self._concurrent_market_pairs = concurrent_market_pairs
+        self._independent_market_pair_groups = self.get_independent_market_pair_groups(market_pairs)
 
         self._main_task = None
         self._gateway_quotes_task = None
@@ -229,6 +244,10 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
     def gateway_transaction_cancel_interval(self):
         return self._config_map.gateway_transaction_cancel_interval
 
+    @property
+    def concurrent_market_pairs(self) -> bool:
+        return self._concurrent_market_pairs
+
     @property
     def logging_options(self) -> int:
         return self._logging_options
@@ -241,6 +260,28 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
     def market_info_to_active_orders(self) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
         return self._sb_order_tracker.market_pair_to_active_orders
 
+    @staticmethod
+    def get_independent_market_pair_groups(
+            market_pairs: List[MakerTakerMarketPair]) -> List[List[MakerTakerMarketPair]]:
+        """
+        Groups the market pairs that share a balance, directly or through other pairs. Pairs in different groups
+        can be processed concurrently, the pairs of a group have to be processed one after the other.
+        """
+        groups = []
+        groups_balances = []
+        for market_pair in market_pairs:
+            group = [market_pair]
+            balances = {(market_info.market, asset)
+                        for market_info in (market_pair.maker, market_pair.taker)
+                        for asset in (market_info.base_asset, market_info.quote_asset)}
+            for index in reversed(range(len(groups))):
+                if not balances.isdisjoint(groups_balances[index]):
+                    group = groups.pop(index) + group
+                    balances |= groups_balances.pop(index)
+            groups.append(group)
+            groups_balances.append(balances)
+        return groups
+
     @staticmethod
     @lru_cache(maxsize=10)
     def is_gateway_market(market_info: MarketTradingPairTuple) -> bool:
@@ -313,10 +354,11 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             else:
                 markets_df = self.market_status_data_frame([market_pair.maker])
                 # Market status for gateway
-                bid_price = "" if self._last_taker_buy_price is None else self._last_taker_buy_price
-                ask_price = "" if self._last_taker_sell_price is None else self._last_taker_sell_price
-                if self._last_taker_buy_price is not None and self._last_taker_sell_price is not None:
-                    mid_price = (self._last_taker_buy_price + self._last_taker_sell_price) / 2
+                last_taker_buy_price, last_taker_sell_price = self.get_last_taker_prices(market_pair)
+                bid_price = "" if last_taker_buy_price is None else last_taker_buy_price
+                ask_price = "" if last_taker_sell_price is None else last_taker_sell_price
+                if last_taker_buy_price is not None and last_taker_sell_price is not None:
+                    mid_price = (last_taker_buy_price + last_taker_sell_price) / 2
                 else:
                     mid_price = ""
                 taker_data = {
@@ -383,27 +425,28 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
         if not self._all_markets_ready:
             self._all_markets_ready = all([market.ready for market in self.active_markets])
-            if not self._all_markets_ready:
-                # Markets not ready yet. Don't do anything.
-                if should_report_warnings:
-                    self.logger().warning("Markets are not ready. No market making trades are permitted.")
-                return
-            else:
+            if self._all_markets_ready:
                 # Markets are ready, ok to proceed.
                 if LogOption.STATUS_REPORT:
                     self.logger().info("Markets are ready.")
+            elif len(self.ready_market_pairs) == 0:
+                # No market pair ready yet. Don't do anything.
+                if should_report_warnings:
+                    self.logger().warning("Markets are not ready. No market making trades are permitted.")
+                return
 
         if not self._conversions_ready:
-            for market_pair in self._market_pairs.values():
+            for market_pair in self.ready_market_pairs:
                 _, _, quote_rate, _, _, base_rate, _, _, _ = self.get_conversion_rates(market_pair)
                 if not quote_rate or not base_rate:
                     if should_report_warnings:
                         self.logger().warning("Conversion rates are not ready. No market making trades are permitted.")
                     return
 
-            # Conversion rates are ready, ok to proceed.
-            self._conversions_ready = True
-            if LogOption.STATUS_REPORT:
+            # Conversion rates are ready, ok to proceed. They are checked again for the market pairs getting ready
+            # until all the markets are.
+            self._conversions_ready = self._all_markets_ready
+            if self._conversions_ready and LogOption.STATUS_REPORT:
                 self.logger().info("Conversion rates are ready. Trading started.")
 
         if should_report_warnings:
@@ -415,7 +458,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         if self._gateway_quotes_task is None or self._gateway_quotes_task.done():
             self._gateway_quotes_task = safe_ensure_future(self.get_gateway_quotes())
 
-        if self.ready_for_new_trades():
+        if self.ready_for_new_trades() or self._concurrent_market_pairs:
             if self._main_task is None or self._main_task.done():
                 self._main_task = safe_ensure_future(self.main(timestamp))
 
@@ -439,9 +482,21 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                         limit_order.client_order_id in self._maker_to_taker_order_ids.keys():
                     market_pair_to_active_orders[market_pair].append(limit_order)
 
-            # Process each market pair independently.
-            for market_pair in self._market_pairs.values():
-                await self.process_market_pair(timestamp, market_pair, market_pair_to_active_orders[market_pair])
+            # Process each market pair independently, only the market pairs already ready while the markets are
+            # initializing.
+            ready_market_pairs = set(self.ready_market_pairs)
+            if self._concurrent_market_pairs:
+                await safe_gather(*[
+                    self.process_market_pair_group(
+                        timestamp,
+                        [market_pair for market_pair in market_pair_group if market_pair in ready_market_pairs],
+                        market_pair_to_active_orders)
+                    for market_pair_group in self._independent_market_pair_groups
+                ])
+            else:
+                for market_pair in self._market_pairs.values():
+                    if market_pair in ready_market_pairs:
+                        await self.process_market_pair(timestamp, market_pair, market_pair_to_active_orders[market_pair])
 
             # log conversion rates every 5 minutes
             if self._last_conv_rates_logged + (60. * 5) < timestamp:
@@ -450,32 +505,90 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         finally:
             self._last_timestamp = timestamp
 
+    async def process_market_pair_group(self,
+                                        timestamp: float,
+                                        market_pairs: List[MakerTakerMarketPair],
+                                        market_pair_to_active_orders: Dict[MakerTakerMarketPair, List[LimitOrder]]):
+        """
+        Processes market pairs sharing balances one after the other. None of them is processed while one of them is
+        hedging, since the hedge changes the balances they share. An error in one market pair doesn't stop the
+        processing of the others.
+        """
+        if not self.ready_for_new_trades(market_pairs):
+            return
+        for market_pair in market_pairs:
+            try:
+                await self.process_market_pair(timestamp, market_pair, market_pair_to_active_orders[market_pair])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error(f"Unexpected error processing the {market_pair.maker.trading_pair} market pair.",
+                                    exc_info=True)
+
     async def get_gateway_quotes(self):
+        """
+        Fetches the buy and sell quotes of all the gateway taker markets concurrently
+        """
+        quoted_market_pairs = []
+        quote_requests = []
         for market_pair in self._market_pairs.values():
             if self.is_gateway_market(market_pair.taker):
                 _, _, quote_rate, _, _, base_rate, _, _, _ = self.get_conversion_rates(market_pair)
                 order_amount = self._config_map.order_amount * base_rate
-                order_price = await market_pair.taker.market.get_order_price(
-                    market_pair.taker.trading_pair,
-                    True,
-                    order_amount
-                )
-                self._last_taker_buy_price = order_price
-                order_price = await market_pair.taker.market.get_order_price(
-                    market_pair.taker.trading_pair,
-                    False,
-                    order_amount
-                )
-                self._last_taker_sell_price = order_price
+                for is_buy in (True, False):
+                    quoted_market_pairs.append((market_pair, is_buy))
+                    quote_requests.append(market_pair.taker.market.get_order_price(
+                        market_pair.taker.trading_pair,
+                        is_buy,
+                        order_amount
+                    ))
+
+        order_prices = await safe_gather(*quote_requests, return_exceptions=True)
+        for (market_pair, is_buy), order_price in zip(quoted_market_pairs, order_prices):
+            if isinstance(order_price, Exception):
+                self.logger().warning(f"Gateway: failed to obtain the {'buy' if is_buy else 'sell'} price of "
+                                      f"{market_pair.taker.trading_pair}. Error: {order_price}")
+                continue
+            if is_buy:
+                self._last_taker_buy_prices[market_pair] = order_price
+            else:
+                self._last_taker_sell_prices[market_pair] = order_price
 
-    def ready_for_new_trades(self) -> bool:
+    def get_last_taker_prices(self, market_pair: MakerTakerMarketPair) -> Tuple[Optional[Decimal], Optional[Decimal]]:
         """
-        Returns True if there is no outstanding unfilled order.
+        :return: the last buy and sell quotes of a gateway taker market, None until they are fetched
         """
+        return self._last_taker_buy_prices.get(market_pair), self._last_taker_sell_prices.get(market_pair)
+
+    def ready_for_new_trades(self, market_pairs: Optional[List[MakerTakerMarketPair]] = None) -> bool:
+        """
+        Returns True if there is no outstanding unfilled order, of the market pairs if given.
+        """
+        if market_pairs is not None:
+            return not any(self.has_ongoing_hedging(market_pair) for market_pair in market_pairs)
         if len(self._ongoing_hedging.keys()) > 0:
             return False
         return True
 
+    @property
+    def ready_market_pairs(self) -> List[MakerTakerMarketPair]:
+        """
+        Market pairs whose maker and taker markets are ready for their trading pairs. Once all the markets are ready,
+        all the market pairs.
+        """
+        if self._all_markets_ready:
+            return list(self._market_pairs.values())
+        return [market_pair for market_pair in self._market_pairs.values()
+                if market_pair.maker.market.is_trading_pair_ready(market_pair.maker.trading_pair)
+                and market_pair.taker.market.is_trading_pair_ready(market_pair.taker.trading_pair)]
+
+    def has_ongoing_hedging(self, market_pair: MakerTakerMarketPair) -> bool:
+        """
+        Returns True if the market pair has an outstanding unfilled hedging order.
+        """
+        return any(self._market_pair_tracker.get_market_pair_from_order_id(taker_order_id) == market_pair
+                   for taker_order_id in self._ongoing_hedging.values())
+
     async def apply_gateway_transaction_cancel_interval(self):
         # XXX (martin_kou): Concurrent cancellations are not supported before the nonce architecture is fixed.
         # See: https://app.shortcut.com/coinalpha/story/24553/nonce-architecture-in-current-amm-trade-and-evm-approve-apis-is-incorrect-and-causes-trouble-with-concurrent-requests
@@ -596,6 +709,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                     self._order_fill_buy_events[market_pair] = [order_fill_record]
                 else:
                     self._order_fill_buy_events[market_pair].append(order_fill_record)
+                self._unhedged_buy_fill_records.setdefault(market_pair, {})[id(order_filled_event)] = order_fill_record
 
                 if LogOption.MAKER_ORDER_FILLED in self.logging_options:
                     self.log_with_clock(
@@ -609,6 +723,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                     self._order_fill_sell_events[market_pair] = [order_fill_record]
                 else:
                     self._order_fill_sell_events[market_pair].append(order_fill_record)
+                self._unhedged_sell_fill_records.setdefault(market_pair, {})[id(order_filled_event)] = order_fill_record
 
                 if LogOption.MAKER_ORDER_FILLED in self.logging_options:
                     self.log_with_clock(
@@ -735,6 +850,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                     if self.is_fill_event_in_ongoing_hedging(fill_event):
                         fill_events += [fill_event]
                 self._order_fill_sell_events[market_pair] = fill_events
+                self._unhedged_sell_fill_records.pop(market_pair, None)
 
                 # Cleanup maker fill events - no longer needed to create taker orders if all fills were hedged
                 if len(self._order_fill_sell_events[market_pair]) == 0:
@@ -802,6 +918,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                     if self.is_fill_event_in_ongoing_hedging(fill_event):
                         fill_events += [fill_event]
                 self._order_fill_buy_events[market_pair] = fill_events
+                self._unhedged_buy_fill_records.pop(market_pair, None)
 
                 # Cleanup maker fill events - no longer needed to create taker orders if all fills were hedged
                 if len(self._order_fill_buy_events[market_pair]) == 0:
@@ -1793,12 +1910,10 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             self.logger().warning("Multiple sell maker orders")
 
     def get_unhedged_buy_records(self, market_pair: MakerTakerMarketPair) -> List[OrderFilledEvent]:
-        buy_fill_records = self._order_fill_buy_events.get(market_pair, [])
-        return self.get_unhedged_events(buy_fill_records)
+        return list(self._unhedged_buy_fill_records.get(market_pair, {}).values())
 
     def get_unhedged_sell_records(self, market_pair: MakerTakerMarketPair) -> List[OrderFilledEvent]:
-        sell_fill_records = self._order_fill_sell_events.get(market_pair, [])
-        return self.get_unhedged_events(sell_fill_records)
+        return list(self._unhedged_sell_fill_records.get(market_pair, {}).values())
 
     def get_unhedged_events(self, fill_records: List[OrderFilledEvent]) -> List[OrderFilledEvent]:
         return [
@@ -1808,17 +1923,23 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         ]
 
     def is_fill_event_in_ongoing_hedging(self, fill_event: OrderFilledEvent) -> bool:
-        trade_id = fill_event[1].exchange_trade_id
-        for maker_exchange_trade_ids in self._ongoing_hedging:
-            for id in maker_exchange_trade_ids:
-                if trade_id is id:
-                    return True
-        return False
+        return id(fill_event[1]) in self._ongoing_hedging_fill_ids
 
     def set_ongoing_hedging(self, fill_records: List[OrderFilledEvent], order_id: str):
         maker_exchange_trade_ids = tuple(r.exchange_trade_id for _, r in fill_records)
         self._ongoing_hedging[maker_exchange_trade_ids] = order_id
+        market_pair = self._market_pair_tracker.get_market_pair_from_order_id(order_id)
+        fill_events = [fill_event for _, fill_event in fill_records]
+        self._ongoing_hedging_fill_events[order_id] = fill_events
+        for fill_event in fill_events:
+            self._ongoing_hedging_fill_ids[id(fill_event)] = order_id
+            unhedged_fill_records = (self._unhedged_buy_fill_records if fill_event.trade_type is TradeType.BUY
+                                     else self._unhedged_sell_fill_records)
+            unhedged_fill_records.get(market_pair, {}).pop(id(fill_event), None)
 
     def del_order_from_ongoing_hedging(self, taker_order_id: str):
         maker_exchange_trade_ids = self._ongoing_hedging.inverse[taker_order_id]
         del self._ongoing_hedging[maker_exchange_trade_ids]
+        for fill_event in self._ongoing_hedging_fill_events.pop(taker_order_id, []):
+            if self._ongoing_hedging_fill_ids.get(id(fill_event)) == taker_order_id:
+                del self._ongoing_hedging_fill_ids[id(fill_event)]
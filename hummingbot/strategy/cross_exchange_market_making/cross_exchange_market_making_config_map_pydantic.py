@@ -359,6 +359,17 @@ class CrossExchangeMarketMakingConfigMap(BaseTradingStrategyMakerTakerConfigMap)
             prompt_on_new=True,
         ),
     )
+    concurrent_market_pairs: bool = Field(
+        default=False,
+        description=("Process the market pairs that don't share any balance concurrently, and keep making markets on"
+                     " them while another market pair is hedging."),
+        client_data=ClientFieldData(
+            prompt=lambda mi: (
+                "Do you want to keep making markets on the market pairs that don't share any balance with a market "
+                "pair that is hedging? (Yes/No)"
+            ),
+        ),
+    )
     taker_market: ClientConfigEnum(
         value="TakerMarkets",  # noqa: F821
         names={e: e for e in
@@ -418,6 +429,7 @@ class CrossExchangeMarketMakingConfigMap(BaseTradingStrategyMakerTakerConfigMap)
 
     @validator(
         "adjust_order_enabled",
+        "concurrent_market_pairs",
         pre=True,
     )
     def validate_bool(cls, v: str):
@@ -69,4 +69,5 @@ def start(self):
         status_report_interval=status_report_interval,
         logging_options=strategy_logging_options,
         hb_app_notification=True,
+        concurrent_market_pairs=c_map.concurrent_market_pairs,
     )
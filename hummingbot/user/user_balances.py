@@ -108,7 +108,7 @@ class UserBalances:
         if exchange_name in self._markets:
             return await self._update_balances(self._markets[exchange_name])
         else:
-            await Security.wait_til_decryption_done()
+            await Security.wait_til_decryption_done([exchange_name])
             api_keys = Security.api_keys(exchange_name) if not is_gateway_market else {}
             return await self.add_exchange(exchange_name, client_config_map, **api_keys)
 
@@ -4,6 +4,7 @@ from typing import Dict
 from hummingbot import data_path
 from hummingbot.client.hummingbot_application import HummingbotApplication
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig, CandlesFactory
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
@@ -15,6 +16,8 @@ class DownloadCandles(ScriptStrategyBase):
     CSV files in the /data directory. The script stops after it has downloaded 50,000 max_records records for each pair.
     Is important to notice that the component will fail if all the candles are not available since the idea of it is to
     use it in production based on candles needed to compute technical indicators.
+    The candles of the exchanges supported by the candles history store are fetched in parallel and kept in the store,
+    so that only the new candles are downloaded the next time.
     """
     exchange = os.getenv("EXCHANGE", "binance_perpetual")
     trading_pairs = os.getenv("TRADING_PAIRS", "DODO-BUSD,LTC-USDT").split(",")
@@ -39,23 +42,36 @@ class DownloadCandles(ScriptStrategyBase):
         for combination in combinations:
 
             candle = CandlesFactory.get_candle(CandlesConfig(connector=self.exchange, trading_pair=combination[0], interval=combination[1], max_records=self.get_max_records(self.days_to_download, combination[1])))
-            candle.start()
+            if candle.candles_fetch_limit is not None:
+                self.candles[f"{combination[0]}_{combination[1]}"]["download_task"] = safe_ensure_future(
+                    candle.download_candles())
+            else:
+                candle.start()
             # we are storing the candles object and the csv path to save the candles
             self.candles[f"{combination[0]}_{combination[1]}"]["candles"] = candle
             self.candles[f"{combination[0]}_{combination[1]}"][
                 "csv_path"] = data_path() + f"/candles_{self.exchange}_{combination[0]}_{combination[1]}.csv"
 
+    @staticmethod
+    def is_done(candles_info: Dict) -> bool:
+        # The candles downloaded from the store are done when the download is, even if it could not get every candle
+        download_task = candles_info.get("download_task")
+        return candles_info["candles"].is_ready or (download_task is not None and download_task.done())
+
     def on_tick(self):
         for trading_pair, candles_info in self.candles.items():
-            if not candles_info["candles"].is_ready:
-                self.logger().info(f"Candles not ready yet for {trading_pair}! Missing {candles_info['candles']._candles.maxlen - len(candles_info['candles']._candles)}")
-                pass
-            else:
+            if candles_info["candles"].is_ready:
                 df = candles_info["candles"].candles_df
                 df.to_csv(candles_info["csv_path"], index=False)
-        if all(candles_info["candles"].is_ready for candles_info in self.candles.values()):
+            elif self.is_done(candles_info):
+                self.logger().error(f"Could not download all the candles for {trading_pair}!")
+            else:
+                self.logger().info(f"Candles not ready yet for {trading_pair}! Missing {candles_info['candles']._candles.maxlen - len(candles_info['candles']._candles)}")
+        if all(self.is_done(candles_info) for candles_info in self.candles.values()):
             HummingbotApplication.main_application().stop()
 
     def on_stop(self):
         for candles_info in self.candles.values():
+            if candles_info.get("download_task") is not None:
+                candles_info["download_task"].cancel()
             candles_info["candles"].stop()
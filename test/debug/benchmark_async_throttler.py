@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+"""
+Measures the acquire latency of AsyncThrottler and SlidingWindowAsyncThrottler with 10, 100 and 1000 tasks in flight.
+Every task consumes a limit linked to two pools, and the limits are high enough for no task to wait for capacity, so
+the numbers show the bookkeeping cost of each throttler.
+"""
+
+import asyncio
+import statistics
+import time
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.sliding_window_async_throttler import SlidingWindowAsyncThrottler
+
+IN_FLIGHT_TASKS = [10, 100, 1000]
+ENDPOINTS = 10
+
+RATE_LIMITS = [
+    RateLimit(limit_id="REQUEST_WEIGHT", limit=1_000_000, time_interval=60),
+    RateLimit(limit_id="RAW_REQUESTS", limit=1_000_000, time_interval=60),
+] + [
+    RateLimit(limit_id=f"/endpoint_{i}", limit=1_000_000, time_interval=60,
+              linked_limits=[LinkedLimitWeightPair("REQUEST_WEIGHT", 2), LinkedLimitWeightPair("RAW_REQUESTS", 1)])
+    for i in range(ENDPOINTS)
+]
+
+
+async def measure(throttler_class, in_flight_tasks: int) -> float:
+    throttler = throttler_class(rate_limits=RATE_LIMITS)
+    latencies = []
+
+    async def request(i: int):
+        start = time.perf_counter()
+        async with throttler.execute_task(limit_id=f"/endpoint_{i % ENDPOINTS}"):
+            latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*[request(i) for i in range(in_flight_tasks)])
+    return statistics.mean(latencies)
+
+
+def main():
+    loop = asyncio.get_event_loop()
+    for throttler_class in (AsyncThrottler, SlidingWindowAsyncThrottler):
+        for in_flight_tasks in IN_FLIGHT_TASKS:
+            latency = loop.run_until_complete(measure(throttler_class, in_flight_tasks))
+            print(f"{throttler_class.__name__}: {in_flight_tasks} tasks in flight, "
+                  f"mean acquire latency {latency * 1e6:,.1f} us")
+
+
+if __name__ == "__main__":
+    main()
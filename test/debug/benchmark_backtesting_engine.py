@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+"""
+Time spent labeling events with the triple barrier method and applying the order level cooldown, on 1m candles with
+a signal on a fifth of them. The "path by path" rows reproduce the previous behaviour: a pandas slice of the path of
+every event, and a loop over the rows of every side for the cooldown.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.smart_components.strategy_frameworks.backtesting_engine_base import BacktestingEngineBase
+
+CANDLES = (10_000, 100_000)
+TAKE_PROFIT = 0.01
+STOP_LOSS = 0.01
+TIME_LIMIT = 60 * 60 * 4
+COOLDOWN = pd.Timedelta(seconds=60 * 15)
+
+
+def get_candles(length: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({
+        "timestamp": 1672531200000 + np.arange(length) * 60000,
+        "close": 100 * np.exp(np.cumsum(rng.normal(0, 0.001, length))),
+        "signal": rng.choice([-1, 0, 0, 0, 0, 0, 0, 0, 0, 1], length),
+        "target": 1,
+    })
+    df.index = pd.to_datetime(df.timestamp, unit="ms")
+    df["tl"] = df.index + pd.Timedelta(seconds=TIME_LIMIT)
+    return df
+
+
+def path_by_path_tp_sl_on_tl(df: pd.DataFrame, tp: float, sl: float):
+    events = df[df["signal"] != 0].copy()
+    take_profit = tp * events["target"]
+    stop_loss = - sl * events["target"]
+    for loc, tl in events["tl"].fillna(df.index[-1]).items():
+        df0 = df.close[loc:tl]
+        df0 = (df0 / df.close[loc] - 1) * events.at[loc, "signal"]
+        df.loc[loc, "stop_loss_time"] = df0[df0 < stop_loss[loc]].index.min()
+        df.loc[loc, "take_profit_time"] = df0[df0 > take_profit[loc]].index.min()
+    df["close_time"] = df[["tl", "take_profit_time", "stop_loss_time"]].dropna(how="all").min(axis=1)
+    return df
+
+
+def row_by_row_cooldown(df: pd.DataFrame):
+    selected = []
+    last_close_time = pd.Timestamp.min
+    for index, row in df[df["signal"] > 0].iterrows():
+        if index >= last_close_time + COOLDOWN:
+            selected.append(index)
+            last_close_time = row["close_time"]
+    return selected
+
+
+def vectorized_cooldown(df: pd.DataFrame):
+    side_df = df[df["signal"] > 0]
+    return side_df.index[BacktestingEngineBase.apply_cooldown(
+        side_df["close_time"].values, side_df.index.values, np.timedelta64(COOLDOWN),
+        pd.Timestamp.min.to_datetime64())].tolist()
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    for length in CANDLES:
+        path_by_path, path_by_path_time = timed(path_by_path_tp_sl_on_tl, get_candles(length), TAKE_PROFIT, STOP_LOSS)
+        vectorized, vectorized_time = timed(BacktestingEngineBase.apply_tp_sl_on_tl, get_candles(length),
+                                            TAKE_PROFIT, STOP_LOSS)
+        assert path_by_path["close_time"].equals(vectorized["close_time"])
+        print(f"{length} candles, triple barrier: path by path {path_by_path_time:.2f} s, "
+              f"vectorized {vectorized_time:.3f} s")
+
+        row_by_row, row_by_row_time = timed(row_by_row_cooldown, vectorized)
+        selected, selected_time = timed(vectorized_cooldown, vectorized)
+        assert row_by_row == selected
+        print(f"{length} candles, cooldown: row by row {row_by_row_time:.3f} s, vectorized {selected_time:.4f} s")
+
+
+if __name__ == "__main__":
+    main()
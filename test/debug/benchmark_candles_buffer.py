@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+"""
+Cost of the candles storage of CandlesBase for many candles feeds with full windows of candles. The "deque" rows
+reproduce the previous storage, a deque of a numpy array per candle, with the values of the candles as strings, as
+they are received from the websockets, and a DataFrame built from the deque on every access of candles_df. The
+"buffer" rows use the CandlesBuffer of the candles feeds.
+- update: websocket message updating the current candle
+- new candle: websocket message starting a new candle
+- candles_df: access of the candles DataFrame after an update
+- close column: access of the close prices as an array after an update
+"""
+
+import time
+import tracemalloc
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+
+FEEDS = 50
+MAX_RECORDS = 1000
+UPDATES = 200
+
+
+def ws_candle(timestamp: int, price: float) -> np.ndarray:
+    values = [f"{price:.2f}"] * 4 + ["12.5", f"{price * 12.5:.2f}", "100", "6.2", f"{price * 6.2:.2f}"]
+    return np.array([timestamp] + values)
+
+
+class DequeFeed:
+    def __init__(self):
+        self._candles = deque(maxlen=MAX_RECORDS)
+
+    @property
+    def candles_df(self) -> pd.DataFrame:
+        return pd.DataFrame(self._candles, columns=CandlesBase.columns, dtype=float)
+
+    def update(self, candle):
+        self._candles.pop()
+        self._candles.append(candle)
+
+    def close(self) -> np.ndarray:
+        return self.candles_df["close"].values
+
+
+class BufferFeed:
+    def __init__(self):
+        self._feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=MAX_RECORDS)
+        self._candles = self._feed._candles
+
+    @property
+    def candles_df(self) -> pd.DataFrame:
+        return self._feed.candles_df
+
+    def update(self, candle):
+        self._candles.update_last(candle)
+
+    def close(self) -> np.ndarray:
+        return self._feed.get_column("close")
+
+
+def fill(feed_class):
+    tracemalloc.start()
+    feeds = [feed_class() for _ in range(FEEDS)]
+    for feed in feeds:
+        for i in range(MAX_RECORDS):
+            feed._candles.append(ws_candle(i * 60000, 100 + i * 0.01))
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return feeds, memory
+
+
+def timed(function, feeds, tick_start: int) -> float:
+    start = time.perf_counter()
+    for tick in range(UPDATES):
+        for feed in feeds:
+            function(feed, tick_start + tick)
+    return (time.perf_counter() - start) / (UPDATES * len(feeds)) * 1e6
+
+
+def update(feed, tick: int):
+    feed.update(ws_candle((MAX_RECORDS - 1) * 60000, 100 + tick * 0.01))
+
+
+def new_candle(feed, tick: int):
+    feed._candles.append(ws_candle((MAX_RECORDS + tick) * 60000, 100 + tick * 0.01))
+
+
+def update_and_candles_df(feed, tick: int):
+    update(feed, tick)
+    feed.candles_df
+
+
+def update_and_close(feed, tick: int):
+    update(feed, tick)
+    feed.close()
+
+
+def main():
+    for name, feed_class in (("deque", DequeFeed), ("buffer", BufferFeed)):
+        feeds, memory = fill(feed_class)
+        print(f"{name}, memory: {memory / 1e6:.1f} MB for {FEEDS} feeds of {MAX_RECORDS} candles")
+        print(f"{name}, update: {timed(update, feeds, 0):.1f} us")
+        print(f"{name}, new candle: {timed(new_candle, feeds, 0):.1f} us")
+        print(f"{name}, candles_df: {timed(update_and_candles_df, feeds, 0):.1f} us")
+        print(f"{name}, close column: {timed(update_and_close, feeds, 0):.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+"""
+Duration of the historical candles backfill of a candles feed of 50,000 1m candles, with a simulated latency of the
+candles requests. The "sequential" row reproduces the previous backfill, which requested pages of 1000 candles one
+after the other from the newest candle backwards, the "store" rows fill the candles from the CandlesHistoryStore,
+without stored candles (cold), with every candle stored but the last ones (warm). The "load" rows compare loading the
+candles for a backtest from a CSV file and from the store.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_history_store import CandlesHistoryStore
+
+MAX_RECORDS = 50000
+LATENCY = 0.05
+STEP = 60000
+NEW_CANDLES = 30
+
+
+class SimulatedCandles(BinanceSpotCandles):
+    async def fetch_candles(self,
+                            start_time: Optional[int] = None,
+                            end_time: Optional[int] = None,
+                            limit: Optional[int] = 500):
+        await asyncio.sleep(LATENCY)
+        if start_time is None:
+            start_time = end_time - (limit - 1) * STEP
+        first = (start_time + STEP - 1) // STEP * STEP
+        timestamps = np.arange(first, end_time + 1, STEP, dtype=float)[:limit]
+        candles = np.tile(np.arange(10, dtype=float), (len(timestamps), 1))
+        candles[:, 0] = timestamps
+        return candles
+
+
+async def sequential_fill(candles: SimulatedCandles):
+    # Previous BinanceSpotCandles.fill_historical_candles, without the error handling
+    while not candles.is_ready:
+        missing_records = candles._candles.maxlen - len(candles._candles)
+        end_timestamp = int(candles._candles[0][0])
+        fetched = await candles.fetch_candles(end_time=end_timestamp, limit=min(missing_records + 1, 1000))
+        candles._candles.extendleft(fetched[-(missing_records + 1):-1][::-1])
+
+
+def new_feed(store: CandlesHistoryStore, first_timestamp: int) -> SimulatedCandles:
+    candles = SimulatedCandles(trading_pair="BTC-USDT", interval="1m", max_records=MAX_RECORDS)
+    candles.history_store = store
+    candles._candles.append(np.array([first_timestamp] + list(range(1, 10)), dtype=float))
+    return candles
+
+
+def timed(coroutine) -> float:
+    start = time.perf_counter()
+    asyncio.get_event_loop().run_until_complete(coroutine)
+    return time.perf_counter() - start
+
+
+def main():
+    path = tempfile.mkdtemp()
+    try:
+        store = CandlesHistoryStore(path=path)
+        first_timestamp = int(time.time() * 1000) // STEP * STEP
+
+        candles = new_feed(store, first_timestamp)
+        print(f"sequential: {timed(sequential_fill(candles)):.2f} s")
+
+        candles = new_feed(store, first_timestamp - NEW_CANDLES * STEP)
+        print(f"store, cold: {timed(candles.fill_historical_candles()):.2f} s")
+
+        candles = new_feed(store, first_timestamp)
+        duration = timed(candles.fill_historical_candles())
+        assert candles.is_ready
+        print(f"store, warm ({NEW_CANDLES} new candles): {duration:.3f} s")
+
+        csv_path = os.path.join(path, f"candles_{candles.name}_{candles.interval}.csv")
+        candles.candles_df.to_csv(csv_path, index=False)
+        start = time.perf_counter()
+        for _ in range(5):
+            csv_candles = SimulatedCandles(trading_pair="BTC-USDT", interval="1m", max_records=MAX_RECORDS)
+            csv_candles.load_candles_from_csv(path)
+        print(f"load, csv: {(time.perf_counter() - start) / 5 * 1e3:.1f} ms")
+        start = time.perf_counter()
+        for _ in range(5):
+            stored_candles = SimulatedCandles(trading_pair="BTC-USDT", interval="1m", max_records=MAX_RECORDS)
+            stored_candles.history_store = store
+            stored_candles.load_candles_from_store()
+        print(f"load, store: {(time.perf_counter() - start) / 5 * 1e3:.1f} ms")
+        pd.testing.assert_frame_equal(csv_candles.candles_df.iloc[:-1], stored_candles.candles_df.iloc[1:]
+                                      .reset_index(drop=True))
+    finally:
+        shutil.rmtree(path)
+
+
+if __name__ == "__main__":
+    main()
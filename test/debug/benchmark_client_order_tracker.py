@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+"""
+Cost per user stream message of the ClientOrderTracker lookups done by the connectors, with 1k tracked orders and
+1k cached orders. The "copies" rows reproduce the previous behaviour: the merged order dictionaries are built on every
+lookup, and orders are found by exchange order id with a linear scan.
+"""
+
+import time
+from decimal import Decimal
+from itertools import chain
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.client_order_tracker import ClientOrderTracker
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder
+
+ORDERS = 1_000
+MESSAGES = 20_000
+
+
+def create_tracker() -> ClientOrderTracker:
+    tracker = ClientOrderTracker(connector=ExchangeBase(client_config_map=ClientConfigAdapter(ClientConfigMap())))
+    for i in range(2 * ORDERS):
+        tracker.start_tracking_order(InFlightOrder(
+            client_order_id=f"OID{i}",
+            exchange_order_id=f"EOID{i}",
+            trading_pair="COINALPHA-HBOT",
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1"),
+        ))
+        if i >= ORDERS:
+            tracker.stop_tracking_order(f"OID{i}")
+    return tracker
+
+
+def copied_fillable_orders(tracker: ClientOrderTracker):
+    cached_orders = {client_order_id: order for client_order_id, order in tracker._cached_orders.items()}
+    lost_orders = {client_order_id: order for client_order_id, order in tracker._lost_orders.items()}
+    return {**tracker._in_flight_orders, **cached_orders, **lost_orders}
+
+
+def copied_fillable_orders_by_exchange_order_id(tracker: ClientOrderTracker):
+    return {order.exchange_order_id: order
+            for order in chain(tracker._in_flight_orders.values(), tracker._cached_orders.values(),
+                               tracker._lost_orders.values())}
+
+
+def copied_fetch_order(tracker: ClientOrderTracker, exchange_order_id: str):
+    all_orders = {**tracker._in_flight_orders, **dict(tracker._cached_orders.items())}
+    return next((order for order in all_orders.values() if order.exchange_order_id == exchange_order_id), None)
+
+
+def time_per_message(name: str, lookup):
+    start = time.perf_counter()
+    for i in range(MESSAGES):
+        lookup(i % (2 * ORDERS))
+    return name, (time.perf_counter() - start) / MESSAGES * 1e6
+
+
+def main():
+    tracker = create_tracker()
+    results = [
+        time_per_message("all_fillable_orders.get, copies",
+                         lambda i: copied_fillable_orders(tracker).get(f"OID{i}")),
+        time_per_message("all_fillable_orders.get, view",
+                         lambda i: tracker.all_fillable_orders.get(f"OID{i}")),
+        time_per_message("all_fillable_orders_by_exchange_order_id.get, copies",
+                         lambda i: copied_fillable_orders_by_exchange_order_id(tracker).get(f"EOID{i}")),
+        time_per_message("all_fillable_orders_by_exchange_order_id.get, index",
+                         lambda i: tracker.all_fillable_orders_by_exchange_order_id.get(f"EOID{i}")),
+        time_per_message("fetch_order(exchange_order_id), scan",
+                         lambda i: copied_fetch_order(tracker, f"EOID{i}")),
+        time_per_message("fetch_order(exchange_order_id), index",
+                         lambda i: tracker.fetch_order(exchange_order_id=f"EOID{i}")),
+    ]
+    for name, duration in results:
+        print(f"{name}: {duration:.2f} us per message")
+
+
+if __name__ == "__main__":
+    main()
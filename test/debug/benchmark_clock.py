@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+"""
+Compares the real time and the event driven clock modes: delay between a best price change of an order book and the
+next tick of the child iterators, and number of ticks and CPU time when the order book doesn't change.
+"""
+
+import asyncio
+import random
+import time
+
+import numpy as np
+
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+RUN_TIME = 10
+CHANGES_PER_SECOND = 2
+
+
+class TickRecorder(PyTimeIterator):
+    def __init__(self):
+        super().__init__()
+        self.ticks = []
+
+    def tick(self, timestamp: float):
+        self.ticks.append(time.time())
+
+
+async def change_order_book(order_book: OrderBook, change_times: list):
+    update_id = 0
+    while True:
+        await asyncio.sleep(random.expovariate(CHANGES_PER_SECOND))
+        update_id += 1
+        mid = 100 + random.uniform(-1, 1)
+        order_book.apply_raw_snapshot(bids=[[mid - 0.01, 1]], asks=[[mid + 0.01, 1]], update_id=update_id)
+        change_times.append(time.time())
+
+
+def run(clock: Clock, with_changes: bool):
+    recorder = TickRecorder()
+    order_book = OrderBook()
+    clock.add_iterator(recorder)
+    clock.subscribe_to_order_book(order_book)
+    change_times = []
+
+    loop = asyncio.get_event_loop()
+    changes_task = loop.create_task(change_order_book(order_book, change_times)) if with_changes else None
+    cpu_start = time.process_time()
+    with clock:
+        loop.run_until_complete(clock.run_til(time.time() + RUN_TIME))
+    cpu_time = time.process_time() - cpu_start
+    if changes_task is not None:
+        changes_task.cancel()
+
+    ticks = np.array(recorder.ticks)
+    delays = [ticks[np.searchsorted(ticks, change_time)] - change_time
+              for change_time in change_times if change_time < ticks[-1]]
+    return delays, len(ticks), cpu_time
+
+
+def main():
+    random.seed(42)
+    clocks = {
+        "real time, tick size 1s": lambda: Clock(ClockMode.REALTIME, tick_size=1.0),
+        "real time, tick size 0.1s": lambda: Clock(ClockMode.REALTIME, tick_size=0.1),
+        "event driven, min interval 0.05s, max idle 1s": lambda: Clock(
+            ClockMode.EVENT_DRIVEN, tick_size=1.0, min_tick_interval=0.05, max_idle_interval=1.0),
+    }
+    for name, clock_factory in clocks.items():
+        delays, _, _ = run(clock_factory(), with_changes=True)
+        _, idle_ticks, idle_cpu_time = run(clock_factory(), with_changes=False)
+        print(f"{name}: reaction delay mean {np.mean(delays) * 1e3:.0f} ms, p99 {np.percentile(delays, 99) * 1e3:.0f} ms; "
+              f"idle {idle_ticks / RUN_TIME:.1f} ticks/s, {idle_cpu_time * 1e3 / RUN_TIME:.1f} ms CPU/s")
+
+
+if __name__ == "__main__":
+    main()
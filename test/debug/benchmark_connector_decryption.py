@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+"""
+Time to decrypt the configs of a number of connectors, with the secrets of every connector saved in a different
+session. The "per secret salt" rows use connector configs encrypted with a new salt for every secret, as they were
+before the secrets manager reused its key derivation parameters, the "per session salt" rows use configs encrypted
+with the current secrets manager. The "sequential" rows reproduce the previous decryption, which decrypted the
+connector configs one after the other and derived the key of every secret. The "login" rows time Security.login
+until the first connector config and until every connector config is decrypted.
+"""
+
+import asyncio
+import binascii
+import json
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from eth_account import Account
+from pydantic import SecretStr
+
+from hummingbot.client.config import config_crypt, config_helpers, security
+from hummingbot.client.config.config_crypt import (
+    ETHKeyFileSecretManger,
+    _create_v3_keyfile_json,
+    store_password_verification,
+)
+from hummingbot.client.config.config_helpers import (
+    ClientConfigAdapter,
+    get_connector_config_yml_path,
+    get_connector_hb_config,
+    list_connector_configs,
+    save_to_yml,
+)
+from hummingbot.client.config.security import Security
+
+CONNECTORS = ["binance", "kucoin", "gate_io", "okx", "bybit", "ascend_ex", "bitmart", "mexc"]
+PASSWORD = "some-password"
+
+
+class PerSecretSaltSecretsManager(ETHKeyFileSecretManger):
+    def encrypt_secret_value(self, attr: str, value: str):
+        keyfile_json = _create_v3_keyfile_json(value.encode(), self._password.encode())
+        return binascii.hexlify(json.dumps(keyfile_json).encode()).decode()
+
+
+class SequentialSecretsManager(ETHKeyFileSecretManger):
+    def decrypt_secret_value(self, attr: str, value: str) -> str:
+        return Account.decrypt(binascii.unhexlify(value).decode(), self._password).decode()
+
+
+def store_connector_configs(secrets_manager_class):
+    for connector_name in CONNECTORS:
+        # Every connector is connected in a different session
+        Security.secrets_manager = secrets_manager_class(PASSWORD)
+        config_map = ClientConfigAdapter(get_connector_hb_config(connector_name))
+        for attr, field in config_map.hb_config.__fields__.items():
+            if field.type_ == SecretStr:
+                config_map.setattr_no_validation(attr, f"{connector_name}-{attr}")
+        save_to_yml(get_connector_config_yml_path(connector_name), config_map)
+
+
+def decrypt_sequentially():
+    Security.secrets_manager = SequentialSecretsManager(PASSWORD)
+    for file_path in list_connector_configs():
+        Security.decrypt_connector_config(file_path)
+
+
+def decrypt_all():
+    Security.secrets_manager = ETHKeyFileSecretManger(PASSWORD)
+    Security.decrypt_all()
+
+
+async def login():
+    start = time.perf_counter()
+    Security.login(ETHKeyFileSecretManger(PASSWORD))
+    await asyncio.wait(
+        [asyncio.ensure_future(Security.wait_til_decryption_done([connector_name])) for connector_name in CONNECTORS],
+        return_when=asyncio.FIRST_COMPLETED,
+    )
+    first_connector_duration = time.perf_counter() - start
+    await Security.wait_til_decryption_done()
+    return first_connector_duration, time.perf_counter() - start
+
+
+def main():
+    with TemporaryDirectory() as temp_dir:
+        config_helpers.CONNECTORS_CONF_DIR_PATH = Path(temp_dir) / "connectors"
+        config_helpers.CONNECTORS_CONF_DIR_PATH.mkdir()
+        config_crypt.PASSWORD_VERIFICATION_PATH = Path(temp_dir) / ".password_verification"
+        security.PASSWORD_VERIFICATION_PATH = config_crypt.PASSWORD_VERIFICATION_PATH
+        store_password_verification(ETHKeyFileSecretManger(PASSWORD))
+
+        for salt, secrets_manager_class in (
+            ("per secret salt", PerSecretSaltSecretsManager),
+            ("per session salt", ETHKeyFileSecretManger),
+        ):
+            store_connector_configs(secrets_manager_class)
+            for name, decrypt in (("sequential", decrypt_sequentially), ("decrypt_all", decrypt_all)):
+                start = time.perf_counter()
+                decrypt()
+                print(f"{salt}, {name}: {(time.perf_counter() - start) * 1e3:.0f} ms")
+            first_connector, all_connectors = asyncio.get_event_loop().run_until_complete(login())
+            print(f"{salt}, login: first connector after {first_connector * 1e3:.0f} ms, "
+                  f"every connector after {all_connectors * 1e3:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
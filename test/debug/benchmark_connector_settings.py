@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+"""
+Startup cost of the connector settings, each run in a new interpreter so that no module is imported beforehand.
+The "settings" rows time AllConnectorSettings.create_connector_settings(), the "application" and "quickstart"
+rows import HummingbotApplication or bin/hummingbot_quickstart.py and then create the connector settings, as
+quick_start() does before loading the strategy. The "discovery" rows import every connector utils module, the
+"cache" rows load the connector settings cache written by the previous run.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+RUNS = 5
+ROOT_PATH = Path(__file__).parent.parent.parent
+
+STARTUP_CODE = """
+import sys
+import time
+from pathlib import Path
+start = time.perf_counter()
+{imports}
+from hummingbot.client import settings
+settings.CONNECTOR_SETTINGS_CACHE_PATH = Path({cache_path!r})
+settings_start = time.perf_counter()
+settings.AllConnectorSettings.create_connector_settings()
+end = time.perf_counter()
+print((end - start) * 1e3, (end - settings_start) * 1e3, len(sys.modules))
+"""
+
+
+def run_startup(imports: str, cache_path: Path):
+    code = STARTUP_CODE.format(imports=imports, cache_path=str(cache_path))
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT_PATH, capture_output=True, text=True)
+    if output.returncode != 0:
+        raise ImportError(output.stderr.strip().splitlines()[-1])
+    total, create_settings, modules = output.stdout.split()[-3:]
+    return float(total), float(create_settings), int(modules)
+
+
+def main():
+    rows = (
+        ("settings", ""),
+        ("application", "import hummingbot.client.hummingbot_application"),
+        ("quickstart", "sys.path.insert(0, 'bin')\nimport bin.hummingbot_quickstart"),
+    )
+    for name, imports in rows:
+        for cached in (False, True):
+            results = []
+            with TemporaryDirectory() as temp_dir:
+                cache_path = Path(temp_dir) / "connector_settings_cache.json"
+                try:
+                    run_startup(imports, cache_path)
+                except ImportError as e:
+                    print(f"{name}: not run, {e}")
+                    break
+                for _ in range(RUNS):
+                    if not cached:
+                        cache_path.unlink(missing_ok=True)
+                    results.append(run_startup(imports, cache_path))
+            total = sum(result[0] for result in results) / RUNS
+            create_settings = sum(result[1] for result in results) / RUNS
+            modules = results[-1][2]
+            print(f"{name}, {'cache' if cached else 'discovery'}: {total:.0f} ms total, "
+                  f"{create_settings:.0f} ms creating the settings, {modules} modules imported")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+"""
+Gateway price requests and duration of an arbitrage cycle on a GatewayEVMAMM connector with 50ms gateway latency.
+A cycle asks for the quote and order prices of both sides concurrently, as amm_arb create_arb_proposals does on
+every tick. The "uncached" rows request every price from gateway, as the connector did for order prices.
+"""
+
+import asyncio
+import time
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.gateway.amm.gateway_evm_amm import GatewayEVMAMM
+
+LATENCY = 0.05
+CYCLES = 10
+# Ethereum mainnet block time
+QUOTE_CACHE_TTL = 12
+
+
+async def arb_cycle(connector: GatewayEVMAMM, get_price):
+    await asyncio.gather(*[
+        get_price(connector, is_buy, price_type)
+        for is_buy in (True, False)
+        for price_type in ("quote", "order")
+    ])
+
+
+async def uncached_price(connector: GatewayEVMAMM, is_buy: bool, price_type: str):
+    return await connector._request_quote_price("DAI-WETH", is_buy, Decimal(1000))
+
+
+async def cached_price(connector: GatewayEVMAMM, is_buy: bool, price_type: str):
+    if price_type == "quote":
+        return await connector.get_quote_price("DAI-WETH", is_buy, Decimal(1000))
+    return await connector.get_order_price("DAI-WETH", is_buy, Decimal(1000))
+
+
+async def main():
+    connector = GatewayEVMAMM(
+        client_config_map=ClientConfigAdapter(ClientConfigMap()),
+        connector_name="uniswap",
+        chain="ethereum",
+        network="mainnet",
+        address="0x5821715133bB451bDE2d5BC6a4cE3430a4fdAF92",
+        trading_pairs=["DAI-WETH"],
+        trading_required=False,
+    )
+    connector.quote_cache_ttl = QUOTE_CACHE_TTL
+    requests = []
+
+    async def request_quote_price(trading_pair: str, is_buy: bool, amount: Decimal, ignore_shim: bool = False):
+        requests.append(trading_pair)
+        await asyncio.sleep(LATENCY)
+        return Decimal("0.0005")
+
+    connector._request_quote_price = request_quote_price
+    for name, get_price in (("uncached", uncached_price), ("quote cache", cached_price)):
+        requests.clear()
+        start = time.perf_counter()
+        for _ in range(CYCLES):
+            await arb_cycle(connector, get_price)
+        duration = (time.perf_counter() - start) / CYCLES * 1e3
+        print(f"{name}: {len(requests) / CYCLES:.1f} gateway requests, {duration:.1f} ms per cycle")
+    print(f"quote cache stats: {connector.quote_cache_stats}")
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+"""
+Compares the MarketData table (JSON order book in SQLite) with ColumnarMarketDataWriter / ColumnarMarketDataReader:
+time to record order book snapshots, size on disk and time to load them back for research.
+"""
+
+import os
+import random
+import tempfile
+import time
+from itertools import islice
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.model import HummingbotBase
+from hummingbot.model.columnar_market_data import ColumnarMarketDataReader, ColumnarMarketDataWriter
+from hummingbot.model.market_data import MarketData
+
+NUM_SNAPSHOTS = 5000
+BOOK_LEVELS = 500
+DEPTH = 20
+START_TIMESTAMP = 1704067200.0
+
+
+def generate_order_book() -> OrderBook:
+    order_book = OrderBook()
+    mid = 100 + random.uniform(-1, 1)
+    order_book.apply_raw_snapshot(
+        bids=[[round(mid - 0.01 * (i + 1), 2), random.uniform(0, 10)] for i in range(BOOK_LEVELS)],
+        asks=[[round(mid + 0.01 * (i + 1), 2), random.uniform(0, 10)] for i in range(BOOK_LEVELS)],
+        update_id=1,
+    )
+    return order_book
+
+
+def directory_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+
+def run_sqlite(directory: str, order_books) -> None:
+    db_path = os.path.join(directory, "market_data.sqlite")
+    engine = create_engine(f"sqlite:///{db_path}")
+    HummingbotBase.metadata.create_all(engine, tables=[MarketData.__table__])
+    session_cls = sessionmaker(bind=engine)
+
+    start = time.perf_counter()
+    with session_cls() as session:
+        with session.begin():
+            for i, order_book in enumerate(order_books):
+                session.add(MarketData(
+                    timestamp=int((START_TIMESTAMP + i) * 1e3),
+                    exchange="binance",
+                    trading_pair="BTC-USDT",
+                    mid_price=order_book.get_price(True),
+                    best_bid=order_book.get_price(False),
+                    best_ask=order_book.get_price(True),
+                    order_book={"bid": list(islice(order_book.bid_entries(), DEPTH)),
+                                "ask": list(islice(order_book.ask_entries(), DEPTH))},
+                ))
+    write_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with session_cls() as session:
+        rows = session.query(MarketData).all()
+        bid_prices = [[level[0] for level in row.order_book["bid"]] for row in rows]
+    read_time = time.perf_counter() - start
+    assert len(bid_prices) == NUM_SNAPSHOTS
+    print(f"sqlite:   write {write_time:.2f} s, {os.path.getsize(db_path) / 1e6:.1f} MB, load {read_time:.2f} s")
+
+
+def run_columnar(directory: str, order_books, compressed: bool) -> None:
+    root_path = os.path.join(directory, f"columnar_{compressed}")
+    writer = ColumnarMarketDataWriter(root_path, depth=DEPTH, compressed=compressed)
+
+    start = time.perf_counter()
+    for i, order_book in enumerate(order_books):
+        writer.append(START_TIMESTAMP + i, "binance", "BTC-USDT", order_book)
+    writer.flush()
+    write_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    columns = ColumnarMarketDataReader(root_path).read("binance", "BTC-USDT")
+    read_time = time.perf_counter() - start
+    assert columns["bid_price"].shape == (NUM_SNAPSHOTS, DEPTH)
+    print(f"columnar (compressed={compressed}): write {write_time:.2f} s, "
+          f"{directory_size(root_path) / 1e6:.1f} MB, load {read_time:.2f} s")
+
+
+def main():
+    random.seed(42)
+    order_books = [generate_order_book() for _ in range(200)]
+    snapshots = [order_books[i % len(order_books)] for i in range(NUM_SNAPSHOTS)]
+    with tempfile.TemporaryDirectory() as directory:
+        run_sqlite(directory, snapshots)
+        run_columnar(directory, snapshots, compressed=True)
+        run_columnar(directory, snapshots, compressed=False)
+
+
+if __name__ == "__main__":
+    main()
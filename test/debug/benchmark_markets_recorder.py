@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+"""
+Measures how long MarketsRecorder blocks the event loop thread per order fill, writing every event synchronously
+and with write-behind enabled. Uses a SQLite database file in a temporary directory.
+"""
+
+import os
+import tempfile
+import time
+from decimal import Decimal
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap, MarketDataCollectionConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketEvent, OrderFilledEvent
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+NUM_ORDERS = 500
+
+
+class FakeMarket:
+    display_name = "fake_exchange"
+
+    def __init__(self):
+        self.tracking_states = {}
+
+    def add_trade_fills_from_market_recorder(self, current_trade_fills):
+        pass
+
+    def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+
+def run(directory: str, write_behind_interval) -> float:
+    db_path = os.path.join(directory, f"recorder_{write_behind_interval}.sqlite")
+    with patch("hummingbot.model.sql_connection_manager.create_engine") as engine_mock:
+        engine_mock.return_value = create_engine(f"sqlite:///{db_path}")
+        sql = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                                   db_name="benchmark")
+    market = FakeMarket()
+    recorder = MarketsRecorder(
+        sql=sql,
+        markets=[market],
+        config_file_path="benchmark.yml",
+        strategy_name="benchmark",
+        market_data_collection=MarketDataCollectionConfigMap(market_data_collection_enabled=False),
+        write_behind_interval=write_behind_interval,
+    )
+
+    elapsed = 0
+    for i in range(NUM_ORDERS):
+        order_id = f"OID{i}"
+        market.tracking_states = {order_id: {"client_order_id": order_id}}
+        create_event = BuyOrderCreatedEvent(timestamp=1642010000, type=OrderType.LIMIT, trading_pair="BTC-USDT",
+                                            amount=Decimal(1), price=Decimal(1000), order_id=order_id,
+                                            creation_timestamp=1642010000, exchange_order_id=f"E{order_id}")
+        fill_event = OrderFilledEvent(timestamp=1642010001, order_id=order_id, trading_pair="BTC-USDT",
+                                      trade_type=TradeType.BUY, order_type=OrderType.LIMIT, price=Decimal(1000),
+                                      amount=Decimal(1), trade_fee=AddedToCostTradeFee(),
+                                      exchange_trade_id=f"T{order_id}")
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, market, create_event)
+        start = time.perf_counter()
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, market, fill_event)
+        elapsed += time.perf_counter() - start
+    recorder.stop()
+    return elapsed / NUM_ORDERS
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        with patch("hummingbot.connector.markets_recorder.data_path", return_value=directory):
+            for write_behind_interval in (None, 1.0):
+                stall = run(directory, write_behind_interval)
+                print(f"write_behind_interval={write_behind_interval}: "
+                      f"event loop blocked {stall * 1e3:.3f} ms per fill")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+
+"""
+Measures how many order book diff messages per second can be applied with the OrderBookRow based path
+(OrderBook.apply_diffs) and with the raw levels path (OrderBook.apply_diff_message).
+"""
+
+import random
+import time
+from typing import List
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+NUM_MESSAGES = 20000
+LEVELS_PER_SIDE = 20
+
+
+def generate_messages(num_messages: int) -> List[OrderBookMessage]:
+    messages = []
+    for update_id in range(1, num_messages + 1):
+        bids = [[f"{random.uniform(90, 100):.2f}", f"{random.choice([0, random.uniform(0, 10)]):.4f}"]
+                for _ in range(LEVELS_PER_SIDE)]
+        asks = [[f"{random.uniform(100, 110):.2f}", f"{random.choice([0, random.uniform(0, 10)]):.4f}"]
+                for _ in range(LEVELS_PER_SIDE)]
+        messages.append(OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": "BTC-USDT", "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=float(update_id)))
+    return messages
+
+
+def run_row_based(messages: List[OrderBookMessage]) -> float:
+    order_book = OrderBook()
+    start = time.perf_counter()
+    for message in messages:
+        order_book.apply_diffs(message.bids, message.asks, message.update_id)
+    return len(messages) / (time.perf_counter() - start)
+
+
+def run_raw(messages: List[OrderBookMessage]) -> float:
+    order_book = OrderBook()
+    start = time.perf_counter()
+    for message in messages:
+        order_book.apply_diff_message(message)
+    return len(messages) / (time.perf_counter() - start)
+
+
+def main():
+    random.seed(42)
+    print(f"Row based path: {run_row_based(generate_messages(NUM_MESSAGES)):,.0f} diffs/sec")
+    print(f"Raw levels path: {run_raw(generate_messages(NUM_MESSAGES)):,.0f} diffs/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+"""
+Cost of the OrderBook depth queries on a book with 5k levels per side. The "generator walk" rows reproduce the
+previous behaviour: the book is walked through ask_entries/bid_entries, creating an OrderBookRow per level.
+The depth curve rows answer the same 50 volumes with 50 single queries or with one get_depth_curve call.
+The depth index rows run 50 single queries after each book update, which rebuilds the index once.
+"""
+
+import math
+import time
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+LEVELS = 5_000
+RUNS = 200
+
+
+def create_order_book() -> OrderBook:
+    order_book = OrderBook()
+    rng = np.random.default_rng(42)
+    bids = np.column_stack([100 - np.arange(1, LEVELS + 1) * 0.01, rng.uniform(0.1, 2, LEVELS), np.ones(LEVELS)])
+    asks = np.column_stack([100 + np.arange(1, LEVELS + 1) * 0.01, rng.uniform(0.1, 2, LEVELS), np.ones(LEVELS)])
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def generator_vwap_for_volume(order_book: OrderBook, volume: float) -> float:
+    total_cost = 0
+    total_volume = 0
+    for row in order_book.ask_entries():
+        total_cost += row.amount * row.price
+        total_volume += row.amount
+        if total_volume >= volume:
+            total_cost -= row.amount * row.price
+            total_volume -= row.amount
+            incremental_amount = volume - total_volume
+            total_cost += incremental_amount * row.price
+            total_volume += incremental_amount
+            return total_cost / total_volume
+    return math.nan
+
+
+def generator_volume_for_price(order_book: OrderBook, price: float) -> float:
+    cumulative_volume = 0
+    for row in order_book.ask_entries():
+        if row.price > price:
+            break
+        cumulative_volume += row.amount
+    return cumulative_volume
+
+
+def queries_after_update(order_book: OrderBook, volumes: np.ndarray):
+    order_book.apply_numpy_diffs(np.array([[100 - LEVELS * 0.01, 1, 2]]), np.empty((0, 3)))
+    for volume in volumes.tolist():
+        order_book.get_vwap_for_volume(True, volume)
+        order_book.get_price_for_volume(False, volume)
+
+
+def time_per_run(name: str, query):
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        query()
+    return name, (time.perf_counter() - start) / RUNS * 1e6
+
+
+def main():
+    order_book = create_order_book()
+    # Half of the book depth, the queries walk 2.5k levels
+    volume = float(order_book.get_volume_for_price(True, 125).result_volume)
+    volumes = np.linspace(volume / 50, volume, 50)
+    results = [
+        time_per_run("vwap_for_volume, generator walk", lambda: generator_vwap_for_volume(order_book, volume)),
+        time_per_run("vwap_for_volume, native", lambda: order_book.get_vwap_for_volume(True, volume)),
+        time_per_run("volume_for_price, generator walk", lambda: generator_volume_for_price(order_book, 125)),
+        time_per_run("volume_for_price, native", lambda: order_book.get_volume_for_price(True, 125)),
+        time_per_run("50 volumes, single queries",
+                     lambda: [order_book.get_vwap_for_volume(True, v) for v in volumes.tolist()]),
+        time_per_run("50 volumes, get_depth_curve", lambda: order_book.get_depth_curve(True, volumes)),
+        time_per_run("update + 2x50 queries, walks", lambda: queries_after_update(order_book, volumes)),
+    ]
+    order_book.depth_index_enabled = True
+    results += [
+        time_per_run("vwap_for_volume, depth index", lambda: order_book.get_vwap_for_volume(True, volume)),
+        time_per_run("volume_for_price, depth index", lambda: order_book.get_volume_for_price(True, 125)),
+        time_per_run("update + 2x50 queries, depth index", lambda: queries_after_update(order_book, volumes)),
+    ]
+    for name, duration in results:
+        print(f"{name}: {duration:.1f} us per query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+"""
+Measures how long OrderBookTracker takes to catch up with a backlog of diff messages for one trading pair, with
+and without diff coalescing.
+"""
+
+import asyncio
+import random
+import time
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+TRADING_PAIR = "BTC-USDT"
+BACKLOG_SIZE = 5000
+LEVELS_PER_SIDE = 10
+
+
+def generate_messages():
+    messages = []
+    for update_id in range(2, BACKLOG_SIZE + 2):
+        bids = [[f"{random.uniform(99, 100):.2f}", f"{random.choice([0, random.uniform(0, 10)]):.4f}"]
+                for _ in range(LEVELS_PER_SIDE)]
+        asks = [[f"{random.uniform(100, 101):.2f}", f"{random.choice([0, random.uniform(0, 10)]):.4f}"]
+                for _ in range(LEVELS_PER_SIDE)]
+        messages.append(OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": TRADING_PAIR, "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=float(update_id)))
+    return messages
+
+
+async def run_catch_up(coalesce_diffs: bool) -> float:
+    tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=[TRADING_PAIR], coalesce_diffs=coalesce_diffs)
+    order_book = OrderBook()
+    order_book.apply_raw_snapshot(bids=[["99", "1"]], asks=[["101", "1"]], update_id=1)
+    tracker._order_books[TRADING_PAIR] = order_book
+    queue = tracker._tracking_message_queues[TRADING_PAIR] = asyncio.Queue()
+    for message in generate_messages():
+        queue.put_nowait(message)
+
+    start = time.perf_counter()
+    task = asyncio.ensure_future(tracker._track_single_book(TRADING_PAIR))
+    while order_book.last_diff_uid < BACKLOG_SIZE + 1:
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+    task.cancel()
+    return elapsed
+
+
+def main():
+    random.seed(42)
+    loop = asyncio.get_event_loop()
+    for coalesce_diffs in (False, True):
+        elapsed = loop.run_until_complete(run_catch_up(coalesce_diffs))
+        print(f"coalesce_diffs={coalesce_diffs}: {BACKLOG_SIZE} queued diffs applied in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
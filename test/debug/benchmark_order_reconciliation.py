@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+"""
+Duration of a status polling cycle (order fills + order status) for a grid of open orders on a venue with 100ms
+latency, simulated with the mock web server. The "one order at a time" rows reproduce the previous behaviour: the
+requests of every order are awaited one after the other.
+"""
+
+import asyncio
+import time
+from decimal import Decimal
+from unittest.mock import patch
+
+from aiohttp import web
+from bidict import bidict
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.mock_api.mock_web_server import MockWebServer
+
+# Binance allows 50 order status requests every 10 seconds
+ORDERS = 40
+LATENCY = 0.1
+HOST = "api.binance.com"
+
+
+class SlowMockWebServer(MockWebServer):
+    async def _handler(self, request: web.Request):
+        await asyncio.sleep(LATENCY)
+        return await super()._handler(request)
+
+
+def create_exchange() -> BinanceExchange:
+    exchange = BinanceExchange(
+        client_config_map=ClientConfigAdapter(ClientConfigMap()),
+        binance_api_key="testAPIKey",
+        binance_api_secret="testSecret",
+        trading_pairs=["COINALPHA-HBOT"],
+    )
+    exchange._set_trading_pair_symbol_map(bidict({"COINALPHAHBOT": "COINALPHA-HBOT"}))
+    for i in range(ORDERS):
+        exchange.start_tracking_order(
+            order_id=f"OID{i}",
+            exchange_order_id=str(i),
+            trading_pair="COINALPHA-HBOT",
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            price=Decimal("100") - i,
+            amount=Decimal("1"),
+        )
+    return exchange
+
+
+async def one_order_at_a_time(exchange: BinanceExchange):
+    for order in list(exchange._order_tracker.all_fillable_orders.values()):
+        for trade_update in await exchange._all_trade_updates_for_order(order=order):
+            exchange._order_tracker.process_trade_update(trade_update)
+    for order in list(exchange.in_flight_orders.values()):
+        exchange._order_tracker.process_order_update(await exchange._request_order_status(tracked_order=order))
+
+
+async def timed(coroutine) -> float:
+    start = time.perf_counter()
+    await coroutine
+    return time.perf_counter() - start
+
+
+async def main():
+    web_app = SlowMockWebServer.get_instance()
+    web_app.add_host_to_mock(HOST)
+    web_app.start()
+    await web_app.wait_til_started()
+    path = "/" + web_utils.private_rest_url(CONSTANTS.ORDER_PATH_URL).split(f"{HOST}/")[1]
+    web_app.update_response("get", HOST, path, {
+        "symbol": "COINALPHAHBOT", "orderId": 1, "status": "NEW", "updateTime": 1640780000000})
+    path = "/" + web_utils.private_rest_url(CONSTANTS.MY_TRADES_PATH_URL).split(f"{HOST}/")[1]
+    web_app.update_response("get", HOST, path, [])
+    path = "/" + web_utils.public_rest_url(CONSTANTS.SERVER_TIME_PATH_URL).split(f"{HOST}/")[1]
+    web_app.update_response("get", HOST, path, {"serverTime": int(time.time() * 1e3)})
+
+    with patch("aiohttp.client.URL") as url_mock:
+        url_mock.side_effect = MockWebServer.reroute_local
+        print(f"{ORDERS} orders, {LATENCY * 1000:.0f}ms latency: "
+              f"one order at a time {await timed(one_order_at_a_time(create_exchange())):.2f} s, "
+              f"concurrent {await timed(create_exchange()._update_order_status()):.2f} s per polling cycle")
+    web_app.stop()
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(main())
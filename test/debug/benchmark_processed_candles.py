@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+
+"""
+Duration of a tick of a market making controller with several order levels, each one reading the price and spread
+multipliers of the processed candles, while the last candle is updated by the candles feed on every tick. The
+"recompute" rows reproduce the previous behaviour, which processed every candle for every order level, the "version"
+rows keep the processed candles until the candles are updated, and the "incremental" rows also process only the
+updated candles with the lookback of the indicators.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.processed_candles_cache import ProcessedCandlesCache
+
+MAX_RECORDS = [150, 1000, 5000]
+ORDER_LEVELS = 10
+BB_LENGTH = 100
+BB_STD = 2.0
+TICKS = 100
+
+
+def process_candles(candles_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Bollinger bands based multipliers, as in the DManV3 controller.
+    """
+    rolling = candles_df["close"].rolling(BB_LENGTH)
+    mid = rolling.mean()
+    std = rolling.std(ddof=0)
+    candles_df["price_multiplier"] = mid
+    candles_df["spread_multiplier"] = (2 * BB_STD * std) / mid * 100 / 200
+    return candles_df
+
+
+def fill_candles(max_records: int) -> BinanceSpotCandles:
+    candles = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=max_records)
+    rng = np.random.default_rng(0)
+    closes = 100 + np.cumsum(rng.normal(0, 0.1, max_records))
+    for i, close in enumerate(closes):
+        candles._candles.append(np.array([i * 60000.0, close, close, close, close, 1.0, close, 1.0, 1.0, close]))
+    return candles
+
+
+def update_last_candle(candles: BinanceSpotCandles, tick: int):
+    candle = candles._candles.pop()
+    candle = candle.copy()
+    candle[4] += 0.01 * (-1) ** tick
+    candles._candles.append(candle)
+
+
+def run(candles: BinanceSpotCandles, get_processed_data) -> float:
+    start = time.perf_counter()
+    for tick in range(TICKS):
+        update_last_candle(candles, tick)
+        for _ in range(ORDER_LEVELS):
+            processed = get_processed_data()
+            processed["price_multiplier"].iloc[-1], processed["spread_multiplier"].iloc[-1]
+    return (time.perf_counter() - start) / TICKS * 1e3
+
+
+def main():
+    for max_records in MAX_RECORDS:
+        candles = fill_candles(max_records)
+        recompute = run(candles, lambda: process_candles(candles.candles_df))
+        version_cache = ProcessedCandlesCache(candles, process_candles)
+        version = run(candles, version_cache.get)
+        incremental_cache = ProcessedCandlesCache(candles, process_candles, lookback=BB_LENGTH)
+        incremental = run(candles, incremental_cache.get)
+        print(f"{max_records} candles, recompute: {recompute:.2f} ms per tick")
+        print(f"{max_records} candles, version: {version:.2f} ms per tick")
+        print(f"{max_records} candles, incremental: {incremental:.2f} ms per tick {incremental_cache.stats}")
+
+
+if __name__ == "__main__":
+    main()
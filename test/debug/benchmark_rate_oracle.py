@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+
+"""
+Source requests, prices received and CPU time of the RateOracle fetch loop over one minute, with a source pricing
+2000 pairs and a strategy requesting 3 conversion rates every second. The loop intervals are scaled down by
+TIME_SCALE so that the minute runs in a few seconds. The "full fetch" row reproduces the previous loop, which
+fetched every price of the source every second. The "back off" row requests the rates with the largest max fetch
+interval.
+"""
+
+import asyncio
+import time
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from hummingbot.core.rate_oracle import rate_oracle as rate_oracle_module
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
+
+TIME_SCALE = 10
+DURATION = 60
+LATENCY = 0.05
+REQUESTED_PAIRS = ["BTC-USDT", "ETH-USDT", "HBOT-USDT"]
+PRICES = {f"TOKEN{i}-USDT": Decimal(i + 1) for i in range(2000 - len(REQUESTED_PAIRS))}
+PRICES.update({pair: Decimal("10") for pair in REQUESTED_PAIRS})
+
+
+class BenchmarkRateSource(RateSourceBase):
+    def __init__(self):
+        self.requests = 0
+        self.prices_received = 0
+
+    @property
+    def name(self) -> str:
+        return "benchmark"
+
+    async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        return await self._request(PRICES)
+
+    async def get_prices_for_pairs(self, trading_pairs: List[str], quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        return await self._request({pair: PRICES[pair] for pair in trading_pairs})
+
+    async def _request(self, prices: Dict[str, Decimal]) -> Dict[str, Decimal]:
+        await asyncio.sleep(LATENCY / TIME_SCALE)
+        self.requests += 1
+        self.prices_received += len(prices)
+        # Parsing the response
+        return {pair: Decimal(str(price)) for pair, price in prices.items()}
+
+
+class FullFetchRateOracle(RateOracle):
+    async def _fetch_price_loop(self):
+        while True:
+            new_prices = await self._source.get_prices(quote_token=self.quote_token)
+            self._prices.update(new_prices)
+            self._ready_event.set()
+            await asyncio.sleep(1 / TIME_SCALE)
+
+
+async def run_strategy(rate_oracle: RateOracle, max_fetch_interval: float):
+    rate_oracle.start()
+    await rate_oracle.get_ready()
+    start = time.process_time()
+    for _ in range(DURATION):
+        for pair in REQUESTED_PAIRS:
+            rate_oracle.get_pair_rate(pair, max_fetch_interval=max_fetch_interval)
+        await asyncio.sleep(1 / TIME_SCALE)
+    cpu_time = time.process_time() - start
+    await rate_oracle.stop_network()
+    return cpu_time
+
+
+def main():
+    rate_oracle_module.MIN_FETCH_INTERVAL /= TIME_SCALE
+    rate_oracle_module.MAX_FETCH_INTERVAL /= TIME_SCALE
+    for name, rate_oracle_class, max_fetch_interval in (
+        ("full fetch", FullFetchRateOracle, rate_oracle_module.MIN_FETCH_INTERVAL),
+        ("subscribed pairs", RateOracle, rate_oracle_module.MIN_FETCH_INTERVAL),
+        ("subscribed pairs, back off", RateOracle, rate_oracle_module.MAX_FETCH_INTERVAL),
+    ):
+        rate_source = BenchmarkRateSource()
+        rate_oracle = rate_oracle_class(source=rate_source)
+        cpu_time = asyncio.get_event_loop().run_until_complete(run_strategy(rate_oracle, max_fetch_interval))
+        print(f"{name}: {rate_source.requests} source requests, {rate_source.prices_received} prices received, "
+              f"{cpu_time * 1e3:.0f} ms CPU time per minute")
+
+
+if __name__ == "__main__":
+    main()
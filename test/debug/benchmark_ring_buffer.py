@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+"""
+Cost per tick of RingBuffer statistics and of the trailing indicators built on it, for 1k and 100k sample windows.
+The "recalculated" rows reproduce the previous behaviour: statistics computed with numpy over a copy of the whole
+buffer on every tick.
+"""
+
+import time
+
+import numpy as np
+
+from hummingbot.strategy.__utils__.ring_buffer import RingBuffer
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import (
+    ExponentialMovingAverageIndicator,
+)
+from hummingbot.strategy.__utils__.trailing_indicators.historical_volatility import HistoricalVolatilityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.instant_volatility import InstantVolatilityIndicator
+
+WINDOWS = (1_000, 100_000)
+TICKS = 2_000
+
+
+def time_per_tick(function, values) -> float:
+    start = time.perf_counter()
+    for value in values:
+        function(value)
+    return (time.perf_counter() - start) / len(values) * 1e6
+
+
+def fill(buffer: RingBuffer, window: int):
+    for value in np.random.normal(100, 1, window):
+        buffer.add_value(value)
+
+
+def benchmark_buffer(window: int, values):
+    recalculated = RingBuffer(window)
+    fill(recalculated, window)
+
+    def recalculated_tick(value):
+        recalculated.add_value(value)
+        array = recalculated.get_as_numpy_array()
+        return np.mean(array), np.std(array)
+
+    running = RingBuffer(window)
+    fill(running, window)
+
+    def running_tick(value):
+        running.add_value(value)
+        return running.mean_value, running.std_dev
+
+    print(f"RingBuffer mean + std, window {window}: recalculated {time_per_tick(recalculated_tick, values):.1f} us, "
+          f"running {time_per_tick(running_tick, values):.2f} us per tick")
+
+
+def benchmark_indicator(indicator_class, window: int, values):
+    indicator = indicator_class(window, 1)
+    for value in np.random.normal(100, 1, window):
+        indicator.add_sample(value)
+
+    def tick(value):
+        indicator.add_sample(value)
+        return indicator.current_value
+
+    print(f"{indicator_class.__name__}, window {window}: {time_per_tick(tick, values):.2f} us per tick")
+
+
+def main():
+    np.random.seed(42)
+    values = np.random.normal(100, 1, TICKS)
+    for window in WINDOWS:
+        benchmark_buffer(window, values)
+        for indicator_class in (InstantVolatilityIndicator, HistoricalVolatilityIndicator,
+                                ExponentialMovingAverageIndicator):
+            benchmark_indicator(indicator_class, window, values)
+
+
+if __name__ == "__main__":
+    main()
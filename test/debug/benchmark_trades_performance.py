@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+"""
+Duration of a trade monitor update after a session of market making on 2 markets, for an increasing number of trade
+fills stored in the database. The "reload" rows reproduce the previous update, which loaded every trade fill of the
+session from the database and calculated the PerformanceMetrics of each market from them, the "accumulator" rows read
+the trades performance kept by the markets recorder. The "add trade" row is the cost of a fill for the markets
+recorder.
+"""
+
+import asyncio
+import random
+import time
+from decimal import Decimal
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.performance import PerformanceAccumulator, PerformanceMetrics
+from hummingbot.core.data_type.common import PositionAction
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+
+CONFIG_FILE_PATH = "conf_pure_mm_1.yml"
+MARKETS = [("binance", "BTC-USDT"), ("kucoin", "ETH-USDT")]
+NUMBERS_OF_TRADES = [1000, 10000, 50000]
+RUNS = 3
+BALANCES = {"BTC": Decimal("1"), "ETH": Decimal("10"), "USDT": Decimal("10000")}
+
+
+def store_trade_fills(sql: SQLConnectionManager, start: int, end: int):
+    rng = random.Random(start)
+    fee = AddedToCostTradeFee(percent=Decimal("0.001")).to_json()
+    with sql.get_new_session() as session:
+        with session.begin():
+            for i in range(start, end):
+                market, trading_pair = MARKETS[i % len(MARKETS)]
+                base, quote = trading_pair.split("-")
+                session.add(TradeFill(
+                    config_file_path=CONFIG_FILE_PATH,
+                    strategy="pure_market_making",
+                    market=market,
+                    symbol=trading_pair,
+                    base_asset=base,
+                    quote_asset=quote,
+                    timestamp=1640000000000 + i,
+                    order_id=f"order{i}",
+                    trade_type=rng.choice(["BUY", "SELL"]),
+                    order_type="LIMIT",
+                    price=Decimal(rng.randint(990000, 1010000)) / Decimal("10000"),
+                    amount=Decimal(rng.randint(1, 1000000)) / Decimal("1000000"),
+                    leverage=1,
+                    trade_fee=fee,
+                    exchange_trade_id=f"trade{i}",
+                    position=PositionAction.NIL.value,
+                ))
+
+
+async def reload_update(sql: SQLConnectionManager):
+    with sql.get_new_session() as session:
+        trades = (session.query(TradeFill)
+                  .filter(TradeFill.timestamp >= 0, TradeFill.config_file_path.like(f"%{CONFIG_FILE_PATH}%"))
+                  .order_by(TradeFill.timestamp.desc())
+                  .all())
+        trades.reverse()
+        for market, symbol in set((t.market, t.symbol) for t in trades):
+            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+            await PerformanceMetrics.create(symbol, cur_trades, BALANCES)
+
+
+async def accumulator_update(accumulators):
+    for performance in accumulators.values():
+        await performance.metrics(BALANCES)
+
+
+def timed(coroutine_function, *args) -> float:
+    durations = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        asyncio.get_event_loop().run_until_complete(coroutine_function(*args))
+        durations.append(time.perf_counter() - start)
+    return min(durations) * 1e3
+
+
+def main():
+    with patch("hummingbot.model.sql_connection_manager.create_engine") as engine_mock:
+        engine_mock.return_value = create_engine("sqlite:///:memory:")
+        sql = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                                   db_name="benchmark")
+    # After the client config, which sets the rate oracle quote token
+    RateOracle.get_instance()._prices.update({"BTC-USDT": Decimal("100"), "ETH-USDT": Decimal("100")})
+    stored_trades = 0
+    for number_of_trades in NUMBERS_OF_TRADES:
+        store_trade_fills(sql, stored_trades, number_of_trades)
+        stored_trades = number_of_trades
+        with sql.get_new_session() as session:
+            trades = session.query(TradeFill).order_by(TradeFill.timestamp).all()
+            start = time.perf_counter()
+            accumulators = PerformanceAccumulator.accumulate_by_market(trades)
+            add_trade_duration = (time.perf_counter() - start) / len(trades) * 1e6
+        print(f"{number_of_trades} trades, reload: {timed(reload_update, sql):.1f} ms per update")
+        print(f"{number_of_trades} trades, accumulator: {timed(accumulator_update, accumulators):.3f} ms per update")
+        print(f"{number_of_trades} trades, add trade: {add_trade_duration:.1f} us per trade")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+"""
+Time per tick of TradingIntensityIndicator.calculate, once the sampling buffer is full, for a few sampling lengths
+and numbers of trades per tick.
+"""
+
+import time
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
+
+TICKS = 300
+
+
+class RandomWalkPriceDelegate:
+    def __init__(self):
+        self.price = 100.0
+
+    def get_price_by_type(self, _):
+        self.price += np.random.normal(0, 0.05)
+        return self.price
+
+
+def run(sampling_length: int, trades_per_tick: int) -> float:
+    price_delegate = RandomWalkPriceDelegate()
+    indicator = TradingIntensityIndicator(OrderBook(), price_delegate, sampling_length)
+    timestamp = 1.0
+    elapsed = 0.0
+    for tick in range(sampling_length + TICKS):
+        for _ in range(trades_per_tick):
+            distance = np.random.exponential(0.5)
+            indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHA-HBOT",
+                timestamp=timestamp - np.random.uniform(0, 0.9),
+                price=round(price_delegate.price + np.random.choice([-1, 1]) * distance, 2),
+                amount=np.random.exponential(1),
+                type=TradeType.BUY,
+            ))
+        start = time.perf_counter()
+        indicator.calculate(timestamp)
+        if tick >= sampling_length:
+            elapsed += time.perf_counter() - start
+        timestamp += 1
+    return elapsed / TICKS * 1e6
+
+
+def main():
+    np.random.seed(42)
+    for sampling_length in (30, 300):
+        for trades_per_tick in (5, 50):
+            print(f"sampling length {sampling_length}, {trades_per_tick} trades per tick: "
+                  f"{run(sampling_length, trades_per_tick):.0f} us per tick")
+
+
+if __name__ == "__main__":
+    main()
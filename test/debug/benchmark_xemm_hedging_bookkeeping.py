@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+"""
+Cost of looking up the unhedged maker fills of a CrossExchangeMarketMakingStrategy market pair, with a number of
+fills waiting for their hedging orders to complete. The "scan" rows reproduce the previous lookup, which checked
+every fill record against the trade ids of every ongoing hedging order.
+"""
+
+import time
+from decimal import Decimal
+
+from bidict import bidict
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import OrderFilledEvent
+from hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making import (
+    CrossExchangeMarketMakingStrategy,
+)
+from hummingbot.strategy.cross_exchange_market_making.order_id_market_pair_tracker import OrderIDMarketPairTracker
+from hummingbot.strategy.maker_taker_market_pair import MakerTakerMarketPair
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+RUNS = 20
+
+
+def scan_unhedged_records(strategy: CrossExchangeMarketMakingStrategy, market_pair: MakerTakerMarketPair):
+    unhedged_records = []
+    for fill_record in strategy._order_fill_buy_events.get(market_pair, []):
+        trade_id = fill_record[1].exchange_trade_id
+        if not any(trade_id in trade_ids for trade_ids in strategy._ongoing_hedging):
+            unhedged_records.append(fill_record)
+    return unhedged_records
+
+
+def create_strategy(hedged_fills: int):
+    maker_market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+    taker_market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+    market_pair = MakerTakerMarketPair(
+        MarketTradingPairTuple(maker_market, "COINALPHA-HBOT", "COINALPHA", "HBOT"),
+        MarketTradingPairTuple(taker_market, "COINALPHA-HBOT", "COINALPHA", "HBOT"),
+    )
+    # Only the hedging bookkeeping of the strategy is set up
+    strategy = CrossExchangeMarketMakingStrategy()
+    strategy._order_fill_buy_events = {}
+    strategy._unhedged_buy_fill_records = {}
+    strategy._unhedged_sell_fill_records = {}
+    strategy._ongoing_hedging = bidict()
+    strategy._ongoing_hedging_fill_ids = {}
+    strategy._ongoing_hedging_fill_events = {}
+    strategy._market_pair_tracker = OrderIDMarketPairTracker()
+    for i in range(hedged_fills + 1):
+        fill_event = OrderFilledEvent(0, f"maker_{i}", "COINALPHA-HBOT", TradeType.BUY, OrderType.LIMIT,
+                                      Decimal("1"), Decimal("1"), AddedToCostTradeFee(), f"trade_{i}")
+        fill_record = (None, fill_event)
+        strategy._order_fill_buy_events.setdefault(market_pair, []).append(fill_record)
+        strategy._unhedged_buy_fill_records.setdefault(market_pair, {})[id(fill_event)] = fill_record
+        if i < hedged_fills:
+            strategy._market_pair_tracker.start_tracking_order_id(f"taker_{i}", taker_market, market_pair)
+            strategy.set_ongoing_hedging([fill_record], f"taker_{i}")
+    return strategy, market_pair
+
+
+def time_per_run(name: str, query):
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        query()
+    return name, (time.perf_counter() - start) / RUNS * 1e6
+
+
+def main():
+    results = []
+    for hedged_fills in (100, 1_000, 5_000):
+        strategy, market_pair = create_strategy(hedged_fills)
+        results += [
+            time_per_run(f"{hedged_fills} hedged fills, scan", lambda: scan_unhedged_records(strategy, market_pair)),
+            time_per_run(f"{hedged_fills} hedged fills, index",
+                         lambda: strategy.get_unhedged_buy_records(market_pair)),
+        ]
+    for name, duration in results:
+        print(f"{name}: {duration:.1f} us per lookup")
+
+
+if __name__ == "__main__":
+    main()
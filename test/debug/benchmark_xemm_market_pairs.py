@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+
+"""
+Duration of a CrossExchangeMarketMakingStrategy tick with 10 market pairs hedged on a gateway taker market with 50ms
+quote latency, sequential (default) vs concurrent market pair processing. The "one quote at a time" row reproduces
+the previous gateway quote loop, which awaited the buy and sell quotes of every pair one after the other.
+"""
+
+import asyncio
+import time
+from decimal import Decimal
+from unittest.mock import patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making import (
+    CrossExchangeMarketMakingStrategy,
+)
+from hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making_config_map_pydantic import (
+    ActiveOrderRefreshMode,
+    CrossExchangeMarketMakingConfigMap,
+    TakerToMakerConversionRateMode,
+)
+from hummingbot.strategy.maker_taker_market_pair import MakerTakerMarketPair
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from test.hummingbot.strategy.cross_exchange_market_making.test_cross_exchange_market_making_gateway import MockAMM
+
+MARKET_PAIRS = 10
+LATENCY = 0.05
+TICKS = 5
+
+
+class SlowMockAMM(MockAMM):
+    async def get_order_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+        await asyncio.sleep(LATENCY)
+        return await self.get_quote_price(trading_pair, is_buy, amount)
+
+
+def create_config_map() -> ClientConfigAdapter:
+    conversion_rate_mode = TakerToMakerConversionRateMode.construct(
+        taker_to_maker_base_conversion_rate=Decimal("1"),
+        taker_to_maker_quote_conversion_rate=Decimal("1"),
+    )
+    return ClientConfigAdapter(CrossExchangeMarketMakingConfigMap.construct(
+        min_profitability=Decimal("0.5"),
+        slippage_buffer=Decimal("0"),
+        order_amount=Decimal("1"),
+        order_size_taker_volume_factor=Decimal("25"),
+        order_size_taker_balance_factor=Decimal("99.5"),
+        order_size_portfolio_ratio_limit=Decimal("30"),
+        adjust_order_enabled=True,
+        anti_hysteresis_duration=60.0,
+        order_refresh_mode=ActiveOrderRefreshMode.construct(),
+        top_depth_tolerance=Decimal("0"),
+        conversion_rate_mode=conversion_rate_mode,
+    ))
+
+
+def create_strategy(concurrent_market_pairs: bool) -> CrossExchangeMarketMakingStrategy:
+    market_pairs = []
+    for i in range(MARKET_PAIRS):
+        # A maker and a gateway account per pair, so that the pairs don't share any balance
+        maker_market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        taker_market = SlowMockAMM(name="uniswap", client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        maker_market.set_balanced_order_book(f"COIN{i}-HBOT", 1.0, 0.5, 1.5, 0.01, 10)
+        maker_market.set_balance(f"COIN{i}", 5)
+        maker_market.set_balance("HBOT", 5)
+        maker_market.set_quantization_param(QuantizationParams(f"COIN{i}-HBOT", 5, 5, 5, 5))
+        taker_market.set_prices(f"WCOIN{i}-WHBOT", True, 1.05)
+        taker_market.set_prices(f"WCOIN{i}-WHBOT", False, 0.95)
+        taker_market.set_balance(f"WCOIN{i}", 5)
+        taker_market.set_balance("WHBOT", 5)
+        market_pairs.append(MakerTakerMarketPair(
+            MarketTradingPairTuple(maker_market, f"COIN{i}-HBOT", f"COIN{i}", "HBOT"),
+            MarketTradingPairTuple(taker_market, f"WCOIN{i}-WHBOT", f"WCOIN{i}", "WHBOT"),
+        ))
+    strategy = CrossExchangeMarketMakingStrategy()
+    strategy.init_params(config_map=create_config_map(),
+                         market_pairs=market_pairs,
+                         concurrent_market_pairs=concurrent_market_pairs)
+    # Evaluates the pairs on every tick without placing orders
+    strategy.check_and_create_new_orders = check_without_orders.__get__(strategy)
+    return strategy
+
+
+async def check_without_orders(self, market_pair: MakerTakerMarketPair, has_active_bid: bool, has_active_ask: bool):
+    for is_buy in (True, False):
+        size = await self.get_market_making_size(market_pair, is_buy)
+        price = await self.get_market_making_price(market_pair, is_buy, size)
+        await self.calculate_effective_hedging_price(market_pair, is_buy, size)
+        assert price > 0
+
+
+async def sequential_gateway_quotes(strategy: CrossExchangeMarketMakingStrategy):
+    for market_pair in strategy._market_pairs.values():
+        for is_buy in (True, False):
+            await market_pair.taker.market.get_order_price(market_pair.taker.trading_pair, is_buy, Decimal("1"))
+
+
+async def time_per_tick(name: str, tick):
+    start = time.perf_counter()
+    for i in range(TICKS):
+        await tick(i)
+    return name, (time.perf_counter() - start) / TICKS * 1e3
+
+
+async def main():
+    sequential_strategy = create_strategy(concurrent_market_pairs=False)
+    concurrent_strategy = create_strategy(concurrent_market_pairs=True)
+    with patch.object(CrossExchangeMarketMakingStrategy, "is_gateway_market", return_value=True):
+        results = [
+            await time_per_tick("gateway quotes, one quote at a time",
+                                lambda i: sequential_gateway_quotes(sequential_strategy)),
+            await time_per_tick("gateway quotes, concurrent", lambda i: concurrent_strategy.get_gateway_quotes()),
+            await time_per_tick("main, sequential market pairs", lambda i: sequential_strategy.main(i)),
+            await time_per_tick("main, concurrent market pairs", lambda i: concurrent_strategy.main(i)),
+        ]
+    for name, duration in results:
+        print(f"{name}: {duration:.0f} ms per tick")
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(main())
@@ -172,3 +172,12 @@ class HistoryCommandTest(unittest.TestCase):
         )
 
         self.assertEqual(df_str_expected, captures[0])
+
+    def test_queued_trades_written_before_listing_trades(self):
+        calls = MagicMock()
+        self.app.markets_recorder = calls.markets_recorder
+
+        self.app._get_trades_from_session(0, session=calls.session)
+
+        self.assertEqual(["markets_recorder.flush_pending_writes", "session.query"],
+                         [name for name, _, _ in calls.mock_calls[:2]])
@@ -1,8 +1,10 @@
 import asyncio
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Awaitable
+from unittest.mock import patch
 
 from hummingbot.client.config import config_crypt, config_helpers, security
 from hummingbot.client.config.config_crypt import ETHKeyFileSecretManger, store_password_verification, validate_password
@@ -78,6 +80,7 @@ class SecurityTest(unittest.TestCase):
         Security.secrets_manager = None
         Security._secure_configs = {}
         Security._decryption_done = asyncio.Event()
+        Security._connector_decryption_events = None
 
     def test_password_process(self):
         self.assertTrue(Security.new_password_required())
@@ -150,3 +153,57 @@ class SecurityTest(unittest.TestCase):
         binance_loaded_config = Security.decrypted_value(binance_config.connector)
 
         self.assertEqual(binance_config, binance_loaded_config)
+
+    def test_secrets_manager_derives_keys_once(self):
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+
+        with patch("hummingbot.client.config.config_crypt._derive_key", wraps=config_crypt._derive_key) as derive_key:
+            encrypted_key = secrets_manager.encrypt_secret_value("api_key", self.api_key)
+            encrypted_secret = secrets_manager.encrypt_secret_value("api_secret", self.api_secret)
+
+            self.assertEqual(self.api_key, secrets_manager.decrypt_secret_value("api_key", encrypted_key))
+            self.assertEqual(self.api_secret, secrets_manager.decrypt_secret_value("api_secret", encrypted_secret))
+            self.assertEqual(1, derive_key.call_count)
+
+            another_secrets_manager = ETHKeyFileSecretManger("som-password")
+            self.assertEqual(self.api_key, another_secrets_manager.decrypt_secret_value("api_key", encrypted_key))
+            self.assertEqual(self.api_secret, another_secrets_manager.decrypt_secret_value("api_secret", encrypted_secret))
+            self.assertEqual(2, derive_key.call_count)
+
+        with self.assertRaises(ValueError):
+            ETHKeyFileSecretManger("another-password").decrypt_secret_value("api_key", encrypted_key)
+
+    def test_wait_til_connector_decryption_done(self):
+        password = "som-password"
+        secrets_manager = ETHKeyFileSecretManger(password)
+        store_password_verification(secrets_manager)
+        Security.secrets_manager = secrets_manager
+        config_map = self.store_binance_config()
+
+        self.assertFalse(Security.is_decryption_done([self.connector]))
+
+        Security.login(secrets_manager)
+
+        self.assertFalse(Security.is_decryption_done([self.connector]))
+        # Connectors without a config have nothing to wait for
+        self.assertTrue(Security.is_decryption_done(["kucoin"]))
+        self.async_run_with_timeout(Security.wait_til_decryption_done(["kucoin"]))
+
+        self.async_run_with_timeout(Security.wait_til_decryption_done([self.connector]))
+
+        self.assertTrue(Security.is_decryption_done([self.connector]))
+        self.assertEqual(api_keys_from_connector_config_map(config_map), Security.api_keys(self.connector))
+        self.async_run_with_timeout(Security.wait_til_decryption_done())
+        self.assertTrue(Security.is_decryption_done())
+
+    def test_secrets_manager_derives_keys_once_when_decrypting_in_parallel(self):
+        encrypted_values = [ETHKeyFileSecretManger("som-password").encrypt_secret_value("api_key", self.api_key)] * 8
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+
+        with patch("hummingbot.client.config.config_crypt._derive_key", wraps=config_crypt._derive_key) as derive_key:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                decrypted_values = list(executor.map(
+                    lambda value: secrets_manager.decrypt_secret_value("api_key", value), encrypted_values))
+
+        self.assertEqual([self.api_key] * 8, decrypted_values)
+        self.assertEqual(1, derive_key.call_count)
@@ -1,11 +1,13 @@
 import asyncio
+import dataclasses
+import random
 import time
 import unittest
 from decimal import Decimal
-from typing import Awaitable
-from unittest.mock import MagicMock, patch
+from typing import Awaitable, List, Tuple
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceAccumulator, PerformanceMetrics
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
@@ -341,3 +343,153 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         performance_metric = PerformanceMetrics()
         returned_impact = performance_metric._process_deducted_fees_impact_in_quote_vol(dummy_trade)
         self.assertEqual(returned_impact, Decimal("-100.0"))
+
+
+class PerformanceAccumulatorUnitTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        rate_oracle = RateOracle()
+        rate_oracle._prices["USDT-HBOT"] = Decimal("5")
+        rate_oracle._prices["BNB-USDT"] = Decimal("300")
+        RateOracle._shared_instance = rate_oracle
+
+    def tearDown(self) -> None:
+        RateOracle._shared_instance = None
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @staticmethod
+    def random_trade_specs(seed: int,
+                           positions: List[str],
+                           num_orders: int = 300,
+                           fills_per_order: Tuple[int, ...] = (1, 1, 2, 3)) -> List[dict]:
+        rng = random.Random(seed)
+        fees = [
+            AddedToCostTradeFee(flat_fees=[TokenAmount(quote, Decimal("0"))]),
+            AddedToCostTradeFee(percent=Decimal("0.001")),
+            AddedToCostTradeFee(percent=Decimal("0.00075"), flat_fees=[TokenAmount("BNB", Decimal("0.0001"))]),
+            DeductedFromReturnsTradeFee(percent=Decimal("0.002")),
+        ]
+        specs = []
+        for order_number in range(num_orders):
+            trade_type = rng.choice(["BUY", "SELL"])
+            position = rng.choice(positions)
+            # Some orders are filled in several trades
+            for fill_number in range(rng.choice(fills_per_order)):
+                specs.append(dict(
+                    order_id=f"order{order_number}",
+                    trade_type=trade_type,
+                    position=position,
+                    price=Decimal(rng.randint(9000000, 11000000)) / Decimal("1000000"),
+                    amount=Decimal(rng.randint(1, 5000000)) / Decimal("1000000"),
+                    trade_fee=rng.choice(fees).to_json(),
+                    exchange_trade_id=f"trade{order_number}-{fill_number}",
+                ))
+        # Fills of different orders are interleaved
+        for i in range(len(specs) - 1):
+            if rng.random() < 0.2:
+                specs[i], specs[i + 1] = specs[i + 1], specs[i]
+        return specs
+
+    @staticmethod
+    def trade_fills(specs: List[dict]) -> List[TradeFill]:
+        return [
+            TradeFill(
+                config_file_path="some-strategy.yml",
+                strategy="pure_market_making",
+                market="binance",
+                symbol=trading_pair,
+                base_asset=base,
+                quote_asset=quote,
+                timestamp=1640001112223 + i,
+                order_type="LIMIT",
+                **spec,
+            )
+            for i, spec in enumerate(specs)
+        ]
+
+    def assert_same_metrics(self, expected: PerformanceMetrics, metrics: PerformanceMetrics):
+        for field in dataclasses.fields(PerformanceMetrics):
+            self.assertEqual(getattr(expected, field.name), getattr(metrics, field.name), field.name)
+        self.assertEqual(list(expected.fees.items()), list(metrics.fees.items()))
+
+    def assert_accumulated_metrics_match(self, specs: List[dict]) -> PerformanceAccumulator:
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+        accumulator = PerformanceAccumulator(trading_pair)
+        # The metrics match after every trade, not only once every trade is added
+        for number_of_trades, trade in enumerate(self.trade_fills(specs), start=1):
+            accumulator.add_trade(trade)
+            if number_of_trades % 97 == 0 or number_of_trades == len(specs):
+                expected = self.async_run_with_timeout(
+                    PerformanceMetrics.create(trading_pair, self.trade_fills(specs[:number_of_trades]), cur_bals))
+                metrics = self.async_run_with_timeout(accumulator.metrics(cur_bals))
+                self.assert_same_metrics(expected, metrics)
+        return accumulator
+
+    def test_metrics_match_performance_metrics_for_spot_trades(self):
+        self.assert_accumulated_metrics_match(self.random_trade_specs(seed=1, positions=[PositionAction.NIL.value]))
+
+    def test_metrics_match_performance_metrics_for_derivative_trades(self):
+        # Orders filled at 1 or 2 prices have an exact average price, the running sum of the position PnL is used
+        specs = self.random_trade_specs(seed=2, positions=["OPEN", "CLOSE"], fills_per_order=(1, 1, 2))
+        accumulator = self.assert_accumulated_metrics_match(specs)
+
+        self.assertTrue(accumulator._are_derivatives())
+        self.assertGreater(len(accumulator._long_pairs), 0)
+        self.assertGreater(len(accumulator._short_pairs), 0)
+        self.assertIsNone(accumulator._summed_pnl)
+
+    def test_metrics_match_performance_metrics_when_position_pnl_sum_is_rounded(self):
+        # Orders filled at 3 prices have a rounded average price, the position PnL are summed in order
+        specs = self.random_trade_specs(seed=3, positions=["OPEN", "CLOSE"], fills_per_order=(1, 3))
+        accumulator = self.assert_accumulated_metrics_match(specs)
+
+        self.assertIsNotNone(accumulator._summed_pnl)
+
+    def test_metrics_match_performance_metrics_when_only_one_side_has_positions(self):
+        # PerformanceMetrics checks the positions of the buys and of the sells apart, the trades are derivatives as
+        # long as one side has no trade without position
+        for seed, (nil_position_side, position_side) in enumerate((("SELL", "BUY"), ("BUY", "SELL")), start=6):
+            specs = self.random_trade_specs(seed=seed, positions=["OPEN", "CLOSE"], num_orders=100)
+            for spec in specs:
+                if spec["trade_type"] == nil_position_side:
+                    spec["position"] = PositionAction.NIL.value
+            # The first trade is of the side without positions
+            first_nil = next(i for i, spec in enumerate(specs) if spec["trade_type"] == nil_position_side)
+            specs.insert(0, specs.pop(first_nil))
+            self.assertTrue(any(spec["trade_type"] == position_side for spec in specs))
+
+            accumulator = self.assert_accumulated_metrics_match(specs)
+
+            self.assertTrue(accumulator._are_derivatives())
+
+    def test_metrics_match_performance_metrics_when_both_sides_have_trades_without_position(self):
+        specs = self.random_trade_specs(seed=8, positions=["OPEN", "CLOSE"], num_orders=100)
+        for side in ("BUY", "SELL"):
+            next(spec for spec in specs if spec["trade_type"] == side)["position"] = PositionAction.NIL.value
+
+        accumulator = self.assert_accumulated_metrics_match(specs)
+
+        self.assertFalse(accumulator._are_derivatives())
+
+    @patch("hummingbot.core.rate_oracle.rate_oracle.RateOracle.stored_or_live_rate", new_callable=AsyncMock)
+    def test_metrics_without_rate_oracle_price_use_the_last_trade_price(self, stored_or_live_rate_mock):
+        stored_or_live_rate_mock.return_value = None
+        self.assert_accumulated_metrics_match(
+            self.random_trade_specs(seed=4, positions=[PositionAction.NIL.value], num_orders=10))
+
+    def test_accumulate_by_market(self):
+        specs = self.random_trade_specs(seed=5, positions=[PositionAction.NIL.value], num_orders=10)
+        trades = self.trade_fills(specs)
+        for trade in trades[::2]:
+            trade.market = "kucoin"
+
+        accumulators = PerformanceAccumulator.accumulate_by_market(trades)
+
+        self.assertEqual([("kucoin", trading_pair), ("binance", trading_pair)], list(accumulators))
+        self.assertEqual(len(trades[::2]), accumulators[("kucoin", trading_pair)].num_trades)
+        self.assertEqual(len(trades[1::2]), accumulators[("binance", trading_pair)].num_trades)
@@ -1,9 +1,13 @@
+import importlib
+import json
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, patch
 
 from pydantic import SecretStr
 
-from hummingbot.client.settings import ConnectorSetting, ConnectorType
+from hummingbot.client.settings import AllConnectorSettings, CachedConnectorSetting, ConnectorSetting, ConnectorType
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.connector.gateway.clob_spot.data_sources.injective.injective_api_data_source import (
     InjectiveAPIDataSource,
@@ -195,3 +199,82 @@ class SettingsTest(unittest.TestCase):
 
         self.assertIsInstance(api_data_source, KujiraAPIDataSource)
         self.assertEqual(expected_params_without_api_data_source, params)
+
+
+class AllConnectorSettingsCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = TemporaryDirectory()
+        self.cache_path = Path(self.temp_dir.name) / "connector_settings_cache.json"
+        cache_path_patch = patch("hummingbot.client.settings.CONNECTOR_SETTINGS_CACHE_PATH", self.cache_path)
+        cache_path_patch.start()
+        self.addCleanup(cache_path_patch.stop)
+        gateway_connections_patch = patch("hummingbot.client.settings.GatewayConnectionSetting.load", return_value=[])
+        gateway_connections_patch.start()
+        self.addCleanup(gateway_connections_patch.stop)
+
+    def tearDown(self) -> None:
+        AllConnectorSettings.all_connector_settings = {}
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_connector_settings_loaded_from_cache(self):
+        imported_settings = dict(AllConnectorSettings.create_connector_settings())
+
+        with patch("hummingbot.client.settings.importlib.import_module") as import_module_mock:
+            cached_settings = AllConnectorSettings.create_connector_settings()
+            import_module_mock.assert_not_called()
+
+        self.assertEqual(list(imported_settings), list(cached_settings))
+        self.assertIsInstance(cached_settings["binance"], CachedConnectorSetting)
+        for name in ["binance", "binance_us"]:
+            self.assertEqual(imported_settings[name].type, cached_settings[name].type)
+            self.assertEqual(imported_settings[name].example_pair, cached_settings[name].example_pair)
+            self.assertEqual(imported_settings[name].trade_fee_schema, cached_settings[name].trade_fee_schema)
+            self.assertEqual(imported_settings[name].domain_parameter, cached_settings[name].domain_parameter)
+            self.assertIs(imported_settings[name].config_keys, cached_settings[name].config_keys)
+
+    def test_stale_connector_settings_cache_ignored(self):
+        AllConnectorSettings.create_connector_settings()
+        with open(self.cache_path) as cache_file:
+            cache = json.load(cache_file)
+        cache["fingerprint"]["version"] = "0.0.0"
+        cache["connector_settings"] = []
+        with open(self.cache_path, "w") as cache_file:
+            json.dump(cache, cache_file)
+
+        settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertIsInstance(settings["binance"], ConnectorSetting)
+        self.assertNotIsInstance(settings["binance"], CachedConnectorSetting)
+        with open(self.cache_path) as cache_file:
+            self.assertNotEqual("0.0.0", json.load(cache_file)["fingerprint"]["version"])
+
+    def test_corrupted_connector_settings_cache_ignored(self):
+        self.cache_path.write_text("{")
+
+        settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertIn("binance", settings)
+        self.assertNotIsInstance(settings["binance"], CachedConnectorSetting)
+
+    def test_connector_settings_cache_not_saved_when_a_dependency_is_missing(self):
+        import_module = importlib.import_module
+        binance_utils = "hummingbot.connector.exchange.binance.binance_utils"
+
+        def import_module_without_dependency(name: str):
+            if name == binance_utils:
+                raise ModuleNotFoundError("No module named 'missing_dependency'", name="missing_dependency")
+            return import_module(name)
+
+        with patch("hummingbot.client.settings.importlib.import_module") as import_module_mock:
+            import_module_mock.side_effect = import_module_without_dependency
+            settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertNotIn("binance", settings)
+        self.assertFalse(self.cache_path.exists())
+
+        settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertIn("binance", settings)
+        self.assertTrue(self.cache_path.exists())
@@ -6,7 +6,7 @@ from decimal import Decimal
 from os.path import join, realpath
 from test.mock.http_recorder import HttpPlayer
 from typing import Dict, List
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from aiohttp import ClientSession
 from aiounittest import async_test
@@ -16,6 +16,7 @@ from bin import path_util  # noqa: F401
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.gateway.amm.gateway_evm_amm import GatewayEVMAMM
+from hummingbot.connector.gateway.amm_perpetual.gateway_evm_amm_perpetual import GatewayEVMAMMPerpetual
 from hummingbot.connector.gateway.gateway_in_flight_order import GatewayInFlightOrder
 from hummingbot.core.clock import Clock, ClockMode
 from hummingbot.core.event.event_logger import EventLogger
@@ -386,3 +387,102 @@ class GatewayEVMAMMConnectorUnitTest(unittest.TestCase):
         inflight_orders = self._connector.in_flight_orders
         self.assertEqual(len(inflight_orders), 1)
         # more asserts
+
+
+class GatewayEVMAMMQuoteCacheUnitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.connector = GatewayEVMAMM(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            connector_name="uniswap",
+            chain="ethereum",
+            network="ropsten",
+            address="0x5821715133bB451bDE2d5BC6a4cE3430a4fdAF92",
+            trading_pairs=["DAI-WETH"],
+            trading_required=False
+        )
+        self.requests = []
+
+    async def delayed_quote_price(self, trading_pair: str, is_buy: bool, amount: Decimal, ignore_shim: bool = False):
+        self.requests.append((trading_pair, is_buy, amount))
+        await asyncio.sleep(0.01)
+        return Decimal("0.002") if is_buy else None
+
+    def test_concurrent_quote_requests_coalesced(self):
+        self.connector._request_quote_price = self.delayed_quote_price
+
+        prices = ev_loop.run_until_complete(asyncio.gather(
+            self.connector.get_quote_price("DAI-WETH", True, Decimal(1000)),
+            self.connector.get_order_price("DAI-WETH", True, Decimal("1000.0")),
+            self.connector.get_quote_price("DAI-WETH", True, Decimal(1)),
+        ))
+
+        self.assertEqual([Decimal("0.002")] * 3, prices)
+        self.assertEqual([("DAI-WETH", True, Decimal(1000)), ("DAI-WETH", True, Decimal(1))], self.requests)
+        self.assertEqual({"hits": 0, "coalesced": 1, "misses": 2}, self.connector.quote_cache_stats)
+
+    def test_quote_price_cached_until_ttl(self):
+        self.connector._request_quote_price = self.delayed_quote_price
+
+        ev_loop.run_until_complete(self.connector.get_quote_price("DAI-WETH", True, Decimal(1000)))
+        price = ev_loop.run_until_complete(self.connector.get_order_price("DAI-WETH", True, Decimal(1000)))
+
+        self.assertEqual(Decimal("0.002"), price)
+        self.assertEqual(1, len(self.requests))
+        self.assertEqual({"hits": 1, "coalesced": 0, "misses": 1}, self.connector.quote_cache_stats)
+
+        self.connector.quote_cache_ttl = 0.01
+        ev_loop.run_until_complete(self.connector.get_quote_price("DAI-WETH", True, Decimal(1000)))
+        ev_loop.run_until_complete(asyncio.sleep(0.02))
+        ev_loop.run_until_complete(self.connector.get_quote_price("DAI-WETH", True, Decimal(1000)))
+
+        self.assertEqual(3, len(self.requests))
+
+    def test_unavailable_quote_price_not_cached(self):
+        self.connector._request_quote_price = self.delayed_quote_price
+
+        ev_loop.run_until_complete(self.connector.get_quote_price("DAI-WETH", False, Decimal(1000)))
+        price = ev_loop.run_until_complete(self.connector.get_quote_price("DAI-WETH", False, Decimal(1000)))
+
+        self.assertIsNone(price)
+        self.assertEqual(2, len(self.requests))
+
+    def test_quote_cache_ttl_from_gateway_config(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.gateway.gateway_quote_cache_ttl = 12
+        connector = GatewayEVMAMM(
+            client_config_map=client_config_map,
+            connector_name="uniswap",
+            chain="ethereum",
+            network="ropsten",
+            address="0x5821715133bB451bDE2d5BC6a4cE3430a4fdAF92",
+            trading_pairs=["DAI-WETH"],
+            trading_required=False
+        )
+
+        self.assertEqual(5, self.connector.quote_cache_ttl)
+        self.assertEqual(12, connector.quote_cache_ttl)
+
+    def test_perpetual_quote_requests_cached_and_coalesced(self):
+        connector = GatewayEVMAMMPerpetual(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            connector_name="perp",
+            chain="ethereum",
+            network="optimism",
+            address="0x5821715133bB451bDE2d5BC6a4cE3430a4fdAF92",
+            trading_pairs=["AAVE-USD"],
+            trading_required=False
+        )
+        gateway_instance = MagicMock()
+        gateway_instance.get_perp_market_price = AsyncMock(return_value={"markPrice": "100"})
+        connector._get_gateway_instance = MagicMock(return_value=gateway_instance)
+
+        prices = ev_loop.run_until_complete(asyncio.gather(
+            connector.get_quote_price("AAVE-USD", True, Decimal(1), ignore_shim=True),
+            connector.get_quote_price("AAVE-USD", True, Decimal(1), ignore_shim=True),
+        ))
+        price = ev_loop.run_until_complete(connector.get_quote_price("AAVE-USD", True, Decimal(1), ignore_shim=True))
+
+        self.assertEqual([Decimal("100")] * 3, prices + [price])
+        gateway_instance.get_perp_market_price.assert_awaited_once()
+        self.assertEqual({"hits": 1, "coalesced": 1, "misses": 1}, connector.quote_cache_stats)
@@ -1132,3 +1132,109 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.tracker.lost_order_count_limit = 2
 
         self.assertEqual(2, self.tracker.lost_order_count_limit)
+
+    def _create_order(self, client_order_id: str, exchange_order_id: str = None) -> InFlightOrder:
+        return InFlightOrder(
+            client_order_id=client_order_id,
+            exchange_order_id=exchange_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+
+    def test_fetch_order_by_exchange_order_id_assigned_after_tracking(self):
+        order = self._create_order("someClientOrderId")
+        self.tracker.start_tracking_order(order)
+
+        update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(update))
+
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertIs(order, self.tracker.all_fillable_orders_by_exchange_order_id["someExchangeOrderId"])
+
+    def test_fetch_order_by_exchange_order_id_assigned_to_the_order_directly(self):
+        order = self._create_order("someClientOrderId")
+        self.tracker.start_tracking_order(order)
+
+        order.update_exchange_order_id("someExchangeOrderId")
+
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertEqual(0, len(self.tracker._orders_without_exchange_order_id))
+
+    def test_fetch_order_by_exchange_order_id_of_cached_and_lost_orders(self):
+        cached_order = self._create_order("cachedClientOrderId", "cachedExchangeOrderId")
+        self.tracker.start_tracking_order(cached_order)
+        self.tracker.stop_tracking_order(cached_order.client_order_id)
+        lost_order = self._create_order("lostClientOrderId", "lostExchangeOrderId")
+        self.tracker.restore_tracking_states({"lostClientOrderId": {
+            **lost_order.to_json(), "last_state": str(OrderState.FAILED.value)}})
+
+        self.assertIs(cached_order, self.tracker.fetch_order(exchange_order_id="cachedExchangeOrderId"))
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="lostExchangeOrderId"))
+        self.assertEqual(
+            "lostClientOrderId", self.tracker.fetch_lost_order(exchange_order_id="lostExchangeOrderId").client_order_id)
+        self.assertIsNone(self.tracker.fetch_lost_order(exchange_order_id="cachedExchangeOrderId"))
+
+        fillable_orders = self.tracker.all_fillable_orders_by_exchange_order_id
+        self.assertEqual({"cachedExchangeOrderId", "lostExchangeOrderId"}, set(fillable_orders))
+        updatable_orders = self.tracker.all_updatable_orders_by_exchange_order_id
+        self.assertNotIn("cachedExchangeOrderId", updatable_orders)
+        self.assertIn("lostExchangeOrderId", updatable_orders)
+
+    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.CACHED_ORDER_TTL", 0.1)
+    def test_fetch_order_by_exchange_order_id_after_cache_expiration(self):
+        tracker = ClientOrderTracker(self.connector)
+        order = self._create_order("someClientOrderId", "someExchangeOrderId")
+        tracker.start_tracking_order(order)
+        tracker.stop_tracking_order(order.client_order_id)
+
+        self.ev_loop.run_until_complete(asyncio.sleep(0.2))
+
+        self.assertIsNone(tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertNotIn("someExchangeOrderId", tracker.all_fillable_orders_by_exchange_order_id)
+
+    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.MAX_CACHE_SIZE", 2)
+    def test_exchange_order_id_index_removes_untracked_orders(self):
+        tracker = ClientOrderTracker(self.connector)
+        for i in range(10):
+            tracker.start_tracking_order(self._create_order(f"OID{i}", f"EOID{i}"))
+            tracker.stop_tracking_order(f"OID{i}")
+
+        # The index is cleaned when it has more than twice the entries of the tracked orders
+        self.assertLessEqual(len(tracker._orders_by_exchange_order_id), 2 * (2 + 1))
+        self.assertNotIn("EOID0", tracker._orders_by_exchange_order_id)
+        self.assertIsNotNone(tracker.fetch_order(exchange_order_id="EOID9"))
+        self.assertIsNone(tracker.fetch_order(exchange_order_id="EOID0"))
+
+    def test_all_fillable_orders_view(self):
+        active_order = self._create_order("activeClientOrderId")
+        cached_order = self._create_order("cachedClientOrderId")
+        self.tracker.start_tracking_order(cached_order)
+        self.tracker.stop_tracking_order(cached_order.client_order_id)
+        fillable_orders = self.tracker.all_fillable_orders
+        updatable_orders = self.tracker.all_updatable_orders
+
+        self.tracker.start_tracking_order(active_order)
+
+        self.assertIs(active_order, fillable_orders.get("activeClientOrderId"))
+        self.assertIs(cached_order, fillable_orders["cachedClientOrderId"])
+        self.assertEqual({"activeClientOrderId": active_order, "cachedClientOrderId": cached_order}, fillable_orders)
+        self.assertEqual(2, len(fillable_orders))
+        self.assertIn("activeClientOrderId", updatable_orders)
+        self.assertNotIn("cachedClientOrderId", updatable_orders)
+        with self.assertRaises(TypeError):
+            fillable_orders["newClientOrderId"] = active_order
+
+        # Iterating works on a snapshot, the orders can change while iterating
+        for order in fillable_orders.values():
+            self.tracker.stop_tracking_order(order.client_order_id)
+        self.assertNotIn("activeClientOrderId", updatable_orders)
@@ -0,0 +1,236 @@
+import asyncio
+from decimal import Decimal
+from typing import Awaitable, List
+from unittest import TestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from bidict import bidict
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+
+
+class ExchangePyBaseOrderReconciliationTests(TestCase):
+    # the level is required to receive logs from the data source logger
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.exchange = BinanceExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+        self.exchange.logger().setLevel(1)
+        self.exchange.logger().addHandler(self)
+        self.exchange._set_current_timestamp(1640780000)
+        self.running_requests = 0
+        self.max_running_requests = 0
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message for record in self.log_records)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def start_tracking_orders(self, count: int) -> List[InFlightOrder]:
+        for i in range(count):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{i}",
+                exchange_order_id=f"EOID{i}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        return list(self.exchange.in_flight_orders.values())
+
+    def order_update(self, order: InFlightOrder, new_state: OrderState = OrderState.OPEN) -> OrderUpdate:
+        return OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id=order.exchange_order_id,
+            trading_pair=order.trading_pair,
+            update_timestamp=self.exchange.current_timestamp,
+            new_state=new_state,
+        )
+
+    def trade_update(self, order: InFlightOrder) -> TradeUpdate:
+        return TradeUpdate(
+            trade_id=f"T{order.client_order_id}",
+            client_order_id=order.client_order_id,
+            exchange_order_id=order.exchange_order_id,
+            trading_pair=order.trading_pair,
+            fill_timestamp=self.exchange.current_timestamp,
+            fill_price=Decimal("10000"),
+            fill_base_amount=Decimal("0.5"),
+            fill_quote_amount=Decimal("5000"),
+            fee=AddedToCostTradeFee(),
+        )
+
+    async def delayed_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
+        self.running_requests += 1
+        self.max_running_requests = max(self.max_running_requests, self.running_requests)
+        await asyncio.sleep(0.01)
+        self.running_requests -= 1
+        return self.order_update(tracked_order)
+
+    async def delayed_trade_updates(self, order: InFlightOrder) -> List[TradeUpdate]:
+        self.running_requests += 1
+        self.max_running_requests = max(self.max_running_requests, self.running_requests)
+        await asyncio.sleep(0.01)
+        self.running_requests -= 1
+        if order.client_order_id == "OID0":
+            raise IOError("Test error")
+        return [self.trade_update(order)]
+
+    def test_order_status_requested_concurrently(self):
+        orders = self.start_tracking_orders(5)
+        self.exchange._request_order_status = self.delayed_order_status
+
+        self.async_run_with_timeout(self.exchange._update_orders())
+
+        self.assertEqual(5, self.max_running_requests)
+        self.assertTrue(all(order.is_open for order in orders))
+
+    def test_order_status_concurrent_requests_limit(self):
+        orders = self.start_tracking_orders(5)
+        self.exchange.MAX_CONCURRENT_ORDER_UPDATES = 2
+        self.exchange._request_order_status = self.delayed_order_status
+
+        self.async_run_with_timeout(self.exchange._update_orders())
+
+        self.assertEqual(2, self.max_running_requests)
+        self.assertTrue(all(order.is_open for order in orders))
+
+    def test_order_status_request_error_handled_for_each_order(self):
+        orders = self.start_tracking_orders(3)
+        self.exchange._request_order_status = AsyncMock(
+            side_effect=[self.order_update(orders[0]), IOError("Test error"), self.order_update(orders[2])])
+
+        self.async_run_with_timeout(self.exchange._update_orders())
+
+        self.assertTrue(orders[0].is_open)
+        self.assertEqual(OrderState.PENDING_CREATE, orders[1].current_state)
+        self.assertTrue(orders[2].is_open)
+        self.assertEqual(1, self.exchange._order_tracker._order_not_found_records[orders[1].client_order_id])
+
+    def test_batch_order_status_requests_only_missing_orders(self):
+        orders = self.start_tracking_orders(3)
+        self.exchange._request_batch_order_status = AsyncMock(return_value={
+            orders[0].client_order_id: self.order_update(orders[0]),
+            orders[2].client_order_id: self.order_update(orders[2], OrderState.CANCELED),
+        })
+        self.exchange._request_order_status = AsyncMock(return_value=self.order_update(orders[1]))
+
+        self.async_run_with_timeout(self.exchange._update_orders())
+
+        self.exchange._request_order_status.assert_awaited_once_with(tracked_order=orders[1])
+        self.assertTrue(orders[0].is_open)
+        self.assertTrue(orders[1].is_open)
+        self.assertTrue(orders[2].is_cancelled)
+
+    def test_batch_order_status_error_requests_every_order(self):
+        orders = self.start_tracking_orders(2)
+        self.exchange._request_batch_order_status = AsyncMock(side_effect=IOError("Test error"))
+        self.exchange._request_order_status = self.delayed_order_status
+
+        self.async_run_with_timeout(self.exchange._update_orders())
+
+        self.assertTrue(all(order.is_open for order in orders))
+        self.assertTrue(self.is_logged(
+            "WARNING", "Failed to fetch the status of 2 orders in a single request. Error: Test error"))
+
+    def test_order_fills_requested_concurrently(self):
+        orders = self.start_tracking_orders(4)
+        self.exchange._all_trade_updates_for_order = self.delayed_trade_updates
+
+        self.async_run_with_timeout(self.exchange._update_orders_fills(orders))
+
+        self.assertEqual(4, self.max_running_requests)
+        self.assertEqual(Decimal("0"), orders[0].executed_amount_base)
+        self.assertTrue(all(order.executed_amount_base == Decimal("0.5") for order in orders[1:]))
+        self.assertTrue(self.is_logged("WARNING", "Failed to fetch trade updates for order OID0. Error: Test error"))
+
+    def test_batch_order_fills(self):
+        orders = self.start_tracking_orders(3)
+        self.exchange._request_batch_trade_updates = AsyncMock(
+            return_value=[self.trade_update(orders[0]), self.trade_update(orders[2])])
+        self.exchange._all_trade_updates_for_order = AsyncMock()
+
+        self.async_run_with_timeout(self.exchange._update_orders_fills(orders))
+
+        self.exchange._all_trade_updates_for_order.assert_not_awaited()
+        self.assertEqual(Decimal("0.5"), orders[0].executed_amount_base)
+        self.assertEqual(Decimal("0"), orders[1].executed_amount_base)
+        self.assertEqual(Decimal("0.5"), orders[2].executed_amount_base)
+
+    def test_batch_order_fills_error_requests_every_order(self):
+        orders = self.start_tracking_orders(2)
+        self.exchange._request_batch_trade_updates = AsyncMock(side_effect=IOError("Test error"))
+        self.exchange._all_trade_updates_for_order = AsyncMock(
+            side_effect=lambda order: [self.trade_update(order)])
+
+        self.async_run_with_timeout(self.exchange._update_orders_fills(orders))
+
+        self.assertEqual(2, self.exchange._all_trade_updates_for_order.await_count)
+        self.assertTrue(all(order.executed_amount_base == Decimal("0.5") for order in orders))
+        self.assertTrue(self.is_logged(
+            "WARNING", "Failed to fetch the trade updates of 2 orders in a single request. Error: Test error"))
+
+
+class ExchangePyBaseOrderBookTrackerTests(TestCase):
+
+    def test_order_book_tracker_coalesces_diffs_when_configured(self):
+        for coalesce_diffs in (False, True):
+            client_config_map = ClientConfigAdapter(ClientConfigMap())
+            client_config_map.order_book_coalesce_diffs = coalesce_diffs
+
+            exchange = BinanceExchange(
+                client_config_map=client_config_map,
+                binance_api_key="testAPIKey",
+                binance_api_secret="testSecret",
+                trading_pairs=["COINALPHA-HBOT"],
+            )
+
+            self.assertEqual(coalesce_diffs, exchange.order_book_tracker._coalesce_diffs)
+
+    def test_trading_pair_ready_before_the_order_books_of_the_other_trading_pairs(self):
+        exchange = BinanceExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=["COINALPHA-HBOT", "WETH-HBOT"],
+        )
+        exchange._set_trading_pair_symbol_map(bidict({"COINALPHAHBOT": "COINALPHA-HBOT", "WETHHBOT": "WETH-HBOT"}))
+        exchange._account_balances["HBOT"] = Decimal("10")
+        exchange._trading_rules["COINALPHA-HBOT"] = TradingRule(trading_pair="COINALPHA-HBOT")
+        exchange._is_user_stream_initialized = MagicMock(return_value=True)
+
+        self.assertFalse(exchange.is_trading_pair_ready("COINALPHA-HBOT"))
+
+        exchange.order_book_tracker._order_book_ready_events["COINALPHA-HBOT"].set()
+
+        self.assertFalse(exchange.ready)
+        self.assertTrue(exchange.is_trading_pair_ready("COINALPHA-HBOT"))
+        self.assertFalse(exchange.is_trading_pair_ready("WETH-HBOT"))
+
+        exchange._account_balances.clear()
+
+        self.assertFalse(exchange.is_trading_pair_ready("COINALPHA-HBOT"))
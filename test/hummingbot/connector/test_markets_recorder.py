@@ -1,4 +1,5 @@
 import asyncio
+import tempfile
 import time
 from decimal import Decimal
 from typing import Awaitable
@@ -7,9 +8,11 @@ from unittest.mock import MagicMock, PropertyMock, patch
 
 import numpy as np
 from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
 
 from hummingbot.client.config.client_config_map import ClientConfigMap, MarketDataCollectionConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
 from hummingbot.core.data_type.order_book import OrderBook
@@ -18,12 +21,16 @@ from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
     MarketEvent,
+    OrderCancelledEvent,
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.logger import HummingbotLogger
+from hummingbot.model.columnar_market_data import ColumnarMarketDataReader
 from hummingbot.model.market_data import MarketData
 from hummingbot.model.order import Order
+from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.smart_components.executors.position_executor.data_types import PositionExecutorConfig
@@ -87,6 +94,39 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def remove_listener(self, event_tag, listener):
+        pass
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def create_write_behind_recorder(self, engine_mock, batch_size: int = 100) -> MarketsRecorder:
+        # The in memory database has to be shared with the writer thread
+        engine_mock.return_value = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        return MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(market_data_collection_enabled=False),
+            write_behind_interval=60,
+            write_behind_batch_size=batch_size,
+        )
+
+    def buy_order_created_event(self, order_id: str) -> BuyOrderCreatedEvent:
+        return BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id=order_id,
+            creation_timestamp=1640001112.223,
+            exchange_order_id=f"E{order_id}",
+        )
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -145,6 +185,75 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(1, len(trades))
         self.assertEqual(fill_id, trades[0].exchange_trade_id)
 
+    def test_trades_performance_matches_the_performance_of_the_stored_trade_fills(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices[self.trading_pair] = Decimal("1005")
+        RateOracle._shared_instance = rate_oracle
+        self.addCleanup(setattr, RateOracle, "_shared_instance", None)
+        start_timestamp = 1642000000000
+
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                for order_id, timestamp in (("OID0", start_timestamp - 1), ("OID1", start_timestamp)):
+                    session.add(TradeFill(
+                        config_file_path=self.config_file_path,
+                        strategy=self.strategy_name,
+                        market=self.display_name,
+                        symbol=self.trading_pair,
+                        base_asset=self.base,
+                        quote_asset=self.quote,
+                        timestamp=timestamp,
+                        order_id=order_id,
+                        trade_type=TradeType.BUY.name,
+                        order_type=OrderType.LIMIT.name,
+                        price=Decimal(1000),
+                        amount=Decimal(1),
+                        leverage=1,
+                        trade_fee=AddedToCostTradeFee(percent=Decimal("0.001")).to_json(),
+                        exchange_trade_id=f"E{order_id}",
+                        position=PositionAction.NIL.value))
+
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(market_data_collection_enabled=False),
+            trades_performance_start=start_timestamp,
+        )
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id="OID2",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.SELL,
+            order_type=OrderType.LIMIT,
+            price=Decimal("1010.123456789"),
+            amount=Decimal("0.123456789"),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.001")),
+            exchange_trade_id="TradeId2"
+        )
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+        self.assertEqual([(self.display_name, self.trading_pair)], list(recorder.trades_performance))
+        performance = recorder.trades_performance[(self.display_name, self.trading_pair)]
+        self.assertEqual(2, performance.num_trades)
+
+        current_balances = {self.base: Decimal("10"), self.quote: Decimal("10000")}
+        with self.manager.get_new_session() as session:
+            trade_fills = (session.query(TradeFill)
+                           .filter(TradeFill.timestamp >= start_timestamp)
+                           .order_by(TradeFill.timestamp)
+                           .all())
+            expected = self.async_run_with_timeout(
+                PerformanceMetrics.create(self.trading_pair, trade_fills, current_balances))
+        metrics = self.async_run_with_timeout(performance.metrics(current_balances))
+
+        self.assertEqual(Decimal("1010.123456"), metrics.avg_s_price)
+        self.assertEqual(expected.s_vol_quote, metrics.s_vol_quote)
+        self.assertEqual(expected.fees, metrics.fees)
+        self.assertEqual(expected.trade_pnl, metrics.trade_pnl)
+        self.assertEqual(expected.total_pnl, metrics.total_pnl)
+
     def test_buy_order_created_event_creates_order_record(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -437,6 +546,73 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
 
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder._sleep")
+    def test_market_data_collection_with_columnar_storage(self, sleep_mock):
+        sleep_mock.side_effect = [0.1, asyncio.CancelledError]
+        order_book = OrderBook(dex=False)
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch("hummingbot.connector.markets_recorder.data_path", return_value=tmp_dir):
+                recorder = MarketsRecorder(
+                    sql=self.manager,
+                    markets=[self],
+                    config_file_path=self.config_file_path,
+                    strategy_name=self.strategy_name,
+                    market_data_collection=MarketDataCollectionConfigMap(
+                        market_data_collection_enabled=True,
+                        market_data_collection_interval=1,
+                        market_data_collection_depth=2,
+                        market_data_collection_storage="columnar",
+                    ),
+                )
+            with patch.object(self, "get_order_book") as get_order_book:
+                get_order_book.return_value = order_book
+                with self.assertRaises(asyncio.CancelledError):
+                    self.async_run_with_timeout(recorder._record_market_data())
+            recorder.stop()
+
+            columns = ColumnarMarketDataReader(f"{tmp_dir}/market_data").read(self.display_name, self.trading_pair)
+
+        self.assertEqual(2, len(columns["timestamp"]))
+        self.assertEqual([[3, 2], [3, 2]], columns["bid_price"].tolist())
+        self.assertEqual([[4, 5], [4, 5]], columns["ask_price"].tolist())
+        self.assertEqual([3.5, 3.5], columns["mid_price"].tolist())
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, len(session.query(MarketData).all()))
+
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder._sleep")
+    def test_market_data_collection_with_uncompressed_columnar_storage(self, sleep_mock):
+        sleep_mock.side_effect = [asyncio.CancelledError]
+        order_book = OrderBook(dex=False)
+        order_book.apply_numpy_snapshot(np.array([[3, 1, 1]], dtype=np.float64),
+                                        np.array([[4, 1, 1]], dtype=np.float64))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch("hummingbot.connector.markets_recorder.data_path", return_value=tmp_dir):
+                recorder = MarketsRecorder(
+                    sql=self.manager,
+                    markets=[self],
+                    config_file_path=self.config_file_path,
+                    strategy_name=self.strategy_name,
+                    market_data_collection=MarketDataCollectionConfigMap(
+                        market_data_collection_enabled=True,
+                        market_data_collection_storage="columnar_npy",
+                    ),
+                )
+            with patch.object(self, "get_order_book") as get_order_book:
+                get_order_book.return_value = order_book
+                with self.assertRaises(asyncio.CancelledError):
+                    self.async_run_with_timeout(recorder._record_market_data())
+            recorder.stop()
+
+            columns = ColumnarMarketDataReader(f"{tmp_dir}/market_data").read(self.display_name, self.trading_pair)
+
+            self.assertEqual([3.5], columns["mid_price"].tolist())
+            self.assertIsInstance(columns["mid_price"], np.memmap)
+
     def test_store_position_executor(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -492,3 +668,164 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(len(executors_in_db), 1)
         executors_in_db = recorder.get_position_executors(controller_name="test_controller_2")
         self.assertEqual(len(executors_in_db), 1)
+
+    def test_write_behind_queues_writes_until_flushed(self):
+        recorder = self.create_write_behind_recorder()
+        self.tracking_states = {"OID1": "serialized order"}
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.buy_order_created_event("OID1"))
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, len(session.query(Order).all()))
+
+        recorder.flush_pending_writes()
+
+        with self.manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            self.assertEqual(1, len(orders))
+            self.assertEqual(1, len(orders[0].status))
+            market_states = recorder.get_market_states(self.config_file_path, self, session)
+            self.assertEqual({"OID1": "serialized order"}, market_states.saved_state)
+
+    def test_write_behind_writes_batch_when_batch_size_is_reached(self):
+        recorder = self.create_write_behind_recorder(batch_size=2)
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.buy_order_created_event("OID1"))
+        self.assertIsNone(recorder._last_write_future)
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.buy_order_created_event("OID2"))
+        recorder._last_write_future.result(timeout=1)
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(2, len(session.query(Order).all()))
+
+    def test_failed_write_does_not_drop_the_other_writes_of_the_batch(self):
+        recorder = self.create_write_behind_recorder()
+
+        def failing_write(session):
+            session.add(Order(id="OID3"))
+            raise Exception("Test error")
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.buy_order_created_event("OID1"))
+        recorder._queue_write(failing_write, self)
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.buy_order_created_event("OID2"))
+        with self.assertLogs(recorder.logger(), level="ERROR"):
+            recorder.flush_pending_writes()
+
+        with self.manager.get_new_session() as session:
+            orders = session.query(Order).order_by(Order.id).all()
+            self.assertEqual(["OID1", "OID2"], [order.id for order in orders])
+            self.assertEqual([1, 1], [len(order.status) for order in orders])
+
+    def test_write_error_raised_without_write_behind(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(market_data_collection_enabled=False),
+        )
+
+        def failing_write(session):
+            session.add(Order(id="OID1"))
+            raise IOError("Test error")
+
+        with self.assertRaises(IOError):
+            recorder._queue_write(failing_write, self)
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, len(session.query(Order).all()))
+
+    def test_trade_fill_appended_to_csv_once_committed(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(market_data_collection_enabled=False),
+        )
+        csv_trade_ids = []
+        recorder.append_to_csv = lambda trade: csv_trade_ids.append(trade.exchange_trade_id)
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.buy_order_created_event("OID1"))
+
+        def fill_event(trade_id: str) -> OrderFilledEvent:
+            return OrderFilledEvent(
+                timestamp=1642020000,
+                order_id="OID1",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT,
+                price=Decimal(1010),
+                amount=Decimal(1),
+                trade_fee=AddedToCostTradeFee(),
+                exchange_trade_id=trade_id,
+            )
+
+        with patch.object(recorder, "_save_tracking_states", side_effect=IOError("Test error")):
+            with self.assertRaises(IOError):
+                recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event("TradeId1"))
+        self.assertEqual([], csv_trade_ids)
+
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event("TradeId2"))
+
+        self.assertEqual(["TradeId2"], csv_trade_ids)
+
+    def test_order_status_update_without_order_record_does_not_save_market_states(self):
+        recorder = self.create_write_behind_recorder()
+        self.tracking_states = {"OID1": "serialized order"}
+
+        recorder._did_cancel_order(MarketEvent.OrderCancelled.value, self, OrderCancelledEvent(1642010000, "OID1"))
+        recorder.flush_pending_writes()
+
+        with self.manager.get_new_session() as session:
+            self.assertIsNone(recorder.get_market_states(self.config_file_path, self, session))
+            self.assertEqual(0, len(session.query(OrderStatus).all()))
+
+    def test_stop_shuts_down_the_writer_thread(self):
+        recorder = self.create_write_behind_recorder()
+        executor = recorder._writer_executor
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.buy_order_created_event("OID1"))
+
+        recorder.stop()
+
+        self.assertIsNone(recorder._writer_executor)
+        self.assertTrue(executor._shutdown)
+        with self.manager.get_new_session() as session:
+            self.assertEqual(1, len(session.query(Order).all()))
+
+    def test_stop_writes_pending_order_updates(self):
+        recorder = self.create_write_behind_recorder()
+        create_event = self.buy_order_created_event("OID1-1642010000000000")
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=Decimal(1010),
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+        complete_event = BuyOrderCompletedEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            base_asset=self.base,
+            quote_asset=self.quote,
+            base_asset_amount=create_event.amount,
+            quote_asset_amount=create_event.amount * create_event.price,
+            order_type=create_event.type)
+        recorder._did_complete_order(MarketEvent.BuyOrderCompleted.value, self, complete_event)
+
+        recorder.stop()
+
+        with self.manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            self.assertEqual(1, len(orders))
+            self.assertEqual(MarketEvent.BuyOrderCompleted.name, orders[0].last_status)
+            self.assertEqual([MarketEvent.BuyOrderCreated.name,
+                              MarketEvent.OrderFilled.name,
+                              MarketEvent.BuyOrderCompleted.name],
+                             [order_status.status for order_status in orders[0].status])
+            self.assertEqual(1, len(orders[0].trade_fills))
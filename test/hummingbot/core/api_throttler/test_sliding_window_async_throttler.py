@@ -0,0 +1,190 @@
+import asyncio
+import time
+import unittest
+from typing import Awaitable, List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.sliding_window_async_throttler import SlidingWindow, SlidingWindowAsyncThrottler
+
+TEST_POOL_ID = "TEST"
+TEST_PATH_URL = "/hummingbot"
+TEST_OTHER_PATH_URL = "/other"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_ID = "/weighted_task"
+
+
+class SlidingWindowTests(unittest.TestCase):
+    def test_used_capacity_and_expiration(self):
+        window = SlidingWindow()
+        window.add(1.0, 1)
+        window.add(2.0, 3)
+        window.add(3.0, 2)
+
+        self.assertEqual(6, window.used_capacity())
+        window.expire(2.0)
+        self.assertEqual(2, len(window))
+        self.assertEqual(5, window.used_capacity())
+        window.expire(10.0)
+        self.assertEqual(0, len(window))
+        self.assertEqual(0, window.used_capacity())
+
+    def test_time_to_free(self):
+        window = SlidingWindow()
+        window.add(1.0, 1)
+        window.add(2.0, 3)
+        window.add(3.0, 2)
+
+        self.assertEqual(1.0, window.time_to_free(1))
+        self.assertEqual(2.0, window.time_to_free(2))
+        self.assertEqual(2.0, window.time_to_free(4))
+        self.assertEqual(3.0, window.time_to_free(5))
+        window.expire(1.5)
+        self.assertEqual(2.0, window.time_to_free(3))
+        self.assertEqual(3.0, window.time_to_free(4))
+
+    def test_expired_entries_are_compacted(self):
+        window = SlidingWindow()
+        for timestamp in range(3000):
+            window.add(float(timestamp), 1)
+
+        window.expire(2500.0)
+
+        self.assertEqual(500, len(window))
+        self.assertEqual(500, len(window._timestamps))
+        self.assertEqual(500, window.used_capacity())
+        self.assertEqual(2600.0, window.time_to_free(101))
+
+
+class SlidingWindowAsyncThrottlerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=0.2),
+            RateLimit(limit_id=TEST_PATH_URL, limit=100, time_interval=0.2,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_OTHER_PATH_URL, limit=100, time_interval=0.2),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=0.2),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_ID, limit=100, time_interval=0.2,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 20)]),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = SlidingWindowAsyncThrottler(rate_limits=self.rate_limits, safety_margin_pct=0)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def execute_request(self, limit_id: str, completed: List[str], name: str):
+        async with self.throttler.execute_task(limit_id=limit_id):
+            completed.append(name)
+
+    def test_task_within_capacity_is_executed_immediately(self):
+        completed = []
+        self.async_run_with_timeout(self.execute_request(TEST_PATH_URL, completed, "first"))
+
+        self.assertEqual(["first"], completed)
+        self.assertEqual(1, self.throttler._windows[TEST_PATH_URL].used_capacity())
+        self.assertEqual(1, self.throttler._windows[TEST_POOL_ID].used_capacity())
+
+    def test_unknown_limit_id_is_not_throttled(self):
+        context = self.throttler.execute_task(limit_id="unknown")
+
+        self.assertTrue(context.within_capacity())
+        self.async_run_with_timeout(context.acquire())
+        self.assertEqual(0, len(self.throttler._windows))
+
+    @patch("hummingbot.core.api_throttler.sliding_window_async_throttler.SlidingWindowAsyncThrottler._time")
+    def test_wait_time_is_calculated_from_the_oldest_entries(self, time_mock):
+        rate_limit, related_limits = self.throttler.get_related_limits(TEST_PATH_URL)
+        limits = [(rate_limit, rate_limit.weight)] + related_limits
+        self.throttler._register_task(limits, 1000.0)
+        self.throttler._register_task(limits, 1000.1)
+
+        time_mock.return_value = 1000.15
+        self.assertAlmostEqual(0.05, self.throttler.wait_time(limits), places=4)
+        self.assertFalse(self.throttler.execute_task(TEST_PATH_URL).within_capacity())
+
+        time_mock.return_value = 1000.2
+        self.assertAlmostEqual(0, self.throttler.wait_time(limits), places=4)
+
+        time_mock.return_value = 1000.21
+        self.assertEqual(0, self.throttler.wait_time(limits))
+        self.assertTrue(self.throttler.execute_task(TEST_PATH_URL).within_capacity())
+
+    def test_safety_margin_extends_the_window(self):
+        throttler = SlidingWindowAsyncThrottler(rate_limits=self.rate_limits, safety_margin_pct=0.5)
+        rate_limit, _ = throttler.get_related_limits(TEST_POOL_ID)
+        limits = [(rate_limit, rate_limit.weight)]
+        now = time.time()
+        throttler._register_task(limits, now)
+        throttler._register_task(limits, now)
+
+        self.assertGreater(throttler.wait_time(limits), 0.2)
+
+    def test_waiting_tasks_are_executed_in_arrival_order(self):
+        completed = []
+
+        async def run_requests():
+            await asyncio.gather(*[self.execute_request(TEST_PATH_URL, completed, f"task_{i}") for i in range(5)])
+
+        start = time.time()
+        self.async_run_with_timeout(run_requests())
+        elapsed = time.time() - start
+
+        self.assertEqual([f"task_{i}" for i in range(5)], completed)
+        # Two tasks every 0.2 seconds
+        self.assertGreaterEqual(elapsed, 0.4)
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(0, len(self.throttler._waiters))
+
+    def test_waiting_task_does_not_block_tasks_for_other_limits(self):
+        completed = []
+
+        async def run_requests():
+            blocked_tasks = [
+                asyncio.ensure_future(self.execute_request(TEST_PATH_URL, completed, f"pool_{i}")) for i in range(3)
+            ]
+            await asyncio.sleep(0.01)
+            await self.execute_request(TEST_OTHER_PATH_URL, completed, "other")
+            await asyncio.gather(*blocked_tasks)
+
+        self.async_run_with_timeout(run_requests())
+
+        self.assertEqual(["pool_0", "pool_1", "other", "pool_2"], completed)
+
+    def test_new_task_queues_behind_waiting_task_sharing_a_limit(self):
+        completed = []
+
+        async def run_requests():
+            heavy_task = asyncio.ensure_future(self.execute_request(TEST_WEIGHTED_TASK_ID, completed, "heavy"))
+            await asyncio.sleep(0)
+            await asyncio.gather(
+                asyncio.ensure_future(self.execute_request(TEST_WEIGHTED_TASK_ID, completed, "second_heavy")),
+                heavy_task,
+            )
+
+        self.async_run_with_timeout(run_requests())
+
+        # Tasks heavier than the pool limit are let through one at a time, once the window is empty
+        self.assertEqual(["heavy", "second_heavy"], completed)
+        self.assertEqual(20, self.throttler._windows[TEST_WEIGHTED_POOL_ID].used_capacity())
+
+    def test_cancelled_waiter_does_not_block_following_tasks(self):
+        completed = []
+
+        async def run_requests():
+            tasks = [
+                asyncio.ensure_future(self.execute_request(TEST_POOL_ID, completed, f"task_{i}")) for i in range(4)
+            ]
+            await asyncio.sleep(0.01)
+            tasks[2].cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        self.async_run_with_timeout(run_requests())
+
+        self.assertEqual(["task_0", "task_1", "task_3"], completed)
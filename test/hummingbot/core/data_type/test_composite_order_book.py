@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import OrderFilledEvent
+
+
+class CompositeOrderBookTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.order_book = CompositeOrderBook()
+        self.order_book.apply_numpy_snapshot(
+            np.array([[10, 1, 1], [9, 2, 1]], dtype=np.float64),
+            np.array([[11, 1, 1], [12, 2, 1]], dtype=np.float64))
+
+    def record_fill(self, trade_type: TradeType, price: float, amount: float):
+        self.order_book.record_filled_order(OrderFilledEvent(
+            timestamp=1,
+            order_id="OID1",
+            trading_pair="COINALPHA-HBOT",
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=price,
+            amount=amount,
+            trade_fee=AddedToCostTradeFee(),
+        ))
+
+    def test_queries_exclude_filled_amounts(self):
+        self.record_fill(TradeType.BUY, 11, 0.5)
+
+        self.assertEqual(12, self.order_book.get_price_for_volume(True, 1).result_price)
+        self.assertEqual((11 * 0.5 + 12 * 0.5), self.order_book.get_vwap_for_volume(True, 1).result_price)
+        self.assertEqual(2.5, self.order_book.get_volume_for_price(True, 12).result_volume)
+        self.assertEqual(11 * 0.5 + 12 * 2, self.order_book.get_quote_volume_for_price(True, 12).result_volume)
+        self.assertEqual(11 * 0.5 + 12 * 0.5, self.order_book.get_quote_volume_for_base_amount(True, 1).result_volume)
+        self.assertEqual(12, self.order_book.get_price_for_quote_volume(True, 6).result_price)
+        # The bids don't have filled orders
+        self.assertEqual(10, self.order_book.get_price_for_volume(False, 1).result_price)
+
+    def test_batched_queries_exclude_filled_amounts(self):
+        self.record_fill(TradeType.SELL, 10, 1)
+
+        prices, vwaps = self.order_book.get_depth_curve(False, [1, 2])
+        self.assertEqual([9, 9], prices.tolist())
+        self.assertEqual([9, 9], vwaps.tolist())
+        volumes, quote_volumes = self.order_book.get_volumes_for_prices(False, [10, 9])
+        self.assertEqual([0, 2], volumes.tolist())
+        self.assertEqual([0, 18], quote_volumes.tolist())
+
+    def test_depth_index_excludes_filled_amounts(self):
+        self.record_fill(TradeType.BUY, 11, 0.5)
+
+        index = self.order_book.get_depth_index(True)
+
+        self.assertEqual([[11, 0.5, 0.5, 5.5], [12, 2, 2.5, 29.5]], index.tolist())
+        self.assertFalse(index.flags.writeable)
@@ -3,6 +3,7 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 import numpy as np
 
 
@@ -50,6 +51,197 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_apply_raw_snapshot_and_diffs(self):
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot(
+            bids=[["1.5", "10", "ignored"], ["1.4", "5"]],
+            asks=[["1.6", "3"], ["1.7", "4"]],
+            update_id=1)
+        self.assertEqual(1.5, order_book.get_price(False))
+        self.assertEqual(1.6, order_book.get_price(True))
+        self.assertEqual(1, order_book.snapshot_uid)
+
+        order_book.apply_raw_diffs(bids=[["1.5", "0"], [1.45, 2.0]], asks=[["1.6", "0.5"]], update_id=2)
+        bids, asks = order_book.snapshot
+        self.assertEqual([[1.45, 2., 2.], [1.4, 5., 1.]], bids.values.tolist())
+        self.assertEqual([[1.6, 0.5, 2.], [1.7, 4., 1.]], asks.values.tolist())
+        self.assertEqual(2, order_book.last_diff_uid)
+
+    def test_apply_diff_message_matches_row_based_diffs(self):
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "update_id": 1,
+            "bids": [["100", "1"], ["99", "2"]],
+            "asks": [["101", "1"], ["102", "2"]],
+        }, timestamp=1)
+        diff = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "update_id": 2,
+            "bids": [["100", "0"], ["99.5", "3"]],
+            "asks": [["101", "4"]],
+        }, timestamp=2)
+        raw_order_book = OrderBook()
+        raw_order_book.apply_snapshot_message(snapshot)
+        raw_order_book.apply_diff_message(diff)
+        row_order_book = OrderBook()
+        row_order_book.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        row_order_book.apply_diffs(diff.bids, diff.asks, diff.update_id)
+
+        for raw_side, row_side in zip(raw_order_book.snapshot, row_order_book.snapshot):
+            self.assertEqual(row_side.values.tolist(), raw_side.values.tolist())
+        self.assertEqual(row_order_book.last_diff_uid, raw_order_book.last_diff_uid)
+
+    def test_apply_diff_messages_keeps_highest_update_id_per_price_level(self):
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot(bids=[["10", "1"], ["9", "1"]], asks=[["11", "1"], ["12", "1"]], update_id=1)
+
+        order_book.apply_diff_messages([
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "update_id": 3, "bids": [["10", "0"]], "asks": [["11", "2"], ["13", "1"]]}, timestamp=3),
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "update_id": 2, "bids": [["10", "5"], ["8", "1"]], "asks": [["11", "0"]]}, timestamp=2),
+        ])
+
+        bids, asks = order_book.snapshot
+        self.assertEqual([[9., 1., 1.], [8., 1., 2.]], bids.values.tolist())
+        self.assertEqual([[11., 2., 3.], [12., 1., 1.], [13., 1., 3.]], asks.values.tolist())
+        self.assertEqual(3, order_book.last_diff_uid)
+        self.assertEqual(9, order_book.get_price(False))
+        self.assertEqual(11, order_book.get_price(True))
+
+    def test_apply_numpy_diffs_tracks_last_update_id(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(
+            np.array([[1, 1, 3], [2, 1, 1]], dtype=np.float64),
+            np.array([[3, 1, 2]], dtype=np.float64))
+        self.assertEqual(3, order_book.snapshot_uid)
+
+        order_book.apply_numpy_diffs(
+            np.array([[2, 0, 7]], dtype=np.float64),
+            np.empty((0, 3), dtype=np.float64))
+        self.assertEqual(7, order_book.last_diff_uid)
+        self.assertEqual(1, order_book.get_price(False))
+
+    def depth_order_book(self) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(
+            np.array([[10 - i * 0.1, 1 + (i % 3) * 0.5, 1] for i in range(20)], dtype=np.float64),
+            np.array([[11 + i * 0.1, 1 + (i % 4) * 0.25, 1] for i in range(20)], dtype=np.float64))
+        return order_book
+
+    def test_queries_walk_the_book(self):
+        order_book = self.depth_order_book()
+
+        self.assertEqual(11.2, order_book.get_price_for_volume(True, 2.5).result_price)
+        self.assertEqual(9.9, order_book.get_price_for_volume(False, 2.5).result_price)
+        self.assertAlmostEqual((11 * 1 + 11.1 * 1.25 + 11.2 * 0.25) / 2.5,
+                               order_book.get_vwap_for_volume(True, 2.5).result_price)
+        self.assertAlmostEqual((10 * 1 + 9.9 * 1.5) / 2.5, order_book.get_vwap_for_volume(False, 2.5).result_price)
+        self.assertEqual(11.1, order_book.get_price_for_quote_volume(True, 20).result_price)
+        self.assertAlmostEqual(11 + 11.1 * 0.5, order_book.get_quote_volume_for_base_amount(True, 1.5).result_volume)
+        self.assertEqual(2.25, order_book.get_volume_for_price(True, 11.15).result_volume)
+        self.assertEqual(11.1, order_book.get_volume_for_price(True, 11.15).result_price)
+        self.assertEqual(2.5, order_book.get_volume_for_price(False, 9.85).result_volume)
+        self.assertAlmostEqual(10 + 9.9 * 1.5, order_book.get_quote_volume_for_price(False, 9.85).result_volume)
+
+    def test_queries_beyond_the_book_depth(self):
+        order_book = self.depth_order_book()
+
+        result = order_book.get_price_for_volume(True, 1000)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(27.5, result.result_volume)
+        self.assertTrue(np.isnan(order_book.get_vwap_for_volume(False, 1000).result_price))
+        self.assertEqual(27.5, order_book.get_volume_for_price(True, 1000).result_volume)
+        self.assertEqual(0, order_book.get_volume_for_price(True, 1).result_volume)
+        self.assertTrue(np.isnan(OrderBook().get_price_for_volume(False, 1).result_price))
+
+    def test_get_depth_curve_matches_single_queries(self):
+        order_book = self.depth_order_book()
+        volumes = [5, 0.5, 2.5, 1000, 1, 27.5, 12.25]
+
+        for is_buy in (True, False):
+            prices, vwaps = order_book.get_depth_curve(is_buy, volumes)
+            for volume, price, vwap in zip(volumes, prices, vwaps):
+                expected_price = order_book.get_price_for_volume(is_buy, volume).result_price
+                expected_vwap = order_book.get_vwap_for_volume(is_buy, volume).result_price
+                if np.isnan(expected_price):
+                    self.assertTrue(np.isnan(price))
+                    self.assertTrue(np.isnan(vwap))
+                else:
+                    self.assertEqual(expected_price, price)
+                    self.assertEqual(expected_vwap, vwap)
+
+    def test_get_volumes_for_prices_matches_single_queries(self):
+        order_book = self.depth_order_book()
+        prices = [11.15, 1, 9.85, 1000, 11, 10, 9.05]
+
+        for is_buy in (True, False):
+            volumes, quote_volumes = order_book.get_volumes_for_prices(is_buy, prices)
+            for price, volume, quote_volume in zip(prices, volumes, quote_volumes):
+                self.assertEqual(order_book.get_volume_for_price(is_buy, price).result_volume, volume)
+                self.assertEqual(order_book.get_quote_volume_for_price(is_buy, price).result_volume, quote_volume)
+
+    def test_batched_queries_on_empty_book(self):
+        prices, vwaps = OrderBook().get_depth_curve(True, [1, 2])
+        self.assertTrue(np.isnan(prices).all())
+        self.assertTrue(np.isnan(vwaps).all())
+        volumes, quote_volumes = OrderBook().get_volumes_for_prices(False, np.array([1.0]))
+        self.assertEqual([0], volumes.tolist())
+        self.assertEqual([0], quote_volumes.tolist())
+
+    def test_depth_index(self):
+        order_book = self.depth_order_book()
+        version = order_book.version
+
+        asks_index = order_book.get_depth_index(True)
+        bids_index = order_book.get_depth_index(False)
+
+        self.assertEqual((20, 4), asks_index.shape)
+        self.assertEqual([11, 1, 1, 11], asks_index[0].tolist())
+        self.assertEqual([11.1, 1.25, 2.25, 11 + 11.1 * 1.25], asks_index[1].tolist())
+        self.assertEqual([9.9, 1.5, 2.5, 10 + 9.9 * 1.5], bids_index[1].tolist())
+        self.assertFalse(asks_index.flags.writeable)
+        self.assertIs(asks_index, order_book.get_depth_index(True))
+
+        order_book.apply_numpy_diffs(np.array([[10, 0, 2]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+
+        self.assertEqual(version + 1, order_book.version)
+        self.assertEqual([9.9, 1.5, 1.5, 9.9 * 1.5], order_book.get_depth_index(False)[0].tolist())
+        # The previous index is not modified
+        self.assertEqual(10, bids_index[0, 0])
+        self.assertEqual((0, 4), OrderBook().get_depth_index(True).shape)
+
+    def test_depth_index_queries_match_book_walks(self):
+        rng = np.random.default_rng(7)
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(
+            np.column_stack([100 - np.arange(1, 301) * 0.01, rng.uniform(0.01, 3, 300), np.ones(300)]),
+            np.column_stack([100 + np.arange(1, 301) * 0.01, rng.uniform(0.01, 3, 300), np.ones(300)]))
+        volumes = np.concatenate([rng.uniform(0, 500, 50), [0.01, 1000]])
+        prices = np.concatenate([rng.uniform(96, 104, 50), [0, 1000]])
+
+        for is_buy in (True, False):
+            order_book.depth_index_enabled = False
+            walks = self.query_results(order_book, is_buy, volumes, prices)
+            order_book.depth_index_enabled = True
+            index_queries = self.query_results(order_book, is_buy, volumes, prices)
+            np.testing.assert_array_equal(walks, index_queries)
+
+    @staticmethod
+    def query_results(order_book: OrderBook, is_buy: bool, volumes: np.ndarray, prices: np.ndarray) -> np.ndarray:
+        results = []
+        for volume in volumes:
+            for result in (order_book.get_price_for_volume(is_buy, volume),
+                           order_book.get_vwap_for_volume(is_buy, volume),
+                           order_book.get_price_for_quote_volume(is_buy, volume * 100),
+                           order_book.get_quote_volume_for_base_amount(is_buy, volume)):
+                results.extend([result.result_price, result.result_volume])
+        for price in prices:
+            for result in (order_book.get_volume_for_price(is_buy, price),
+                           order_book.get_quote_volume_for_price(is_buy, price)):
+                results.extend([result.result_price, result.result_volume])
+        results.extend(np.concatenate(order_book.get_depth_curve(is_buy, volumes)))
+        results.extend(np.concatenate(order_book.get_volumes_for_prices(is_buy, prices)))
+        return np.array(results)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -119,6 +119,42 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertEqual(6, bids[0].amount)
         self.assertEqual(update_id, bids[0].update_id)
 
+    def test_bids_and_asks_are_parsed_once(self):
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "update_id": 1,
+                "asks": [("1", "2")],
+                "bids": [("5", "6")],
+            },
+            timestamp=time.time(),
+        )
+
+        self.assertIs(msg.asks, msg.asks)
+        self.assertIs(msg.bids, msg.bids)
+        self.assertEqual([OrderBookRow(5.0, 6.0, 1)], msg.bids)
+
+    def test_raw_levels(self):
+        content = {
+            "update_id": 1,
+            "asks": [("1", "2")],
+            "bids": [("5", "6")],
+        }
+        msg = OrderBookMessage(message_type=OrderBookMessageType.DIFF, content=content, timestamp=time.time())
+
+        self.assertTrue(msg.has_raw_levels)
+        self.assertIs(content["asks"], msg.raw_asks)
+        self.assertIs(content["bids"], msg.raw_bids)
+
+        class CustomLevelsMessage(OrderBookMessage):
+            @property
+            def bids(self):
+                return []
+
+        msg = CustomLevelsMessage(message_type=OrderBookMessageType.DIFF, content=content, timestamp=time.time())
+
+        self.assertFalse(msg.has_raw_levels)
+
     def test_has_update_id(self):
         update_id = "someId"
 
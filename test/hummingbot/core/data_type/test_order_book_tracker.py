@@ -0,0 +1,176 @@
+import asyncio
+import unittest
+from typing import Awaitable, List
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tracking_task = None
+
+    def tearDown(self) -> None:
+        self.tracking_task and self.tracking_task.cancel()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def create_tracker(self, coalesce_diffs: bool) -> OrderBookTracker:
+        tracker = OrderBookTracker(
+            data_source=MagicMock(), trading_pairs=[self.trading_pair], coalesce_diffs=coalesce_diffs
+        )
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot(bids=[["10", "1"], ["9", "1"]], asks=[["11", "1"], ["12", "1"]], update_id=1)
+        tracker._order_books[self.trading_pair] = order_book
+        tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        return tracker
+
+    def diff_message(self, update_id: int, bids: List[List[str]], asks: List[List[str]]) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=float(update_id),
+        )
+
+    def run_tracking(self, tracker: OrderBookTracker):
+        self.tracking_task = self.ev_loop.create_task(tracker._track_single_book(self.trading_pair))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+    def test_coalescing_mode_produces_same_book_as_sequential_mode(self):
+        messages = [
+            self.diff_message(2, bids=[["10", "5"], ["8", "1"]], asks=[["11", "0"]]),
+            self.diff_message(3, bids=[["10", "0"]], asks=[["11", "2"], ["13", "1"]]),
+            self.diff_message(4, bids=[["9.5", "3"]], asks=[["12", "0"]]),
+        ]
+        books = []
+        for coalesce_diffs in (False, True):
+            tracker = self.create_tracker(coalesce_diffs=coalesce_diffs)
+            for message in messages:
+                tracker._tracking_message_queues[self.trading_pair].put_nowait(message)
+            self.run_tracking(tracker)
+            self.tracking_task.cancel()
+            order_book = tracker.order_books[self.trading_pair]
+            books.append([side.values.tolist() for side in order_book.snapshot])
+            self.assertEqual(4, order_book.last_diff_uid)
+            self.assertEqual(messages, list(tracker._past_diffs_windows[self.trading_pair]))
+
+        self.assertEqual(books[0], books[1])
+
+    def test_coalescing_stops_at_snapshot_message(self):
+        tracker = self.create_tracker(coalesce_diffs=True)
+        queue = tracker._tracking_message_queues[self.trading_pair]
+        queue.put_nowait(self.diff_message(2, bids=[["10", "5"]], asks=[]))
+        queue.put_nowait(self.diff_message(3, bids=[["10", "6"]], asks=[]))
+        queue.put_nowait(OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": self.trading_pair, "update_id": 3, "bids": [["7", "1"]], "asks": [["8", "1"]]},
+            timestamp=3.5,
+        ))
+        queue.put_nowait(self.diff_message(4, bids=[["7.5", "2"]], asks=[]))
+
+        self.run_tracking(tracker)
+
+        order_book = tracker.order_books[self.trading_pair]
+        bids, asks = order_book.snapshot
+        self.assertEqual([[7.5, 2.0, 4.0], [7.0, 1.0, 3.0]], bids.values.tolist())
+        self.assertEqual([[8.0, 1.0, 3.0]], asks.values.tolist())
+        self.assertEqual(3, order_book.snapshot_uid)
+        self.assertEqual(4, order_book.last_diff_uid)
+
+    def test_init_order_books_requests_snapshots_concurrently(self):
+        trading_pairs = ["A-USDT", "B-USDT", "C-USDT"]
+        data_source = MagicMock()
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=trading_pairs)
+        requested_pairs = []
+        release_events = {trading_pair: asyncio.Event() for trading_pair in trading_pairs}
+
+        async def get_new_order_book(trading_pair: str) -> OrderBook:
+            requested_pairs.append(trading_pair)
+            await release_events[trading_pair].wait()
+            return OrderBook()
+
+        data_source.get_new_order_book.side_effect = get_new_order_book
+
+        init_task = self.ev_loop.create_task(tracker._init_order_books())
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        self.assertEqual(trading_pairs, requested_pairs)
+        self.assertEqual([], tracker.ready_trading_pairs)
+
+        release_events["B-USDT"].set()
+        self.async_run_with_timeout(tracker.wait_order_book_ready("B-USDT"))
+
+        self.assertTrue(tracker.is_order_book_ready("B-USDT"))
+        self.assertFalse(tracker.is_order_book_ready("A-USDT"))
+        self.assertEqual(["B-USDT"], tracker.ready_trading_pairs)
+        self.assertIn("B-USDT", tracker.order_books)
+        self.assertFalse(tracker.ready)
+
+        release_events["A-USDT"].set()
+        release_events["C-USDT"].set()
+        self.async_run_with_timeout(init_task)
+
+        self.assertTrue(tracker.ready)
+        self.assertEqual(trading_pairs, tracker.ready_trading_pairs)
+        for task in tracker._tracking_tasks.values():
+            task.cancel()
+
+    def test_init_order_books_limits_concurrent_snapshot_requests(self):
+        trading_pairs = [f"TOKEN{i}-USDT" for i in range(5)]
+        data_source = MagicMock()
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=trading_pairs)
+        tracker.MAX_CONCURRENT_SNAPSHOT_REQUESTS = 2
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_new_order_book(trading_pair: str) -> OrderBook:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return OrderBook()
+
+        data_source.get_new_order_book.side_effect = get_new_order_book
+
+        self.async_run_with_timeout(tracker._init_order_books())
+
+        self.assertEqual(2, max_in_flight)
+        self.assertTrue(tracker.ready)
+        for task in tracker._tracking_tasks.values():
+            task.cancel()
+
+    def test_init_order_books_retries_failed_snapshot_requests(self):
+        trading_pairs = ["A-USDT", "B-USDT"]
+        data_source = MagicMock()
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=trading_pairs)
+        tracker.SNAPSHOT_RETRY_INTERVAL = 0
+        requested_pairs = []
+
+        async def get_new_order_book(trading_pair: str) -> OrderBook:
+            requested_pairs.append(trading_pair)
+            if requested_pairs.count("A-USDT") == 1 and trading_pair == "A-USDT":
+                raise IOError("Test error")
+            return OrderBook()
+
+        data_source.get_new_order_book.side_effect = get_new_order_book
+
+        self.async_run_with_timeout(tracker._init_order_books())
+
+        self.assertEqual(["A-USDT", "B-USDT", "A-USDT"], requested_pairs)
+        self.assertTrue(tracker.ready)
+        self.assertEqual(trading_pairs, sorted(tracker.ready_trading_pairs))
+        for task in tracker._tracking_tasks.values():
+            task.cancel()
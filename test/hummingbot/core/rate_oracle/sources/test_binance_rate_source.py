@@ -1,8 +1,10 @@
 import asyncio
 import json
+import re
 import unittest
 from decimal import Decimal
 from typing import Awaitable
+from unittest.mock import patch
 
 from aioresponses import aioresponses
 
@@ -92,8 +94,8 @@ class BinanceRateSourceTest(unittest.TestCase):
         ]
         mock_api.get(pairs_us_url, body=json.dumps(symbols_response))
         mock_api.get(pairs_url, body=json.dumps(symbols_response))
-        mock_api.get(binance_prices_us_url, body=json.dumps(binance_prices_us_response))
-        mock_api.get(binance_prices_global_url, body=json.dumps(binance_prices_global_response))
+        mock_api.get(re.compile(f"^{binance_prices_us_url}"), body=json.dumps(binance_prices_us_response))
+        mock_api.get(re.compile(f"^{binance_prices_global_url}"), body=json.dumps(binance_prices_global_response))
 
     @aioresponses()
     def test_get_binance_prices(self, mock_api):
@@ -107,3 +109,43 @@ class BinanceRateSourceTest(unittest.TestCase):
         self.assertEqual(expected_rate, prices[self.trading_pair])
         self.assertIn(self.us_trading_pair, prices)
         self.assertNotIn(self.ignored_trading_pair, prices)
+
+    @aioresponses()
+    def test_get_binance_prices_for_pairs(self, mock_api):
+        expected_rate = Decimal("10")
+        self.setup_binance_responses(mock_api=mock_api, expected_rate=expected_rate)
+
+        rate_source = BinanceRateSource()
+        prices = self.async_run_with_timeout(rate_source.get_prices_for_pairs([self.trading_pair]))
+
+        self.assertEqual(expected_rate, prices[self.trading_pair])
+        self.assertIn(self.us_trading_pair, prices)
+        requested_symbols = {
+            url.host: json.loads(requests[0].kwargs["params"]["symbols"])
+            for (_, url), requests in mock_api.requests.items()
+            if url.path.endswith(CONSTANTS.TICKER_BOOK_PATH_URL)
+        }
+        # Only the pairs with a token of the trading pair, and only the USD pairs on binance.us
+        self.assertEqual({"api.binance.com": [self.binance_pair, self.binance_us_pair],
+                          "api.binance.us": [self.binance_us_pair]},
+                         requested_symbols)
+
+    @aioresponses()
+    @patch("hummingbot.core.rate_oracle.sources.binance_rate_source.MAX_REQUESTED_SYMBOLS", 1)
+    def test_get_binance_prices_for_pairs_requests_every_price_above_max_requested_symbols(self, mock_api):
+        expected_rate = Decimal("10")
+        self.setup_binance_responses(mock_api=mock_api, expected_rate=expected_rate)
+
+        rate_source = BinanceRateSource()
+        prices = self.async_run_with_timeout(rate_source.get_prices_for_pairs([self.trading_pair]))
+
+        self.assertEqual(expected_rate, prices[self.trading_pair])
+        self.assertIn(self.us_trading_pair, prices)
+        requested_params = {
+            url.host: requests[0].kwargs["params"]
+            for (_, url), requests in mock_api.requests.items()
+            if url.path.endswith(CONSTANTS.TICKER_BOOK_PATH_URL)
+        }
+        # The two symbols of binance.com are over the limit, the single USD symbol of binance.us is not
+        self.assertIsNone(requested_params["api.binance.com"])
+        self.assertEqual([self.binance_us_pair], json.loads(requested_params["api.binance.us"]["symbols"]))
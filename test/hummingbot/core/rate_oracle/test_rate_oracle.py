@@ -2,12 +2,18 @@ import asyncio
 import unittest
 from copy import deepcopy
 from decimal import Decimal
-from typing import Awaitable, Dict, Optional
+from typing import Awaitable, Dict, List, Optional
+from unittest.mock import MagicMock, patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.utils import combine_to_hb_trading_pair
-from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.core.rate_oracle.rate_oracle import (
+    MAX_FETCH_INTERVAL,
+    MIN_FETCH_INTERVAL,
+    PAIR_SUBSCRIPTION_TTL,
+    RateOracle,
+)
 from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGeckoRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.rate_oracle.utils import find_rate
@@ -25,6 +31,16 @@ class DummyRateSource(RateSourceBase):
         return deepcopy(self._price_dict)
 
 
+class DummyPairsRateSource(DummyRateSource):
+    def __init__(self, price_dict: Dict[str, Decimal]):
+        super().__init__(price_dict)
+        self.requested_pairs: List[List[str]] = []
+
+    async def get_prices_for_pairs(self, trading_pairs: List[str], quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        self.requested_pairs.append(trading_pairs)
+        return {pair: price for pair, price in self._price_dict.items() if pair in trading_pairs}
+
+
 class RateOracleTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -101,3 +117,126 @@ class RateOracleTest(unittest.TestCase):
         config_map.global_token.global_token_name = "EUR"
 
         self.assertEqual(0, len(rate_oracle.prices))
+
+    def test_requested_pairs_are_subscribed(self):
+        rate_source = DummyPairsRateSource(price_dict={self.trading_pair: Decimal("10"), "BTC-USDT": Decimal("20000")})
+        rate_oracle = RateOracle(source=rate_source)
+
+        self.assertIsNone(rate_oracle.get_pair_rate(self.trading_pair))
+        self.assertEqual([self.trading_pair], rate_oracle.subscribed_pairs)
+
+        rate = self.async_run_with_timeout(rate_oracle.rate_async("BTC-USDT"))
+
+        self.assertEqual(Decimal("20000"), rate)
+        self.assertEqual([self.trading_pair, "BTC-USDT"], rate_oracle.subscribed_pairs)
+        self.assertEqual([["BTC-USDT"]], rate_source.requested_pairs)
+
+    def test_fetch_prices_of_subscribed_pairs(self):
+        rate_source = DummyPairsRateSource(price_dict={self.trading_pair: Decimal("10"), "BTC-USDT": Decimal("20000")})
+        rate_oracle = RateOracle(source=rate_source)
+
+        self.async_run_with_timeout(rate_oracle._fetch_prices())
+
+        # Without subscriptions every price is fetched
+        self.assertEqual(2, len(rate_oracle.prices))
+        self.assertEqual([], rate_source.requested_pairs)
+
+        rate_oracle.get_pair_rate(self.trading_pair)
+        rate_oracle._prices = {}
+        self.async_run_with_timeout(rate_oracle._fetch_prices())
+
+        self.assertEqual([[self.trading_pair]], rate_source.requested_pairs)
+        self.assertEqual({self.trading_pair: Decimal("10")}, rate_oracle.prices)
+        self.assertEqual(Decimal("10"), rate_oracle.get_pair_rate(self.trading_pair))
+
+    def test_fetch_interval_backs_off_while_rates_do_not_change(self):
+        rate_source = DummyPairsRateSource(price_dict={self.trading_pair: Decimal("10")})
+        rate_oracle = RateOracle(source=rate_source)
+        rate_oracle.get_pair_rate(self.trading_pair, max_fetch_interval=MAX_FETCH_INTERVAL)
+
+        self.async_run_with_timeout(rate_oracle._fetch_prices())
+        self.assertEqual(MIN_FETCH_INTERVAL, rate_oracle._fetch_interval)
+
+        self.async_run_with_timeout(rate_oracle._fetch_prices())
+        self.assertEqual(MIN_FETCH_INTERVAL * 2, rate_oracle._fetch_interval)
+
+        self.async_run_with_timeout(rate_oracle._fetch_prices())
+        self.assertEqual(MIN_FETCH_INTERVAL * 4, rate_oracle._fetch_interval)
+
+        for _ in range(10):
+            self.async_run_with_timeout(rate_oracle._fetch_prices())
+        self.assertEqual(MAX_FETCH_INTERVAL, rate_oracle._fetch_interval)
+
+        rate_source._price_dict[self.trading_pair] = Decimal("11")
+        self.async_run_with_timeout(rate_oracle._fetch_prices())
+        self.assertEqual(MIN_FETCH_INTERVAL, rate_oracle._fetch_interval)
+
+    def test_fetch_interval_backs_off_up_to_smallest_max_fetch_interval(self):
+        rate_source = DummyPairsRateSource(price_dict={self.trading_pair: Decimal("10"), "BTC-USDT": Decimal("20000")})
+        rate_oracle = RateOracle(source=rate_source)
+        rate_oracle.get_pair_rate(self.trading_pair, max_fetch_interval=MAX_FETCH_INTERVAL)
+        rate_oracle.get_pair_rate("BTC-USDT", max_fetch_interval=4)
+
+        for _ in range(10):
+            self.async_run_with_timeout(rate_oracle._fetch_prices())
+        self.assertEqual(4, rate_oracle._fetch_interval)
+
+        # Requested without a max fetch interval, the pair is fetched every MIN_FETCH_INTERVAL
+        rate_oracle._subscription_event.clear()
+        rate_oracle.get_pair_rate(self.trading_pair)
+        self.assertTrue(rate_oracle._subscription_event.is_set())
+        for _ in range(10):
+            self.async_run_with_timeout(rate_oracle._fetch_prices())
+        self.assertEqual(MIN_FETCH_INTERVAL, rate_oracle._fetch_interval)
+
+    def test_fetch_interval_does_not_back_off_without_subscriptions(self):
+        rate_oracle = RateOracle(source=DummyPairsRateSource(price_dict={self.trading_pair: Decimal("10")}))
+
+        for _ in range(10):
+            self.async_run_with_timeout(rate_oracle._fetch_prices())
+        self.assertEqual(MIN_FETCH_INTERVAL, rate_oracle._fetch_interval)
+
+    @patch("hummingbot.core.rate_oracle.rate_oracle.time.time")
+    def test_prices_of_expired_subscriptions_dropped(self, time_mock):
+        time_mock.return_value = 1000
+        rate_source = DummyPairsRateSource(price_dict={
+            self.trading_pair: Decimal("10"), "BTC-USDT": Decimal("20000"), "USDT-HBOT": Decimal("2")
+        })
+        rate_oracle = RateOracle(source=rate_source)
+        rate_oracle.get_pair_rate(self.trading_pair)
+        rate_oracle.get_pair_rate("BTC-USDT", max_fetch_interval=MAX_FETCH_INTERVAL)
+        self.async_run_with_timeout(rate_oracle._fetch_prices())
+        rate_oracle._prices["USDT-HBOT"] = Decimal("2")
+
+        self.assertEqual(3, len(rate_oracle.prices))
+
+        time_mock.return_value = 1000 + PAIR_SUBSCRIPTION_TTL / 2
+        rate_oracle.get_pair_rate("BTC-USDT")
+        time_mock.return_value = 1000 + PAIR_SUBSCRIPTION_TTL + 1
+        self.async_run_with_timeout(rate_oracle._fetch_prices())
+
+        self.assertEqual(["BTC-USDT"], rate_oracle.subscribed_pairs)
+        # The subscription with the max fetch interval expired, the one without it didn't
+        self.assertEqual(MIN_FETCH_INTERVAL, rate_oracle._max_fetch_interval())
+        # USDT-HBOT shares USDT with BTC-USDT
+        self.assertEqual({"BTC-USDT": Decimal("20000"), "USDT-HBOT": Decimal("2")}, rate_oracle.prices)
+
+    def test_rate_from_connector_order_books(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+        rate_oracle._prices = {"COINALPHA-USDT": Decimal("9")}
+        order_book = MagicMock()
+        order_book.get_price.side_effect = lambda is_buy: 10.5 if is_buy else 9.5
+        empty_order_book = MagicMock()
+        empty_order_book.get_price.side_effect = EnvironmentError("Order book is empty - no price quote is possible.")
+        connector = MagicMock()
+        connector.order_books = {"COINALPHA-USDT": order_book, "USDT-HBOT": empty_order_book}
+        rate_oracle.connectors = [connector]
+
+        self.assertEqual(Decimal("9"), rate_oracle.get_pair_rate("COINALPHA-USDT"))
+
+        rate_oracle.use_connector_prices = True
+
+        self.assertEqual(Decimal("10"), rate_oracle.get_pair_rate("COINALPHA-USDT"))
+        self.assertEqual(Decimal("0.1"), rate_oracle.get_pair_rate("USDT-COINALPHA"))
+        # Not priced by the connectors
+        self.assertIsNone(rate_oracle.get_pair_rate("COINALPHA-HBOT"))
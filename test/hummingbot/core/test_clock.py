@@ -4,12 +4,32 @@ import pandas as pd
 import time
 
 from hummingbot.core.clock import (
+    ORDER_EVENTS,
     Clock,
     ClockMode
 )
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent
+from hummingbot.core.py_time_iterator import PyTimeIterator
+from hummingbot.core.pubsub import PubSub
 from hummingbot.core.time_iterator import TimeIterator
 
 
+class TickRecorder(PyTimeIterator):
+    def __init__(self):
+        super().__init__()
+        self.ticks = []
+
+    def tick(self, timestamp: float):
+        self.ticks.append(timestamp)
+
+
+class MockConnector(PubSub):
+    def __init__(self):
+        super().__init__()
+        self.order_books = {}
+
+
 class ClockUnitTest(unittest.TestCase):
 
     backtest_start_timestamp: float = pd.Timestamp("2021-01-01", tz="UTC").timestamp()
@@ -124,3 +144,100 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_event_driven_clock_ticks_on_max_idle_interval(self):
+        clock = Clock(ClockMode.EVENT_DRIVEN, tick_size=1.0, min_tick_interval=0.01, max_idle_interval=0.2)
+        recorder = TickRecorder()
+        clock.add_iterator(recorder)
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.7))
+
+        self.assertEqual(0.2, clock.max_idle_interval)
+        self.assertIn(len(recorder.ticks), [3, 4])
+
+    def test_event_driven_clock_ticks_on_best_price_change(self):
+        clock = Clock(ClockMode.EVENT_DRIVEN, tick_size=1.0, min_tick_interval=0.01, max_idle_interval=10)
+        recorder = TickRecorder()
+        clock.add_iterator(recorder)
+        order_book = OrderBook()
+        clock.subscribe_to_order_book(order_book)
+
+        async def update_order_book():
+            await asyncio.sleep(0.05)
+            order_book.apply_raw_snapshot(bids=[["10", "1"]], asks=[["11", "1"]], update_id=1)
+            await asyncio.sleep(0.05)
+            # Same best prices, no tick
+            order_book.apply_raw_diffs(bids=[["9", "1"]], asks=[], update_id=2)
+            await asyncio.sleep(0.05)
+            change_time = time.time()
+            order_book.apply_raw_diffs(bids=[["10.5", "1"]], asks=[], update_id=3)
+            return change_time
+
+        with clock:
+            update_task = self.ev_loop.create_task(update_order_book())
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.3))
+
+        self.assertEqual(2, len(recorder.ticks))
+        self.assertLess(recorder.ticks[1] - update_task.result(), 0.05)
+
+    def test_event_driven_clock_ticks_on_connector_events(self):
+        clock = Clock(ClockMode.EVENT_DRIVEN, tick_size=1.0, min_tick_interval=0.1, max_idle_interval=10)
+        recorder = TickRecorder()
+        clock.add_iterator(recorder)
+        connector = MockConnector()
+        order_book = OrderBook()
+        connector.order_books["COINALPHA-HBOT"] = order_book
+        clock.subscribe_to_connector(connector)
+
+        async def trigger_events():
+            await asyncio.sleep(0.05)
+            connector.trigger_event(MarketEvent.OrderFilled, None)
+            # Changes within the minimum tick interval are handled in a single tick
+            connector.trigger_event(MarketEvent.OrderCancelled, None)
+            order_book.apply_raw_snapshot(bids=[["10", "1"]], asks=[["11", "1"]], update_id=1)
+
+        with clock:
+            self.ev_loop.create_task(trigger_events())
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.4))
+
+        self.assertEqual(1, len(recorder.ticks))
+
+    def test_notify_event_driven_clock(self):
+        clock = Clock(ClockMode.EVENT_DRIVEN, tick_size=1.0, min_tick_interval=0.1, max_idle_interval=10)
+        recorder = TickRecorder()
+        clock.add_iterator(recorder)
+        start = time.time()
+
+        async def notify():
+            await asyncio.sleep(0.01)
+            clock.notify()
+
+        with clock:
+            self.ev_loop.create_task(notify())
+            self.ev_loop.run_until_complete(clock.run_til(start + 0.3))
+
+        self.assertEqual(1, len(recorder.ticks))
+        # The tick waits for the minimum tick interval since the start
+        self.assertGreaterEqual(recorder.ticks[0] - start, 0.1)
+
+    def test_removed_connector_unsubscribed(self):
+        clock = Clock(ClockMode.EVENT_DRIVEN, tick_size=1.0, min_tick_interval=0.01, max_idle_interval=10)
+        connector = TickRecorder()
+        order_book = OrderBook()
+        connector.order_books = {"COINALPHA-HBOT": order_book}
+        clock.add_iterator(connector)
+        clock.subscribe_to_connector(connector)
+        self.assertEqual(1, len(connector.get_listeners(MarketEvent.OrderFilled)))
+        self.assertEqual(1, len(order_book.get_listeners(OrderBookEvent.BestPriceChangeEvent)))
+
+        clock.remove_iterator(connector)
+
+        for event in ORDER_EVENTS:
+            self.assertEqual(0, len(connector.get_listeners(event)))
+        self.assertEqual(0, len(order_book.get_listeners(OrderBookEvent.BestPriceChangeEvent)))
+
+        # The connector can be subscribed again once added back
+        clock.add_iterator(connector)
+        clock.subscribe_to_connector(connector)
+        self.assertEqual(1, len(order_book.get_listeners(OrderBookEvent.BestPriceChangeEvent)))
@@ -0,0 +1,39 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+
+
+class CandlesBaseTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=3)
+        for i in range(4):
+            self.data_feed._candles.append(np.arange(10, dtype=float) + i)
+
+    def test_candles_df_can_be_modified(self):
+        candles_df = self.data_feed.candles_df
+        candles_df["close"] = 0.0
+        candles_df["signal"] = 1
+
+        candles_df = self.data_feed.candles_df
+        self.assertEqual(self.data_feed.columns, list(candles_df.columns))
+        self.assertEqual([5.0, 6.0, 7.0], candles_df["close"].tolist())
+
+    def test_candles_df_follows_candles_updates(self):
+        self.assertEqual(3, len(self.data_feed.candles_df))
+
+        self.data_feed._candles.update_last(np.arange(10, dtype=float) * 10)
+        self.assertEqual([5.0, 6.0, 40.0], self.data_feed.candles_df["close"].tolist())
+
+        self.data_feed._candles.append(np.arange(10, dtype=float) + 4)
+        self.assertEqual([6.0, 40.0, 8.0], self.data_feed.candles_df["close"].tolist())
+        self.assertEqual([40.0, 8.0], self.data_feed.get_candles_df(1)["close"].tolist())
+
+    def test_candles_array_and_columns(self):
+        np.testing.assert_array_equal(self.data_feed.candles_df.values, self.data_feed.candles_array)
+        np.testing.assert_array_equal([5.0, 6.0, 7.0], self.data_feed.get_column("close"))
+        np.testing.assert_array_equal(np.arange(10, dtype=float) + 3, self.data_feed.last_candle)
+        self.assertEqual(3.0, self.data_feed.last_candle_timestamp)
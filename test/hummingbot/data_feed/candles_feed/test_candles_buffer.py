@@ -0,0 +1,108 @@
+import unittest
+from collections import deque
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+
+
+class CandlesBufferTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.buffer = CandlesBuffer(n_columns=2, maxlen=3)
+
+    @staticmethod
+    def candle(timestamp: float) -> np.ndarray:
+        return np.array([timestamp, timestamp * 10])
+
+    def assert_candles(self, expected, buffer: CandlesBuffer):
+        expected = np.array(expected, dtype=float).reshape(-1, 2)
+        np.testing.assert_array_equal(expected, buffer.values)
+        np.testing.assert_array_equal(expected, np.array(list(buffer)).reshape(-1, 2))
+
+    def test_append_evicts_first_candle_when_full(self):
+        for i in range(10):
+            self.buffer.append(self.candle(i))
+
+        self.assertEqual(3, len(self.buffer))
+        self.assert_candles([self.candle(7), self.candle(8), self.candle(9)], self.buffer)
+        self.assertEqual(10, self.buffer.version)
+        self.assertEqual(0, self.buffer.rewrites)
+        self.assertEqual(7, self.buffer.evictions)
+
+    def test_index_candles(self):
+        for i in range(5):
+            self.buffer.append(self.candle(i))
+
+        np.testing.assert_array_equal(self.candle(2), self.buffer[0])
+        np.testing.assert_array_equal(self.candle(4), self.buffer[-1])
+        np.testing.assert_array_equal([self.candle(3), self.candle(4)], self.buffer[1:])
+        with self.assertRaises(IndexError):
+            self.buffer[3]
+
+    def test_update_last_candle_in_place(self):
+        self.buffer.append(self.candle(1))
+        self.buffer.append(self.candle(2))
+        self.buffer.update_last([2, 25])
+
+        self.assert_candles([self.candle(1), [2, 25]], self.buffer)
+        self.assertEqual(1, self.buffer.pops)
+        self.assertEqual(0, self.buffer.rewrites)
+
+    def test_pop(self):
+        self.buffer.append(self.candle(1))
+        self.buffer.append(self.candle(2))
+
+        np.testing.assert_array_equal(self.candle(2), self.buffer.pop())
+        self.assert_candles([self.candle(1)], self.buffer)
+        self.assertEqual(1, self.buffer.pops)
+        self.buffer.pop()
+        with self.assertRaises(IndexError):
+            self.buffer.pop()
+
+    def test_extendleft_behaves_as_deque(self):
+        expected = deque(maxlen=3)
+        for i in (5, 6):
+            self.buffer.append(self.candle(i))
+            expected.append(self.candle(i))
+
+        for candles in ([self.candle(4)], np.array([self.candle(3), self.candle(2)])):
+            self.buffer.extendleft(candles)
+            expected.extendleft(candles)
+            self.assert_candles(list(expected), self.buffer)
+        self.buffer.extendleft([])
+        self.assert_candles(list(expected), self.buffer)
+
+        self.assertEqual(3, self.buffer.rewrites)
+
+    def test_string_values_are_parsed(self):
+        self.buffer.append(np.array([1672981200000, "1.5"]))
+
+        self.assertEqual(1672981200000, int(self.buffer[-1][0]))
+        self.assertEqual(1.5, self.buffer[-1][1])
+
+    def test_views_are_read_only_and_follow_updates(self):
+        self.buffer.append(self.candle(1))
+        column = self.buffer.column(1)
+        values = self.buffer.values
+
+        with self.assertRaises(ValueError):
+            column[0] = 0
+        with self.assertRaises(ValueError):
+            values[0, 0] = 0
+        self.buffer.update_last(self.candle(2))
+        self.assertEqual(20, column[0])
+        self.assertTrue(self.buffer.column(0).flags.c_contiguous)
+
+    def test_other_updates_are_rewrites(self):
+        self.buffer.extendleft([self.candle(1), self.candle(0)])
+        self.buffer.appendleft(self.candle(-1))
+        self.buffer[0] = self.candle(3)
+        self.buffer.popleft()
+        self.buffer.clear()
+
+        self.assertEqual(0, len(self.buffer))
+        self.assertEqual(5, self.buffer.version)
+        self.assertEqual(5, self.buffer.rewrites)
+        self.assertEqual(0, self.buffer.evictions)
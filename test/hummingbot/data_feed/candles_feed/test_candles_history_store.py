@@ -0,0 +1,245 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from typing import Awaitable, Optional
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_history_store import CandlesHistoryStore
+
+STEP = 60000
+NOW = 1700000000
+
+
+class CandlesHistoryStoreTests(unittest.TestCase):
+    # the level is required to receive logs from the data source logger
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+        self.store = CandlesHistoryStore(path=self.path)
+        self.store._time = lambda: NOW
+        self.last_closed_timestamp = NOW * 1000 // STEP * STEP - STEP
+        self.data_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=150)
+        self.data_feed.history_store = self.store
+        self.data_feed.fetch_candles = AsyncMock(side_effect=self.fetch_candles)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @staticmethod
+    def candle(timestamp: float) -> np.ndarray:
+        return np.array([timestamp, 1, 2, 0.5, timestamp / STEP, 10, 20, 5, 2, 4], dtype=float)
+
+    async def fetch_candles(self, start_time: Optional[int] = None, end_time: Optional[int] = None,
+                            limit: Optional[int] = 500) -> np.ndarray:
+        step = self.data_feed.candle_timestamp_step
+        first = (start_time + step - 1) // step * step
+        timestamps = range(first, min(end_time, first + (limit - 1) * step) + 1, step)
+        return np.array([self.candle(timestamp) for timestamp in timestamps]).reshape(-1, 10)
+
+    def fetched_ranges(self):
+        return sorted((call.kwargs["start_time"], call.kwargs["end_time"])
+                      for call in self.data_feed.fetch_candles.call_args_list)
+
+    def get_candles(self, start_time: int, end_time: int) -> np.ndarray:
+        return self.async_run_with_timeout(self.store.get_candles(self.data_feed, start_time, end_time))
+
+    def test_missing_candles_are_fetched_in_pages(self):
+        end_time = self.last_closed_timestamp
+        start_time = end_time - 2499 * STEP
+
+        candles = self.get_candles(start_time, end_time)
+
+        np.testing.assert_array_equal(np.arange(start_time, end_time + 1, STEP), candles[:, 0])
+        self.assertEqual([(start_time, start_time + 999 * STEP),
+                          (start_time + 1000 * STEP, start_time + 1999 * STEP),
+                          (start_time + 2000 * STEP, end_time)], self.fetched_ranges())
+        self.assertEqual([(start_time, end_time)], self.store.stored_ranges(self.data_feed))
+        self.assertEqual((10, 2500), self.store.load(self.data_feed).shape)
+
+    def test_stored_candles_are_not_fetched_again(self):
+        end_time = self.last_closed_timestamp
+        start_time = end_time - 99 * STEP
+        self.get_candles(start_time, end_time)
+        self.data_feed.fetch_candles.reset_mock()
+
+        candles = self.get_candles(start_time + 10 * STEP, end_time - 10 * STEP)
+
+        self.data_feed.fetch_candles.assert_not_called()
+        np.testing.assert_array_equal(np.arange(start_time + 10 * STEP, end_time - 10 * STEP + 1, STEP),
+                                      candles[:, 0])
+
+    def test_only_missing_ranges_are_fetched(self):
+        end_time = self.last_closed_timestamp
+        start_time = end_time - 99 * STEP
+        self.get_candles(start_time + 10 * STEP, end_time - 10 * STEP)
+        self.data_feed.fetch_candles.reset_mock()
+
+        candles = self.get_candles(start_time, end_time)
+
+        # The newest stored candle is fetched again, in case it was stored before it was closed
+        self.assertEqual([(start_time, start_time + 9 * STEP), (end_time - 10 * STEP, end_time)],
+                         self.fetched_ranges())
+        np.testing.assert_array_equal([self.candle(timestamp) for timestamp in range(start_time, end_time + 1, STEP)],
+                                      candles)
+        self.assertEqual([(start_time, end_time)], self.store.stored_ranges(self.data_feed))
+
+    def test_range_apart_from_stored_range_is_stored_with_it(self):
+        end_time = self.last_closed_timestamp
+        self.get_candles(end_time - 1099 * STEP, end_time - 1000 * STEP)
+
+        self.get_candles(end_time - 99 * STEP, end_time)
+
+        self.assertEqual([(end_time - 1099 * STEP, end_time - 1000 * STEP), (end_time - 99 * STEP, end_time)],
+                         self.store.stored_ranges(self.data_feed))
+        self.assertEqual((10, 200), self.store.load(self.data_feed).shape)
+        self.data_feed.fetch_candles.reset_mock()
+
+        candles = self.get_candles(end_time - 1049 * STEP, end_time - 50 * STEP)
+
+        # Only the gap between the ranges is fetched, with the last candle of the older range
+        self.assertEqual([(end_time - 1000 * STEP, end_time - 100 * STEP)], self.fetched_ranges())
+        np.testing.assert_array_equal(np.arange(end_time - 1049 * STEP, end_time - 50 * STEP + 1, STEP), candles[:, 0])
+        self.assertEqual([(end_time - 1099 * STEP, end_time)], self.store.stored_ranges(self.data_feed))
+
+    def test_new_candles_do_not_rewrite_the_bigger_chunks(self):
+        end_time = self.last_closed_timestamp
+        self.get_candles(end_time - 999 * STEP, end_time - 8 * STEP)
+        first_chunk = os.path.join(self.store.directory_path(self.data_feed),
+                                   f"{end_time - 999 * STEP}_{end_time - 8 * STEP}.npy")
+        first_chunk_modified = os.stat(first_chunk).st_mtime_ns
+
+        for candle_end in range(end_time - 7 * STEP, end_time + 1, STEP):
+            self.get_candles(end_time - 999 * STEP, candle_end)
+
+        self.assertEqual(first_chunk_modified, os.stat(first_chunk).st_mtime_ns)
+        # The chunks of the new candles are merged together, but not with the bigger chunk
+        self.assertEqual(sorted([os.path.basename(first_chunk), f"{end_time - 8 * STEP}_{end_time}.npy"]),
+                         sorted(os.listdir(self.store.directory_path(self.data_feed))))
+        np.testing.assert_array_equal([self.candle(timestamp) for timestamp in
+                                       range(end_time - 999 * STEP, end_time + 1, STEP)],
+                                      self.get_candles(end_time - 999 * STEP, end_time))
+
+    def test_open_candles_are_not_stored(self):
+        end_time = self.last_closed_timestamp
+
+        candles = self.get_candles(end_time - 9 * STEP, end_time + 10 * STEP)
+
+        self.assertEqual(end_time, candles[-1, 0])
+        self.assertEqual([(end_time - 9 * STEP, end_time)], self.store.stored_ranges(self.data_feed))
+
+    def test_candles_closed_within_the_margin_are_not_stored(self):
+        candle_end = self.last_closed_timestamp + STEP
+        self.store._time = lambda: candle_end / 1000 + CandlesHistoryStore.CLOSED_CANDLE_MARGIN - 1
+
+        self.assertEqual(self.last_closed_timestamp - STEP, self.store.last_closed_candle_timestamp(self.data_feed))
+
+        self.store._time = lambda: candle_end / 1000 + CandlesHistoryStore.CLOSED_CANDLE_MARGIN
+
+        self.assertEqual(self.last_closed_timestamp, self.store.last_closed_candle_timestamp(self.data_feed))
+
+    def test_fill_historical_candles_from_store(self):
+        first_timestamp = self.last_closed_timestamp + STEP
+        self.data_feed._candles.append(self.candle(first_timestamp))
+
+        self.async_run_with_timeout(self.data_feed.fill_historical_candles())
+
+        self.assertTrue(self.data_feed.is_ready)
+        np.testing.assert_array_equal(np.arange(first_timestamp - 149 * STEP, first_timestamp + 1, STEP),
+                                      self.data_feed.get_column("timestamp"))
+        self.assertEqual([(first_timestamp - 149 * STEP, first_timestamp - STEP)],
+                         self.store.stored_ranges(self.data_feed))
+
+    def test_fill_historical_candles_within_the_closed_candle_margin(self):
+        first_timestamp = self.last_closed_timestamp + 2 * STEP
+        # The candle before the first websocket candle is closed, even in the first seconds of the first candle
+        for second in range(CandlesHistoryStore.CLOSED_CANDLE_MARGIN):
+            with self.subTest(second=second):
+                self.store._time = lambda: first_timestamp / 1000 + second
+                self.data_feed._candles.clear()
+                self.data_feed._candles.append(self.candle(first_timestamp))
+
+                self.async_run_with_timeout(self.data_feed.fill_historical_candles())
+
+                self.assertTrue(self.data_feed.is_ready)
+                np.testing.assert_array_equal(np.arange(first_timestamp - 149 * STEP, first_timestamp + 1, STEP),
+                                              self.data_feed.get_column("timestamp"))
+
+    def test_fill_historical_candles_of_one_second_interval(self):
+        self.data_feed = data_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1s", max_records=150)
+        data_feed.history_store = self.store
+        data_feed.fetch_candles = AsyncMock(side_effect=self.fetch_candles)
+        first_timestamp = NOW * 1000
+        self.store._time = lambda: NOW + 0.5
+        data_feed._candles.append(self.candle(first_timestamp))
+
+        self.async_run_with_timeout(data_feed.fill_historical_candles())
+
+        self.assertTrue(data_feed.is_ready)
+        np.testing.assert_array_equal(np.arange(first_timestamp - 149 * 1000, first_timestamp + 1, 1000),
+                                      data_feed.get_column("timestamp"))
+
+    def test_fill_historical_candles_keeps_candles_cleared_while_fetching(self):
+        self.data_feed._candles.append(self.candle(self.last_closed_timestamp + STEP))
+        fetch_candles = self.fetch_candles
+
+        async def fetch_candles_and_clear(**kwargs):
+            self.data_feed._candles.clear()
+            return await fetch_candles(**kwargs)
+
+        self.data_feed.fetch_candles.side_effect = fetch_candles_and_clear
+
+        self.async_run_with_timeout(self.data_feed.fill_historical_candles())
+
+        self.assertEqual(0, len(self.data_feed._candles))
+
+    @patch("hummingbot.data_feed.candles_feed.candles_base.CandlesBase._sleep", new_callable=AsyncMock)
+    def test_fill_historical_candles_gives_up_after_max_attempts(self, sleep_mock):
+        self.data_feed._candles.append(self.candle(self.last_closed_timestamp + STEP))
+        self.data_feed.fetch_candles.side_effect = IOError("Test error")
+
+        self.async_run_with_timeout(self.data_feed.fill_historical_candles())
+
+        self.assertEqual(self.data_feed.HISTORICAL_CANDLES_MAX_ATTEMPTS, self.data_feed.fetch_candles.call_count)
+        self.assertEqual(self.data_feed.HISTORICAL_CANDLES_MAX_ATTEMPTS - 1, sleep_mock.call_count)
+        self.assertEqual(1, len(self.data_feed._candles))
+
+    def test_download_candles_fills_the_candles(self):
+        self.data_feed._candles.append(self.candle(self.last_closed_timestamp + STEP))
+
+        self.async_run_with_timeout(self.data_feed.download_candles())
+
+        self.assertTrue(self.data_feed.is_ready)
+        np.testing.assert_array_equal(np.arange(self.last_closed_timestamp - 149 * STEP,
+                                                self.last_closed_timestamp + 1, STEP),
+                                      self.data_feed.get_column("timestamp"))
+
+    def test_load_candles_from_store(self):
+        self.assertFalse(self.data_feed.load_candles_from_store())
+        end_time = self.last_closed_timestamp
+        self.get_candles(end_time - 199 * STEP, end_time)
+        self.get_candles(end_time - 1199 * STEP, end_time - 1000 * STEP)
+
+        self.assertTrue(self.data_feed.load_candles_from_store())
+
+        np.testing.assert_array_equal(np.arange(end_time - 149 * STEP, end_time + 1, STEP),
+                                      self.data_feed.get_column("timestamp"))
+
+    def test_default_path_is_in_data_path(self):
+        with patch("hummingbot.data_feed.candles_feed.candles_history_store.data_path", return_value=self.path):
+            store = CandlesHistoryStore()
+            self.assertEqual(os.path.join(self.path, "candles_history", "candles_binance_BTC-USDT_1m"),
+                             store.directory_path(self.data_feed))
@@ -0,0 +1,161 @@
+import asyncio
+import json
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import numpy as np
+
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_stream_multiplexer import (
+    CandlesStreamConnection,
+    CandlesStreamMultiplexer,
+)
+
+
+class CandlesStreamMultiplexerTests(unittest.TestCase):
+    # the level is required to receive logs from the data source logger
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mocking_assistant = NetworkMockingAssistant()
+        CandlesStreamMultiplexer._instances.clear()
+        self.btc_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m")
+        self.eth_feed = BinanceSpotCandles(trading_pair="ETH-USDT", interval="1m")
+        self.multiplexer = CandlesStreamMultiplexer.get_instance(self.btc_feed)
+        sleep_patch = patch.object(CandlesStreamConnection, "_sleep", new_callable=AsyncMock)
+        sleep_patch.start()
+        self.addCleanup(sleep_patch.stop)
+        fill_patch = patch.object(BinanceSpotCandles, "fill_historical_candles", new_callable=AsyncMock)
+        fill_patch.start()
+        self.addCleanup(fill_patch.stop)
+
+    def tearDown(self) -> None:
+        for connection in list(self.multiplexer.connections):
+            connection.stop()
+        CandlesStreamMultiplexer._instances.clear()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @staticmethod
+    def kline_message(symbol: str, timestamp: int, close: str):
+        return {
+            "e": "kline",
+            "E": timestamp + 1,
+            "s": symbol,
+            "k": {"t": timestamp, "T": timestamp + 59999, "s": symbol, "i": "1m", "f": 100, "L": 200,
+                  "o": "10", "c": close, "h": "12", "l": "9", "v": "1000", "n": 100, "x": False, "q": "1.0000",
+                  "V": "500", "Q": "0.500", "B": "123456"}
+        }
+
+    def add_message(self, ws, message):
+        self.mocking_assistant.add_websocket_aiohttp_message(websocket_mock=ws, message=json.dumps(message))
+
+    def run_until_delivered(self, ws):
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+    def test_get_instance_by_exchange(self):
+        self.assertIs(self.multiplexer, CandlesStreamMultiplexer.get_instance(self.eth_feed))
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_feeds_share_connection_and_receive_their_candles(self, ws_connect_mock):
+        ws = ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.add_message(ws, {"result": None, "id": 1})
+        self.add_message(ws, self.kline_message("BTCUSDT", 60000, "20000"))
+        self.add_message(ws, self.kline_message("ETHUSDT", 60000, "1500"))
+        self.add_message(ws, self.kline_message("ETHUSDT", 60000, "1600"))
+
+        self.async_run_with_timeout(asyncio.gather(self.btc_feed.start_network(), self.eth_feed.start_network()))
+        self.run_until_delivered(ws)
+
+        self.assertEqual(1, ws_connect_mock.call_count)
+        self.assertEqual(1, len(self.multiplexer.connections))
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(websocket_mock=ws)
+        self.assertEqual([{"method": "SUBSCRIBE", "params": ["btcusdt@kline_1m", "ethusdt@kline_1m"], "id": 1}],
+                         sent_messages)
+        self.assertEqual([20000.0], self.btc_feed.candles_df["close"].tolist())
+        self.assertEqual([1600.0], self.eth_feed.candles_df["close"].tolist())
+        self.assertIs(self.multiplexer.api_factory, self.btc_feed._api_factory)
+        self.assertIs(self.multiplexer.api_factory, self.eth_feed._api_factory)
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_feeds_of_same_channel_subscribe_once(self, ws_connect_mock):
+        ws = ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        other_btc_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m")
+        self.add_message(ws, self.kline_message("BTCUSDT", 60000, "20000"))
+
+        self.multiplexer.add_feed(self.btc_feed)
+        self.multiplexer.add_feed(other_btc_feed)
+        self.run_until_delivered(ws)
+        self.multiplexer.remove_feed(self.btc_feed)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(websocket_mock=ws)
+        self.assertEqual([{"method": "SUBSCRIBE", "params": ["btcusdt@kline_1m"], "id": 1}], sent_messages)
+        self.assertEqual([20000.0], other_btc_feed.candles_df["close"].tolist())
+
+    def test_connections_are_added_when_full(self):
+        self.multiplexer.max_channels_per_connection = 1
+
+        self.multiplexer.add_feed(self.btc_feed)
+        self.multiplexer.add_feed(self.eth_feed)
+
+        self.assertEqual(2, len(self.multiplexer.connections))
+        self.assertEqual([{"btcusdt@kline_1m"}, {"ethusdt@kline_1m"}],
+                         [connection.channels for connection in self.multiplexer.connections])
+
+        self.multiplexer.remove_feed(self.btc_feed)
+
+        self.assertEqual([{"ethusdt@kline_1m"}], [connection.channels for connection in self.multiplexer.connections])
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_removed_feed_is_unsubscribed(self, ws_connect_mock):
+        ws = ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.add_message(ws, {"result": None, "id": 1})
+
+        self.async_run_with_timeout(self.btc_feed.start_network())
+        self.async_run_with_timeout(self.eth_feed.start_network())
+        self.run_until_delivered(ws)
+        self.async_run_with_timeout(self.btc_feed.stop_network())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(websocket_mock=ws)
+        self.assertEqual({"method": "UNSUBSCRIBE", "params": ["btcusdt@kline_1m"], "id": 1}, sent_messages[-1])
+        self.assertEqual([{"ethusdt@kline_1m"}], [connection.channels for connection in self.multiplexer.connections])
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_reconnection_resubscribes_channels_of_the_connection(self, ws_connect_mock):
+        self.multiplexer.max_channels_per_connection = 1
+        btc_ws = self.mocking_assistant.create_websocket_mock()
+        btc_reconnected_ws = self.mocking_assistant.create_websocket_mock()
+        eth_ws = self.mocking_assistant.create_websocket_mock()
+        ws_connect_mock.side_effect = [btc_ws, eth_ws, btc_reconnected_ws]
+        self.add_message(btc_ws, self.kline_message("BTCUSDT", 60000, "20000"))
+        self.add_message(eth_ws, self.kline_message("ETHUSDT", 60000, "1500"))
+
+        self.multiplexer.add_feed(self.btc_feed)
+        self.multiplexer.add_feed(self.eth_feed)
+        self.run_until_delivered(btc_ws)
+        self.run_until_delivered(eth_ws)
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=btc_ws, message=None, message_type=aiohttp.WSMsgType.CLOSE)
+        self.add_message(btc_reconnected_ws, {"result": None, "id": 1})
+        self.run_until_delivered(btc_reconnected_ws)
+
+        self.assertEqual(3, ws_connect_mock.call_count)
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(websocket_mock=btc_reconnected_ws)
+        self.assertEqual([{"method": "SUBSCRIBE", "params": ["btcusdt@kline_1m"], "id": 1}], sent_messages)
+        self.assertEqual(0, len(self.btc_feed.candles_df))
+        np.testing.assert_array_equal([1500.0], self.eth_feed.get_column("close"))
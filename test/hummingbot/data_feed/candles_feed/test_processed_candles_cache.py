@@ -0,0 +1,129 @@
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.processed_candles_cache import ProcessedCandlesCache
+
+
+class ProcessedCandlesCacheTests(unittest.TestCase):
+    window = 5
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.candles = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=20)
+        self.rng = np.random.default_rng(42)
+        self.next_timestamp = 0.0
+        for _ in range(15):
+            self.add_candle()
+        self.process = MagicMock(side_effect=self.rolling_mean)
+
+    @classmethod
+    def rolling_mean(cls, candles_df: pd.DataFrame) -> pd.DataFrame:
+        candles_df["mean"] = candles_df["close"].rolling(cls.window).mean()
+        return candles_df
+
+    def new_candle(self, timestamp: float) -> np.ndarray:
+        close = self.rng.uniform(90, 110)
+        return np.array([timestamp, close, close, close, close, 1.0, close, 1.0, 1.0, close])
+
+    def add_candle(self):
+        self.candles._candles.append(self.new_candle(self.next_timestamp))
+        self.next_timestamp += 60000
+
+    def assert_matches_full_processing(self, processed: pd.DataFrame):
+        expected = self.rolling_mean(self.candles.candles_df)
+        pd.testing.assert_frame_equal(expected, processed, check_exact=False, rtol=1e-12)
+
+    def test_processed_candles_are_kept_until_candles_update(self):
+        cache = ProcessedCandlesCache(self.candles, self.process, lookback=self.window)
+
+        processed = cache.get()
+        self.assertIs(processed, cache.get())
+        self.assertEqual(1, self.process.call_count)
+
+        self.add_candle()
+        self.assertIsNot(processed, cache.get())
+        self.assertEqual(2, self.process.call_count)
+
+    def test_appended_candles_are_processed_incrementally(self):
+        cache = ProcessedCandlesCache(self.candles, self.process, lookback=self.window)
+        cache.get()
+
+        self.add_candle()
+        self.add_candle()
+        processed = cache.get()
+
+        self.assert_matches_full_processing(processed)
+        self.assertEqual({"full_updates": 1, "incremental_updates": 1}, cache.stats)
+        self.assertEqual(self.window + 2, len(self.process.call_args[0][0]))
+
+    def test_updated_last_candle_is_processed_incrementally(self):
+        cache = ProcessedCandlesCache(self.candles, self.process, lookback=self.window)
+        cache.get()
+
+        timestamp = self.candles._candles.pop()[0]
+        self.candles._candles.append(self.new_candle(timestamp))
+        processed = cache.get()
+
+        self.assert_matches_full_processing(processed)
+        self.assertEqual({"full_updates": 1, "incremental_updates": 1}, cache.stats)
+
+    def test_evicted_candles_are_removed_from_processed_candles(self):
+        cache = ProcessedCandlesCache(self.candles, self.process, lookback=self.window)
+        first_processed = cache.get().copy()
+
+        for _ in range(8):
+            self.add_candle()
+        processed = cache.get()
+
+        self.assertEqual(3, self.candles._candles.evictions)
+        # The first candles keep the values processed with the evicted candles
+        expected = self.rolling_mean(self.candles.candles_df)
+        pd.testing.assert_frame_equal(expected.iloc[self.window:], processed.iloc[self.window:],
+                                      check_exact=False, rtol=1e-12)
+        pd.testing.assert_frame_equal(first_processed.iloc[3:3 + self.window].reset_index(drop=True),
+                                      processed.iloc[:self.window])
+        self.assertEqual({"full_updates": 1, "incremental_updates": 1}, cache.stats)
+
+    def test_rewritten_candles_are_processed_entirely(self):
+        cache = ProcessedCandlesCache(self.candles, self.process, lookback=self.window)
+        cache.get()
+
+        self.candles._candles.extendleft([self.new_candle(-60000.0)])
+        processed = cache.get()
+
+        self.assert_matches_full_processing(processed)
+        self.assertEqual({"full_updates": 2, "incremental_updates": 0}, cache.stats)
+
+    def test_candles_are_processed_entirely_without_lookback(self):
+        cache = ProcessedCandlesCache(self.candles, self.process)
+        cache.get()
+
+        self.add_candle()
+        processed = cache.get()
+
+        self.assert_matches_full_processing(processed)
+        self.assertEqual({"full_updates": 2, "incremental_updates": 0}, cache.stats)
+
+    def test_candles_are_processed_entirely_when_fewer_than_lookback_are_unchanged(self):
+        cache = ProcessedCandlesCache(self.candles, self.process, lookback=self.window)
+        cache.get()
+
+        for _ in range(11):
+            self.candles._candles.pop()
+        self.add_candle()
+        processed = cache.get()
+
+        self.assert_matches_full_processing(processed)
+        self.assertEqual({"full_updates": 2, "incremental_updates": 0}, cache.stats)
+
+    def test_clear(self):
+        cache = ProcessedCandlesCache(self.candles, self.process, lookback=self.window)
+        cache.get()
+        cache.clear()
+        cache.get()
+
+        self.assertEqual(2, self.process.call_count)
@@ -0,0 +1,158 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.model.columnar_market_data import ColumnarMarketDataReader, ColumnarMarketDataWriter
+
+# 2024-01-01 23:59:58 UTC
+START_TIMESTAMP = 1704153598.0
+
+
+class ColumnarMarketDataTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root_path = self.tmp_dir.name
+        self.exchange = "binance"
+        self.trading_pair = "COINALPHA-HBOT"
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+        super().tearDown()
+
+    def order_book(self, offset: float) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot(
+            bids=[[str(10 + offset), "1"], [str(9 + offset), "2"], [str(8 + offset), "3"]],
+            asks=[[str(11 + offset), "4"]],
+            update_id=1,
+        )
+        return order_book
+
+    def write_rows(self, writer: ColumnarMarketDataWriter, num_rows: int):
+        for i in range(num_rows):
+            writer.append(START_TIMESTAMP + i, self.exchange, self.trading_pair, self.order_book(offset=i))
+
+    def test_order_book_top_levels(self):
+        bids, asks = self.order_book(offset=0).top_levels(2)
+
+        self.assertEqual([[10, 1], [9, 2]], bids.tolist())
+        self.assertEqual([11, 4], asks[0].tolist())
+        self.assertTrue(np.isnan(asks[1]).all())
+
+    def test_rows_are_buffered_until_chunk_size_or_flush(self):
+        writer = ColumnarMarketDataWriter(self.root_path, depth=2, chunk_size=2)
+        reader = ColumnarMarketDataReader(self.root_path)
+
+        writer.append(START_TIMESTAMP, self.exchange, self.trading_pair, self.order_book(offset=0))
+        self.assertEqual(0, len(reader.read(self.exchange, self.trading_pair)["timestamp"]))
+
+        writer.append(START_TIMESTAMP + 1, self.exchange, self.trading_pair, self.order_book(offset=1))
+        self.assertEqual(2, len(reader.read(self.exchange, self.trading_pair)["timestamp"]))
+
+        writer.append(START_TIMESTAMP + 2, self.exchange, self.trading_pair, self.order_book(offset=2))
+        writer.flush()
+        self.assertEqual(3, len(reader.read(self.exchange, self.trading_pair)["timestamp"]))
+
+    def test_rows_buffered_for_max_buffer_duration(self):
+        writer = ColumnarMarketDataWriter(self.root_path, depth=2, chunk_size=100, max_buffer_duration=60)
+        reader = ColumnarMarketDataReader(self.root_path)
+
+        writer.append(START_TIMESTAMP - 100, self.exchange, self.trading_pair, self.order_book(offset=0))
+        writer.append(START_TIMESTAMP - 50, self.exchange, self.trading_pair, self.order_book(offset=1))
+        self.assertEqual(0, len(reader.read(self.exchange, self.trading_pair)["timestamp"]))
+
+        writer.append(START_TIMESTAMP - 40, self.exchange, self.trading_pair, self.order_book(offset=2))
+        self.assertEqual(3, len(reader.read(self.exchange, self.trading_pair)["timestamp"]))
+
+    def test_chunks_written_in_background(self):
+        writer = ColumnarMarketDataWriter(self.root_path, depth=2, chunk_size=2, write_in_background=True)
+        reader = ColumnarMarketDataReader(self.root_path)
+
+        self.write_rows(writer, 5)
+        writer.flush()
+        self.assertEqual(5, len(reader.read(self.exchange, self.trading_pair)["timestamp"]))
+        self.assertIsNotNone(writer._executor)
+
+        writer.close()
+        self.assertIsNone(writer._executor)
+
+    def test_background_write_errors_raised_by_flush(self):
+        writer = ColumnarMarketDataWriter(self.root_path, depth=2, chunk_size=2, write_in_background=True)
+
+        def failing_write_chunk(*_):
+            raise IOError("Test error")
+
+        writer._write_chunk = failing_write_chunk
+
+        self.write_rows(writer, 2)
+
+        with self.assertRaises(IOError):
+            writer.close()
+        self.assertIsNone(writer._executor)
+
+    def test_depth_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            ColumnarMarketDataWriter(self.root_path, depth=0)
+
+    def test_write_and_read_compressed_chunks_partitioned_by_day(self):
+        writer = ColumnarMarketDataWriter(self.root_path, depth=2)
+        self.write_rows(writer, num_rows=4)
+        writer.flush()
+        reader = ColumnarMarketDataReader(self.root_path)
+
+        self.assertEqual(["2024-01-01", "2024-01-02"], reader.partitions(self.exchange, self.trading_pair))
+        columns = reader.read(self.exchange, self.trading_pair)
+        self.assertEqual([START_TIMESTAMP + i for i in range(4)], columns["timestamp"].tolist())
+        self.assertEqual([10.5, 11.5, 12.5, 13.5], columns["mid_price"].tolist())
+        self.assertEqual([10, 11, 12, 13], columns["best_bid"].tolist())
+        self.assertEqual([11, 12, 13, 14], columns["best_ask"].tolist())
+        self.assertEqual([[10, 9], [11, 10], [12, 11], [13, 12]], columns["bid_price"].tolist())
+        self.assertEqual([[1, 2]] * 4, columns["bid_amount"].tolist())
+        self.assertEqual([4] * 4, columns["ask_amount"][:, 0].tolist())
+        self.assertTrue(np.isnan(columns["ask_price"][:, 1]).all())
+
+    def test_read_time_range(self):
+        writer = ColumnarMarketDataWriter(self.root_path, depth=2, chunk_size=3)
+        self.write_rows(writer, num_rows=6)
+        writer.flush()
+        reader = ColumnarMarketDataReader(self.root_path)
+
+        columns = reader.read(self.exchange, self.trading_pair, start=START_TIMESTAMP + 1, end=START_TIMESTAMP + 4)
+
+        self.assertEqual([START_TIMESTAMP + i for i in range(1, 5)], columns["timestamp"].tolist())
+
+    def test_uncompressed_chunks_are_memory_mapped(self):
+        writer = ColumnarMarketDataWriter(self.root_path, depth=2, compressed=False)
+        self.write_rows(writer, num_rows=2)
+        writer.flush()
+        reader = ColumnarMarketDataReader(self.root_path)
+
+        chunks = list(reader.iter_chunks(self.exchange, self.trading_pair))
+
+        self.assertEqual(1, len(chunks))
+        self.assertIsInstance(chunks[0]["bid_price"], np.memmap)
+        self.assertEqual([[10, 9], [11, 10]], chunks[0]["bid_price"].tolist())
+        self.assertFalse(any(name.startswith(".") for name in os.listdir(
+            os.path.join(self.root_path, self.exchange, self.trading_pair, "2024-01-01"))))
+
+    def test_read_dataframe(self):
+        writer = ColumnarMarketDataWriter(self.root_path, depth=2)
+        self.write_rows(writer, num_rows=2)
+        writer.flush()
+
+        df = ColumnarMarketDataReader(self.root_path).read_dataframe(self.exchange, self.trading_pair)
+
+        self.assertEqual(["timestamp", "mid_price", "best_bid", "best_ask",
+                          "bid_price_0", "bid_price_1", "bid_amount_0", "bid_amount_1",
+                          "ask_price_0", "ask_price_1", "ask_amount_0", "ask_amount_1"], list(df.columns))
+        self.assertEqual([9, 10], df["bid_price_1"].tolist())
+
+    def test_read_unknown_trading_pair_returns_empty_columns(self):
+        reader = ColumnarMarketDataReader(self.root_path)
+
+        self.assertEqual([], reader.partitions(self.exchange, "UNKNOWN-PAIR"))
+        self.assertEqual(0, len(reader.read(self.exchange, "UNKNOWN-PAIR")["timestamp"]))
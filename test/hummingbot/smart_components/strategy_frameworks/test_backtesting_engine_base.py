@@ -2,6 +2,7 @@ import unittest
 from datetime import datetime, timezone
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.smart_components.strategy_frameworks.backtesting_engine_base import BacktestingEngineBase
@@ -92,3 +93,76 @@ class TestBacktestingEngineBase(unittest.TestCase):
         result = self.backtesting_engine.summarize_results(pd.DataFrame())
         self.assertEqual(result["net_pnl"], 0)
         self.assertEqual(result["net_pnl_quote"], 0)
+
+    @staticmethod
+    def get_candles_with_signals(length: int = 500, seed: int = 0) -> pd.DataFrame:
+        rng = np.random.default_rng(seed)
+        return pd.DataFrame({
+            "timestamp": 1672531200000 + np.arange(length) * 60000,
+            "close": 100 * np.exp(np.cumsum(rng.normal(0, 0.002, length))),
+            "signal": rng.choice([-1, 0, 0, 0, 1], length),
+        })
+
+    @staticmethod
+    def get_expected_barrier_touches(df: pd.DataFrame, tp: float, sl: float):
+        take_profit_times = {}
+        stop_loss_times = {}
+        for loc, tl in df.loc[df["signal"] != 0, "tl"].items():
+            path_returns = (df.close[loc:tl] / df.close[loc] - 1) * df.at[loc, "signal"]
+            take_profit = path_returns[path_returns > tp * df.at[loc, "target"]] if tp > 0 else path_returns[:0]
+            stop_loss = path_returns[path_returns < - sl * df.at[loc, "target"]] if sl > 0 else path_returns[:0]
+            take_profit_times[loc] = take_profit.index.min()
+            stop_loss_times[loc] = stop_loss.index.min()
+        return take_profit_times, stop_loss_times
+
+    def test_apply_triple_barrier_method_matches_path_by_path_touches(self):
+        for tp, sl, tl in ((0.004, 0.003, 1800), (0.01, 0, 600), (0, 0.002, 3600)):
+            df = self.backtesting_engine.apply_triple_barrier_method(
+                self.get_candles_with_signals(), tp=tp, sl=sl, tl=tl, trade_cost=0.0006)
+            take_profit_times, stop_loss_times = self.get_expected_barrier_touches(df, tp, sl)
+            events = df[df["signal"] != 0]
+            self.assertTrue(events["take_profit_time"].notna().any() or tp == 0)
+            self.assertTrue(events["stop_loss_time"].notna().any() or sl == 0)
+            for loc, event in events.iterrows():
+                self.assertIs(pd.isna(take_profit_times[loc]), pd.isna(event["take_profit_time"]))
+                self.assertIs(pd.isna(stop_loss_times[loc]), pd.isna(event["stop_loss_time"]))
+                if not pd.isna(take_profit_times[loc]):
+                    self.assertEqual(take_profit_times[loc], event["take_profit_time"])
+                if not pd.isna(stop_loss_times[loc]):
+                    self.assertEqual(stop_loss_times[loc], event["stop_loss_time"])
+                self.assertEqual(min(event[["tl", "take_profit_time", "stop_loss_time"]].dropna()), event["close_time"])
+            self.assertTrue(df.loc[df["signal"] == 0, "take_profit_time"].isna().all())
+
+    def test_get_first_barrier_touches_in_chunks(self):
+        df = self.get_candles_with_signals()
+        close = df["close"].values
+        path_starts = np.flatnonzero(df["signal"].values != 0)
+        path_ends = np.minimum(path_starts + 30, len(close))
+        args = dict(close=close, path_starts=path_starts, path_ends=path_ends,
+                    signals=df["signal"].values[path_starts].astype(float),
+                    take_profit=np.full(len(path_starts), 0.003), stop_loss=np.full(len(path_starts), -0.003))
+        take_profit, stop_loss = self.backtesting_engine.get_first_barrier_touches(**args)
+        chunked_take_profit, chunked_stop_loss = self.backtesting_engine.get_first_barrier_touches(
+            max_chunk_size=45, **args)
+        np.testing.assert_array_equal(take_profit, chunked_take_profit)
+        np.testing.assert_array_equal(stop_loss, chunked_stop_loss)
+        self.assertTrue(np.all((take_profit == -1) | ((take_profit >= path_starts) & (take_profit < path_ends))))
+
+    def test_get_first_barrier_touches_without_events(self):
+        take_profit, stop_loss = self.backtesting_engine.get_first_barrier_touches(
+            close=np.ones(10), path_starts=np.array([], dtype=np.int64), path_ends=np.array([], dtype=np.int64),
+            signals=np.array([]), take_profit=np.array([]), stop_loss=np.array([]))
+        self.assertEqual(0, len(take_profit))
+        self.assertEqual(0, len(stop_loss))
+
+    def test_apply_cooldown(self):
+        timestamps = pd.date_range("2023-01-01", periods=10, freq="1min").values
+        close_times = timestamps + np.timedelta64(150, "s")
+        selected = self.backtesting_engine.apply_cooldown(
+            close_times, timestamps, np.timedelta64(60, "s"), pd.Timestamp.min.to_datetime64())
+        # Each executor closes 2.5 minutes after it starts and the next one starts 1 minute after that
+        np.testing.assert_array_equal([0, 4, 8], selected)
+
+        selected = self.backtesting_engine.apply_cooldown(
+            close_times, timestamps, np.timedelta64(0, "s"), timestamps[5])
+        np.testing.assert_array_equal([5, 8], selected)
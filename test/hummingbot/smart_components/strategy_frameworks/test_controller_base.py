@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import MagicMock
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
@@ -44,8 +45,7 @@ class TestControllerBase(unittest.TestCase):
         mock_candle.name = "binance_BTC-USDT"
         mock_candle._trading_pair = "BTC-USDT"
         mock_candle.interval = "1m"
-        mock_candle.candles_df = pd.DataFrame({"close": [100.0, 200.0, 300.0],
-                                               "open": [100.0, 200.0, 300.0]})
+        mock_candle.last_candle = np.array([1000.0, 300.0, 300.0, 300.0, 300.0, 1.0, 300.0, 1.0, 1.0, 300.0])
         self.controller.candles = [mock_candle]
         close_price = self.controller.get_close_price("BTC-USDT")
         self.assertEqual(close_price, 300)
@@ -90,3 +90,36 @@ class TestControllerBase(unittest.TestCase):
     def test_to_format_status(self):
         status = self.controller.to_format_status()
         self.assertEqual("     id: test", status[1])
+
+    def test_get_processed_data_is_cached_until_candles_update(self):
+        candles = self.controller.candles[0]
+        for i in range(3):
+            candles._candles.append([i * 60000.0, 100.0, 100.0, 100.0, 100.0 + i, 1.0, 100.0, 1.0, 1.0, 100.0])
+        process_candles = MagicMock(side_effect=lambda df: df.assign(signal=df["close"] > 100))
+        self.controller.process_candles = process_candles
+
+        first = self.controller.get_processed_data()
+        self.assertIs(first, self.controller.get_processed_data())
+        self.assertEqual(1, process_candles.call_count)
+
+        candles._candles.append([180000.0, 100.0, 100.0, 100.0, 99.0, 1.0, 100.0, 1.0, 1.0, 100.0])
+        processed = self.controller.get_processed_data()
+        self.assertEqual(2, process_candles.call_count)
+        self.assertEqual([False, True, True, False], processed["signal"].tolist())
+        pd.testing.assert_series_equal(candles.candles_df["close"], processed["close"])
+
+    def test_load_historical_data_from_csv_or_store(self):
+        csv_candle = MagicMock()
+        stored_candle = MagicMock()
+        stored_candle.load_candles_from_csv.side_effect = FileNotFoundError
+        stored_candle.load_candles_from_store.return_value = True
+        self.controller.candles = [csv_candle, stored_candle]
+
+        self.controller.load_historical_data(data_path="data")
+
+        csv_candle.load_candles_from_store.assert_not_called()
+        stored_candle.load_candles_from_store.assert_called_once()
+
+        stored_candle.load_candles_from_store.return_value = False
+        with self.assertRaises(FileNotFoundError):
+            self.controller.load_historical_data(data_path="data")
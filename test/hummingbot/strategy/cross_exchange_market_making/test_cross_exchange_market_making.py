@@ -4,7 +4,7 @@ from copy import deepcopy
 from decimal import Decimal
 from math import ceil, floor
 from typing import Awaitable, List
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pandas as pd
 
@@ -1051,3 +1051,181 @@ class HedgedMarketMakingUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("1.006"), ask_order.price)
         self.assertAlmostEqual(Decimal("1"), round(bid_order.quantity, 4))
         self.assertAlmostEqual(Decimal("1"), round(ask_order.quantity, 4))
+
+    def create_concurrent_strategy(self) -> CrossExchangeMarketMakingStrategy:
+        other_maker_market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        other_taker_market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        self.independent_market_pair = MakerTakerMarketPair(
+            MarketTradingPairTuple(other_maker_market, "HBOT-USDT", "HBOT", "USDT"),
+            MarketTradingPairTuple(other_taker_market, "HBOT-USDC", "HBOT", "USDC"),
+        )
+        # Shares the ETH balance of the taker market with the first market pair
+        self.dependent_market_pair = MakerTakerMarketPair(
+            MarketTradingPairTuple(other_maker_market, "ZRX-DAI", "ZRX", "DAI"),
+            MarketTradingPairTuple(self.taker_market, "ZRX-ETH", "ZRX", "ETH"),
+        )
+        strategy = CrossExchangeMarketMakingStrategy()
+        strategy.init_params(
+            config_map=self.config_map,
+            market_pairs=[self.market_pair, self.independent_market_pair, self.dependent_market_pair],
+            logging_options=self.logging_options,
+            concurrent_market_pairs=True,
+        )
+        strategy._last_conv_rates_logged = self.start_timestamp
+        return strategy
+
+    def test_get_independent_market_pair_groups(self):
+        strategy = self.create_concurrent_strategy()
+
+        groups = strategy.get_independent_market_pair_groups(
+            [self.market_pair, self.independent_market_pair, self.dependent_market_pair])
+
+        self.assertEqual([[self.independent_market_pair], [self.market_pair, self.dependent_market_pair]], groups)
+
+    def test_concurrent_market_pairs_processing(self):
+        strategy = self.create_concurrent_strategy()
+        processed_market_pairs = []
+        running_market_pairs = []
+        max_running_market_pairs = []
+
+        async def process_market_pair(timestamp, market_pair, active_orders):
+            running_market_pairs.append(market_pair)
+            max_running_market_pairs.append(len(running_market_pairs))
+            await asyncio.sleep(0.01)
+            running_market_pairs.remove(market_pair)
+            processed_market_pairs.append(market_pair)
+
+        strategy.process_market_pair = process_market_pair
+        self.async_run_with_timeout(strategy.main(self.start_timestamp))
+
+        self.assertEqual(2, max(max_running_market_pairs))
+        self.assertEqual(3, len(processed_market_pairs))
+        # The pairs sharing a balance are processed one after the other
+        self.assertLess(processed_market_pairs.index(self.market_pair),
+                        processed_market_pairs.index(self.dependent_market_pair))
+
+    def test_only_ready_market_pairs_processed_while_markets_initialize(self):
+        class InitializingExchange(MockPaperExchange):
+            def is_trading_pair_ready(self, trading_pair: str) -> bool:
+                return trading_pair != "ZRX-DAI"
+
+        initializing_market = InitializingExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        ready_market_pair = MakerTakerMarketPair(
+            MarketTradingPairTuple(initializing_market, "HBOT-USDT", "HBOT", "USDT"),
+            MarketTradingPairTuple(self.taker_market, "HBOT-ETH", "HBOT", "ETH"),
+        )
+        initializing_market_pair = MakerTakerMarketPair(
+            MarketTradingPairTuple(initializing_market, "ZRX-DAI", "ZRX", "DAI"),
+            MarketTradingPairTuple(self.taker_market, "ZRX-ETH", "ZRX", "ETH"),
+        )
+        for concurrent_market_pairs in (False, True):
+            strategy = CrossExchangeMarketMakingStrategy()
+            strategy.init_params(
+                config_map=self.config_map,
+                market_pairs=[self.market_pair, ready_market_pair, initializing_market_pair],
+                logging_options=self.logging_options,
+                concurrent_market_pairs=concurrent_market_pairs,
+            )
+            strategy._last_conv_rates_logged = self.start_timestamp
+            processed_market_pairs = []
+
+            async def process_market_pair(timestamp, market_pair, active_orders):
+                processed_market_pairs.append(market_pair)
+
+            strategy.process_market_pair = process_market_pair
+            self.assertEqual([self.market_pair, ready_market_pair], strategy.ready_market_pairs)
+
+            self.async_run_with_timeout(strategy.main(self.start_timestamp))
+
+            self.assertEqual([self.market_pair, ready_market_pair], processed_market_pairs)
+
+            strategy._all_markets_ready = True
+            self.assertEqual([self.market_pair, ready_market_pair, initializing_market_pair],
+                             strategy.ready_market_pairs)
+
+    def test_concurrent_market_pairs_skip_hedging_pair_and_isolate_errors(self):
+        strategy = self.create_concurrent_strategy()
+        strategy._market_pair_tracker.start_tracking_order_id(
+            "taker_order", self.independent_market_pair.taker.market, self.independent_market_pair)
+        strategy._ongoing_hedging[("trade_id",)] = "taker_order"
+        processed_market_pairs = []
+
+        async def process_market_pair(timestamp, market_pair, active_orders):
+            if market_pair is self.market_pair:
+                raise IOError("Test error")
+            processed_market_pairs.append(market_pair)
+
+        strategy.process_market_pair = process_market_pair
+        with self.assertLogs(strategy.logger().name, level="ERROR") as logs:
+            self.async_run_with_timeout(strategy.main(self.start_timestamp))
+
+        self.assertTrue(strategy.has_ongoing_hedging(self.independent_market_pair))
+        self.assertFalse(strategy.has_ongoing_hedging(self.market_pair))
+        self.assertEqual([self.dependent_market_pair], processed_market_pairs)
+        self.assertIn("Unexpected error processing the COINALPHA-WETH market pair.", logs.output[0])
+
+    def test_concurrent_market_pairs_sharing_balances_with_hedging_pair_not_processed(self):
+        strategy = self.create_concurrent_strategy()
+        strategy._market_pair_tracker.start_tracking_order_id(
+            "taker_order", self.market_pair.taker.market, self.market_pair)
+        strategy._ongoing_hedging[("trade_id",)] = "taker_order"
+        processed_market_pairs = []
+
+        async def process_market_pair(timestamp, market_pair, active_orders):
+            processed_market_pairs.append(market_pair)
+
+        strategy.process_market_pair = process_market_pair
+        self.async_run_with_timeout(strategy.main(self.start_timestamp))
+
+        self.assertFalse(strategy.ready_for_new_trades())
+        self.assertFalse(strategy.ready_for_new_trades([self.market_pair, self.dependent_market_pair]))
+        self.assertTrue(strategy.ready_for_new_trades([self.independent_market_pair]))
+        self.assertEqual([self.independent_market_pair], processed_market_pairs)
+
+    def test_unhedged_fill_records_updated_with_ongoing_hedging(self):
+        self.strategy.check_and_hedge_orders = AsyncMock()
+        self.strategy._market_pair_tracker.start_tracking_order_id("maker_order", self.maker_market, self.market_pair)
+        self.strategy._market_pair_tracker.start_tracking_order_id("taker_order", self.taker_market, self.market_pair)
+        fill_events = [
+            OrderFilledEvent(self.start_timestamp, "maker_order", self.trading_pairs_maker[0], TradeType.BUY,
+                             OrderType.LIMIT, Decimal("1"), Decimal("1"), AddedToCostTradeFee(), f"trade_{i}")
+            for i in range(3)
+        ]
+        for fill_event in fill_events:
+            self.async_run_with_timeout(self.strategy.hedge_filled_maker_order("maker_order", fill_event))
+        fill_records = self.strategy.get_unhedged_buy_records(self.market_pair)
+
+        self.assertEqual(fill_events, [fill_event for _, fill_event in fill_records])
+        self.assertEqual([], self.strategy.get_unhedged_sell_records(self.market_pair))
+
+        self.strategy.set_ongoing_hedging(fill_records[:2], "taker_order")
+
+        self.assertEqual(fill_records[2:], self.strategy.get_unhedged_buy_records(self.market_pair))
+        self.assertTrue(self.strategy.is_fill_event_in_ongoing_hedging(fill_records[0]))
+        self.assertFalse(self.strategy.is_fill_event_in_ongoing_hedging(fill_records[2]))
+
+        self.strategy.del_order_from_ongoing_hedging("taker_order")
+
+        self.assertFalse(self.strategy.is_fill_event_in_ongoing_hedging(fill_records[0]))
+        self.assertTrue(self.strategy.ready_for_new_trades())
+
+    def test_unhedged_fill_records_with_empty_exchange_trade_id(self):
+        self.strategy.check_and_hedge_orders = AsyncMock()
+        self.strategy._market_pair_tracker.start_tracking_order_id("maker_order", self.maker_market, self.market_pair)
+        self.strategy._market_pair_tracker.start_tracking_order_id("taker_order", self.taker_market, self.market_pair)
+        fill_events = [
+            OrderFilledEvent(self.start_timestamp, "maker_order", self.trading_pairs_maker[0], TradeType.BUY,
+                             OrderType.LIMIT, Decimal("1"), Decimal("1"), AddedToCostTradeFee())
+            for _ in range(2)
+        ]
+        for fill_event in fill_events:
+            self.async_run_with_timeout(self.strategy.hedge_filled_maker_order("maker_order", fill_event))
+        fill_records = self.strategy.get_unhedged_buy_records(self.market_pair)
+
+        self.assertEqual(2, len(fill_records))
+
+        self.strategy.set_ongoing_hedging(fill_records[:1], "taker_order")
+
+        self.assertEqual(fill_records[1:], self.strategy.get_unhedged_buy_records(self.market_pair))
+        self.assertTrue(self.strategy.is_fill_event_in_ongoing_hedging(fill_records[0]))
+        self.assertFalse(self.strategy.is_fill_event_in_ongoing_hedging(fill_records[1]))
@@ -1246,3 +1246,38 @@ class HedgedMarketMakingUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("1.056"), ask_order.price)
         self.assertAlmostEqual(Decimal("1"), round(bid_order.quantity, 4))
         self.assertAlmostEqual(Decimal("1"), round(ask_order.quantity, 4))
+
+    @patch("hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making."
+           "CrossExchangeMarketMakingStrategy.is_gateway_market", return_value=True)
+    def test_gateway_quotes_fetched_concurrently(self, _: unittest.mock.Mock):
+        other_market_pair = MakerTakerMarketPair(
+            MarketTradingPairTuple(self.maker_market, "HBOT-USDT", "HBOT", "USDT"),
+            MarketTradingPairTuple(self.taker_market, "WHBOT-USDC", "WHBOT", "USDC"),
+        )
+        self.taker_market.set_prices("WHBOT-USDC", True, 2.1)
+        self.taker_market.set_prices("WHBOT-USDC", False, 1.9)
+        strategy = CrossExchangeMarketMakingStrategy()
+        strategy.init_params(
+            config_map=self.config_map,
+            market_pairs=[self.market_pair, other_market_pair],
+            logging_options=self.logging_options
+        )
+        running_requests = []
+        max_running_requests = []
+        quote_price = self.taker_market.get_quote_price
+
+        async def delayed_order_price(trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+            running_requests.append(is_buy)
+            max_running_requests.append(len(running_requests))
+            await asyncio.sleep(0.01)
+            running_requests.remove(is_buy)
+            if trading_pair == "WHBOT-USDC" and not is_buy:
+                raise IOError("Test error")
+            return await quote_price(trading_pair, is_buy, amount)
+
+        with patch.object(self.taker_market, "get_order_price", side_effect=delayed_order_price):
+            self.async_run_with_timeout(strategy.get_gateway_quotes())
+
+        self.assertEqual(4, max(max_running_requests))
+        self.assertEqual((Decimal("1.05"), Decimal("0.95")), strategy.get_last_taker_prices(self.market_pair))
+        self.assertEqual((Decimal("2.1"), None), strategy.get_last_taker_prices(other_market_pair))
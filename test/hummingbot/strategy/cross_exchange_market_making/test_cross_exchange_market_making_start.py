@@ -58,3 +58,9 @@ class XEMMStartTest(unittest.TestCase):
         strategy_start.start(self)
         self.assertEqual(self.strategy.order_amount, Decimal("1"))
         self.assertEqual(self.strategy.min_profitability, Decimal("0.02"))
+        self.assertFalse(self.strategy.concurrent_market_pairs)
+
+    def test_strategy_creation_with_concurrent_market_pairs(self):
+        self.strategy_config_map.concurrent_market_pairs = "Yes"
+        strategy_start.start(self)
+        self.assertTrue(self.strategy.concurrent_market_pairs)
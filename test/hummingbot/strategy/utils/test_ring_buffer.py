@@ -107,3 +107,68 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_numpy_view(self):
+        buffer = RingBuffer(3)
+        self.assertEqual(buffer.get_as_numpy_view().size, 0)
+
+        for i in range(5):
+            buffer.add_value(i)
+
+        view = buffer.get_as_numpy_view()
+        self.assertTrue(np.array_equal(view, np.array([2, 3, 4])))
+        self.assertFalse(view.flags.writeable)
+        self.assertTrue(view.flags.c_contiguous)
+        self.assertEqual(2, buffer.get_first_value())
+        self.assertEqual(3, len(buffer))
+
+    def test_running_statistics_before_full(self):
+        self.assertTrue(np.isnan(self.buffer.running_mean))
+        self.assertTrue(np.isnan(self.buffer.running_variance))
+        for value in [1, 2, 3, 4]:
+            self.buffer.add_value(value)
+
+        self.assertAlmostEqual(2.5, self.buffer.running_mean)
+        self.assertAlmostEqual(1.25, self.buffer.running_variance)
+        self.assertTrue(np.isnan(self.buffer.mean_value))
+
+    def test_running_statistics_match_numpy(self):
+        np.random.seed(123)
+        values = np.random.normal(1e4, 10, self.BUFFER_LENGTH * 10)
+        for value in values:
+            self.buffer.add_value(value)
+            window = self.buffer.get_as_numpy_array()
+            self.assertAlmostEqual(np.mean(window), self.buffer.running_mean, 8)
+            self.assertAlmostEqual(np.var(window), self.buffer.running_variance, 6)
+        self.assertAlmostEqual(np.std(values[-self.BUFFER_LENGTH:]), self.buffer.std_dev, 8)
+
+    def test_non_finite_values_leave_the_statistics(self):
+        self.fill_buffer_with_zeros()
+        self.buffer.add_value(np.nan)
+        self.assertTrue(np.isnan(self.buffer.mean_value))
+
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(2 * ((-1) ** i))
+        self.assertEqual(0, self.buffer.mean_value)
+        self.assertEqual(4, self.buffer.variance)
+
+    def test_large_buffer(self):
+        length = 100_000
+        buffer = RingBuffer(length)
+        for i in range(length + 10):
+            buffer.add_value(i)
+
+        self.assertTrue(buffer.is_full)
+        self.assertEqual(10, buffer.get_first_value())
+        self.assertEqual(length + 9, buffer.get_last_value())
+        self.assertTrue(np.array_equal(np.arange(10, length + 10), buffer.get_as_numpy_array()))
+        self.assertAlmostEqual(np.mean(np.arange(10, length + 10)), buffer.mean_value)
+
+    def test_change_length(self):
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(i)
+
+        self.buffer.length = 5
+
+        self.assertTrue(np.array_equal(np.arange(25, 30), self.buffer.get_as_numpy_array()))
+        self.assertEqual(27, self.buffer.mean_value)
@@ -66,3 +66,13 @@ class HistoricalVolatilityTest(unittest.TestCase):
         energy_smoothed = sum(x ** 2 for x in np.diff(output_smoothed))
 
         self.assertGreater(energy_normal, energy_smoothed)
+
+    def test_calculate_volatility_matches_window_log_returns(self):
+        samples = 100 * np.exp(np.cumsum(np.random.normal(0, 0.1, 100)))
+        self.indicator = HistoricalVolatilityIndicator(20, 1)
+
+        for i, sample in enumerate(samples):
+            self.indicator.add_sample(sample)
+            window = samples[max(0, i - 19):i + 1]
+            if window.size > 1:
+                self.assertAlmostEqual(np.std(np.diff(np.log(window))), self.indicator.current_value, 10)
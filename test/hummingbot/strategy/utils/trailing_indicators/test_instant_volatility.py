@@ -20,3 +20,16 @@ class InstantVolatilityTest(unittest.TestCase):
             self.indicator.add_sample(sample)
 
         self.assertAlmostEqual(self.indicator.current_value, 14.068197250366211, 4)
+
+    def test_change_sampling_length(self):
+        samples = np.random.normal(100, 10, 100)
+        self.indicator = InstantVolatilityIndicator(50, 1)
+        for sample in samples:
+            self.indicator.add_sample(sample)
+
+        self.indicator.sampling_length = 10
+        self.indicator.add_sample(samples[-1])
+
+        window = np.append(samples[-9:], samples[-1])
+        expected = np.sqrt(np.sum(np.square(np.diff(window))) / window.size)
+        self.assertAlmostEqual(expected, self.indicator.current_value, 8)
@@ -4,6 +4,7 @@ from decimal import Decimal
 
 import numpy as np
 import pandas as pd
+from scipy.optimize import curve_fit
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -13,7 +14,10 @@ from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import (
+    TradingIntensityIndicator,
+    fit_exponential_decay,
+)
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate import OrderBookAssetPriceDelegate
 
@@ -259,3 +263,46 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def test_trade_samples_outside_the_window_are_discarded(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2)
+        timestamp = self.start_timestamp
+        indicator.last_quotes = [{"timestamp": timestamp, "price": 1}]
+
+        for price, amount in zip([2, 3, 4], [5, 0.5, 0.25]):
+            timestamp += 1
+            indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT", timestamp=timestamp, price=price, amount=amount, type=TradeType.SELL))
+            indicator.calculate(timestamp)
+            indicator.last_quotes = [{"timestamp": timestamp, "price": 1}] + indicator.last_quotes
+
+        self.assertTrue(indicator.is_sampling_buffer_full)
+        # Quotes before the one matched with the latest trade are discarded
+        self.assertEqual([timestamp, timestamp, timestamp - 1],
+                         [quote["timestamp"] for quote in indicator.last_quotes])
+        # Only the trades at price levels 2 and 3 are in the window: 0.5 = 2 * exp(-ln(2) * 2), 0.25 = 2 * exp(-ln(2) * 3)
+        alpha, kappa = indicator.current_value
+        self.assertAlmostEqual(2, alpha, 10)
+        self.assertAlmostEqual(np.log(2), kappa, 10)
+
+    def test_fit_exponential_decay_matches_curve_fit(self):
+        price_levels = np.linspace(0.1, 10, 100)
+        lambdas = 3 * np.exp(-0.5 * price_levels) * (1 + np.random.normal(0, 0.05, price_levels.size))
+
+        alpha, kappa = fit_exponential_decay(price_levels, lambdas)
+
+        params = curve_fit(lambda t, a, b: a * np.exp(-b * t), price_levels, lambdas, p0=(1, 1),
+                           method="dogbox", bounds=([0, 0], [np.inf, np.inf]))[0]
+        self.assertAlmostEqual(params[0], alpha, 6)
+        self.assertAlmostEqual(params[1], kappa, 6)
+
+    def test_fit_exponential_decay_not_possible(self):
+        self.assertIsNone(fit_exponential_decay(np.array([1.0]), np.array([1.0])))
+        self.assertIsNone(fit_exponential_decay(np.array([1.0, 1.0]), np.array([1.0, 2.0])))
+
+    def test_fit_exponential_decay_with_increasing_intensity(self):
+        # The fit would need a negative kappa, the best fit with kappa >= 0 is the average intensity
+        alpha, kappa = fit_exponential_decay(np.array([1.0, 2.0, 3.0]), np.array([1.0, 2.0, 4.0]))
+
+        self.assertAlmostEqual(7 / 3, alpha, 10)
+        self.assertEqual(0, kappa)